@@ -1,2 +1,10 @@
+# submodules are imported on first access, so importing the package is cheap
+_submodules = {'analytics', 'batch', 'bulk', 'cache', 'instrument', 'parse', 'server', 'stringify', 'tokens',
+               'transform'}
 
-import numtowords.stringify as stringify
+
+def __getattr__(name):
+    if name in _submodules:
+        import importlib
+        return importlib.import_module('{}.{}'.format(__name__, name))
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
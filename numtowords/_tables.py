@@ -0,0 +1,38 @@
+'''
+Generated by bin/gen_tables.py, do not edit.
+'''
+
+_block_0 = '\none\ntwo\nthree\nfour\nfive\nsix\nseven\neight\nnine\nten\neleven\ntwelve\nthirteen\nfourteen\nfifteen\nsixteen\nseventeen\neighteen\nnineteen\ntwenty\ntwenty-one\ntwenty-two\ntwenty-three\ntwenty-four\ntwenty-five\ntwenty-six\ntwenty-seven\ntwenty-eight\ntwenty-nine\nthirty\nthirty-one\nthirty-two\nthirty-three\nthirty-four\nthirty-five\nthirty-six\nthirty-seven\nthirty-eight\nthirty-nine\nforty\nforty-one\nforty-two\nforty-three\nforty-four\nforty-five\nforty-six\nforty-seven\nforty-eight\nforty-nine\nfifty\nfifty-one\nfifty-two\nfifty-three\nfifty-four\nfifty-five\nfifty-six\nfifty-seven\nfifty-eight\nfifty-nine\nsixty\nsixty-one\nsixty-two\nsixty-three\nsixty-four\nsixty-five\nsixty-six\nsixty-seven\nsixty-eight\nsixty-nine\nseventy\nseventy-one\nseventy-two\nseventy-three\nseventy-four\nseventy-five\nseventy-six\nseventy-seven\nseventy-eight\nseventy-nine\neighty\neighty-one\neighty-two\neighty-three\neighty-four\neighty-five\neighty-six\neighty-seven\neighty-eight\neighty-nine\nninety\nninety-one\nninety-two\nninety-three\nninety-four\nninety-five\nninety-six\nninety-seven\nninety-eight\nninety-nine\none hundred\none hundred and one\none hundred and two\none hundred and three\none hundred and four\none hundred and five\none hundred and six\none hundred and seven\none hundred and eight\none hundred and nine\none hundred and ten\none hundred and eleven\none hundred and twelve\none hundred and thirteen\none hundred and fourteen\none hundred and fifteen\none hundred and sixteen\none hundred and seventeen\none hundred and eighteen\none hundred and nineteen\none hundred and twenty\none hundred and twenty-one\none hundred and twenty-two\none hundred and twenty-three\none hundred and twenty-four\none hundred and twenty-five\none hundred and twenty-six\none hundred and twenty-seven\none hundred and twenty-eight\none hundred and twenty-nine\none hundred and thirty\none hundred and thirty-one\none hundred and thirty-two\none hundred and thirty-three\none hundred and thirty-four\none hundred and thirty-five\none hundred and thirty-six\none hundred and thirty-seven\none hundred and thirty-eight\none hundred and thirty-nine\none hundred and forty\none hundred and forty-one\none hundred and forty-two\none hundred and forty-three\none hundred and forty-four\none hundred and forty-five\none hundred and forty-six\none hundred and forty-seven\none hundred and forty-eight\none hundred and forty-nine\none hundred and fifty\none hundred and fifty-one\none hundred and fifty-two\none hundred and fifty-three\none hundred and fifty-four\none hundred and fifty-five\none hundred and fifty-six\none hundred and fifty-seven\none hundred and fifty-eight\none hundred and fifty-nine\none hundred and sixty\none hundred and sixty-one\none hundred and sixty-two\none hundred and sixty-three\none hundred and sixty-four\none hundred and sixty-five\none hundred and sixty-six\none hundred and sixty-seven\none hundred and sixty-eight\none hundred and sixty-nine\none hundred and seventy\none hundred and seventy-one\none hundred and seventy-two\none hundred and seventy-three\none hundred and seventy-four\none hundred and seventy-five\none hundred and seventy-six\none hundred and seventy-seven\none hundred and seventy-eight\none hundred and seventy-nine\none hundred and eighty\none hundred and eighty-one\none hundred and eighty-two\none hundred and eighty-three\none hundred and eighty-four\none hundred and eighty-five\none hundred and eighty-six\none hundred and eighty-seven\none hundred and eighty-eight\none hundred and eighty-nine\none hundred and ninety\none hundred and ninety-one\none hundred and ninety-two\none hundred and ninety-three\none hundred and ninety-four\none hundred and ninety-five\none hundred and ninety-six\none hundred and ninety-seven\none hundred and ninety-eight\none hundred and ninety-nine\ntwo hundred\ntwo hundred and one\ntwo hundred and two\ntwo hundred and three\ntwo hundred and four\ntwo hundred and five\ntwo hundred and six\ntwo hundred and seven\ntwo hundred and eight\ntwo hundred and nine\ntwo hundred and ten\ntwo hundred and eleven\ntwo hundred and twelve\ntwo hundred and thirteen\ntwo hundred and fourteen\ntwo hundred and fifteen\ntwo hundred and sixteen\ntwo hundred and seventeen\ntwo hundred and eighteen\ntwo hundred and nineteen\ntwo hundred and twenty\ntwo hundred and twenty-one\ntwo hundred and twenty-two\ntwo hundred and twenty-three\ntwo hundred and twenty-four\ntwo hundred and twenty-five\ntwo hundred and twenty-six\ntwo hundred and twenty-seven\ntwo hundred and twenty-eight\ntwo hundred and twenty-nine\ntwo hundred and thirty\ntwo hundred and thirty-one\ntwo hundred and thirty-two\ntwo hundred and thirty-three\ntwo hundred and thirty-four\ntwo hundred and thirty-five\ntwo hundred and thirty-six\ntwo hundred and thirty-seven\ntwo hundred and thirty-eight\ntwo hundred and thirty-nine\ntwo hundred and forty\ntwo hundred and forty-one\ntwo hundred and forty-two\ntwo hundred and forty-three\ntwo hundred and forty-four\ntwo hundred and forty-five\ntwo hundred and forty-six\ntwo hundred and forty-seven\ntwo hundred and forty-eight\ntwo hundred and forty-nine\ntwo hundred and fifty\ntwo hundred and fifty-one\ntwo hundred and fifty-two\ntwo hundred and fifty-three\ntwo hundred and fifty-four\ntwo hundred and fifty-five\ntwo hundred and fifty-six\ntwo hundred and fifty-seven\ntwo hundred and fifty-eight\ntwo hundred and fifty-nine\ntwo hundred and sixty\ntwo hundred and sixty-one\ntwo hundred and sixty-two\ntwo hundred and sixty-three\ntwo hundred and sixty-four\ntwo hundred and sixty-five\ntwo hundred and sixty-six\ntwo hundred and sixty-seven\ntwo hundred and sixty-eight\ntwo hundred and sixty-nine\ntwo hundred and seventy\ntwo hundred and seventy-one\ntwo hundred and seventy-two\ntwo hundred and seventy-three\ntwo hundred and seventy-four\ntwo hundred and seventy-five\ntwo hundred and seventy-six\ntwo hundred and seventy-seven\ntwo hundred and seventy-eight\ntwo hundred and seventy-nine\ntwo hundred and eighty\ntwo hundred and eighty-one\ntwo hundred and eighty-two\ntwo hundred and eighty-three\ntwo hundred and eighty-four\ntwo hundred and eighty-five\ntwo hundred and eighty-six\ntwo hundred and eighty-seven\ntwo hundred and eighty-eight\ntwo hundred and eighty-nine\ntwo hundred and ninety\ntwo hundred and ninety-one\ntwo hundred and ninety-two\ntwo hundred and ninety-three\ntwo hundred and ninety-four\ntwo hundred and ninety-five\ntwo hundred and ninety-six\ntwo hundred and ninety-seven\ntwo hundred and ninety-eight\ntwo hundred and ninety-nine\nthree hundred\nthree hundred and one\nthree hundred and two\nthree hundred and three\nthree hundred and four\nthree hundred and five\nthree hundred and six\nthree hundred and seven\nthree hundred and eight\nthree hundred and nine\nthree hundred and ten\nthree hundred and eleven\nthree hundred and twelve\nthree hundred and thirteen\nthree hundred and fourteen\nthree hundred and fifteen\nthree hundred and sixteen\nthree hundred and seventeen\nthree hundred and eighteen\nthree hundred and nineteen\nthree hundred and twenty\nthree hundred and twenty-one\nthree hundred and twenty-two\nthree hundred and twenty-three\nthree hundred and twenty-four\nthree hundred and twenty-five\nthree hundred and twenty-six\nthree hundred and twenty-seven\nthree hundred and twenty-eight\nthree hundred and twenty-nine\nthree hundred and thirty\nthree hundred and thirty-one\nthree hundred and thirty-two\nthree hundred and thirty-three\nthree hundred and thirty-four\nthree hundred and thirty-five\nthree hundred and thirty-six\nthree hundred and thirty-seven\nthree hundred and thirty-eight\nthree hundred and thirty-nine\nthree hundred and forty\nthree hundred and forty-one\nthree hundred and forty-two\nthree hundred and forty-three\nthree hundred and forty-four\nthree hundred and forty-five\nthree hundred and forty-six\nthree hundred and forty-seven\nthree hundred and forty-eight\nthree hundred and forty-nine\nthree hundred and fifty\nthree hundred and fifty-one\nthree hundred and fifty-two\nthree hundred and fifty-three\nthree hundred and fifty-four\nthree hundred and fifty-five\nthree hundred and fifty-six\nthree hundred and fifty-seven\nthree hundred and fifty-eight\nthree hundred and fifty-nine\nthree hundred and sixty\nthree hundred and sixty-one\nthree hundred and sixty-two\nthree hundred and sixty-three\nthree hundred and sixty-four\nthree hundred and sixty-five\nthree hundred and sixty-six\nthree hundred and sixty-seven\nthree hundred and sixty-eight\nthree hundred and sixty-nine\nthree hundred and seventy\nthree hundred and seventy-one\nthree hundred and seventy-two\nthree hundred and seventy-three\nthree hundred and seventy-four\nthree hundred and seventy-five\nthree hundred and seventy-six\nthree hundred and seventy-seven\nthree hundred and seventy-eight\nthree hundred and seventy-nine\nthree hundred and eighty\nthree hundred and eighty-one\nthree hundred and eighty-two\nthree hundred and eighty-three\nthree hundred and eighty-four\nthree hundred and eighty-five\nthree hundred and eighty-six\nthree hundred and eighty-seven\nthree hundred and eighty-eight\nthree hundred and eighty-nine\nthree hundred and ninety\nthree hundred and ninety-one\nthree hundred and ninety-two\nthree hundred and ninety-three\nthree hundred and ninety-four\nthree hundred and ninety-five\nthree hundred and ninety-six\nthree hundred and ninety-seven\nthree hundred and ninety-eight\nthree hundred and ninety-nine\nfour hundred\nfour hundred and one\nfour hundred and two\nfour hundred and three\nfour hundred and four\nfour hundred and five\nfour hundred and six\nfour hundred and seven\nfour hundred and eight\nfour hundred and nine\nfour hundred and ten\nfour hundred and eleven\nfour hundred and twelve\nfour hundred and thirteen\nfour hundred and fourteen\nfour hundred and fifteen\nfour hundred and sixteen\nfour hundred and seventeen\nfour hundred and eighteen\nfour hundred and nineteen\nfour hundred and twenty\nfour hundred and twenty-one\nfour hundred and twenty-two\nfour hundred and twenty-three\nfour hundred and twenty-four\nfour hundred and twenty-five\nfour hundred and twenty-six\nfour hundred and twenty-seven\nfour hundred and twenty-eight\nfour hundred and twenty-nine\nfour hundred and thirty\nfour hundred and thirty-one\nfour hundred and thirty-two\nfour hundred and thirty-three\nfour hundred and thirty-four\nfour hundred and thirty-five\nfour hundred and thirty-six\nfour hundred and thirty-seven\nfour hundred and thirty-eight\nfour hundred and thirty-nine\nfour hundred and forty\nfour hundred and forty-one\nfour hundred and forty-two\nfour hundred and forty-three\nfour hundred and forty-four\nfour hundred and forty-five\nfour hundred and forty-six\nfour hundred and forty-seven\nfour hundred and forty-eight\nfour hundred and forty-nine\nfour hundred and fifty\nfour hundred and fifty-one\nfour hundred and fifty-two\nfour hundred and fifty-three\nfour hundred and fifty-four\nfour hundred and fifty-five\nfour hundred and fifty-six\nfour hundred and fifty-seven\nfour hundred and fifty-eight\nfour hundred and fifty-nine\nfour hundred and sixty\nfour hundred and sixty-one\nfour hundred and sixty-two\nfour hundred and sixty-three\nfour hundred and sixty-four\nfour hundred and sixty-five\nfour hundred and sixty-six\nfour hundred and sixty-seven\nfour hundred and sixty-eight\nfour hundred and sixty-nine\nfour hundred and seventy\nfour hundred and seventy-one\nfour hundred and seventy-two\nfour hundred and seventy-three\nfour hundred and seventy-four\nfour hundred and seventy-five\nfour hundred and seventy-six\nfour hundred and seventy-seven\nfour hundred and seventy-eight\nfour hundred and seventy-nine\nfour hundred and eighty\nfour hundred and eighty-one\nfour hundred and eighty-two\nfour hundred and eighty-three\nfour hundred and eighty-four\nfour hundred and eighty-five\nfour hundred and eighty-six\nfour hundred and eighty-seven\nfour hundred and eighty-eight\nfour hundred and eighty-nine\nfour hundred and ninety\nfour hundred and ninety-one\nfour hundred and ninety-two\nfour hundred and ninety-three\nfour hundred and ninety-four\nfour hundred and ninety-five\nfour hundred and ninety-six\nfour hundred and ninety-seven\nfour hundred and ninety-eight\nfour hundred and ninety-nine\nfive hundred\nfive hundred and one\nfive hundred and two\nfive hundred and three\nfive hundred and four\nfive hundred and five\nfive hundred and six\nfive hundred and seven\nfive hundred and eight\nfive hundred and nine\nfive hundred and ten\nfive hundred and eleven\nfive hundred and twelve\nfive hundred and thirteen\nfive hundred and fourteen\nfive hundred and fifteen\nfive hundred and sixteen\nfive hundred and seventeen\nfive hundred and eighteen\nfive hundred and nineteen\nfive hundred and twenty\nfive hundred and twenty-one\nfive hundred and twenty-two\nfive hundred and twenty-three\nfive hundred and twenty-four\nfive hundred and twenty-five\nfive hundred and twenty-six\nfive hundred and twenty-seven\nfive hundred and twenty-eight\nfive hundred and twenty-nine\nfive hundred and thirty\nfive hundred and thirty-one\nfive hundred and thirty-two\nfive hundred and thirty-three\nfive hundred and thirty-four\nfive hundred and thirty-five\nfive hundred and thirty-six\nfive hundred and thirty-seven\nfive hundred and thirty-eight\nfive hundred and thirty-nine\nfive hundred and forty\nfive hundred and forty-one\nfive hundred and forty-two\nfive hundred and forty-three\nfive hundred and forty-four\nfive hundred and forty-five\nfive hundred and forty-six\nfive hundred and forty-seven\nfive hundred and forty-eight\nfive hundred and forty-nine\nfive hundred and fifty\nfive hundred and fifty-one\nfive hundred and fifty-two\nfive hundred and fifty-three\nfive hundred and fifty-four\nfive hundred and fifty-five\nfive hundred and fifty-six\nfive hundred and fifty-seven\nfive hundred and fifty-eight\nfive hundred and fifty-nine\nfive hundred and sixty\nfive hundred and sixty-one\nfive hundred and sixty-two\nfive hundred and sixty-three\nfive hundred and sixty-four\nfive hundred and sixty-five\nfive hundred and sixty-six\nfive hundred and sixty-seven\nfive hundred and sixty-eight\nfive hundred and sixty-nine\nfive hundred and seventy\nfive hundred and seventy-one\nfive hundred and seventy-two\nfive hundred and seventy-three\nfive hundred and seventy-four\nfive hundred and seventy-five\nfive hundred and seventy-six\nfive hundred and seventy-seven\nfive hundred and seventy-eight\nfive hundred and seventy-nine\nfive hundred and eighty\nfive hundred and eighty-one\nfive hundred and eighty-two\nfive hundred and eighty-three\nfive hundred and eighty-four\nfive hundred and eighty-five\nfive hundred and eighty-six\nfive hundred and eighty-seven\nfive hundred and eighty-eight\nfive hundred and eighty-nine\nfive hundred and ninety\nfive hundred and ninety-one\nfive hundred and ninety-two\nfive hundred and ninety-three\nfive hundred and ninety-four\nfive hundred and ninety-five\nfive hundred and ninety-six\nfive hundred and ninety-seven\nfive hundred and ninety-eight\nfive hundred and ninety-nine\nsix hundred\nsix hundred and one\nsix hundred and two\nsix hundred and three\nsix hundred and four\nsix hundred and five\nsix hundred and six\nsix hundred and seven\nsix hundred and eight\nsix hundred and nine\nsix hundred and ten\nsix hundred and eleven\nsix hundred and twelve\nsix hundred and thirteen\nsix hundred and fourteen\nsix hundred and fifteen\nsix hundred and sixteen\nsix hundred and seventeen\nsix hundred and eighteen\nsix hundred and nineteen\nsix hundred and twenty\nsix hundred and twenty-one\nsix hundred and twenty-two\nsix hundred and twenty-three\nsix hundred and twenty-four\nsix hundred and twenty-five\nsix hundred and twenty-six\nsix hundred and twenty-seven\nsix hundred and twenty-eight\nsix hundred and twenty-nine\nsix hundred and thirty\nsix hundred and thirty-one\nsix hundred and thirty-two\nsix hundred and thirty-three\nsix hundred and thirty-four\nsix hundred and thirty-five\nsix hundred and thirty-six\nsix hundred and thirty-seven\nsix hundred and thirty-eight\nsix hundred and thirty-nine\nsix hundred and forty\nsix hundred and forty-one\nsix hundred and forty-two\nsix hundred and forty-three\nsix hundred and forty-four\nsix hundred and forty-five\nsix hundred and forty-six\nsix hundred and forty-seven\nsix hundred and forty-eight\nsix hundred and forty-nine\nsix hundred and fifty\nsix hundred and fifty-one\nsix hundred and fifty-two\nsix hundred and fifty-three\nsix hundred and fifty-four\nsix hundred and fifty-five\nsix hundred and fifty-six\nsix hundred and fifty-seven\nsix hundred and fifty-eight\nsix hundred and fifty-nine\nsix hundred and sixty\nsix hundred and sixty-one\nsix hundred and sixty-two\nsix hundred and sixty-three\nsix hundred and sixty-four\nsix hundred and sixty-five\nsix hundred and sixty-six\nsix hundred and sixty-seven\nsix hundred and sixty-eight\nsix hundred and sixty-nine\nsix hundred and seventy\nsix hundred and seventy-one\nsix hundred and seventy-two\nsix hundred and seventy-three\nsix hundred and seventy-four\nsix hundred and seventy-five\nsix hundred and seventy-six\nsix hundred and seventy-seven\nsix hundred and seventy-eight\nsix hundred and seventy-nine\nsix hundred and eighty\nsix hundred and eighty-one\nsix hundred and eighty-two\nsix hundred and eighty-three\nsix hundred and eighty-four\nsix hundred and eighty-five\nsix hundred and eighty-six\nsix hundred and eighty-seven\nsix hundred and eighty-eight\nsix hundred and eighty-nine\nsix hundred and ninety\nsix hundred and ninety-one\nsix hundred and ninety-two\nsix hundred and ninety-three\nsix hundred and ninety-four\nsix hundred and ninety-five\nsix hundred and ninety-six\nsix hundred and ninety-seven\nsix hundred and ninety-eight\nsix hundred and ninety-nine\nseven hundred\nseven hundred and one\nseven hundred and two\nseven hundred and three\nseven hundred and four\nseven hundred and five\nseven hundred and six\nseven hundred and seven\nseven hundred and eight\nseven hundred and nine\nseven hundred and ten\nseven hundred and eleven\nseven hundred and twelve\nseven hundred and thirteen\nseven hundred and fourteen\nseven hundred and fifteen\nseven hundred and sixteen\nseven hundred and seventeen\nseven hundred and eighteen\nseven hundred and nineteen\nseven hundred and twenty\nseven hundred and twenty-one\nseven hundred and twenty-two\nseven hundred and twenty-three\nseven hundred and twenty-four\nseven hundred and twenty-five\nseven hundred and twenty-six\nseven hundred and twenty-seven\nseven hundred and twenty-eight\nseven hundred and twenty-nine\nseven hundred and thirty\nseven hundred and thirty-one\nseven hundred and thirty-two\nseven hundred and thirty-three\nseven hundred and thirty-four\nseven hundred and thirty-five\nseven hundred and thirty-six\nseven hundred and thirty-seven\nseven hundred and thirty-eight\nseven hundred and thirty-nine\nseven hundred and forty\nseven hundred and forty-one\nseven hundred and forty-two\nseven hundred and forty-three\nseven hundred and forty-four\nseven hundred and forty-five\nseven hundred and forty-six\nseven hundred and forty-seven\nseven hundred and forty-eight\nseven hundred and forty-nine\nseven hundred and fifty\nseven hundred and fifty-one\nseven hundred and fifty-two\nseven hundred and fifty-three\nseven hundred and fifty-four\nseven hundred and fifty-five\nseven hundred and fifty-six\nseven hundred and fifty-seven\nseven hundred and fifty-eight\nseven hundred and fifty-nine\nseven hundred and sixty\nseven hundred and sixty-one\nseven hundred and sixty-two\nseven hundred and sixty-three\nseven hundred and sixty-four\nseven hundred and sixty-five\nseven hundred and sixty-six\nseven hundred and sixty-seven\nseven hundred and sixty-eight\nseven hundred and sixty-nine\nseven hundred and seventy\nseven hundred and seventy-one\nseven hundred and seventy-two\nseven hundred and seventy-three\nseven hundred and seventy-four\nseven hundred and seventy-five\nseven hundred and seventy-six\nseven hundred and seventy-seven\nseven hundred and seventy-eight\nseven hundred and seventy-nine\nseven hundred and eighty\nseven hundred and eighty-one\nseven hundred and eighty-two\nseven hundred and eighty-three\nseven hundred and eighty-four\nseven hundred and eighty-five\nseven hundred and eighty-six\nseven hundred and eighty-seven\nseven hundred and eighty-eight\nseven hundred and eighty-nine\nseven hundred and ninety\nseven hundred and ninety-one\nseven hundred and ninety-two\nseven hundred and ninety-three\nseven hundred and ninety-four\nseven hundred and ninety-five\nseven hundred and ninety-six\nseven hundred and ninety-seven\nseven hundred and ninety-eight\nseven hundred and ninety-nine\neight hundred\neight hundred and one\neight hundred and two\neight hundred and three\neight hundred and four\neight hundred and five\neight hundred and six\neight hundred and seven\neight hundred and eight\neight hundred and nine\neight hundred and ten\neight hundred and eleven\neight hundred and twelve\neight hundred and thirteen\neight hundred and fourteen\neight hundred and fifteen\neight hundred and sixteen\neight hundred and seventeen\neight hundred and eighteen\neight hundred and nineteen\neight hundred and twenty\neight hundred and twenty-one\neight hundred and twenty-two\neight hundred and twenty-three\neight hundred and twenty-four\neight hundred and twenty-five\neight hundred and twenty-six\neight hundred and twenty-seven\neight hundred and twenty-eight\neight hundred and twenty-nine\neight hundred and thirty\neight hundred and thirty-one\neight hundred and thirty-two\neight hundred and thirty-three\neight hundred and thirty-four\neight hundred and thirty-five\neight hundred and thirty-six\neight hundred and thirty-seven\neight hundred and thirty-eight\neight hundred and thirty-nine\neight hundred and forty\neight hundred and forty-one\neight hundred and forty-two\neight hundred and forty-three\neight hundred and forty-four\neight hundred and forty-five\neight hundred and forty-six\neight hundred and forty-seven\neight hundred and forty-eight\neight hundred and forty-nine\neight hundred and fifty\neight hundred and fifty-one\neight hundred and fifty-two\neight hundred and fifty-three\neight hundred and fifty-four\neight hundred and fifty-five\neight hundred and fifty-six\neight hundred and fifty-seven\neight hundred and fifty-eight\neight hundred and fifty-nine\neight hundred and sixty\neight hundred and sixty-one\neight hundred and sixty-two\neight hundred and sixty-three\neight hundred and sixty-four\neight hundred and sixty-five\neight hundred and sixty-six\neight hundred and sixty-seven\neight hundred and sixty-eight\neight hundred and sixty-nine\neight hundred and seventy\neight hundred and seventy-one\neight hundred and seventy-two\neight hundred and seventy-three\neight hundred and seventy-four\neight hundred and seventy-five\neight hundred and seventy-six\neight hundred and seventy-seven\neight hundred and seventy-eight\neight hundred and seventy-nine\neight hundred and eighty\neight hundred and eighty-one\neight hundred and eighty-two\neight hundred and eighty-three\neight hundred and eighty-four\neight hundred and eighty-five\neight hundred and eighty-six\neight hundred and eighty-seven\neight hundred and eighty-eight\neight hundred and eighty-nine\neight hundred and ninety\neight hundred and ninety-one\neight hundred and ninety-two\neight hundred and ninety-three\neight hundred and ninety-four\neight hundred and ninety-five\neight hundred and ninety-six\neight hundred and ninety-seven\neight hundred and ninety-eight\neight hundred and ninety-nine\nnine hundred\nnine hundred and one\nnine hundred and two\nnine hundred and three\nnine hundred and four\nnine hundred and five\nnine hundred and six\nnine hundred and seven\nnine hundred and eight\nnine hundred and nine\nnine hundred and ten\nnine hundred and eleven\nnine hundred and twelve\nnine hundred and thirteen\nnine hundred and fourteen\nnine hundred and fifteen\nnine hundred and sixteen\nnine hundred and seventeen\nnine hundred and eighteen\nnine hundred and nineteen\nnine hundred and twenty\nnine hundred and twenty-one\nnine hundred and twenty-two\nnine hundred and twenty-three\nnine hundred and twenty-four\nnine hundred and twenty-five\nnine hundred and twenty-six\nnine hundred and twenty-seven\nnine hundred and twenty-eight\nnine hundred and twenty-nine\nnine hundred and thirty\nnine hundred and thirty-one\nnine hundred and thirty-two\nnine hundred and thirty-three\nnine hundred and thirty-four\nnine hundred and thirty-five\nnine hundred and thirty-six\nnine hundred and thirty-seven\nnine hundred and thirty-eight\nnine hundred and thirty-nine\nnine hundred and forty\nnine hundred and forty-one\nnine hundred and forty-two\nnine hundred and forty-three\nnine hundred and forty-four\nnine hundred and forty-five\nnine hundred and forty-six\nnine hundred and forty-seven\nnine hundred and forty-eight\nnine hundred and forty-nine\nnine hundred and fifty\nnine hundred and fifty-one\nnine hundred and fifty-two\nnine hundred and fifty-three\nnine hundred and fifty-four\nnine hundred and fifty-five\nnine hundred and fifty-six\nnine hundred and fifty-seven\nnine hundred and fifty-eight\nnine hundred and fifty-nine\nnine hundred and sixty\nnine hundred and sixty-one\nnine hundred and sixty-two\nnine hundred and sixty-three\nnine hundred and sixty-four\nnine hundred and sixty-five\nnine hundred and sixty-six\nnine hundred and sixty-seven\nnine hundred and sixty-eight\nnine hundred and sixty-nine\nnine hundred and seventy\nnine hundred and seventy-one\nnine hundred and seventy-two\nnine hundred and seventy-three\nnine hundred and seventy-four\nnine hundred and seventy-five\nnine hundred and seventy-six\nnine hundred and seventy-seven\nnine hundred and seventy-eight\nnine hundred and seventy-nine\nnine hundred and eighty\nnine hundred and eighty-one\nnine hundred and eighty-two\nnine hundred and eighty-three\nnine hundred and eighty-four\nnine hundred and eighty-five\nnine hundred and eighty-six\nnine hundred and eighty-seven\nnine hundred and eighty-eight\nnine hundred and eighty-nine\nnine hundred and ninety\nnine hundred and ninety-one\nnine hundred and ninety-two\nnine hundred and ninety-three\nnine hundred and ninety-four\nnine hundred and ninety-five\nnine hundred and ninety-six\nnine hundred and ninety-seven\nnine hundred and ninety-eight\nnine hundred and ninety-nine'
+
+_tail_1 = ('\none\ntwo\nthree\nfour\nfive\nsix\nseven\neight\nnine\nten\neleven\ntwelve\nthirteen\nfourteen\nfifteen\nsixteen\nseventeen\neighteen\nnineteen\ntwenty\ntwenty-one\ntwenty-two\ntwenty-three\ntwenty-four\ntwenty-five\ntwenty-six\ntwenty-seven\ntwenty-eight\ntwenty-nine\nthirty\nthirty-one\nthirty-two\nthirty-three\nthirty-four\nthirty-five\nthirty-six\nthirty-seven\nthirty-eight\nthirty-nine\nforty\nforty-one\nforty-two\nforty-three\nforty-four\nforty-five\nforty-six\nforty-seven\nforty-eight\nforty-nine\nfifty\nfifty-one\nfifty-two\nfifty-three\nfifty-four\nfifty-five\nfifty-six\nfifty-seven\nfifty-eight\nfifty-nine\nsixty\nsixty-one\nsixty-two\nsixty-three\nsixty-four\nsixty-five\nsixty-six\nsixty-seven\nsixty-eight\nsixty-nine\nseventy\nseventy-one\nseventy-two\nseventy-three\nseventy-four\nseventy-five\nseventy-six\nseventy-seven\nseventy-eight\nseventy-nine\neighty\neighty-one\neighty-two\neighty-three\neighty-four\neighty-five\neighty-six\neighty-seven\neighty-eight\neighty-nine\nninety\nninety-one\nninety-two\nninety-three\nninety-four\nninety-five\nninety-six\nninety-seven\nninety-eight\nninety-nine\none hundred\none hundred and one\none hundred and two\none hundred and three\none hundred and four\none hundred and five\none hundred and six\none hundred and seven\none hundred and eight\none hundred and nine\none hundred and ten\none hundred and eleven\none hundred and twelve\none hundred and thirteen\none hundred and fourteen\none hundred and fifteen\none hundred and sixteen\none hundred and seventeen\none hundred and eighteen\none hundred and nineteen\none hundred and twenty\none hundred and twenty-one\none hundred and twenty-two\none hundred and twenty-three\none hundred and twenty-four\none hundred and twenty-five\none hundred and twenty-six\none hundred and twenty-seven\none hundred and twenty-eight\none hundred and twenty-nine\none hundred and thirty\none hundred and thirty-one\none hundred and thirty-two\none hundred and thirty-three\none hundred and thirty-four\none hundred and thirty-five\none hundred and thirty-six\none hundred and thirty-seven\none hundred and thirty-eight\none hundred and thirty-nine\none hundred and forty\none hundred and forty-one\none hundred and forty-two\none hundred and forty-three\none hundred and forty-four\none hundred and forty-five\none hundred and forty-six\none hundred and forty-seven\none hundred and forty-eight\none hundred and forty-nine\none hundred and fifty\none hundred and fifty-one\none hundred and fifty-two\none hundred and fifty-three\none hundred and fifty-four\none hundred and fifty-five\none hundred and fifty-six\none hundred and fifty-seven\none hundred and fifty-eight\none hundred and fifty-nine\none hundred and sixty\none hundred and sixty-one\none hundred and sixty-two\none hundred and sixty-three\none hundred and sixty-four\none hundred and sixty-five\none hundred and sixty-six\none hundred and sixty-seven\none hundred and sixty-eight\none hundred and sixty-nine\none hundred and seventy\none hundred and seventy-one\none hundred and seventy-two\none hundred and seventy-three\none hundred and seventy-four\none hundred and seventy-five\none hundred and seventy-six\none hundred and seventy-seven\none hundred and seventy-eight\none hundred and seventy-nine\none hundred and eighty\none hundred and eighty-one\none hundred and eighty-two\none hundred and eighty-three\none hundred and eighty-four\none hundred and eighty-five\none hundred and eighty-six\none hundred and eighty-seven\none hundred and eighty-eight\none hundred and eighty-nine\none hundred and ninety\none hundred and ninety-one\none hundred and ninety-two\none hundred and ninety-three\none hundred and ninety-four\none hundred and ninety-five\none hundred and ninety-six\none hundred and ninety-seven\none hundred and ninety-eight\none hundred and ninety-nine\ntwo hundred\ntwo hundred and one\ntwo hundred and two\ntwo hundred and three\ntwo hundred and four\ntwo hundred and five\ntwo hundred and six\ntwo hundred and seven\ntwo hundred and eight\ntwo hundred and nine\ntwo hundred and ten\ntwo hundred and eleven\ntwo hundred and twelve\ntwo hundred and thirteen\ntwo hundred and fourteen\ntwo hundred and fifteen\ntwo hundred and sixteen\ntwo hundred and seventeen\ntwo hundred and eighteen\ntwo hundred and nineteen\ntwo hundred and twenty\ntwo hundred and twenty-one\ntwo hundred and twenty-two\ntwo hundred and twenty-three\ntwo hundred and twenty-four\ntwo hundred and twenty-five\ntwo hundred and twenty-six\ntwo hundred and twenty-seven\ntwo hundred and twenty-eight\ntwo hundred and twenty-nine\ntwo hundred and thirty\ntwo hundred and thirty-one\ntwo hundred and thirty-two\ntwo hundred and thirty-three\ntwo hundred and thirty-four\ntwo hundred and thirty-five\ntwo hundred and thirty-six\ntwo hundred and thirty-seven\ntwo hundred and thirty-eight\ntwo hundred and thirty-nine\ntwo hundred and forty\ntwo hundred and forty-one\ntwo hundred and forty-two\ntwo hundred and forty-three\ntwo hundred and forty-four\ntwo hundred and forty-five\ntwo hundred and forty-six\ntwo hundred and forty-seven\ntwo hundred and forty-eight\ntwo hundred and forty-nine\ntwo hundred and fifty\ntwo hundred and fifty-one\ntwo hundred and fifty-two\ntwo hundred and fifty-three\ntwo hundred and fifty-four\ntwo hundred and fifty-five\ntwo hundred and fifty-six\ntwo hundred and fifty-seven\ntwo hundred and fifty-eight\ntwo hundred and fifty-nine\ntwo hundred and sixty\ntwo hundred and sixty-one\ntwo hundred and sixty-two\ntwo hundred and sixty-three\ntwo hundred and sixty-four\ntwo hundred and sixty-five\ntwo hundred and sixty-six\ntwo hundred and sixty-seven\ntwo hundred and sixty-eight\ntwo hundred and sixty-nine\ntwo hundred and seventy\ntwo hundred and seventy-one\ntwo hundred and seventy-two\ntwo hundred and seventy-three\ntwo hundred and seventy-four\ntwo hundred and seventy-five\ntwo hundred and seventy-six\ntwo hundred and seventy-seven\ntwo hundred and seventy-eight\ntwo hundred and seventy-nine\ntwo hundred and eighty\ntwo hundred and eighty-one\ntwo hundred and eighty-two\ntwo hundred and eighty-three\ntwo hundred and eighty-four\ntwo hundred and eighty-five\ntwo hundred and eighty-six\ntwo hundred and eighty-seven\ntwo hundred and eighty-eight\ntwo hundred and eighty-nine\ntwo hundred and ninety\ntwo hundred and ninety-one\ntwo hundred and ninety-two\ntwo hundred and ninety-three\ntwo hundred and ninety-four\ntwo hundred and ninety-five\ntwo hundred and ninety-six\ntwo hundred and ninety-seven\ntwo hundred and ninety-eight\ntwo hundred and ninety-nine\nthree hundred\nthree hundred and one\nthree hundred and two\nthree hundred and three\nthree hundred and four\nthree hundred and five\nthree hundred and six\nthree hundred and seven\nthree hundred and eight\nthree hundred and nine\nthree hundred and ten\nthree hundred and eleven\nthree hundred and twelve\nthree hundred and thirteen\nthree hundred and fourteen\nthree hundred and fifteen\nthree hundred and sixteen\nthree hundred and seventeen\nthree hundred and eighteen\nthree hundred and nineteen\nthree hundred and twenty\nthree hundred and twenty-one\nthree hundred and twenty-two\nthree hundred and twenty-three\nthree hundred and twenty-four\nthree hundred and twenty-five\nthree hundred and twenty-six\nthree hundred and twenty-seven\nthree hundred and twenty-eight\nthree hundred and twenty-nine\nthree hundred and thirty\nthree hundred and thirty-one\nthree hundred and thirty-two\nthree hundred and thirty-three\nthree hundred and thirty-four\nthree hundred and thirty-five\nthree hundred and thirty-six\nthree hundred and thirty-seven\nthree hundred and thirty-eight\nthree hundred and thirty-nine\nthree hundred and forty\nthree hundred and forty-one\nthree hundred and forty-two\nthree hundred and forty-three\nthree hundred and forty-four\nthree hundred and forty-five\nthree hundred and forty-six\nthree hundred and forty-seven\nthree hundred and forty-eight\nthree hundred and forty-nine\nthree hundred and fifty\nthree hundred and fifty-one\nthree hundred and fifty-two\nthree hundred and fifty-three\nthree hundred and fifty-four\nthree hundred and fifty-five\nthree hundred and fifty-six\nthree hundred and fifty-seven\nthree hundred and fifty-eight\nthree hundred and fifty-nine\nthree hundred and sixty\nthree hundred and sixty-one\nthree hundred and sixty-two\nthree hundred and sixty-three\nthree hundred and sixty-four\nthree hundred and sixty-five\nthree hundred and sixty-six\nthree hundred and sixty-seven\nthree hundred and sixty-eight\nthree hundred and sixty-nine\nthree hundred and seventy\nthree hundred and seventy-one\nthree hundred and seventy-two\nthree hundred and seventy-three\nthree hundred and seventy-four\nthree hundred and seventy-five\nthree hundred and seventy-six\nthree hundred and seventy-seven\nthree hundred and seventy-eight\nthree hundred and seventy-nine\nthree hundred and eighty\nthree hundred and eighty-one\nthree hundred and eighty-two\nthree hundred and eighty-three\nthree hundred and eighty-four\nthree hundred and eighty-five\nthree hundred and eighty-six\nthree hundred and eighty-seven\nthree hundred and eighty-eight\nthree hundred and eighty-nine\nthree hundred and ninety\nthree hundred and ninety-one\nthree hundred and ninety-two\nthree hundred and ninety-three\nthree hundred and ninety-four\nthree hundred and ninety-five\nthree hundred and ninety-six\nthree hundred and ninety-seven\nthree hundred and ninety-eight\nthree hundred and ninety-nine\nfour hundred\nfour hundred and one\nfour hundred and two\nfour hundred and three\nfour hundred and four\nfour hundred and five\nfour hundred and six\nfour hundred and seven\nfour hundred and eight\nfour hundred and nine\nfour hundred and ten\nfour hundred and eleven\nfour hundred and twelve\nfour hundred and thirteen\nfour hundred and fourteen\nfour hundred and fifteen\nfour hundred and sixteen\nfour hundred and seventeen\nfour hundred and eighteen\nfour hundred and nineteen\nfour hundred and twenty\nfour hundred and twenty-one\nfour hundred and twenty-two\nfour hundred and twenty-three\nfour hundred and twenty-four\nfour hundred and twenty-five\nfour hundred and twenty-six\nfour hundred and twenty-seven\nfour hundred and twenty-eight\nfour hundred and twenty-nine\nfour hundred and thirty\nfour hundred and thirty-one\nfour hundred and thirty-two\nfour hundred and thirty-three\nfour hundred and thirty-four\nfour hundred and thirty-five\nfour hundred and thirty-six\nfour hundred and thirty-seven\nfour hundred and thirty-eight\nfour hundred and thirty-nine\nfour hundred and forty\nfour hundred and forty-one\nfour hundred and forty-two\nfour hundred and forty-three\nfour hundred and forty-four\nfour hundred and forty-five\nfour hundred and forty-six\nfour hundred and forty-seven\nfour hundred and forty-eight\nfour hundred and forty-nine\nfour hundred and fifty\nfour hundred and fifty-one\nfour hundred and fifty-two\nfour hundred and fifty-three\nfour hundred and fifty-four\nfour hundred and fifty-five\nfour hundred and fifty-six\nfour hundred and fifty-seven\nfour hundred and fifty-eight\nfour hundred and fifty-nine\nfour hundred and sixty\nfour hundred and sixty-one\nfour hundred and sixty-two\nfour hundred and sixty-three\nfour hundred and sixty-four\nfour hundred and sixty-five\nfour hundred and sixty-six\nfour hundred and sixty-seven\nfour hundred and sixty-eight\nfour hundred and sixty-nine\nfour hundred and seventy\nfour hundred and seventy-one\nfour hundred and seventy-two\nfour hundred and seventy-three\nfour hundred and seventy-four\nfour hundred and seventy-five\nfour hundred and seventy-six\nfour hundred and seventy-seven\nfour hundred and seventy-eight\nfour hundred and seventy-nine\nfour hundred and eighty\nfour hundred and eighty-one\nfour hundred and eighty-two\nfour hundred and eighty-three\nfour hundred and eighty-four\nfour hundred and eighty-five\nfour hundred and eighty-six\nfour hundred and eighty-seven\nfour hundred and eighty-eight\nfour hundred and eighty-nine\nfour hundred and ninety\nfour hundred and ninety-one\nfour hundred and ninety-two\nfour hundred and ninety-three\nfour hundred and ninety-four\nfour hundred and ninety-five\nfour hundred and ninety-six\nfour hundred and ninety-seven\nfour hundred and ninety-eight\nfour hundred and ninety-nine\nfive hundred\nfive hundred and one\nfive hundred and two\nfive hundred and three\nfive hundred and four\nfive hundred and five\nfive hundred and six\nfive hundred and seven\nfive hundred and eight\nfive hundred and nine\nfive hundred and ten\nfive hundred and eleven\nfive hundred and twelve\nfive hundred and thirteen\nfive hundred and fourteen\nfive hundred and fifteen\nfive hundred and sixteen\nfive hundred and seventeen\nfive hundred and eighteen\nfive hundred and nineteen\nfive hundred and twenty\nfive hundred and twenty-one\nfive hundred and twenty-two\nfive hundred and twenty-three\nfive hundred and twenty-four\nfive hundred and twenty-five\nfive hundred and twenty-six\nfive hundred and twenty-seven\nfive hundred and twenty-eight\nfive hundred and twenty-nine\nfive hundred and thirty\nfive hundred and thirty-one\nfive hundred and thirty-two\nfive hundred and thirty-three\nfive hundred and thirty-four\nfive hundred and thirty-five\nfive hundred and thirty-six\nfive hundred and thirty-seven\nfive hundred and thirty-eight\nfive hundred and thirty-nine\nfive hundred and forty\nfive hundred and forty-one\nfive hundred and forty-two\nfive hundred and forty-three\nfive hundred and forty-four\nfive hundred and forty-five\nfive hundred and forty-six\nfive hundred and forty-seven\nfive hundred and forty-eight\nfive hundred and forty-nine\nfive hundred and fifty\nfive hundred and fifty-one\nfive hundred and fifty-two\nfive hundred and fifty-three\nfive hundred and fifty-four\nfive hundred and fifty-five\nfive hundred and fifty-six\nfive hundred and fifty-seven\nfive hundred and fifty-eight\nfive hundred and fifty-nine\nfive hundred and sixty\nfive hundred and sixty-one\nfive hundred and sixty-two\nfive hundred and sixty-three\nfive hundred and sixty-four\nfive hundred and sixty-five\nfive hundred and sixty-six\nfive hundred and sixty-seven\nfive hundred and sixty-eight\nfive hundred and sixty-nine\nfive hundred and seventy\nfive hundred and seventy-one\nfive hundred and seventy-two\nfive hundred and seventy-three\nfive hundred and seventy-four\nfive hundred and seventy-five\nfive hundred and seventy-six\nfive hundred and seventy-seven\nfive hundred and seventy-eight\nfive hundred and seventy-nine\nfive hundred and eighty\nfive hundred and eighty-one\nfive hundred and eighty-two\nfive hundred and eighty-three\nfive hundred and eighty-four\nfive hundred and eighty-five\nfive hundred and eighty-six\nfive hundred and eighty-seven\nfive hundred and eighty-eight\nfive hundred and eighty-nine\nfive hundred and ninety\nfive hundred and ninety-one\nfive hundred and ninety-two\nfive hundred and ninety-three\nfive hundred and ninety-four\nfive hundred and ninety-five\nfive hundred and ninety-six\nfive hundred and ninety-seven\nfive hundred and ninety-eight\nfive hundred and ninety-nine\nsix hundred\nsix hundred and one\nsix hundred and two\nsix hundred and three\nsix hundred and four\nsix hundred and five\nsix hundred and six\nsix hundred and seven\nsix hundred and eight\nsix hundred and nine\nsix hundred and ten\nsix hundred and eleven\nsix hundred and twelve\nsix hundred and thirteen\nsix hundred and fourteen\nsix hundred and fifteen\nsix hundred and sixteen\nsix hundred and seventeen\nsix hundred and eighteen\nsix hundred and nineteen\nsix hundred and twenty\nsix hundred and twenty-one\nsix hundred and twenty-two\nsix hundred and twenty-three\nsix hundred and twenty-four\nsix hundred and twenty-five\nsix hundred and twenty-six\nsix hundred and twenty-seven\nsix hundred and twenty-eight\nsix hundred and twenty-nine\nsix hundred and thirty\nsix hundred and thirty-one\nsix hundred and thirty-two\nsix hundred and thirty-three\nsix hundred and thirty-four\nsix hundred and thirty-five\nsix hundred and thirty-six\nsix hundred and thirty-seven\nsix hundred and thirty-eight\nsix hundred and thirty-nine\nsix hundred and forty\nsix hundred and forty-one\nsix hundred and forty-two\nsix hundred and forty-three\nsix hundred and forty-four\nsix hundred and forty-five\nsix hundred and forty-six\nsix hundred and forty-seven\nsix hundred and forty-eight\nsix hundred and forty-nine\nsix hundred and fifty\nsix hundred and fifty-one\nsix hundred and fifty-two\nsix hundred and fifty-three\nsix hundred and fifty-four\nsix hundred and fifty-five\nsix hundred and fifty-six\nsix hundred and fifty-seven\nsix hundred and fifty-eight\nsix hundred and fifty-nine\nsix hundred and sixty\nsix hundred and sixty-one\nsix hundred and sixty-two\nsix hundred and sixty-three\nsix hundred and sixty-four\nsix hundred and sixty-five\nsix hundred and sixty-six\nsix hundred and sixty-seven\nsix hundred and sixty-eight\nsix hundred and sixty-nine\nsix hundred and seventy\nsix hundred and seventy-one\nsix hundred and seventy-two\nsix hundred and seventy-three\nsix hundred and seventy-four\nsix hundred and seventy-five\nsix hundred and seventy-six\nsix hundred and seventy-seven\nsix hundred and seventy-eight\nsix hundred and seventy-nine\nsix hundred and eighty\nsix hundred and eighty-one\nsix hundred and eighty-two\nsix hundred and eighty-three\nsix hundred and eighty-four\nsix hundred and eighty-five\nsix hundred and eighty-six\nsix hundred and eighty-seven\nsix hundred and eighty-eight\nsix hundred and eighty-nine\nsix hundred and ninety\nsix hundred and ninety-one\nsix hundred and ninety-two\nsix hundred and ninety-three\nsix hundred and ninety-four\nsix hundred and ninety-five\nsix hundred and ninety-six\nsix hundred and ninety-seven\nsix hundred and ninety-eight\nsix hundred and ninety-nine\nseven hundred\nseven hundred and one\nseven hundred and two\nseven hundred and three\nseven hundred and four\nseven hundred and five\nseven hundred and six\nseven hundred and seven\nseven hundred and eight\nseven hundred and nine\nseven hundred and ten\nseven hundred and eleven\nseven hundred and twelve\nseven hundred and thirteen\nseven hundred and fourteen\nseven hundred and fifteen\nseven hundred and sixteen\nseven hundred and seventeen\nseven hundred and eighteen\nseven hundred and nineteen\nseven hundred and twenty\nseven hundred and twenty-one\nseven hundred and twenty-two\nseven hundred and twenty-three\nseven hundred and twenty-four\nseven hundred and twenty-five\nseven hundred and twenty-six\nseven hundred and twenty-seven\nseven hundred and twenty-eight\nseven hundred and twenty-nine\nseven hundred and thirty\nseven hundred and thirty-one\nseven hundred and thirty-two\nseven hundred and thirty-three\nseven hundred and thirty-four\nseven hundred and thirty-five\nseven hundred and thirty-six\nseven hundred and thirty-seven\nseven hundred and thirty-eight\nseven hundred and thirty-nine\nseven hundred and forty\nseven hundred and forty-one\nseven hundred and forty-two\nseven hundred and forty-three\nseven hundred and forty-four\nseven hundred and forty-five\nseven hundred and forty-six\nseven hundred and forty-seven\nseven hundred and forty-eight\nseven hundred and forty-nine\nseven hundred and fifty\nseven hundred and fifty-one\nseven hundred and fifty-two\nseven hundred and fifty-three\nseven hundred and fifty-four\nseven hundred and fifty-five\nseven hundred and fifty-six\nseven hundred and fifty-seven\nseven hundred and fifty-eight\nseven hundred and fifty-nine\nseven hundred and sixty\nseven hundred and sixty-one\nseven hundred and sixty-two\nseven hundred and sixty-three\nseven hundred and sixty-four\nseven hundred and sixty-five\nseven hundred and sixty-six\nseven hundred and sixty-seven\nseven hundred and sixty-eight\nseven hundred and sixty-nine\nseven hundred and seventy\nseven hundred and seventy-one\nseven hundred and seventy-two\nseven hundred and seventy-three\nseven hundred and seventy-four\nseven hundred and seventy-five\nseven hundred and seventy-six\nseven hundred and seventy-seven\nseven hundred and seventy-eight\nseven hundred and seventy-nine\nseven hundred and eighty\nseven hundred and eighty-one\nseven hundred and eighty-two\nseven hundred and eighty-three\nseven hundred and eighty-four\nseven hundred and eighty-five\nseven hundred and eighty-six\nseven hundred and eighty-seven\nseven hundred and eighty-eight\nseven hundred and eighty-nine\nseven hundred and ninety\nseven hundred and ninety-one\nseven hundred and ninety-two\nseven hundred and ninety-three\nseven hundred and ninety-four\nseven hundred and ninety-five\nseven hundred and ninety-six\nseven hundred and ninety-seven\nseven hundred and ninety-eight\nseven hundred and ninety-nine\neight hundred\neight hundred and one\neight hundred and two\neight hundred and three\neight hundred and four\neight hundred and five\neight hundred and six\neight hundred and seven\neight hundred and eight\neight hundred and nine\neight hundred and ten\neight hundred and eleven\neight hundred and twelve\neight hundred and thirteen\neight hundred and fourteen\neight hundred and fifteen\neight hundred and sixteen\neight hundred and seventeen\neight hundred and eighteen\neight hundred and nineteen\neight hundred and twenty\neight hundred and twenty-one\neight hundred and twenty-two\neight hundred and twenty-three\neight hundred and twenty-four\neight hundred and twenty-five\neight hundred and twenty-six\neight hundred and twenty-seven\neight hundred and twenty-eight\neight hundred and twenty-nine\neight hundred and thirty\neight hundred and thirty-one\neight hundred and thirty-two\neight hundred and thirty-three\neight hundred and thirty-four\neight hundred and thirty-five\neight hundred and thirty-six\neight hundred and thirty-seven\neight hundred and thirty-eight\neight hundred and thirty-nine\neight hundred and forty\neight hundred and forty-one\neight hundred and forty-two\neight hundred and forty-three\neight hundred and forty-four\neight hundred and forty-five\neight hundred and forty-six\neight hundred and forty-seven\neight hundred and forty-eight\neight hundred and forty-nine\neight hundred and fifty\neight hundred and fifty-one\neight hundred and fifty-two\neight hundred and fifty-three\neight hundred and fifty-four\neight hundred and fifty-five\neight hundred and fifty-six\neight hundred and fifty-seven\neight hundred and fifty-eight\neight hundred and fifty-nine\neight hundred and sixty\neight hundred and sixty-one\neight hundred and sixty-two\neight hundred and sixty-three\neight hundred and sixty-four\neight hundred and sixty-five\neight hundred and sixty-six\neight hundred and sixty-seven\neight hundred and sixty-eight\neight hundred and sixty-nine\neight hundred and seventy\neight hundred and seventy-one\neight hundred and seventy-two\neight hundred and seventy-three\neight hundred and seventy-four\neight hundred and seventy-five\neight hundred and seventy-six\neight hundred and seventy-seven\neight hundred and seventy-eight\neight hundred and seventy-nine\neight hundred and eighty\neight hundred and eighty-one\neight hundred and eighty-two\neight hundred and eighty-three\neight hundred and eighty-four\neight hundred and eighty-five\neight hundred and eighty-six\neight hundred and eighty-seven\neight hundred and eighty-eight\neight hundred and eighty-nine\neight hundred and ninety\neight hundred and ninety-one\neight hundred and ninety-two\neight hundred and ninety-three\neight hundred and ninety-four\neight hundred and ninety-five\neight hundred and ninety-six\neight hundred and ninety-seven\neight hundred and ninety-eight\neight hundred and ninety-nine\nnine hundred\nnine hundred and one\nnine hundred and two\nnine hundred and three\nnine hundred and four\nnine hundred and five\nnine hundred and six\nnine hundred and seven\nnine hundred and eight\nnine hundred and nine\nnine hundred and ten\nnine hundred and eleven\nnine hundred and twelve\nnine hundred and thirteen\nnine hundred and fourteen\nnine hundred and fifteen\nnine hundred and sixteen\nnine hundred and seventeen\nnine hundred and eighteen\nnine hundred and nineteen\nnine hundred and twenty\nnine hundred and twenty-one\nnine hundred and twenty-two\nnine hundred and twenty-three\nnine hundred and twenty-four\nnine hundred and twenty-five\nnine hundred and twenty-six\nnine hundred and twenty-seven\nnine hundred and twenty-eight\nnine hundred and twenty-nine\nnine hundred and thirty\nnine hundred and thirty-one\nnine hundred and thirty-two\nnine hundred and thirty-three\nnine hundred and thirty-four\nnine hundred and thirty-five\nnine hundred and thirty-six\nnine hundred and thirty-seven\nnine hundred and thirty-eight\nnine hundred and thirty-nine\nnine hundred and forty\nnine hundred and forty-one\nnine hundred and forty-two\nnine hundred and forty-three\nnine hundred and forty-four\nnine hundred and forty-five\nnine hundred and forty-six\nnine hundred and forty-seven\nnine hundred and forty-eight\nnine hundred and forty-nine\nnine hundred and fifty\nnine hundred and fifty-one\nnine hundred and fifty-two\nnine hundred and fifty-three\nnine hundred and fifty-four\nnine hundred and fifty-five\nnine hundred and fifty-six\nnine hundred and fifty-seven\nnine hundred and fifty-eight\nnine hundred and fifty-nine\nnine hundred and sixty\nnine hundred and sixty-one\nnine hundred and sixty-two\nnine hundred and sixty-three\nnine hundred and sixty-four\nnine hundred and sixty-five\nnine hundred and sixty-six\nnine hundred and sixty-seven\nnine hundred and sixty-eight\nnine hundred and sixty-nine\nnine hundred and seventy\nnine hundred and seventy-one\nnine hundred and seventy-two\nnine hundred and seventy-three\nnine hundred and seventy-four\nnine hundred and seventy-five\nnine hundred and seventy-six\nnine hundred and seventy-seven\nnine hundred and seventy-eight\nnine hundred and seventy-nine\nnine hundred and eighty\nnine hundred and eighty-one\nnine hundred and eighty-two\nnine hundred and eighty-three\nnine hundred and eighty-four\nnine hundred and eighty-five\nnine hundred and eighty-six\nnine hundred and eighty-seven\nnine hundred and eighty-eight\nnine hundred and eighty-nine\nnine hundred and ninety\nnine hundred and ninety-one\nnine hundred and ninety-two\nnine hundred and ninety-three\nnine hundred and ninety-four\nnine hundred and ninety-five\nnine hundred and ninety-six\nnine hundred and ninety-seven\nnine hundred and ninety-eight\nnine hundred and ninety-nine', '\n and one\n and two\n and three\n and four\n and five\n and six\n and seven\n and eight\n and nine\n and ten\n and eleven\n and twelve\n and thirteen\n and fourteen\n and fifteen\n and sixteen\n and seventeen\n and eighteen\n and nineteen\n and twenty\n and twenty-one\n and twenty-two\n and twenty-three\n and twenty-four\n and twenty-five\n and twenty-six\n and twenty-seven\n and twenty-eight\n and twenty-nine\n and thirty\n and thirty-one\n and thirty-two\n and thirty-three\n and thirty-four\n and thirty-five\n and thirty-six\n and thirty-seven\n and thirty-eight\n and thirty-nine\n and forty\n and forty-one\n and forty-two\n and forty-three\n and forty-four\n and forty-five\n and forty-six\n and forty-seven\n and forty-eight\n and forty-nine\n and fifty\n and fifty-one\n and fifty-two\n and fifty-three\n and fifty-four\n and fifty-five\n and fifty-six\n and fifty-seven\n and fifty-eight\n and fifty-nine\n and sixty\n and sixty-one\n and sixty-two\n and sixty-three\n and sixty-four\n and sixty-five\n and sixty-six\n and sixty-seven\n and sixty-eight\n and sixty-nine\n and seventy\n and seventy-one\n and seventy-two\n and seventy-three\n and seventy-four\n and seventy-five\n and seventy-six\n and seventy-seven\n and seventy-eight\n and seventy-nine\n and eighty\n and eighty-one\n and eighty-two\n and eighty-three\n and eighty-four\n and eighty-five\n and eighty-six\n and eighty-seven\n and eighty-eight\n and eighty-nine\n and ninety\n and ninety-one\n and ninety-two\n and ninety-three\n and ninety-four\n and ninety-five\n and ninety-six\n and ninety-seven\n and ninety-eight\n and ninety-nine\n, one hundred\n, one hundred and one\n, one hundred and two\n, one hundred and three\n, one hundred and four\n, one hundred and five\n, one hundred and six\n, one hundred and seven\n, one hundred and eight\n, one hundred and nine\n, one hundred and ten\n, one hundred and eleven\n, one hundred and twelve\n, one hundred and thirteen\n, one hundred and fourteen\n, one hundred and fifteen\n, one hundred and sixteen\n, one hundred and seventeen\n, one hundred and eighteen\n, one hundred and nineteen\n, one hundred and twenty\n, one hundred and twenty-one\n, one hundred and twenty-two\n, one hundred and twenty-three\n, one hundred and twenty-four\n, one hundred and twenty-five\n, one hundred and twenty-six\n, one hundred and twenty-seven\n, one hundred and twenty-eight\n, one hundred and twenty-nine\n, one hundred and thirty\n, one hundred and thirty-one\n, one hundred and thirty-two\n, one hundred and thirty-three\n, one hundred and thirty-four\n, one hundred and thirty-five\n, one hundred and thirty-six\n, one hundred and thirty-seven\n, one hundred and thirty-eight\n, one hundred and thirty-nine\n, one hundred and forty\n, one hundred and forty-one\n, one hundred and forty-two\n, one hundred and forty-three\n, one hundred and forty-four\n, one hundred and forty-five\n, one hundred and forty-six\n, one hundred and forty-seven\n, one hundred and forty-eight\n, one hundred and forty-nine\n, one hundred and fifty\n, one hundred and fifty-one\n, one hundred and fifty-two\n, one hundred and fifty-three\n, one hundred and fifty-four\n, one hundred and fifty-five\n, one hundred and fifty-six\n, one hundred and fifty-seven\n, one hundred and fifty-eight\n, one hundred and fifty-nine\n, one hundred and sixty\n, one hundred and sixty-one\n, one hundred and sixty-two\n, one hundred and sixty-three\n, one hundred and sixty-four\n, one hundred and sixty-five\n, one hundred and sixty-six\n, one hundred and sixty-seven\n, one hundred and sixty-eight\n, one hundred and sixty-nine\n, one hundred and seventy\n, one hundred and seventy-one\n, one hundred and seventy-two\n, one hundred and seventy-three\n, one hundred and seventy-four\n, one hundred and seventy-five\n, one hundred and seventy-six\n, one hundred and seventy-seven\n, one hundred and seventy-eight\n, one hundred and seventy-nine\n, one hundred and eighty\n, one hundred and eighty-one\n, one hundred and eighty-two\n, one hundred and eighty-three\n, one hundred and eighty-four\n, one hundred and eighty-five\n, one hundred and eighty-six\n, one hundred and eighty-seven\n, one hundred and eighty-eight\n, one hundred and eighty-nine\n, one hundred and ninety\n, one hundred and ninety-one\n, one hundred and ninety-two\n, one hundred and ninety-three\n, one hundred and ninety-four\n, one hundred and ninety-five\n, one hundred and ninety-six\n, one hundred and ninety-seven\n, one hundred and ninety-eight\n, one hundred and ninety-nine\n, two hundred\n, two hundred and one\n, two hundred and two\n, two hundred and three\n, two hundred and four\n, two hundred and five\n, two hundred and six\n, two hundred and seven\n, two hundred and eight\n, two hundred and nine\n, two hundred and ten\n, two hundred and eleven\n, two hundred and twelve\n, two hundred and thirteen\n, two hundred and fourteen\n, two hundred and fifteen\n, two hundred and sixteen\n, two hundred and seventeen\n, two hundred and eighteen\n, two hundred and nineteen\n, two hundred and twenty\n, two hundred and twenty-one\n, two hundred and twenty-two\n, two hundred and twenty-three\n, two hundred and twenty-four\n, two hundred and twenty-five\n, two hundred and twenty-six\n, two hundred and twenty-seven\n, two hundred and twenty-eight\n, two hundred and twenty-nine\n, two hundred and thirty\n, two hundred and thirty-one\n, two hundred and thirty-two\n, two hundred and thirty-three\n, two hundred and thirty-four\n, two hundred and thirty-five\n, two hundred and thirty-six\n, two hundred and thirty-seven\n, two hundred and thirty-eight\n, two hundred and thirty-nine\n, two hundred and forty\n, two hundred and forty-one\n, two hundred and forty-two\n, two hundred and forty-three\n, two hundred and forty-four\n, two hundred and forty-five\n, two hundred and forty-six\n, two hundred and forty-seven\n, two hundred and forty-eight\n, two hundred and forty-nine\n, two hundred and fifty\n, two hundred and fifty-one\n, two hundred and fifty-two\n, two hundred and fifty-three\n, two hundred and fifty-four\n, two hundred and fifty-five\n, two hundred and fifty-six\n, two hundred and fifty-seven\n, two hundred and fifty-eight\n, two hundred and fifty-nine\n, two hundred and sixty\n, two hundred and sixty-one\n, two hundred and sixty-two\n, two hundred and sixty-three\n, two hundred and sixty-four\n, two hundred and sixty-five\n, two hundred and sixty-six\n, two hundred and sixty-seven\n, two hundred and sixty-eight\n, two hundred and sixty-nine\n, two hundred and seventy\n, two hundred and seventy-one\n, two hundred and seventy-two\n, two hundred and seventy-three\n, two hundred and seventy-four\n, two hundred and seventy-five\n, two hundred and seventy-six\n, two hundred and seventy-seven\n, two hundred and seventy-eight\n, two hundred and seventy-nine\n, two hundred and eighty\n, two hundred and eighty-one\n, two hundred and eighty-two\n, two hundred and eighty-three\n, two hundred and eighty-four\n, two hundred and eighty-five\n, two hundred and eighty-six\n, two hundred and eighty-seven\n, two hundred and eighty-eight\n, two hundred and eighty-nine\n, two hundred and ninety\n, two hundred and ninety-one\n, two hundred and ninety-two\n, two hundred and ninety-three\n, two hundred and ninety-four\n, two hundred and ninety-five\n, two hundred and ninety-six\n, two hundred and ninety-seven\n, two hundred and ninety-eight\n, two hundred and ninety-nine\n, three hundred\n, three hundred and one\n, three hundred and two\n, three hundred and three\n, three hundred and four\n, three hundred and five\n, three hundred and six\n, three hundred and seven\n, three hundred and eight\n, three hundred and nine\n, three hundred and ten\n, three hundred and eleven\n, three hundred and twelve\n, three hundred and thirteen\n, three hundred and fourteen\n, three hundred and fifteen\n, three hundred and sixteen\n, three hundred and seventeen\n, three hundred and eighteen\n, three hundred and nineteen\n, three hundred and twenty\n, three hundred and twenty-one\n, three hundred and twenty-two\n, three hundred and twenty-three\n, three hundred and twenty-four\n, three hundred and twenty-five\n, three hundred and twenty-six\n, three hundred and twenty-seven\n, three hundred and twenty-eight\n, three hundred and twenty-nine\n, three hundred and thirty\n, three hundred and thirty-one\n, three hundred and thirty-two\n, three hundred and thirty-three\n, three hundred and thirty-four\n, three hundred and thirty-five\n, three hundred and thirty-six\n, three hundred and thirty-seven\n, three hundred and thirty-eight\n, three hundred and thirty-nine\n, three hundred and forty\n, three hundred and forty-one\n, three hundred and forty-two\n, three hundred and forty-three\n, three hundred and forty-four\n, three hundred and forty-five\n, three hundred and forty-six\n, three hundred and forty-seven\n, three hundred and forty-eight\n, three hundred and forty-nine\n, three hundred and fifty\n, three hundred and fifty-one\n, three hundred and fifty-two\n, three hundred and fifty-three\n, three hundred and fifty-four\n, three hundred and fifty-five\n, three hundred and fifty-six\n, three hundred and fifty-seven\n, three hundred and fifty-eight\n, three hundred and fifty-nine\n, three hundred and sixty\n, three hundred and sixty-one\n, three hundred and sixty-two\n, three hundred and sixty-three\n, three hundred and sixty-four\n, three hundred and sixty-five\n, three hundred and sixty-six\n, three hundred and sixty-seven\n, three hundred and sixty-eight\n, three hundred and sixty-nine\n, three hundred and seventy\n, three hundred and seventy-one\n, three hundred and seventy-two\n, three hundred and seventy-three\n, three hundred and seventy-four\n, three hundred and seventy-five\n, three hundred and seventy-six\n, three hundred and seventy-seven\n, three hundred and seventy-eight\n, three hundred and seventy-nine\n, three hundred and eighty\n, three hundred and eighty-one\n, three hundred and eighty-two\n, three hundred and eighty-three\n, three hundred and eighty-four\n, three hundred and eighty-five\n, three hundred and eighty-six\n, three hundred and eighty-seven\n, three hundred and eighty-eight\n, three hundred and eighty-nine\n, three hundred and ninety\n, three hundred and ninety-one\n, three hundred and ninety-two\n, three hundred and ninety-three\n, three hundred and ninety-four\n, three hundred and ninety-five\n, three hundred and ninety-six\n, three hundred and ninety-seven\n, three hundred and ninety-eight\n, three hundred and ninety-nine\n, four hundred\n, four hundred and one\n, four hundred and two\n, four hundred and three\n, four hundred and four\n, four hundred and five\n, four hundred and six\n, four hundred and seven\n, four hundred and eight\n, four hundred and nine\n, four hundred and ten\n, four hundred and eleven\n, four hundred and twelve\n, four hundred and thirteen\n, four hundred and fourteen\n, four hundred and fifteen\n, four hundred and sixteen\n, four hundred and seventeen\n, four hundred and eighteen\n, four hundred and nineteen\n, four hundred and twenty\n, four hundred and twenty-one\n, four hundred and twenty-two\n, four hundred and twenty-three\n, four hundred and twenty-four\n, four hundred and twenty-five\n, four hundred and twenty-six\n, four hundred and twenty-seven\n, four hundred and twenty-eight\n, four hundred and twenty-nine\n, four hundred and thirty\n, four hundred and thirty-one\n, four hundred and thirty-two\n, four hundred and thirty-three\n, four hundred and thirty-four\n, four hundred and thirty-five\n, four hundred and thirty-six\n, four hundred and thirty-seven\n, four hundred and thirty-eight\n, four hundred and thirty-nine\n, four hundred and forty\n, four hundred and forty-one\n, four hundred and forty-two\n, four hundred and forty-three\n, four hundred and forty-four\n, four hundred and forty-five\n, four hundred and forty-six\n, four hundred and forty-seven\n, four hundred and forty-eight\n, four hundred and forty-nine\n, four hundred and fifty\n, four hundred and fifty-one\n, four hundred and fifty-two\n, four hundred and fifty-three\n, four hundred and fifty-four\n, four hundred and fifty-five\n, four hundred and fifty-six\n, four hundred and fifty-seven\n, four hundred and fifty-eight\n, four hundred and fifty-nine\n, four hundred and sixty\n, four hundred and sixty-one\n, four hundred and sixty-two\n, four hundred and sixty-three\n, four hundred and sixty-four\n, four hundred and sixty-five\n, four hundred and sixty-six\n, four hundred and sixty-seven\n, four hundred and sixty-eight\n, four hundred and sixty-nine\n, four hundred and seventy\n, four hundred and seventy-one\n, four hundred and seventy-two\n, four hundred and seventy-three\n, four hundred and seventy-four\n, four hundred and seventy-five\n, four hundred and seventy-six\n, four hundred and seventy-seven\n, four hundred and seventy-eight\n, four hundred and seventy-nine\n, four hundred and eighty\n, four hundred and eighty-one\n, four hundred and eighty-two\n, four hundred and eighty-three\n, four hundred and eighty-four\n, four hundred and eighty-five\n, four hundred and eighty-six\n, four hundred and eighty-seven\n, four hundred and eighty-eight\n, four hundred and eighty-nine\n, four hundred and ninety\n, four hundred and ninety-one\n, four hundred and ninety-two\n, four hundred and ninety-three\n, four hundred and ninety-four\n, four hundred and ninety-five\n, four hundred and ninety-six\n, four hundred and ninety-seven\n, four hundred and ninety-eight\n, four hundred and ninety-nine\n, five hundred\n, five hundred and one\n, five hundred and two\n, five hundred and three\n, five hundred and four\n, five hundred and five\n, five hundred and six\n, five hundred and seven\n, five hundred and eight\n, five hundred and nine\n, five hundred and ten\n, five hundred and eleven\n, five hundred and twelve\n, five hundred and thirteen\n, five hundred and fourteen\n, five hundred and fifteen\n, five hundred and sixteen\n, five hundred and seventeen\n, five hundred and eighteen\n, five hundred and nineteen\n, five hundred and twenty\n, five hundred and twenty-one\n, five hundred and twenty-two\n, five hundred and twenty-three\n, five hundred and twenty-four\n, five hundred and twenty-five\n, five hundred and twenty-six\n, five hundred and twenty-seven\n, five hundred and twenty-eight\n, five hundred and twenty-nine\n, five hundred and thirty\n, five hundred and thirty-one\n, five hundred and thirty-two\n, five hundred and thirty-three\n, five hundred and thirty-four\n, five hundred and thirty-five\n, five hundred and thirty-six\n, five hundred and thirty-seven\n, five hundred and thirty-eight\n, five hundred and thirty-nine\n, five hundred and forty\n, five hundred and forty-one\n, five hundred and forty-two\n, five hundred and forty-three\n, five hundred and forty-four\n, five hundred and forty-five\n, five hundred and forty-six\n, five hundred and forty-seven\n, five hundred and forty-eight\n, five hundred and forty-nine\n, five hundred and fifty\n, five hundred and fifty-one\n, five hundred and fifty-two\n, five hundred and fifty-three\n, five hundred and fifty-four\n, five hundred and fifty-five\n, five hundred and fifty-six\n, five hundred and fifty-seven\n, five hundred and fifty-eight\n, five hundred and fifty-nine\n, five hundred and sixty\n, five hundred and sixty-one\n, five hundred and sixty-two\n, five hundred and sixty-three\n, five hundred and sixty-four\n, five hundred and sixty-five\n, five hundred and sixty-six\n, five hundred and sixty-seven\n, five hundred and sixty-eight\n, five hundred and sixty-nine\n, five hundred and seventy\n, five hundred and seventy-one\n, five hundred and seventy-two\n, five hundred and seventy-three\n, five hundred and seventy-four\n, five hundred and seventy-five\n, five hundred and seventy-six\n, five hundred and seventy-seven\n, five hundred and seventy-eight\n, five hundred and seventy-nine\n, five hundred and eighty\n, five hundred and eighty-one\n, five hundred and eighty-two\n, five hundred and eighty-three\n, five hundred and eighty-four\n, five hundred and eighty-five\n, five hundred and eighty-six\n, five hundred and eighty-seven\n, five hundred and eighty-eight\n, five hundred and eighty-nine\n, five hundred and ninety\n, five hundred and ninety-one\n, five hundred and ninety-two\n, five hundred and ninety-three\n, five hundred and ninety-four\n, five hundred and ninety-five\n, five hundred and ninety-six\n, five hundred and ninety-seven\n, five hundred and ninety-eight\n, five hundred and ninety-nine\n, six hundred\n, six hundred and one\n, six hundred and two\n, six hundred and three\n, six hundred and four\n, six hundred and five\n, six hundred and six\n, six hundred and seven\n, six hundred and eight\n, six hundred and nine\n, six hundred and ten\n, six hundred and eleven\n, six hundred and twelve\n, six hundred and thirteen\n, six hundred and fourteen\n, six hundred and fifteen\n, six hundred and sixteen\n, six hundred and seventeen\n, six hundred and eighteen\n, six hundred and nineteen\n, six hundred and twenty\n, six hundred and twenty-one\n, six hundred and twenty-two\n, six hundred and twenty-three\n, six hundred and twenty-four\n, six hundred and twenty-five\n, six hundred and twenty-six\n, six hundred and twenty-seven\n, six hundred and twenty-eight\n, six hundred and twenty-nine\n, six hundred and thirty\n, six hundred and thirty-one\n, six hundred and thirty-two\n, six hundred and thirty-three\n, six hundred and thirty-four\n, six hundred and thirty-five\n, six hundred and thirty-six\n, six hundred and thirty-seven\n, six hundred and thirty-eight\n, six hundred and thirty-nine\n, six hundred and forty\n, six hundred and forty-one\n, six hundred and forty-two\n, six hundred and forty-three\n, six hundred and forty-four\n, six hundred and forty-five\n, six hundred and forty-six\n, six hundred and forty-seven\n, six hundred and forty-eight\n, six hundred and forty-nine\n, six hundred and fifty\n, six hundred and fifty-one\n, six hundred and fifty-two\n, six hundred and fifty-three\n, six hundred and fifty-four\n, six hundred and fifty-five\n, six hundred and fifty-six\n, six hundred and fifty-seven\n, six hundred and fifty-eight\n, six hundred and fifty-nine\n, six hundred and sixty\n, six hundred and sixty-one\n, six hundred and sixty-two\n, six hundred and sixty-three\n, six hundred and sixty-four\n, six hundred and sixty-five\n, six hundred and sixty-six\n, six hundred and sixty-seven\n, six hundred and sixty-eight\n, six hundred and sixty-nine\n, six hundred and seventy\n, six hundred and seventy-one\n, six hundred and seventy-two\n, six hundred and seventy-three\n, six hundred and seventy-four\n, six hundred and seventy-five\n, six hundred and seventy-six\n, six hundred and seventy-seven\n, six hundred and seventy-eight\n, six hundred and seventy-nine\n, six hundred and eighty\n, six hundred and eighty-one\n, six hundred and eighty-two\n, six hundred and eighty-three\n, six hundred and eighty-four\n, six hundred and eighty-five\n, six hundred and eighty-six\n, six hundred and eighty-seven\n, six hundred and eighty-eight\n, six hundred and eighty-nine\n, six hundred and ninety\n, six hundred and ninety-one\n, six hundred and ninety-two\n, six hundred and ninety-three\n, six hundred and ninety-four\n, six hundred and ninety-five\n, six hundred and ninety-six\n, six hundred and ninety-seven\n, six hundred and ninety-eight\n, six hundred and ninety-nine\n, seven hundred\n, seven hundred and one\n, seven hundred and two\n, seven hundred and three\n, seven hundred and four\n, seven hundred and five\n, seven hundred and six\n, seven hundred and seven\n, seven hundred and eight\n, seven hundred and nine\n, seven hundred and ten\n, seven hundred and eleven\n, seven hundred and twelve\n, seven hundred and thirteen\n, seven hundred and fourteen\n, seven hundred and fifteen\n, seven hundred and sixteen\n, seven hundred and seventeen\n, seven hundred and eighteen\n, seven hundred and nineteen\n, seven hundred and twenty\n, seven hundred and twenty-one\n, seven hundred and twenty-two\n, seven hundred and twenty-three\n, seven hundred and twenty-four\n, seven hundred and twenty-five\n, seven hundred and twenty-six\n, seven hundred and twenty-seven\n, seven hundred and twenty-eight\n, seven hundred and twenty-nine\n, seven hundred and thirty\n, seven hundred and thirty-one\n, seven hundred and thirty-two\n, seven hundred and thirty-three\n, seven hundred and thirty-four\n, seven hundred and thirty-five\n, seven hundred and thirty-six\n, seven hundred and thirty-seven\n, seven hundred and thirty-eight\n, seven hundred and thirty-nine\n, seven hundred and forty\n, seven hundred and forty-one\n, seven hundred and forty-two\n, seven hundred and forty-three\n, seven hundred and forty-four\n, seven hundred and forty-five\n, seven hundred and forty-six\n, seven hundred and forty-seven\n, seven hundred and forty-eight\n, seven hundred and forty-nine\n, seven hundred and fifty\n, seven hundred and fifty-one\n, seven hundred and fifty-two\n, seven hundred and fifty-three\n, seven hundred and fifty-four\n, seven hundred and fifty-five\n, seven hundred and fifty-six\n, seven hundred and fifty-seven\n, seven hundred and fifty-eight\n, seven hundred and fifty-nine\n, seven hundred and sixty\n, seven hundred and sixty-one\n, seven hundred and sixty-two\n, seven hundred and sixty-three\n, seven hundred and sixty-four\n, seven hundred and sixty-five\n, seven hundred and sixty-six\n, seven hundred and sixty-seven\n, seven hundred and sixty-eight\n, seven hundred and sixty-nine\n, seven hundred and seventy\n, seven hundred and seventy-one\n, seven hundred and seventy-two\n, seven hundred and seventy-three\n, seven hundred and seventy-four\n, seven hundred and seventy-five\n, seven hundred and seventy-six\n, seven hundred and seventy-seven\n, seven hundred and seventy-eight\n, seven hundred and seventy-nine\n, seven hundred and eighty\n, seven hundred and eighty-one\n, seven hundred and eighty-two\n, seven hundred and eighty-three\n, seven hundred and eighty-four\n, seven hundred and eighty-five\n, seven hundred and eighty-six\n, seven hundred and eighty-seven\n, seven hundred and eighty-eight\n, seven hundred and eighty-nine\n, seven hundred and ninety\n, seven hundred and ninety-one\n, seven hundred and ninety-two\n, seven hundred and ninety-three\n, seven hundred and ninety-four\n, seven hundred and ninety-five\n, seven hundred and ninety-six\n, seven hundred and ninety-seven\n, seven hundred and ninety-eight\n, seven hundred and ninety-nine\n, eight hundred\n, eight hundred and one\n, eight hundred and two\n, eight hundred and three\n, eight hundred and four\n, eight hundred and five\n, eight hundred and six\n, eight hundred and seven\n, eight hundred and eight\n, eight hundred and nine\n, eight hundred and ten\n, eight hundred and eleven\n, eight hundred and twelve\n, eight hundred and thirteen\n, eight hundred and fourteen\n, eight hundred and fifteen\n, eight hundred and sixteen\n, eight hundred and seventeen\n, eight hundred and eighteen\n, eight hundred and nineteen\n, eight hundred and twenty\n, eight hundred and twenty-one\n, eight hundred and twenty-two\n, eight hundred and twenty-three\n, eight hundred and twenty-four\n, eight hundred and twenty-five\n, eight hundred and twenty-six\n, eight hundred and twenty-seven\n, eight hundred and twenty-eight\n, eight hundred and twenty-nine\n, eight hundred and thirty\n, eight hundred and thirty-one\n, eight hundred and thirty-two\n, eight hundred and thirty-three\n, eight hundred and thirty-four\n, eight hundred and thirty-five\n, eight hundred and thirty-six\n, eight hundred and thirty-seven\n, eight hundred and thirty-eight\n, eight hundred and thirty-nine\n, eight hundred and forty\n, eight hundred and forty-one\n, eight hundred and forty-two\n, eight hundred and forty-three\n, eight hundred and forty-four\n, eight hundred and forty-five\n, eight hundred and forty-six\n, eight hundred and forty-seven\n, eight hundred and forty-eight\n, eight hundred and forty-nine\n, eight hundred and fifty\n, eight hundred and fifty-one\n, eight hundred and fifty-two\n, eight hundred and fifty-three\n, eight hundred and fifty-four\n, eight hundred and fifty-five\n, eight hundred and fifty-six\n, eight hundred and fifty-seven\n, eight hundred and fifty-eight\n, eight hundred and fifty-nine\n, eight hundred and sixty\n, eight hundred and sixty-one\n, eight hundred and sixty-two\n, eight hundred and sixty-three\n, eight hundred and sixty-four\n, eight hundred and sixty-five\n, eight hundred and sixty-six\n, eight hundred and sixty-seven\n, eight hundred and sixty-eight\n, eight hundred and sixty-nine\n, eight hundred and seventy\n, eight hundred and seventy-one\n, eight hundred and seventy-two\n, eight hundred and seventy-three\n, eight hundred and seventy-four\n, eight hundred and seventy-five\n, eight hundred and seventy-six\n, eight hundred and seventy-seven\n, eight hundred and seventy-eight\n, eight hundred and seventy-nine\n, eight hundred and eighty\n, eight hundred and eighty-one\n, eight hundred and eighty-two\n, eight hundred and eighty-three\n, eight hundred and eighty-four\n, eight hundred and eighty-five\n, eight hundred and eighty-six\n, eight hundred and eighty-seven\n, eight hundred and eighty-eight\n, eight hundred and eighty-nine\n, eight hundred and ninety\n, eight hundred and ninety-one\n, eight hundred and ninety-two\n, eight hundred and ninety-three\n, eight hundred and ninety-four\n, eight hundred and ninety-five\n, eight hundred and ninety-six\n, eight hundred and ninety-seven\n, eight hundred and ninety-eight\n, eight hundred and ninety-nine\n, nine hundred\n, nine hundred and one\n, nine hundred and two\n, nine hundred and three\n, nine hundred and four\n, nine hundred and five\n, nine hundred and six\n, nine hundred and seven\n, nine hundred and eight\n, nine hundred and nine\n, nine hundred and ten\n, nine hundred and eleven\n, nine hundred and twelve\n, nine hundred and thirteen\n, nine hundred and fourteen\n, nine hundred and fifteen\n, nine hundred and sixteen\n, nine hundred and seventeen\n, nine hundred and eighteen\n, nine hundred and nineteen\n, nine hundred and twenty\n, nine hundred and twenty-one\n, nine hundred and twenty-two\n, nine hundred and twenty-three\n, nine hundred and twenty-four\n, nine hundred and twenty-five\n, nine hundred and twenty-six\n, nine hundred and twenty-seven\n, nine hundred and twenty-eight\n, nine hundred and twenty-nine\n, nine hundred and thirty\n, nine hundred and thirty-one\n, nine hundred and thirty-two\n, nine hundred and thirty-three\n, nine hundred and thirty-four\n, nine hundred and thirty-five\n, nine hundred and thirty-six\n, nine hundred and thirty-seven\n, nine hundred and thirty-eight\n, nine hundred and thirty-nine\n, nine hundred and forty\n, nine hundred and forty-one\n, nine hundred and forty-two\n, nine hundred and forty-three\n, nine hundred and forty-four\n, nine hundred and forty-five\n, nine hundred and forty-six\n, nine hundred and forty-seven\n, nine hundred and forty-eight\n, nine hundred and forty-nine\n, nine hundred and fifty\n, nine hundred and fifty-one\n, nine hundred and fifty-two\n, nine hundred and fifty-three\n, nine hundred and fifty-four\n, nine hundred and fifty-five\n, nine hundred and fifty-six\n, nine hundred and fifty-seven\n, nine hundred and fifty-eight\n, nine hundred and fifty-nine\n, nine hundred and sixty\n, nine hundred and sixty-one\n, nine hundred and sixty-two\n, nine hundred and sixty-three\n, nine hundred and sixty-four\n, nine hundred and sixty-five\n, nine hundred and sixty-six\n, nine hundred and sixty-seven\n, nine hundred and sixty-eight\n, nine hundred and sixty-nine\n, nine hundred and seventy\n, nine hundred and seventy-one\n, nine hundred and seventy-two\n, nine hundred and seventy-three\n, nine hundred and seventy-four\n, nine hundred and seventy-five\n, nine hundred and seventy-six\n, nine hundred and seventy-seven\n, nine hundred and seventy-eight\n, nine hundred and seventy-nine\n, nine hundred and eighty\n, nine hundred and eighty-one\n, nine hundred and eighty-two\n, nine hundred and eighty-three\n, nine hundred and eighty-four\n, nine hundred and eighty-five\n, nine hundred and eighty-six\n, nine hundred and eighty-seven\n, nine hundred and eighty-eight\n, nine hundred and eighty-nine\n, nine hundred and ninety\n, nine hundred and ninety-one\n, nine hundred and ninety-two\n, nine hundred and ninety-three\n, nine hundred and ninety-four\n, nine hundred and ninety-five\n, nine hundred and ninety-six\n, nine hundred and ninety-seven\n, nine hundred and ninety-eight\n, nine hundred and ninety-nine', '\n, and one\n, and two\n, and three\n, and four\n, and five\n, and six\n, and seven\n, and eight\n, and nine\n, and ten\n, and eleven\n, and twelve\n, and thirteen\n, and fourteen\n, and fifteen\n, and sixteen\n, and seventeen\n, and eighteen\n, and nineteen\n, and twenty\n, and twenty-one\n, and twenty-two\n, and twenty-three\n, and twenty-four\n, and twenty-five\n, and twenty-six\n, and twenty-seven\n, and twenty-eight\n, and twenty-nine\n, and thirty\n, and thirty-one\n, and thirty-two\n, and thirty-three\n, and thirty-four\n, and thirty-five\n, and thirty-six\n, and thirty-seven\n, and thirty-eight\n, and thirty-nine\n, and forty\n, and forty-one\n, and forty-two\n, and forty-three\n, and forty-four\n, and forty-five\n, and forty-six\n, and forty-seven\n, and forty-eight\n, and forty-nine\n, and fifty\n, and fifty-one\n, and fifty-two\n, and fifty-three\n, and fifty-four\n, and fifty-five\n, and fifty-six\n, and fifty-seven\n, and fifty-eight\n, and fifty-nine\n, and sixty\n, and sixty-one\n, and sixty-two\n, and sixty-three\n, and sixty-four\n, and sixty-five\n, and sixty-six\n, and sixty-seven\n, and sixty-eight\n, and sixty-nine\n, and seventy\n, and seventy-one\n, and seventy-two\n, and seventy-three\n, and seventy-four\n, and seventy-five\n, and seventy-six\n, and seventy-seven\n, and seventy-eight\n, and seventy-nine\n, and eighty\n, and eighty-one\n, and eighty-two\n, and eighty-three\n, and eighty-four\n, and eighty-five\n, and eighty-six\n, and eighty-seven\n, and eighty-eight\n, and eighty-nine\n, and ninety\n, and ninety-one\n, and ninety-two\n, and ninety-three\n, and ninety-four\n, and ninety-five\n, and ninety-six\n, and ninety-seven\n, and ninety-eight\n, and ninety-nine\n, one hundred\n, one hundred and one\n, one hundred and two\n, one hundred and three\n, one hundred and four\n, one hundred and five\n, one hundred and six\n, one hundred and seven\n, one hundred and eight\n, one hundred and nine\n, one hundred and ten\n, one hundred and eleven\n, one hundred and twelve\n, one hundred and thirteen\n, one hundred and fourteen\n, one hundred and fifteen\n, one hundred and sixteen\n, one hundred and seventeen\n, one hundred and eighteen\n, one hundred and nineteen\n, one hundred and twenty\n, one hundred and twenty-one\n, one hundred and twenty-two\n, one hundred and twenty-three\n, one hundred and twenty-four\n, one hundred and twenty-five\n, one hundred and twenty-six\n, one hundred and twenty-seven\n, one hundred and twenty-eight\n, one hundred and twenty-nine\n, one hundred and thirty\n, one hundred and thirty-one\n, one hundred and thirty-two\n, one hundred and thirty-three\n, one hundred and thirty-four\n, one hundred and thirty-five\n, one hundred and thirty-six\n, one hundred and thirty-seven\n, one hundred and thirty-eight\n, one hundred and thirty-nine\n, one hundred and forty\n, one hundred and forty-one\n, one hundred and forty-two\n, one hundred and forty-three\n, one hundred and forty-four\n, one hundred and forty-five\n, one hundred and forty-six\n, one hundred and forty-seven\n, one hundred and forty-eight\n, one hundred and forty-nine\n, one hundred and fifty\n, one hundred and fifty-one\n, one hundred and fifty-two\n, one hundred and fifty-three\n, one hundred and fifty-four\n, one hundred and fifty-five\n, one hundred and fifty-six\n, one hundred and fifty-seven\n, one hundred and fifty-eight\n, one hundred and fifty-nine\n, one hundred and sixty\n, one hundred and sixty-one\n, one hundred and sixty-two\n, one hundred and sixty-three\n, one hundred and sixty-four\n, one hundred and sixty-five\n, one hundred and sixty-six\n, one hundred and sixty-seven\n, one hundred and sixty-eight\n, one hundred and sixty-nine\n, one hundred and seventy\n, one hundred and seventy-one\n, one hundred and seventy-two\n, one hundred and seventy-three\n, one hundred and seventy-four\n, one hundred and seventy-five\n, one hundred and seventy-six\n, one hundred and seventy-seven\n, one hundred and seventy-eight\n, one hundred and seventy-nine\n, one hundred and eighty\n, one hundred and eighty-one\n, one hundred and eighty-two\n, one hundred and eighty-three\n, one hundred and eighty-four\n, one hundred and eighty-five\n, one hundred and eighty-six\n, one hundred and eighty-seven\n, one hundred and eighty-eight\n, one hundred and eighty-nine\n, one hundred and ninety\n, one hundred and ninety-one\n, one hundred and ninety-two\n, one hundred and ninety-three\n, one hundred and ninety-four\n, one hundred and ninety-five\n, one hundred and ninety-six\n, one hundred and ninety-seven\n, one hundred and ninety-eight\n, one hundred and ninety-nine\n, two hundred\n, two hundred and one\n, two hundred and two\n, two hundred and three\n, two hundred and four\n, two hundred and five\n, two hundred and six\n, two hundred and seven\n, two hundred and eight\n, two hundred and nine\n, two hundred and ten\n, two hundred and eleven\n, two hundred and twelve\n, two hundred and thirteen\n, two hundred and fourteen\n, two hundred and fifteen\n, two hundred and sixteen\n, two hundred and seventeen\n, two hundred and eighteen\n, two hundred and nineteen\n, two hundred and twenty\n, two hundred and twenty-one\n, two hundred and twenty-two\n, two hundred and twenty-three\n, two hundred and twenty-four\n, two hundred and twenty-five\n, two hundred and twenty-six\n, two hundred and twenty-seven\n, two hundred and twenty-eight\n, two hundred and twenty-nine\n, two hundred and thirty\n, two hundred and thirty-one\n, two hundred and thirty-two\n, two hundred and thirty-three\n, two hundred and thirty-four\n, two hundred and thirty-five\n, two hundred and thirty-six\n, two hundred and thirty-seven\n, two hundred and thirty-eight\n, two hundred and thirty-nine\n, two hundred and forty\n, two hundred and forty-one\n, two hundred and forty-two\n, two hundred and forty-three\n, two hundred and forty-four\n, two hundred and forty-five\n, two hundred and forty-six\n, two hundred and forty-seven\n, two hundred and forty-eight\n, two hundred and forty-nine\n, two hundred and fifty\n, two hundred and fifty-one\n, two hundred and fifty-two\n, two hundred and fifty-three\n, two hundred and fifty-four\n, two hundred and fifty-five\n, two hundred and fifty-six\n, two hundred and fifty-seven\n, two hundred and fifty-eight\n, two hundred and fifty-nine\n, two hundred and sixty\n, two hundred and sixty-one\n, two hundred and sixty-two\n, two hundred and sixty-three\n, two hundred and sixty-four\n, two hundred and sixty-five\n, two hundred and sixty-six\n, two hundred and sixty-seven\n, two hundred and sixty-eight\n, two hundred and sixty-nine\n, two hundred and seventy\n, two hundred and seventy-one\n, two hundred and seventy-two\n, two hundred and seventy-three\n, two hundred and seventy-four\n, two hundred and seventy-five\n, two hundred and seventy-six\n, two hundred and seventy-seven\n, two hundred and seventy-eight\n, two hundred and seventy-nine\n, two hundred and eighty\n, two hundred and eighty-one\n, two hundred and eighty-two\n, two hundred and eighty-three\n, two hundred and eighty-four\n, two hundred and eighty-five\n, two hundred and eighty-six\n, two hundred and eighty-seven\n, two hundred and eighty-eight\n, two hundred and eighty-nine\n, two hundred and ninety\n, two hundred and ninety-one\n, two hundred and ninety-two\n, two hundred and ninety-three\n, two hundred and ninety-four\n, two hundred and ninety-five\n, two hundred and ninety-six\n, two hundred and ninety-seven\n, two hundred and ninety-eight\n, two hundred and ninety-nine\n, three hundred\n, three hundred and one\n, three hundred and two\n, three hundred and three\n, three hundred and four\n, three hundred and five\n, three hundred and six\n, three hundred and seven\n, three hundred and eight\n, three hundred and nine\n, three hundred and ten\n, three hundred and eleven\n, three hundred and twelve\n, three hundred and thirteen\n, three hundred and fourteen\n, three hundred and fifteen\n, three hundred and sixteen\n, three hundred and seventeen\n, three hundred and eighteen\n, three hundred and nineteen\n, three hundred and twenty\n, three hundred and twenty-one\n, three hundred and twenty-two\n, three hundred and twenty-three\n, three hundred and twenty-four\n, three hundred and twenty-five\n, three hundred and twenty-six\n, three hundred and twenty-seven\n, three hundred and twenty-eight\n, three hundred and twenty-nine\n, three hundred and thirty\n, three hundred and thirty-one\n, three hundred and thirty-two\n, three hundred and thirty-three\n, three hundred and thirty-four\n, three hundred and thirty-five\n, three hundred and thirty-six\n, three hundred and thirty-seven\n, three hundred and thirty-eight\n, three hundred and thirty-nine\n, three hundred and forty\n, three hundred and forty-one\n, three hundred and forty-two\n, three hundred and forty-three\n, three hundred and forty-four\n, three hundred and forty-five\n, three hundred and forty-six\n, three hundred and forty-seven\n, three hundred and forty-eight\n, three hundred and forty-nine\n, three hundred and fifty\n, three hundred and fifty-one\n, three hundred and fifty-two\n, three hundred and fifty-three\n, three hundred and fifty-four\n, three hundred and fifty-five\n, three hundred and fifty-six\n, three hundred and fifty-seven\n, three hundred and fifty-eight\n, three hundred and fifty-nine\n, three hundred and sixty\n, three hundred and sixty-one\n, three hundred and sixty-two\n, three hundred and sixty-three\n, three hundred and sixty-four\n, three hundred and sixty-five\n, three hundred and sixty-six\n, three hundred and sixty-seven\n, three hundred and sixty-eight\n, three hundred and sixty-nine\n, three hundred and seventy\n, three hundred and seventy-one\n, three hundred and seventy-two\n, three hundred and seventy-three\n, three hundred and seventy-four\n, three hundred and seventy-five\n, three hundred and seventy-six\n, three hundred and seventy-seven\n, three hundred and seventy-eight\n, three hundred and seventy-nine\n, three hundred and eighty\n, three hundred and eighty-one\n, three hundred and eighty-two\n, three hundred and eighty-three\n, three hundred and eighty-four\n, three hundred and eighty-five\n, three hundred and eighty-six\n, three hundred and eighty-seven\n, three hundred and eighty-eight\n, three hundred and eighty-nine\n, three hundred and ninety\n, three hundred and ninety-one\n, three hundred and ninety-two\n, three hundred and ninety-three\n, three hundred and ninety-four\n, three hundred and ninety-five\n, three hundred and ninety-six\n, three hundred and ninety-seven\n, three hundred and ninety-eight\n, three hundred and ninety-nine\n, four hundred\n, four hundred and one\n, four hundred and two\n, four hundred and three\n, four hundred and four\n, four hundred and five\n, four hundred and six\n, four hundred and seven\n, four hundred and eight\n, four hundred and nine\n, four hundred and ten\n, four hundred and eleven\n, four hundred and twelve\n, four hundred and thirteen\n, four hundred and fourteen\n, four hundred and fifteen\n, four hundred and sixteen\n, four hundred and seventeen\n, four hundred and eighteen\n, four hundred and nineteen\n, four hundred and twenty\n, four hundred and twenty-one\n, four hundred and twenty-two\n, four hundred and twenty-three\n, four hundred and twenty-four\n, four hundred and twenty-five\n, four hundred and twenty-six\n, four hundred and twenty-seven\n, four hundred and twenty-eight\n, four hundred and twenty-nine\n, four hundred and thirty\n, four hundred and thirty-one\n, four hundred and thirty-two\n, four hundred and thirty-three\n, four hundred and thirty-four\n, four hundred and thirty-five\n, four hundred and thirty-six\n, four hundred and thirty-seven\n, four hundred and thirty-eight\n, four hundred and thirty-nine\n, four hundred and forty\n, four hundred and forty-one\n, four hundred and forty-two\n, four hundred and forty-three\n, four hundred and forty-four\n, four hundred and forty-five\n, four hundred and forty-six\n, four hundred and forty-seven\n, four hundred and forty-eight\n, four hundred and forty-nine\n, four hundred and fifty\n, four hundred and fifty-one\n, four hundred and fifty-two\n, four hundred and fifty-three\n, four hundred and fifty-four\n, four hundred and fifty-five\n, four hundred and fifty-six\n, four hundred and fifty-seven\n, four hundred and fifty-eight\n, four hundred and fifty-nine\n, four hundred and sixty\n, four hundred and sixty-one\n, four hundred and sixty-two\n, four hundred and sixty-three\n, four hundred and sixty-four\n, four hundred and sixty-five\n, four hundred and sixty-six\n, four hundred and sixty-seven\n, four hundred and sixty-eight\n, four hundred and sixty-nine\n, four hundred and seventy\n, four hundred and seventy-one\n, four hundred and seventy-two\n, four hundred and seventy-three\n, four hundred and seventy-four\n, four hundred and seventy-five\n, four hundred and seventy-six\n, four hundred and seventy-seven\n, four hundred and seventy-eight\n, four hundred and seventy-nine\n, four hundred and eighty\n, four hundred and eighty-one\n, four hundred and eighty-two\n, four hundred and eighty-three\n, four hundred and eighty-four\n, four hundred and eighty-five\n, four hundred and eighty-six\n, four hundred and eighty-seven\n, four hundred and eighty-eight\n, four hundred and eighty-nine\n, four hundred and ninety\n, four hundred and ninety-one\n, four hundred and ninety-two\n, four hundred and ninety-three\n, four hundred and ninety-four\n, four hundred and ninety-five\n, four hundred and ninety-six\n, four hundred and ninety-seven\n, four hundred and ninety-eight\n, four hundred and ninety-nine\n, five hundred\n, five hundred and one\n, five hundred and two\n, five hundred and three\n, five hundred and four\n, five hundred and five\n, five hundred and six\n, five hundred and seven\n, five hundred and eight\n, five hundred and nine\n, five hundred and ten\n, five hundred and eleven\n, five hundred and twelve\n, five hundred and thirteen\n, five hundred and fourteen\n, five hundred and fifteen\n, five hundred and sixteen\n, five hundred and seventeen\n, five hundred and eighteen\n, five hundred and nineteen\n, five hundred and twenty\n, five hundred and twenty-one\n, five hundred and twenty-two\n, five hundred and twenty-three\n, five hundred and twenty-four\n, five hundred and twenty-five\n, five hundred and twenty-six\n, five hundred and twenty-seven\n, five hundred and twenty-eight\n, five hundred and twenty-nine\n, five hundred and thirty\n, five hundred and thirty-one\n, five hundred and thirty-two\n, five hundred and thirty-three\n, five hundred and thirty-four\n, five hundred and thirty-five\n, five hundred and thirty-six\n, five hundred and thirty-seven\n, five hundred and thirty-eight\n, five hundred and thirty-nine\n, five hundred and forty\n, five hundred and forty-one\n, five hundred and forty-two\n, five hundred and forty-three\n, five hundred and forty-four\n, five hundred and forty-five\n, five hundred and forty-six\n, five hundred and forty-seven\n, five hundred and forty-eight\n, five hundred and forty-nine\n, five hundred and fifty\n, five hundred and fifty-one\n, five hundred and fifty-two\n, five hundred and fifty-three\n, five hundred and fifty-four\n, five hundred and fifty-five\n, five hundred and fifty-six\n, five hundred and fifty-seven\n, five hundred and fifty-eight\n, five hundred and fifty-nine\n, five hundred and sixty\n, five hundred and sixty-one\n, five hundred and sixty-two\n, five hundred and sixty-three\n, five hundred and sixty-four\n, five hundred and sixty-five\n, five hundred and sixty-six\n, five hundred and sixty-seven\n, five hundred and sixty-eight\n, five hundred and sixty-nine\n, five hundred and seventy\n, five hundred and seventy-one\n, five hundred and seventy-two\n, five hundred and seventy-three\n, five hundred and seventy-four\n, five hundred and seventy-five\n, five hundred and seventy-six\n, five hundred and seventy-seven\n, five hundred and seventy-eight\n, five hundred and seventy-nine\n, five hundred and eighty\n, five hundred and eighty-one\n, five hundred and eighty-two\n, five hundred and eighty-three\n, five hundred and eighty-four\n, five hundred and eighty-five\n, five hundred and eighty-six\n, five hundred and eighty-seven\n, five hundred and eighty-eight\n, five hundred and eighty-nine\n, five hundred and ninety\n, five hundred and ninety-one\n, five hundred and ninety-two\n, five hundred and ninety-three\n, five hundred and ninety-four\n, five hundred and ninety-five\n, five hundred and ninety-six\n, five hundred and ninety-seven\n, five hundred and ninety-eight\n, five hundred and ninety-nine\n, six hundred\n, six hundred and one\n, six hundred and two\n, six hundred and three\n, six hundred and four\n, six hundred and five\n, six hundred and six\n, six hundred and seven\n, six hundred and eight\n, six hundred and nine\n, six hundred and ten\n, six hundred and eleven\n, six hundred and twelve\n, six hundred and thirteen\n, six hundred and fourteen\n, six hundred and fifteen\n, six hundred and sixteen\n, six hundred and seventeen\n, six hundred and eighteen\n, six hundred and nineteen\n, six hundred and twenty\n, six hundred and twenty-one\n, six hundred and twenty-two\n, six hundred and twenty-three\n, six hundred and twenty-four\n, six hundred and twenty-five\n, six hundred and twenty-six\n, six hundred and twenty-seven\n, six hundred and twenty-eight\n, six hundred and twenty-nine\n, six hundred and thirty\n, six hundred and thirty-one\n, six hundred and thirty-two\n, six hundred and thirty-three\n, six hundred and thirty-four\n, six hundred and thirty-five\n, six hundred and thirty-six\n, six hundred and thirty-seven\n, six hundred and thirty-eight\n, six hundred and thirty-nine\n, six hundred and forty\n, six hundred and forty-one\n, six hundred and forty-two\n, six hundred and forty-three\n, six hundred and forty-four\n, six hundred and forty-five\n, six hundred and forty-six\n, six hundred and forty-seven\n, six hundred and forty-eight\n, six hundred and forty-nine\n, six hundred and fifty\n, six hundred and fifty-one\n, six hundred and fifty-two\n, six hundred and fifty-three\n, six hundred and fifty-four\n, six hundred and fifty-five\n, six hundred and fifty-six\n, six hundred and fifty-seven\n, six hundred and fifty-eight\n, six hundred and fifty-nine\n, six hundred and sixty\n, six hundred and sixty-one\n, six hundred and sixty-two\n, six hundred and sixty-three\n, six hundred and sixty-four\n, six hundred and sixty-five\n, six hundred and sixty-six\n, six hundred and sixty-seven\n, six hundred and sixty-eight\n, six hundred and sixty-nine\n, six hundred and seventy\n, six hundred and seventy-one\n, six hundred and seventy-two\n, six hundred and seventy-three\n, six hundred and seventy-four\n, six hundred and seventy-five\n, six hundred and seventy-six\n, six hundred and seventy-seven\n, six hundred and seventy-eight\n, six hundred and seventy-nine\n, six hundred and eighty\n, six hundred and eighty-one\n, six hundred and eighty-two\n, six hundred and eighty-three\n, six hundred and eighty-four\n, six hundred and eighty-five\n, six hundred and eighty-six\n, six hundred and eighty-seven\n, six hundred and eighty-eight\n, six hundred and eighty-nine\n, six hundred and ninety\n, six hundred and ninety-one\n, six hundred and ninety-two\n, six hundred and ninety-three\n, six hundred and ninety-four\n, six hundred and ninety-five\n, six hundred and ninety-six\n, six hundred and ninety-seven\n, six hundred and ninety-eight\n, six hundred and ninety-nine\n, seven hundred\n, seven hundred and one\n, seven hundred and two\n, seven hundred and three\n, seven hundred and four\n, seven hundred and five\n, seven hundred and six\n, seven hundred and seven\n, seven hundred and eight\n, seven hundred and nine\n, seven hundred and ten\n, seven hundred and eleven\n, seven hundred and twelve\n, seven hundred and thirteen\n, seven hundred and fourteen\n, seven hundred and fifteen\n, seven hundred and sixteen\n, seven hundred and seventeen\n, seven hundred and eighteen\n, seven hundred and nineteen\n, seven hundred and twenty\n, seven hundred and twenty-one\n, seven hundred and twenty-two\n, seven hundred and twenty-three\n, seven hundred and twenty-four\n, seven hundred and twenty-five\n, seven hundred and twenty-six\n, seven hundred and twenty-seven\n, seven hundred and twenty-eight\n, seven hundred and twenty-nine\n, seven hundred and thirty\n, seven hundred and thirty-one\n, seven hundred and thirty-two\n, seven hundred and thirty-three\n, seven hundred and thirty-four\n, seven hundred and thirty-five\n, seven hundred and thirty-six\n, seven hundred and thirty-seven\n, seven hundred and thirty-eight\n, seven hundred and thirty-nine\n, seven hundred and forty\n, seven hundred and forty-one\n, seven hundred and forty-two\n, seven hundred and forty-three\n, seven hundred and forty-four\n, seven hundred and forty-five\n, seven hundred and forty-six\n, seven hundred and forty-seven\n, seven hundred and forty-eight\n, seven hundred and forty-nine\n, seven hundred and fifty\n, seven hundred and fifty-one\n, seven hundred and fifty-two\n, seven hundred and fifty-three\n, seven hundred and fifty-four\n, seven hundred and fifty-five\n, seven hundred and fifty-six\n, seven hundred and fifty-seven\n, seven hundred and fifty-eight\n, seven hundred and fifty-nine\n, seven hundred and sixty\n, seven hundred and sixty-one\n, seven hundred and sixty-two\n, seven hundred and sixty-three\n, seven hundred and sixty-four\n, seven hundred and sixty-five\n, seven hundred and sixty-six\n, seven hundred and sixty-seven\n, seven hundred and sixty-eight\n, seven hundred and sixty-nine\n, seven hundred and seventy\n, seven hundred and seventy-one\n, seven hundred and seventy-two\n, seven hundred and seventy-three\n, seven hundred and seventy-four\n, seven hundred and seventy-five\n, seven hundred and seventy-six\n, seven hundred and seventy-seven\n, seven hundred and seventy-eight\n, seven hundred and seventy-nine\n, seven hundred and eighty\n, seven hundred and eighty-one\n, seven hundred and eighty-two\n, seven hundred and eighty-three\n, seven hundred and eighty-four\n, seven hundred and eighty-five\n, seven hundred and eighty-six\n, seven hundred and eighty-seven\n, seven hundred and eighty-eight\n, seven hundred and eighty-nine\n, seven hundred and ninety\n, seven hundred and ninety-one\n, seven hundred and ninety-two\n, seven hundred and ninety-three\n, seven hundred and ninety-four\n, seven hundred and ninety-five\n, seven hundred and ninety-six\n, seven hundred and ninety-seven\n, seven hundred and ninety-eight\n, seven hundred and ninety-nine\n, eight hundred\n, eight hundred and one\n, eight hundred and two\n, eight hundred and three\n, eight hundred and four\n, eight hundred and five\n, eight hundred and six\n, eight hundred and seven\n, eight hundred and eight\n, eight hundred and nine\n, eight hundred and ten\n, eight hundred and eleven\n, eight hundred and twelve\n, eight hundred and thirteen\n, eight hundred and fourteen\n, eight hundred and fifteen\n, eight hundred and sixteen\n, eight hundred and seventeen\n, eight hundred and eighteen\n, eight hundred and nineteen\n, eight hundred and twenty\n, eight hundred and twenty-one\n, eight hundred and twenty-two\n, eight hundred and twenty-three\n, eight hundred and twenty-four\n, eight hundred and twenty-five\n, eight hundred and twenty-six\n, eight hundred and twenty-seven\n, eight hundred and twenty-eight\n, eight hundred and twenty-nine\n, eight hundred and thirty\n, eight hundred and thirty-one\n, eight hundred and thirty-two\n, eight hundred and thirty-three\n, eight hundred and thirty-four\n, eight hundred and thirty-five\n, eight hundred and thirty-six\n, eight hundred and thirty-seven\n, eight hundred and thirty-eight\n, eight hundred and thirty-nine\n, eight hundred and forty\n, eight hundred and forty-one\n, eight hundred and forty-two\n, eight hundred and forty-three\n, eight hundred and forty-four\n, eight hundred and forty-five\n, eight hundred and forty-six\n, eight hundred and forty-seven\n, eight hundred and forty-eight\n, eight hundred and forty-nine\n, eight hundred and fifty\n, eight hundred and fifty-one\n, eight hundred and fifty-two\n, eight hundred and fifty-three\n, eight hundred and fifty-four\n, eight hundred and fifty-five\n, eight hundred and fifty-six\n, eight hundred and fifty-seven\n, eight hundred and fifty-eight\n, eight hundred and fifty-nine\n, eight hundred and sixty\n, eight hundred and sixty-one\n, eight hundred and sixty-two\n, eight hundred and sixty-three\n, eight hundred and sixty-four\n, eight hundred and sixty-five\n, eight hundred and sixty-six\n, eight hundred and sixty-seven\n, eight hundred and sixty-eight\n, eight hundred and sixty-nine\n, eight hundred and seventy\n, eight hundred and seventy-one\n, eight hundred and seventy-two\n, eight hundred and seventy-three\n, eight hundred and seventy-four\n, eight hundred and seventy-five\n, eight hundred and seventy-six\n, eight hundred and seventy-seven\n, eight hundred and seventy-eight\n, eight hundred and seventy-nine\n, eight hundred and eighty\n, eight hundred and eighty-one\n, eight hundred and eighty-two\n, eight hundred and eighty-three\n, eight hundred and eighty-four\n, eight hundred and eighty-five\n, eight hundred and eighty-six\n, eight hundred and eighty-seven\n, eight hundred and eighty-eight\n, eight hundred and eighty-nine\n, eight hundred and ninety\n, eight hundred and ninety-one\n, eight hundred and ninety-two\n, eight hundred and ninety-three\n, eight hundred and ninety-four\n, eight hundred and ninety-five\n, eight hundred and ninety-six\n, eight hundred and ninety-seven\n, eight hundred and ninety-eight\n, eight hundred and ninety-nine\n, nine hundred\n, nine hundred and one\n, nine hundred and two\n, nine hundred and three\n, nine hundred and four\n, nine hundred and five\n, nine hundred and six\n, nine hundred and seven\n, nine hundred and eight\n, nine hundred and nine\n, nine hundred and ten\n, nine hundred and eleven\n, nine hundred and twelve\n, nine hundred and thirteen\n, nine hundred and fourteen\n, nine hundred and fifteen\n, nine hundred and sixteen\n, nine hundred and seventeen\n, nine hundred and eighteen\n, nine hundred and nineteen\n, nine hundred and twenty\n, nine hundred and twenty-one\n, nine hundred and twenty-two\n, nine hundred and twenty-three\n, nine hundred and twenty-four\n, nine hundred and twenty-five\n, nine hundred and twenty-six\n, nine hundred and twenty-seven\n, nine hundred and twenty-eight\n, nine hundred and twenty-nine\n, nine hundred and thirty\n, nine hundred and thirty-one\n, nine hundred and thirty-two\n, nine hundred and thirty-three\n, nine hundred and thirty-four\n, nine hundred and thirty-five\n, nine hundred and thirty-six\n, nine hundred and thirty-seven\n, nine hundred and thirty-eight\n, nine hundred and thirty-nine\n, nine hundred and forty\n, nine hundred and forty-one\n, nine hundred and forty-two\n, nine hundred and forty-three\n, nine hundred and forty-four\n, nine hundred and forty-five\n, nine hundred and forty-six\n, nine hundred and forty-seven\n, nine hundred and forty-eight\n, nine hundred and forty-nine\n, nine hundred and fifty\n, nine hundred and fifty-one\n, nine hundred and fifty-two\n, nine hundred and fifty-three\n, nine hundred and fifty-four\n, nine hundred and fifty-five\n, nine hundred and fifty-six\n, nine hundred and fifty-seven\n, nine hundred and fifty-eight\n, nine hundred and fifty-nine\n, nine hundred and sixty\n, nine hundred and sixty-one\n, nine hundred and sixty-two\n, nine hundred and sixty-three\n, nine hundred and sixty-four\n, nine hundred and sixty-five\n, nine hundred and sixty-six\n, nine hundred and sixty-seven\n, nine hundred and sixty-eight\n, nine hundred and sixty-nine\n, nine hundred and seventy\n, nine hundred and seventy-one\n, nine hundred and seventy-two\n, nine hundred and seventy-three\n, nine hundred and seventy-four\n, nine hundred and seventy-five\n, nine hundred and seventy-six\n, nine hundred and seventy-seven\n, nine hundred and seventy-eight\n, nine hundred and seventy-nine\n, nine hundred and eighty\n, nine hundred and eighty-one\n, nine hundred and eighty-two\n, nine hundred and eighty-three\n, nine hundred and eighty-four\n, nine hundred and eighty-five\n, nine hundred and eighty-six\n, nine hundred and eighty-seven\n, nine hundred and eighty-eight\n, nine hundred and eighty-nine\n, nine hundred and ninety\n, nine hundred and ninety-one\n, nine hundred and ninety-two\n, nine hundred and ninety-three\n, nine hundred and ninety-four\n, nine hundred and ninety-five\n, nine hundred and ninety-six\n, nine hundred and ninety-seven\n, nine hundred and ninety-eight\n, nine hundred and ninety-nine')
+
+_tail_2 = ('\none\ntwo\nthree\nfour\nfive\nsix\nseven\neight\nnine\nten\neleven\ntwelve\nthirteen\nfourteen\nfifteen\nsixteen\nseventeen\neighteen\nnineteen\ntwenty\ntwenty-one\ntwenty-two\ntwenty-three\ntwenty-four\ntwenty-five\ntwenty-six\ntwenty-seven\ntwenty-eight\ntwenty-nine\nthirty\nthirty-one\nthirty-two\nthirty-three\nthirty-four\nthirty-five\nthirty-six\nthirty-seven\nthirty-eight\nthirty-nine\nforty\nforty-one\nforty-two\nforty-three\nforty-four\nforty-five\nforty-six\nforty-seven\nforty-eight\nforty-nine\nfifty\nfifty-one\nfifty-two\nfifty-three\nfifty-four\nfifty-five\nfifty-six\nfifty-seven\nfifty-eight\nfifty-nine\nsixty\nsixty-one\nsixty-two\nsixty-three\nsixty-four\nsixty-five\nsixty-six\nsixty-seven\nsixty-eight\nsixty-nine\nseventy\nseventy-one\nseventy-two\nseventy-three\nseventy-four\nseventy-five\nseventy-six\nseventy-seven\nseventy-eight\nseventy-nine\neighty\neighty-one\neighty-two\neighty-three\neighty-four\neighty-five\neighty-six\neighty-seven\neighty-eight\neighty-nine\nninety\nninety-one\nninety-two\nninety-three\nninety-four\nninety-five\nninety-six\nninety-seven\nninety-eight\nninety-nine\none hundred\none hundred and one\none hundred and two\none hundred and three\none hundred and four\none hundred and five\none hundred and six\none hundred and seven\none hundred and eight\none hundred and nine\none hundred and ten\none hundred and eleven\none hundred and twelve\none hundred and thirteen\none hundred and fourteen\none hundred and fifteen\none hundred and sixteen\none hundred and seventeen\none hundred and eighteen\none hundred and nineteen\none hundred and twenty\none hundred and twenty-one\none hundred and twenty-two\none hundred and twenty-three\none hundred and twenty-four\none hundred and twenty-five\none hundred and twenty-six\none hundred and twenty-seven\none hundred and twenty-eight\none hundred and twenty-nine\none hundred and thirty\none hundred and thirty-one\none hundred and thirty-two\none hundred and thirty-three\none hundred and thirty-four\none hundred and thirty-five\none hundred and thirty-six\none hundred and thirty-seven\none hundred and thirty-eight\none hundred and thirty-nine\none hundred and forty\none hundred and forty-one\none hundred and forty-two\none hundred and forty-three\none hundred and forty-four\none hundred and forty-five\none hundred and forty-six\none hundred and forty-seven\none hundred and forty-eight\none hundred and forty-nine\none hundred and fifty\none hundred and fifty-one\none hundred and fifty-two\none hundred and fifty-three\none hundred and fifty-four\none hundred and fifty-five\none hundred and fifty-six\none hundred and fifty-seven\none hundred and fifty-eight\none hundred and fifty-nine\none hundred and sixty\none hundred and sixty-one\none hundred and sixty-two\none hundred and sixty-three\none hundred and sixty-four\none hundred and sixty-five\none hundred and sixty-six\none hundred and sixty-seven\none hundred and sixty-eight\none hundred and sixty-nine\none hundred and seventy\none hundred and seventy-one\none hundred and seventy-two\none hundred and seventy-three\none hundred and seventy-four\none hundred and seventy-five\none hundred and seventy-six\none hundred and seventy-seven\none hundred and seventy-eight\none hundred and seventy-nine\none hundred and eighty\none hundred and eighty-one\none hundred and eighty-two\none hundred and eighty-three\none hundred and eighty-four\none hundred and eighty-five\none hundred and eighty-six\none hundred and eighty-seven\none hundred and eighty-eight\none hundred and eighty-nine\none hundred and ninety\none hundred and ninety-one\none hundred and ninety-two\none hundred and ninety-three\none hundred and ninety-four\none hundred and ninety-five\none hundred and ninety-six\none hundred and ninety-seven\none hundred and ninety-eight\none hundred and ninety-nine\ntwo hundred\ntwo hundred and one\ntwo hundred and two\ntwo hundred and three\ntwo hundred and four\ntwo hundred and five\ntwo hundred and six\ntwo hundred and seven\ntwo hundred and eight\ntwo hundred and nine\ntwo hundred and ten\ntwo hundred and eleven\ntwo hundred and twelve\ntwo hundred and thirteen\ntwo hundred and fourteen\ntwo hundred and fifteen\ntwo hundred and sixteen\ntwo hundred and seventeen\ntwo hundred and eighteen\ntwo hundred and nineteen\ntwo hundred and twenty\ntwo hundred and twenty-one\ntwo hundred and twenty-two\ntwo hundred and twenty-three\ntwo hundred and twenty-four\ntwo hundred and twenty-five\ntwo hundred and twenty-six\ntwo hundred and twenty-seven\ntwo hundred and twenty-eight\ntwo hundred and twenty-nine\ntwo hundred and thirty\ntwo hundred and thirty-one\ntwo hundred and thirty-two\ntwo hundred and thirty-three\ntwo hundred and thirty-four\ntwo hundred and thirty-five\ntwo hundred and thirty-six\ntwo hundred and thirty-seven\ntwo hundred and thirty-eight\ntwo hundred and thirty-nine\ntwo hundred and forty\ntwo hundred and forty-one\ntwo hundred and forty-two\ntwo hundred and forty-three\ntwo hundred and forty-four\ntwo hundred and forty-five\ntwo hundred and forty-six\ntwo hundred and forty-seven\ntwo hundred and forty-eight\ntwo hundred and forty-nine\ntwo hundred and fifty\ntwo hundred and fifty-one\ntwo hundred and fifty-two\ntwo hundred and fifty-three\ntwo hundred and fifty-four\ntwo hundred and fifty-five\ntwo hundred and fifty-six\ntwo hundred and fifty-seven\ntwo hundred and fifty-eight\ntwo hundred and fifty-nine\ntwo hundred and sixty\ntwo hundred and sixty-one\ntwo hundred and sixty-two\ntwo hundred and sixty-three\ntwo hundred and sixty-four\ntwo hundred and sixty-five\ntwo hundred and sixty-six\ntwo hundred and sixty-seven\ntwo hundred and sixty-eight\ntwo hundred and sixty-nine\ntwo hundred and seventy\ntwo hundred and seventy-one\ntwo hundred and seventy-two\ntwo hundred and seventy-three\ntwo hundred and seventy-four\ntwo hundred and seventy-five\ntwo hundred and seventy-six\ntwo hundred and seventy-seven\ntwo hundred and seventy-eight\ntwo hundred and seventy-nine\ntwo hundred and eighty\ntwo hundred and eighty-one\ntwo hundred and eighty-two\ntwo hundred and eighty-three\ntwo hundred and eighty-four\ntwo hundred and eighty-five\ntwo hundred and eighty-six\ntwo hundred and eighty-seven\ntwo hundred and eighty-eight\ntwo hundred and eighty-nine\ntwo hundred and ninety\ntwo hundred and ninety-one\ntwo hundred and ninety-two\ntwo hundred and ninety-three\ntwo hundred and ninety-four\ntwo hundred and ninety-five\ntwo hundred and ninety-six\ntwo hundred and ninety-seven\ntwo hundred and ninety-eight\ntwo hundred and ninety-nine\nthree hundred\nthree hundred and one\nthree hundred and two\nthree hundred and three\nthree hundred and four\nthree hundred and five\nthree hundred and six\nthree hundred and seven\nthree hundred and eight\nthree hundred and nine\nthree hundred and ten\nthree hundred and eleven\nthree hundred and twelve\nthree hundred and thirteen\nthree hundred and fourteen\nthree hundred and fifteen\nthree hundred and sixteen\nthree hundred and seventeen\nthree hundred and eighteen\nthree hundred and nineteen\nthree hundred and twenty\nthree hundred and twenty-one\nthree hundred and twenty-two\nthree hundred and twenty-three\nthree hundred and twenty-four\nthree hundred and twenty-five\nthree hundred and twenty-six\nthree hundred and twenty-seven\nthree hundred and twenty-eight\nthree hundred and twenty-nine\nthree hundred and thirty\nthree hundred and thirty-one\nthree hundred and thirty-two\nthree hundred and thirty-three\nthree hundred and thirty-four\nthree hundred and thirty-five\nthree hundred and thirty-six\nthree hundred and thirty-seven\nthree hundred and thirty-eight\nthree hundred and thirty-nine\nthree hundred and forty\nthree hundred and forty-one\nthree hundred and forty-two\nthree hundred and forty-three\nthree hundred and forty-four\nthree hundred and forty-five\nthree hundred and forty-six\nthree hundred and forty-seven\nthree hundred and forty-eight\nthree hundred and forty-nine\nthree hundred and fifty\nthree hundred and fifty-one\nthree hundred and fifty-two\nthree hundred and fifty-three\nthree hundred and fifty-four\nthree hundred and fifty-five\nthree hundred and fifty-six\nthree hundred and fifty-seven\nthree hundred and fifty-eight\nthree hundred and fifty-nine\nthree hundred and sixty\nthree hundred and sixty-one\nthree hundred and sixty-two\nthree hundred and sixty-three\nthree hundred and sixty-four\nthree hundred and sixty-five\nthree hundred and sixty-six\nthree hundred and sixty-seven\nthree hundred and sixty-eight\nthree hundred and sixty-nine\nthree hundred and seventy\nthree hundred and seventy-one\nthree hundred and seventy-two\nthree hundred and seventy-three\nthree hundred and seventy-four\nthree hundred and seventy-five\nthree hundred and seventy-six\nthree hundred and seventy-seven\nthree hundred and seventy-eight\nthree hundred and seventy-nine\nthree hundred and eighty\nthree hundred and eighty-one\nthree hundred and eighty-two\nthree hundred and eighty-three\nthree hundred and eighty-four\nthree hundred and eighty-five\nthree hundred and eighty-six\nthree hundred and eighty-seven\nthree hundred and eighty-eight\nthree hundred and eighty-nine\nthree hundred and ninety\nthree hundred and ninety-one\nthree hundred and ninety-two\nthree hundred and ninety-three\nthree hundred and ninety-four\nthree hundred and ninety-five\nthree hundred and ninety-six\nthree hundred and ninety-seven\nthree hundred and ninety-eight\nthree hundred and ninety-nine\nfour hundred\nfour hundred and one\nfour hundred and two\nfour hundred and three\nfour hundred and four\nfour hundred and five\nfour hundred and six\nfour hundred and seven\nfour hundred and eight\nfour hundred and nine\nfour hundred and ten\nfour hundred and eleven\nfour hundred and twelve\nfour hundred and thirteen\nfour hundred and fourteen\nfour hundred and fifteen\nfour hundred and sixteen\nfour hundred and seventeen\nfour hundred and eighteen\nfour hundred and nineteen\nfour hundred and twenty\nfour hundred and twenty-one\nfour hundred and twenty-two\nfour hundred and twenty-three\nfour hundred and twenty-four\nfour hundred and twenty-five\nfour hundred and twenty-six\nfour hundred and twenty-seven\nfour hundred and twenty-eight\nfour hundred and twenty-nine\nfour hundred and thirty\nfour hundred and thirty-one\nfour hundred and thirty-two\nfour hundred and thirty-three\nfour hundred and thirty-four\nfour hundred and thirty-five\nfour hundred and thirty-six\nfour hundred and thirty-seven\nfour hundred and thirty-eight\nfour hundred and thirty-nine\nfour hundred and forty\nfour hundred and forty-one\nfour hundred and forty-two\nfour hundred and forty-three\nfour hundred and forty-four\nfour hundred and forty-five\nfour hundred and forty-six\nfour hundred and forty-seven\nfour hundred and forty-eight\nfour hundred and forty-nine\nfour hundred and fifty\nfour hundred and fifty-one\nfour hundred and fifty-two\nfour hundred and fifty-three\nfour hundred and fifty-four\nfour hundred and fifty-five\nfour hundred and fifty-six\nfour hundred and fifty-seven\nfour hundred and fifty-eight\nfour hundred and fifty-nine\nfour hundred and sixty\nfour hundred and sixty-one\nfour hundred and sixty-two\nfour hundred and sixty-three\nfour hundred and sixty-four\nfour hundred and sixty-five\nfour hundred and sixty-six\nfour hundred and sixty-seven\nfour hundred and sixty-eight\nfour hundred and sixty-nine\nfour hundred and seventy\nfour hundred and seventy-one\nfour hundred and seventy-two\nfour hundred and seventy-three\nfour hundred and seventy-four\nfour hundred and seventy-five\nfour hundred and seventy-six\nfour hundred and seventy-seven\nfour hundred and seventy-eight\nfour hundred and seventy-nine\nfour hundred and eighty\nfour hundred and eighty-one\nfour hundred and eighty-two\nfour hundred and eighty-three\nfour hundred and eighty-four\nfour hundred and eighty-five\nfour hundred and eighty-six\nfour hundred and eighty-seven\nfour hundred and eighty-eight\nfour hundred and eighty-nine\nfour hundred and ninety\nfour hundred and ninety-one\nfour hundred and ninety-two\nfour hundred and ninety-three\nfour hundred and ninety-four\nfour hundred and ninety-five\nfour hundred and ninety-six\nfour hundred and ninety-seven\nfour hundred and ninety-eight\nfour hundred and ninety-nine\nfive hundred\nfive hundred and one\nfive hundred and two\nfive hundred and three\nfive hundred and four\nfive hundred and five\nfive hundred and six\nfive hundred and seven\nfive hundred and eight\nfive hundred and nine\nfive hundred and ten\nfive hundred and eleven\nfive hundred and twelve\nfive hundred and thirteen\nfive hundred and fourteen\nfive hundred and fifteen\nfive hundred and sixteen\nfive hundred and seventeen\nfive hundred and eighteen\nfive hundred and nineteen\nfive hundred and twenty\nfive hundred and twenty-one\nfive hundred and twenty-two\nfive hundred and twenty-three\nfive hundred and twenty-four\nfive hundred and twenty-five\nfive hundred and twenty-six\nfive hundred and twenty-seven\nfive hundred and twenty-eight\nfive hundred and twenty-nine\nfive hundred and thirty\nfive hundred and thirty-one\nfive hundred and thirty-two\nfive hundred and thirty-three\nfive hundred and thirty-four\nfive hundred and thirty-five\nfive hundred and thirty-six\nfive hundred and thirty-seven\nfive hundred and thirty-eight\nfive hundred and thirty-nine\nfive hundred and forty\nfive hundred and forty-one\nfive hundred and forty-two\nfive hundred and forty-three\nfive hundred and forty-four\nfive hundred and forty-five\nfive hundred and forty-six\nfive hundred and forty-seven\nfive hundred and forty-eight\nfive hundred and forty-nine\nfive hundred and fifty\nfive hundred and fifty-one\nfive hundred and fifty-two\nfive hundred and fifty-three\nfive hundred and fifty-four\nfive hundred and fifty-five\nfive hundred and fifty-six\nfive hundred and fifty-seven\nfive hundred and fifty-eight\nfive hundred and fifty-nine\nfive hundred and sixty\nfive hundred and sixty-one\nfive hundred and sixty-two\nfive hundred and sixty-three\nfive hundred and sixty-four\nfive hundred and sixty-five\nfive hundred and sixty-six\nfive hundred and sixty-seven\nfive hundred and sixty-eight\nfive hundred and sixty-nine\nfive hundred and seventy\nfive hundred and seventy-one\nfive hundred and seventy-two\nfive hundred and seventy-three\nfive hundred and seventy-four\nfive hundred and seventy-five\nfive hundred and seventy-six\nfive hundred and seventy-seven\nfive hundred and seventy-eight\nfive hundred and seventy-nine\nfive hundred and eighty\nfive hundred and eighty-one\nfive hundred and eighty-two\nfive hundred and eighty-three\nfive hundred and eighty-four\nfive hundred and eighty-five\nfive hundred and eighty-six\nfive hundred and eighty-seven\nfive hundred and eighty-eight\nfive hundred and eighty-nine\nfive hundred and ninety\nfive hundred and ninety-one\nfive hundred and ninety-two\nfive hundred and ninety-three\nfive hundred and ninety-four\nfive hundred and ninety-five\nfive hundred and ninety-six\nfive hundred and ninety-seven\nfive hundred and ninety-eight\nfive hundred and ninety-nine\nsix hundred\nsix hundred and one\nsix hundred and two\nsix hundred and three\nsix hundred and four\nsix hundred and five\nsix hundred and six\nsix hundred and seven\nsix hundred and eight\nsix hundred and nine\nsix hundred and ten\nsix hundred and eleven\nsix hundred and twelve\nsix hundred and thirteen\nsix hundred and fourteen\nsix hundred and fifteen\nsix hundred and sixteen\nsix hundred and seventeen\nsix hundred and eighteen\nsix hundred and nineteen\nsix hundred and twenty\nsix hundred and twenty-one\nsix hundred and twenty-two\nsix hundred and twenty-three\nsix hundred and twenty-four\nsix hundred and twenty-five\nsix hundred and twenty-six\nsix hundred and twenty-seven\nsix hundred and twenty-eight\nsix hundred and twenty-nine\nsix hundred and thirty\nsix hundred and thirty-one\nsix hundred and thirty-two\nsix hundred and thirty-three\nsix hundred and thirty-four\nsix hundred and thirty-five\nsix hundred and thirty-six\nsix hundred and thirty-seven\nsix hundred and thirty-eight\nsix hundred and thirty-nine\nsix hundred and forty\nsix hundred and forty-one\nsix hundred and forty-two\nsix hundred and forty-three\nsix hundred and forty-four\nsix hundred and forty-five\nsix hundred and forty-six\nsix hundred and forty-seven\nsix hundred and forty-eight\nsix hundred and forty-nine\nsix hundred and fifty\nsix hundred and fifty-one\nsix hundred and fifty-two\nsix hundred and fifty-three\nsix hundred and fifty-four\nsix hundred and fifty-five\nsix hundred and fifty-six\nsix hundred and fifty-seven\nsix hundred and fifty-eight\nsix hundred and fifty-nine\nsix hundred and sixty\nsix hundred and sixty-one\nsix hundred and sixty-two\nsix hundred and sixty-three\nsix hundred and sixty-four\nsix hundred and sixty-five\nsix hundred and sixty-six\nsix hundred and sixty-seven\nsix hundred and sixty-eight\nsix hundred and sixty-nine\nsix hundred and seventy\nsix hundred and seventy-one\nsix hundred and seventy-two\nsix hundred and seventy-three\nsix hundred and seventy-four\nsix hundred and seventy-five\nsix hundred and seventy-six\nsix hundred and seventy-seven\nsix hundred and seventy-eight\nsix hundred and seventy-nine\nsix hundred and eighty\nsix hundred and eighty-one\nsix hundred and eighty-two\nsix hundred and eighty-three\nsix hundred and eighty-four\nsix hundred and eighty-five\nsix hundred and eighty-six\nsix hundred and eighty-seven\nsix hundred and eighty-eight\nsix hundred and eighty-nine\nsix hundred and ninety\nsix hundred and ninety-one\nsix hundred and ninety-two\nsix hundred and ninety-three\nsix hundred and ninety-four\nsix hundred and ninety-five\nsix hundred and ninety-six\nsix hundred and ninety-seven\nsix hundred and ninety-eight\nsix hundred and ninety-nine\nseven hundred\nseven hundred and one\nseven hundred and two\nseven hundred and three\nseven hundred and four\nseven hundred and five\nseven hundred and six\nseven hundred and seven\nseven hundred and eight\nseven hundred and nine\nseven hundred and ten\nseven hundred and eleven\nseven hundred and twelve\nseven hundred and thirteen\nseven hundred and fourteen\nseven hundred and fifteen\nseven hundred and sixteen\nseven hundred and seventeen\nseven hundred and eighteen\nseven hundred and nineteen\nseven hundred and twenty\nseven hundred and twenty-one\nseven hundred and twenty-two\nseven hundred and twenty-three\nseven hundred and twenty-four\nseven hundred and twenty-five\nseven hundred and twenty-six\nseven hundred and twenty-seven\nseven hundred and twenty-eight\nseven hundred and twenty-nine\nseven hundred and thirty\nseven hundred and thirty-one\nseven hundred and thirty-two\nseven hundred and thirty-three\nseven hundred and thirty-four\nseven hundred and thirty-five\nseven hundred and thirty-six\nseven hundred and thirty-seven\nseven hundred and thirty-eight\nseven hundred and thirty-nine\nseven hundred and forty\nseven hundred and forty-one\nseven hundred and forty-two\nseven hundred and forty-three\nseven hundred and forty-four\nseven hundred and forty-five\nseven hundred and forty-six\nseven hundred and forty-seven\nseven hundred and forty-eight\nseven hundred and forty-nine\nseven hundred and fifty\nseven hundred and fifty-one\nseven hundred and fifty-two\nseven hundred and fifty-three\nseven hundred and fifty-four\nseven hundred and fifty-five\nseven hundred and fifty-six\nseven hundred and fifty-seven\nseven hundred and fifty-eight\nseven hundred and fifty-nine\nseven hundred and sixty\nseven hundred and sixty-one\nseven hundred and sixty-two\nseven hundred and sixty-three\nseven hundred and sixty-four\nseven hundred and sixty-five\nseven hundred and sixty-six\nseven hundred and sixty-seven\nseven hundred and sixty-eight\nseven hundred and sixty-nine\nseven hundred and seventy\nseven hundred and seventy-one\nseven hundred and seventy-two\nseven hundred and seventy-three\nseven hundred and seventy-four\nseven hundred and seventy-five\nseven hundred and seventy-six\nseven hundred and seventy-seven\nseven hundred and seventy-eight\nseven hundred and seventy-nine\nseven hundred and eighty\nseven hundred and eighty-one\nseven hundred and eighty-two\nseven hundred and eighty-three\nseven hundred and eighty-four\nseven hundred and eighty-five\nseven hundred and eighty-six\nseven hundred and eighty-seven\nseven hundred and eighty-eight\nseven hundred and eighty-nine\nseven hundred and ninety\nseven hundred and ninety-one\nseven hundred and ninety-two\nseven hundred and ninety-three\nseven hundred and ninety-four\nseven hundred and ninety-five\nseven hundred and ninety-six\nseven hundred and ninety-seven\nseven hundred and ninety-eight\nseven hundred and ninety-nine\neight hundred\neight hundred and one\neight hundred and two\neight hundred and three\neight hundred and four\neight hundred and five\neight hundred and six\neight hundred and seven\neight hundred and eight\neight hundred and nine\neight hundred and ten\neight hundred and eleven\neight hundred and twelve\neight hundred and thirteen\neight hundred and fourteen\neight hundred and fifteen\neight hundred and sixteen\neight hundred and seventeen\neight hundred and eighteen\neight hundred and nineteen\neight hundred and twenty\neight hundred and twenty-one\neight hundred and twenty-two\neight hundred and twenty-three\neight hundred and twenty-four\neight hundred and twenty-five\neight hundred and twenty-six\neight hundred and twenty-seven\neight hundred and twenty-eight\neight hundred and twenty-nine\neight hundred and thirty\neight hundred and thirty-one\neight hundred and thirty-two\neight hundred and thirty-three\neight hundred and thirty-four\neight hundred and thirty-five\neight hundred and thirty-six\neight hundred and thirty-seven\neight hundred and thirty-eight\neight hundred and thirty-nine\neight hundred and forty\neight hundred and forty-one\neight hundred and forty-two\neight hundred and forty-three\neight hundred and forty-four\neight hundred and forty-five\neight hundred and forty-six\neight hundred and forty-seven\neight hundred and forty-eight\neight hundred and forty-nine\neight hundred and fifty\neight hundred and fifty-one\neight hundred and fifty-two\neight hundred and fifty-three\neight hundred and fifty-four\neight hundred and fifty-five\neight hundred and fifty-six\neight hundred and fifty-seven\neight hundred and fifty-eight\neight hundred and fifty-nine\neight hundred and sixty\neight hundred and sixty-one\neight hundred and sixty-two\neight hundred and sixty-three\neight hundred and sixty-four\neight hundred and sixty-five\neight hundred and sixty-six\neight hundred and sixty-seven\neight hundred and sixty-eight\neight hundred and sixty-nine\neight hundred and seventy\neight hundred and seventy-one\neight hundred and seventy-two\neight hundred and seventy-three\neight hundred and seventy-four\neight hundred and seventy-five\neight hundred and seventy-six\neight hundred and seventy-seven\neight hundred and seventy-eight\neight hundred and seventy-nine\neight hundred and eighty\neight hundred and eighty-one\neight hundred and eighty-two\neight hundred and eighty-three\neight hundred and eighty-four\neight hundred and eighty-five\neight hundred and eighty-six\neight hundred and eighty-seven\neight hundred and eighty-eight\neight hundred and eighty-nine\neight hundred and ninety\neight hundred and ninety-one\neight hundred and ninety-two\neight hundred and ninety-three\neight hundred and ninety-four\neight hundred and ninety-five\neight hundred and ninety-six\neight hundred and ninety-seven\neight hundred and ninety-eight\neight hundred and ninety-nine\nnine hundred\nnine hundred and one\nnine hundred and two\nnine hundred and three\nnine hundred and four\nnine hundred and five\nnine hundred and six\nnine hundred and seven\nnine hundred and eight\nnine hundred and nine\nnine hundred and ten\nnine hundred and eleven\nnine hundred and twelve\nnine hundred and thirteen\nnine hundred and fourteen\nnine hundred and fifteen\nnine hundred and sixteen\nnine hundred and seventeen\nnine hundred and eighteen\nnine hundred and nineteen\nnine hundred and twenty\nnine hundred and twenty-one\nnine hundred and twenty-two\nnine hundred and twenty-three\nnine hundred and twenty-four\nnine hundred and twenty-five\nnine hundred and twenty-six\nnine hundred and twenty-seven\nnine hundred and twenty-eight\nnine hundred and twenty-nine\nnine hundred and thirty\nnine hundred and thirty-one\nnine hundred and thirty-two\nnine hundred and thirty-three\nnine hundred and thirty-four\nnine hundred and thirty-five\nnine hundred and thirty-six\nnine hundred and thirty-seven\nnine hundred and thirty-eight\nnine hundred and thirty-nine\nnine hundred and forty\nnine hundred and forty-one\nnine hundred and forty-two\nnine hundred and forty-three\nnine hundred and forty-four\nnine hundred and forty-five\nnine hundred and forty-six\nnine hundred and forty-seven\nnine hundred and forty-eight\nnine hundred and forty-nine\nnine hundred and fifty\nnine hundred and fifty-one\nnine hundred and fifty-two\nnine hundred and fifty-three\nnine hundred and fifty-four\nnine hundred and fifty-five\nnine hundred and fifty-six\nnine hundred and fifty-seven\nnine hundred and fifty-eight\nnine hundred and fifty-nine\nnine hundred and sixty\nnine hundred and sixty-one\nnine hundred and sixty-two\nnine hundred and sixty-three\nnine hundred and sixty-four\nnine hundred and sixty-five\nnine hundred and sixty-six\nnine hundred and sixty-seven\nnine hundred and sixty-eight\nnine hundred and sixty-nine\nnine hundred and seventy\nnine hundred and seventy-one\nnine hundred and seventy-two\nnine hundred and seventy-three\nnine hundred and seventy-four\nnine hundred and seventy-five\nnine hundred and seventy-six\nnine hundred and seventy-seven\nnine hundred and seventy-eight\nnine hundred and seventy-nine\nnine hundred and eighty\nnine hundred and eighty-one\nnine hundred and eighty-two\nnine hundred and eighty-three\nnine hundred and eighty-four\nnine hundred and eighty-five\nnine hundred and eighty-six\nnine hundred and eighty-seven\nnine hundred and eighty-eight\nnine hundred and eighty-nine\nnine hundred and ninety\nnine hundred and ninety-one\nnine hundred and ninety-two\nnine hundred and ninety-three\nnine hundred and ninety-four\nnine hundred and ninety-five\nnine hundred and ninety-six\nnine hundred and ninety-seven\nnine hundred and ninety-eight\nnine hundred and ninety-nine', '\n and one\n and two\n and three\n and four\n and five\n and six\n and seven\n and eight\n and nine\n and ten\n and eleven\n and twelve\n and thirteen\n and fourteen\n and fifteen\n and sixteen\n and seventeen\n and eighteen\n and nineteen\n and twenty\n and twenty-one\n and twenty-two\n and twenty-three\n and twenty-four\n and twenty-five\n and twenty-six\n and twenty-seven\n and twenty-eight\n and twenty-nine\n and thirty\n and thirty-one\n and thirty-two\n and thirty-three\n and thirty-four\n and thirty-five\n and thirty-six\n and thirty-seven\n and thirty-eight\n and thirty-nine\n and forty\n and forty-one\n and forty-two\n and forty-three\n and forty-four\n and forty-five\n and forty-six\n and forty-seven\n and forty-eight\n and forty-nine\n and fifty\n and fifty-one\n and fifty-two\n and fifty-three\n and fifty-four\n and fifty-five\n and fifty-six\n and fifty-seven\n and fifty-eight\n and fifty-nine\n and sixty\n and sixty-one\n and sixty-two\n and sixty-three\n and sixty-four\n and sixty-five\n and sixty-six\n and sixty-seven\n and sixty-eight\n and sixty-nine\n and seventy\n and seventy-one\n and seventy-two\n and seventy-three\n and seventy-four\n and seventy-five\n and seventy-six\n and seventy-seven\n and seventy-eight\n and seventy-nine\n and eighty\n and eighty-one\n and eighty-two\n and eighty-three\n and eighty-four\n and eighty-five\n and eighty-six\n and eighty-seven\n and eighty-eight\n and eighty-nine\n and ninety\n and ninety-one\n and ninety-two\n and ninety-three\n and ninety-four\n and ninety-five\n and ninety-six\n and ninety-seven\n and ninety-eight\n and ninety-nine\n one hundred\n one hundred and one\n one hundred and two\n one hundred and three\n one hundred and four\n one hundred and five\n one hundred and six\n one hundred and seven\n one hundred and eight\n one hundred and nine\n one hundred and ten\n one hundred and eleven\n one hundred and twelve\n one hundred and thirteen\n one hundred and fourteen\n one hundred and fifteen\n one hundred and sixteen\n one hundred and seventeen\n one hundred and eighteen\n one hundred and nineteen\n one hundred and twenty\n one hundred and twenty-one\n one hundred and twenty-two\n one hundred and twenty-three\n one hundred and twenty-four\n one hundred and twenty-five\n one hundred and twenty-six\n one hundred and twenty-seven\n one hundred and twenty-eight\n one hundred and twenty-nine\n one hundred and thirty\n one hundred and thirty-one\n one hundred and thirty-two\n one hundred and thirty-three\n one hundred and thirty-four\n one hundred and thirty-five\n one hundred and thirty-six\n one hundred and thirty-seven\n one hundred and thirty-eight\n one hundred and thirty-nine\n one hundred and forty\n one hundred and forty-one\n one hundred and forty-two\n one hundred and forty-three\n one hundred and forty-four\n one hundred and forty-five\n one hundred and forty-six\n one hundred and forty-seven\n one hundred and forty-eight\n one hundred and forty-nine\n one hundred and fifty\n one hundred and fifty-one\n one hundred and fifty-two\n one hundred and fifty-three\n one hundred and fifty-four\n one hundred and fifty-five\n one hundred and fifty-six\n one hundred and fifty-seven\n one hundred and fifty-eight\n one hundred and fifty-nine\n one hundred and sixty\n one hundred and sixty-one\n one hundred and sixty-two\n one hundred and sixty-three\n one hundred and sixty-four\n one hundred and sixty-five\n one hundred and sixty-six\n one hundred and sixty-seven\n one hundred and sixty-eight\n one hundred and sixty-nine\n one hundred and seventy\n one hundred and seventy-one\n one hundred and seventy-two\n one hundred and seventy-three\n one hundred and seventy-four\n one hundred and seventy-five\n one hundred and seventy-six\n one hundred and seventy-seven\n one hundred and seventy-eight\n one hundred and seventy-nine\n one hundred and eighty\n one hundred and eighty-one\n one hundred and eighty-two\n one hundred and eighty-three\n one hundred and eighty-four\n one hundred and eighty-five\n one hundred and eighty-six\n one hundred and eighty-seven\n one hundred and eighty-eight\n one hundred and eighty-nine\n one hundred and ninety\n one hundred and ninety-one\n one hundred and ninety-two\n one hundred and ninety-three\n one hundred and ninety-four\n one hundred and ninety-five\n one hundred and ninety-six\n one hundred and ninety-seven\n one hundred and ninety-eight\n one hundred and ninety-nine\n two hundred\n two hundred and one\n two hundred and two\n two hundred and three\n two hundred and four\n two hundred and five\n two hundred and six\n two hundred and seven\n two hundred and eight\n two hundred and nine\n two hundred and ten\n two hundred and eleven\n two hundred and twelve\n two hundred and thirteen\n two hundred and fourteen\n two hundred and fifteen\n two hundred and sixteen\n two hundred and seventeen\n two hundred and eighteen\n two hundred and nineteen\n two hundred and twenty\n two hundred and twenty-one\n two hundred and twenty-two\n two hundred and twenty-three\n two hundred and twenty-four\n two hundred and twenty-five\n two hundred and twenty-six\n two hundred and twenty-seven\n two hundred and twenty-eight\n two hundred and twenty-nine\n two hundred and thirty\n two hundred and thirty-one\n two hundred and thirty-two\n two hundred and thirty-three\n two hundred and thirty-four\n two hundred and thirty-five\n two hundred and thirty-six\n two hundred and thirty-seven\n two hundred and thirty-eight\n two hundred and thirty-nine\n two hundred and forty\n two hundred and forty-one\n two hundred and forty-two\n two hundred and forty-three\n two hundred and forty-four\n two hundred and forty-five\n two hundred and forty-six\n two hundred and forty-seven\n two hundred and forty-eight\n two hundred and forty-nine\n two hundred and fifty\n two hundred and fifty-one\n two hundred and fifty-two\n two hundred and fifty-three\n two hundred and fifty-four\n two hundred and fifty-five\n two hundred and fifty-six\n two hundred and fifty-seven\n two hundred and fifty-eight\n two hundred and fifty-nine\n two hundred and sixty\n two hundred and sixty-one\n two hundred and sixty-two\n two hundred and sixty-three\n two hundred and sixty-four\n two hundred and sixty-five\n two hundred and sixty-six\n two hundred and sixty-seven\n two hundred and sixty-eight\n two hundred and sixty-nine\n two hundred and seventy\n two hundred and seventy-one\n two hundred and seventy-two\n two hundred and seventy-three\n two hundred and seventy-four\n two hundred and seventy-five\n two hundred and seventy-six\n two hundred and seventy-seven\n two hundred and seventy-eight\n two hundred and seventy-nine\n two hundred and eighty\n two hundred and eighty-one\n two hundred and eighty-two\n two hundred and eighty-three\n two hundred and eighty-four\n two hundred and eighty-five\n two hundred and eighty-six\n two hundred and eighty-seven\n two hundred and eighty-eight\n two hundred and eighty-nine\n two hundred and ninety\n two hundred and ninety-one\n two hundred and ninety-two\n two hundred and ninety-three\n two hundred and ninety-four\n two hundred and ninety-five\n two hundred and ninety-six\n two hundred and ninety-seven\n two hundred and ninety-eight\n two hundred and ninety-nine\n three hundred\n three hundred and one\n three hundred and two\n three hundred and three\n three hundred and four\n three hundred and five\n three hundred and six\n three hundred and seven\n three hundred and eight\n three hundred and nine\n three hundred and ten\n three hundred and eleven\n three hundred and twelve\n three hundred and thirteen\n three hundred and fourteen\n three hundred and fifteen\n three hundred and sixteen\n three hundred and seventeen\n three hundred and eighteen\n three hundred and nineteen\n three hundred and twenty\n three hundred and twenty-one\n three hundred and twenty-two\n three hundred and twenty-three\n three hundred and twenty-four\n three hundred and twenty-five\n three hundred and twenty-six\n three hundred and twenty-seven\n three hundred and twenty-eight\n three hundred and twenty-nine\n three hundred and thirty\n three hundred and thirty-one\n three hundred and thirty-two\n three hundred and thirty-three\n three hundred and thirty-four\n three hundred and thirty-five\n three hundred and thirty-six\n three hundred and thirty-seven\n three hundred and thirty-eight\n three hundred and thirty-nine\n three hundred and forty\n three hundred and forty-one\n three hundred and forty-two\n three hundred and forty-three\n three hundred and forty-four\n three hundred and forty-five\n three hundred and forty-six\n three hundred and forty-seven\n three hundred and forty-eight\n three hundred and forty-nine\n three hundred and fifty\n three hundred and fifty-one\n three hundred and fifty-two\n three hundred and fifty-three\n three hundred and fifty-four\n three hundred and fifty-five\n three hundred and fifty-six\n three hundred and fifty-seven\n three hundred and fifty-eight\n three hundred and fifty-nine\n three hundred and sixty\n three hundred and sixty-one\n three hundred and sixty-two\n three hundred and sixty-three\n three hundred and sixty-four\n three hundred and sixty-five\n three hundred and sixty-six\n three hundred and sixty-seven\n three hundred and sixty-eight\n three hundred and sixty-nine\n three hundred and seventy\n three hundred and seventy-one\n three hundred and seventy-two\n three hundred and seventy-three\n three hundred and seventy-four\n three hundred and seventy-five\n three hundred and seventy-six\n three hundred and seventy-seven\n three hundred and seventy-eight\n three hundred and seventy-nine\n three hundred and eighty\n three hundred and eighty-one\n three hundred and eighty-two\n three hundred and eighty-three\n three hundred and eighty-four\n three hundred and eighty-five\n three hundred and eighty-six\n three hundred and eighty-seven\n three hundred and eighty-eight\n three hundred and eighty-nine\n three hundred and ninety\n three hundred and ninety-one\n three hundred and ninety-two\n three hundred and ninety-three\n three hundred and ninety-four\n three hundred and ninety-five\n three hundred and ninety-six\n three hundred and ninety-seven\n three hundred and ninety-eight\n three hundred and ninety-nine\n four hundred\n four hundred and one\n four hundred and two\n four hundred and three\n four hundred and four\n four hundred and five\n four hundred and six\n four hundred and seven\n four hundred and eight\n four hundred and nine\n four hundred and ten\n four hundred and eleven\n four hundred and twelve\n four hundred and thirteen\n four hundred and fourteen\n four hundred and fifteen\n four hundred and sixteen\n four hundred and seventeen\n four hundred and eighteen\n four hundred and nineteen\n four hundred and twenty\n four hundred and twenty-one\n four hundred and twenty-two\n four hundred and twenty-three\n four hundred and twenty-four\n four hundred and twenty-five\n four hundred and twenty-six\n four hundred and twenty-seven\n four hundred and twenty-eight\n four hundred and twenty-nine\n four hundred and thirty\n four hundred and thirty-one\n four hundred and thirty-two\n four hundred and thirty-three\n four hundred and thirty-four\n four hundred and thirty-five\n four hundred and thirty-six\n four hundred and thirty-seven\n four hundred and thirty-eight\n four hundred and thirty-nine\n four hundred and forty\n four hundred and forty-one\n four hundred and forty-two\n four hundred and forty-three\n four hundred and forty-four\n four hundred and forty-five\n four hundred and forty-six\n four hundred and forty-seven\n four hundred and forty-eight\n four hundred and forty-nine\n four hundred and fifty\n four hundred and fifty-one\n four hundred and fifty-two\n four hundred and fifty-three\n four hundred and fifty-four\n four hundred and fifty-five\n four hundred and fifty-six\n four hundred and fifty-seven\n four hundred and fifty-eight\n four hundred and fifty-nine\n four hundred and sixty\n four hundred and sixty-one\n four hundred and sixty-two\n four hundred and sixty-three\n four hundred and sixty-four\n four hundred and sixty-five\n four hundred and sixty-six\n four hundred and sixty-seven\n four hundred and sixty-eight\n four hundred and sixty-nine\n four hundred and seventy\n four hundred and seventy-one\n four hundred and seventy-two\n four hundred and seventy-three\n four hundred and seventy-four\n four hundred and seventy-five\n four hundred and seventy-six\n four hundred and seventy-seven\n four hundred and seventy-eight\n four hundred and seventy-nine\n four hundred and eighty\n four hundred and eighty-one\n four hundred and eighty-two\n four hundred and eighty-three\n four hundred and eighty-four\n four hundred and eighty-five\n four hundred and eighty-six\n four hundred and eighty-seven\n four hundred and eighty-eight\n four hundred and eighty-nine\n four hundred and ninety\n four hundred and ninety-one\n four hundred and ninety-two\n four hundred and ninety-three\n four hundred and ninety-four\n four hundred and ninety-five\n four hundred and ninety-six\n four hundred and ninety-seven\n four hundred and ninety-eight\n four hundred and ninety-nine\n five hundred\n five hundred and one\n five hundred and two\n five hundred and three\n five hundred and four\n five hundred and five\n five hundred and six\n five hundred and seven\n five hundred and eight\n five hundred and nine\n five hundred and ten\n five hundred and eleven\n five hundred and twelve\n five hundred and thirteen\n five hundred and fourteen\n five hundred and fifteen\n five hundred and sixteen\n five hundred and seventeen\n five hundred and eighteen\n five hundred and nineteen\n five hundred and twenty\n five hundred and twenty-one\n five hundred and twenty-two\n five hundred and twenty-three\n five hundred and twenty-four\n five hundred and twenty-five\n five hundred and twenty-six\n five hundred and twenty-seven\n five hundred and twenty-eight\n five hundred and twenty-nine\n five hundred and thirty\n five hundred and thirty-one\n five hundred and thirty-two\n five hundred and thirty-three\n five hundred and thirty-four\n five hundred and thirty-five\n five hundred and thirty-six\n five hundred and thirty-seven\n five hundred and thirty-eight\n five hundred and thirty-nine\n five hundred and forty\n five hundred and forty-one\n five hundred and forty-two\n five hundred and forty-three\n five hundred and forty-four\n five hundred and forty-five\n five hundred and forty-six\n five hundred and forty-seven\n five hundred and forty-eight\n five hundred and forty-nine\n five hundred and fifty\n five hundred and fifty-one\n five hundred and fifty-two\n five hundred and fifty-three\n five hundred and fifty-four\n five hundred and fifty-five\n five hundred and fifty-six\n five hundred and fifty-seven\n five hundred and fifty-eight\n five hundred and fifty-nine\n five hundred and sixty\n five hundred and sixty-one\n five hundred and sixty-two\n five hundred and sixty-three\n five hundred and sixty-four\n five hundred and sixty-five\n five hundred and sixty-six\n five hundred and sixty-seven\n five hundred and sixty-eight\n five hundred and sixty-nine\n five hundred and seventy\n five hundred and seventy-one\n five hundred and seventy-two\n five hundred and seventy-three\n five hundred and seventy-four\n five hundred and seventy-five\n five hundred and seventy-six\n five hundred and seventy-seven\n five hundred and seventy-eight\n five hundred and seventy-nine\n five hundred and eighty\n five hundred and eighty-one\n five hundred and eighty-two\n five hundred and eighty-three\n five hundred and eighty-four\n five hundred and eighty-five\n five hundred and eighty-six\n five hundred and eighty-seven\n five hundred and eighty-eight\n five hundred and eighty-nine\n five hundred and ninety\n five hundred and ninety-one\n five hundred and ninety-two\n five hundred and ninety-three\n five hundred and ninety-four\n five hundred and ninety-five\n five hundred and ninety-six\n five hundred and ninety-seven\n five hundred and ninety-eight\n five hundred and ninety-nine\n six hundred\n six hundred and one\n six hundred and two\n six hundred and three\n six hundred and four\n six hundred and five\n six hundred and six\n six hundred and seven\n six hundred and eight\n six hundred and nine\n six hundred and ten\n six hundred and eleven\n six hundred and twelve\n six hundred and thirteen\n six hundred and fourteen\n six hundred and fifteen\n six hundred and sixteen\n six hundred and seventeen\n six hundred and eighteen\n six hundred and nineteen\n six hundred and twenty\n six hundred and twenty-one\n six hundred and twenty-two\n six hundred and twenty-three\n six hundred and twenty-four\n six hundred and twenty-five\n six hundred and twenty-six\n six hundred and twenty-seven\n six hundred and twenty-eight\n six hundred and twenty-nine\n six hundred and thirty\n six hundred and thirty-one\n six hundred and thirty-two\n six hundred and thirty-three\n six hundred and thirty-four\n six hundred and thirty-five\n six hundred and thirty-six\n six hundred and thirty-seven\n six hundred and thirty-eight\n six hundred and thirty-nine\n six hundred and forty\n six hundred and forty-one\n six hundred and forty-two\n six hundred and forty-three\n six hundred and forty-four\n six hundred and forty-five\n six hundred and forty-six\n six hundred and forty-seven\n six hundred and forty-eight\n six hundred and forty-nine\n six hundred and fifty\n six hundred and fifty-one\n six hundred and fifty-two\n six hundred and fifty-three\n six hundred and fifty-four\n six hundred and fifty-five\n six hundred and fifty-six\n six hundred and fifty-seven\n six hundred and fifty-eight\n six hundred and fifty-nine\n six hundred and sixty\n six hundred and sixty-one\n six hundred and sixty-two\n six hundred and sixty-three\n six hundred and sixty-four\n six hundred and sixty-five\n six hundred and sixty-six\n six hundred and sixty-seven\n six hundred and sixty-eight\n six hundred and sixty-nine\n six hundred and seventy\n six hundred and seventy-one\n six hundred and seventy-two\n six hundred and seventy-three\n six hundred and seventy-four\n six hundred and seventy-five\n six hundred and seventy-six\n six hundred and seventy-seven\n six hundred and seventy-eight\n six hundred and seventy-nine\n six hundred and eighty\n six hundred and eighty-one\n six hundred and eighty-two\n six hundred and eighty-three\n six hundred and eighty-four\n six hundred and eighty-five\n six hundred and eighty-six\n six hundred and eighty-seven\n six hundred and eighty-eight\n six hundred and eighty-nine\n six hundred and ninety\n six hundred and ninety-one\n six hundred and ninety-two\n six hundred and ninety-three\n six hundred and ninety-four\n six hundred and ninety-five\n six hundred and ninety-six\n six hundred and ninety-seven\n six hundred and ninety-eight\n six hundred and ninety-nine\n seven hundred\n seven hundred and one\n seven hundred and two\n seven hundred and three\n seven hundred and four\n seven hundred and five\n seven hundred and six\n seven hundred and seven\n seven hundred and eight\n seven hundred and nine\n seven hundred and ten\n seven hundred and eleven\n seven hundred and twelve\n seven hundred and thirteen\n seven hundred and fourteen\n seven hundred and fifteen\n seven hundred and sixteen\n seven hundred and seventeen\n seven hundred and eighteen\n seven hundred and nineteen\n seven hundred and twenty\n seven hundred and twenty-one\n seven hundred and twenty-two\n seven hundred and twenty-three\n seven hundred and twenty-four\n seven hundred and twenty-five\n seven hundred and twenty-six\n seven hundred and twenty-seven\n seven hundred and twenty-eight\n seven hundred and twenty-nine\n seven hundred and thirty\n seven hundred and thirty-one\n seven hundred and thirty-two\n seven hundred and thirty-three\n seven hundred and thirty-four\n seven hundred and thirty-five\n seven hundred and thirty-six\n seven hundred and thirty-seven\n seven hundred and thirty-eight\n seven hundred and thirty-nine\n seven hundred and forty\n seven hundred and forty-one\n seven hundred and forty-two\n seven hundred and forty-three\n seven hundred and forty-four\n seven hundred and forty-five\n seven hundred and forty-six\n seven hundred and forty-seven\n seven hundred and forty-eight\n seven hundred and forty-nine\n seven hundred and fifty\n seven hundred and fifty-one\n seven hundred and fifty-two\n seven hundred and fifty-three\n seven hundred and fifty-four\n seven hundred and fifty-five\n seven hundred and fifty-six\n seven hundred and fifty-seven\n seven hundred and fifty-eight\n seven hundred and fifty-nine\n seven hundred and sixty\n seven hundred and sixty-one\n seven hundred and sixty-two\n seven hundred and sixty-three\n seven hundred and sixty-four\n seven hundred and sixty-five\n seven hundred and sixty-six\n seven hundred and sixty-seven\n seven hundred and sixty-eight\n seven hundred and sixty-nine\n seven hundred and seventy\n seven hundred and seventy-one\n seven hundred and seventy-two\n seven hundred and seventy-three\n seven hundred and seventy-four\n seven hundred and seventy-five\n seven hundred and seventy-six\n seven hundred and seventy-seven\n seven hundred and seventy-eight\n seven hundred and seventy-nine\n seven hundred and eighty\n seven hundred and eighty-one\n seven hundred and eighty-two\n seven hundred and eighty-three\n seven hundred and eighty-four\n seven hundred and eighty-five\n seven hundred and eighty-six\n seven hundred and eighty-seven\n seven hundred and eighty-eight\n seven hundred and eighty-nine\n seven hundred and ninety\n seven hundred and ninety-one\n seven hundred and ninety-two\n seven hundred and ninety-three\n seven hundred and ninety-four\n seven hundred and ninety-five\n seven hundred and ninety-six\n seven hundred and ninety-seven\n seven hundred and ninety-eight\n seven hundred and ninety-nine\n eight hundred\n eight hundred and one\n eight hundred and two\n eight hundred and three\n eight hundred and four\n eight hundred and five\n eight hundred and six\n eight hundred and seven\n eight hundred and eight\n eight hundred and nine\n eight hundred and ten\n eight hundred and eleven\n eight hundred and twelve\n eight hundred and thirteen\n eight hundred and fourteen\n eight hundred and fifteen\n eight hundred and sixteen\n eight hundred and seventeen\n eight hundred and eighteen\n eight hundred and nineteen\n eight hundred and twenty\n eight hundred and twenty-one\n eight hundred and twenty-two\n eight hundred and twenty-three\n eight hundred and twenty-four\n eight hundred and twenty-five\n eight hundred and twenty-six\n eight hundred and twenty-seven\n eight hundred and twenty-eight\n eight hundred and twenty-nine\n eight hundred and thirty\n eight hundred and thirty-one\n eight hundred and thirty-two\n eight hundred and thirty-three\n eight hundred and thirty-four\n eight hundred and thirty-five\n eight hundred and thirty-six\n eight hundred and thirty-seven\n eight hundred and thirty-eight\n eight hundred and thirty-nine\n eight hundred and forty\n eight hundred and forty-one\n eight hundred and forty-two\n eight hundred and forty-three\n eight hundred and forty-four\n eight hundred and forty-five\n eight hundred and forty-six\n eight hundred and forty-seven\n eight hundred and forty-eight\n eight hundred and forty-nine\n eight hundred and fifty\n eight hundred and fifty-one\n eight hundred and fifty-two\n eight hundred and fifty-three\n eight hundred and fifty-four\n eight hundred and fifty-five\n eight hundred and fifty-six\n eight hundred and fifty-seven\n eight hundred and fifty-eight\n eight hundred and fifty-nine\n eight hundred and sixty\n eight hundred and sixty-one\n eight hundred and sixty-two\n eight hundred and sixty-three\n eight hundred and sixty-four\n eight hundred and sixty-five\n eight hundred and sixty-six\n eight hundred and sixty-seven\n eight hundred and sixty-eight\n eight hundred and sixty-nine\n eight hundred and seventy\n eight hundred and seventy-one\n eight hundred and seventy-two\n eight hundred and seventy-three\n eight hundred and seventy-four\n eight hundred and seventy-five\n eight hundred and seventy-six\n eight hundred and seventy-seven\n eight hundred and seventy-eight\n eight hundred and seventy-nine\n eight hundred and eighty\n eight hundred and eighty-one\n eight hundred and eighty-two\n eight hundred and eighty-three\n eight hundred and eighty-four\n eight hundred and eighty-five\n eight hundred and eighty-six\n eight hundred and eighty-seven\n eight hundred and eighty-eight\n eight hundred and eighty-nine\n eight hundred and ninety\n eight hundred and ninety-one\n eight hundred and ninety-two\n eight hundred and ninety-three\n eight hundred and ninety-four\n eight hundred and ninety-five\n eight hundred and ninety-six\n eight hundred and ninety-seven\n eight hundred and ninety-eight\n eight hundred and ninety-nine\n nine hundred\n nine hundred and one\n nine hundred and two\n nine hundred and three\n nine hundred and four\n nine hundred and five\n nine hundred and six\n nine hundred and seven\n nine hundred and eight\n nine hundred and nine\n nine hundred and ten\n nine hundred and eleven\n nine hundred and twelve\n nine hundred and thirteen\n nine hundred and fourteen\n nine hundred and fifteen\n nine hundred and sixteen\n nine hundred and seventeen\n nine hundred and eighteen\n nine hundred and nineteen\n nine hundred and twenty\n nine hundred and twenty-one\n nine hundred and twenty-two\n nine hundred and twenty-three\n nine hundred and twenty-four\n nine hundred and twenty-five\n nine hundred and twenty-six\n nine hundred and twenty-seven\n nine hundred and twenty-eight\n nine hundred and twenty-nine\n nine hundred and thirty\n nine hundred and thirty-one\n nine hundred and thirty-two\n nine hundred and thirty-three\n nine hundred and thirty-four\n nine hundred and thirty-five\n nine hundred and thirty-six\n nine hundred and thirty-seven\n nine hundred and thirty-eight\n nine hundred and thirty-nine\n nine hundred and forty\n nine hundred and forty-one\n nine hundred and forty-two\n nine hundred and forty-three\n nine hundred and forty-four\n nine hundred and forty-five\n nine hundred and forty-six\n nine hundred and forty-seven\n nine hundred and forty-eight\n nine hundred and forty-nine\n nine hundred and fifty\n nine hundred and fifty-one\n nine hundred and fifty-two\n nine hundred and fifty-three\n nine hundred and fifty-four\n nine hundred and fifty-five\n nine hundred and fifty-six\n nine hundred and fifty-seven\n nine hundred and fifty-eight\n nine hundred and fifty-nine\n nine hundred and sixty\n nine hundred and sixty-one\n nine hundred and sixty-two\n nine hundred and sixty-three\n nine hundred and sixty-four\n nine hundred and sixty-five\n nine hundred and sixty-six\n nine hundred and sixty-seven\n nine hundred and sixty-eight\n nine hundred and sixty-nine\n nine hundred and seventy\n nine hundred and seventy-one\n nine hundred and seventy-two\n nine hundred and seventy-three\n nine hundred and seventy-four\n nine hundred and seventy-five\n nine hundred and seventy-six\n nine hundred and seventy-seven\n nine hundred and seventy-eight\n nine hundred and seventy-nine\n nine hundred and eighty\n nine hundred and eighty-one\n nine hundred and eighty-two\n nine hundred and eighty-three\n nine hundred and eighty-four\n nine hundred and eighty-five\n nine hundred and eighty-six\n nine hundred and eighty-seven\n nine hundred and eighty-eight\n nine hundred and eighty-nine\n nine hundred and ninety\n nine hundred and ninety-one\n nine hundred and ninety-two\n nine hundred and ninety-three\n nine hundred and ninety-four\n nine hundred and ninety-five\n nine hundred and ninety-six\n nine hundred and ninety-seven\n nine hundred and ninety-eight\n nine hundred and ninety-nine', '\n and one\n and two\n and three\n and four\n and five\n and six\n and seven\n and eight\n and nine\n and ten\n and eleven\n and twelve\n and thirteen\n and fourteen\n and fifteen\n and sixteen\n and seventeen\n and eighteen\n and nineteen\n and twenty\n and twenty-one\n and twenty-two\n and twenty-three\n and twenty-four\n and twenty-five\n and twenty-six\n and twenty-seven\n and twenty-eight\n and twenty-nine\n and thirty\n and thirty-one\n and thirty-two\n and thirty-three\n and thirty-four\n and thirty-five\n and thirty-six\n and thirty-seven\n and thirty-eight\n and thirty-nine\n and forty\n and forty-one\n and forty-two\n and forty-three\n and forty-four\n and forty-five\n and forty-six\n and forty-seven\n and forty-eight\n and forty-nine\n and fifty\n and fifty-one\n and fifty-two\n and fifty-three\n and fifty-four\n and fifty-five\n and fifty-six\n and fifty-seven\n and fifty-eight\n and fifty-nine\n and sixty\n and sixty-one\n and sixty-two\n and sixty-three\n and sixty-four\n and sixty-five\n and sixty-six\n and sixty-seven\n and sixty-eight\n and sixty-nine\n and seventy\n and seventy-one\n and seventy-two\n and seventy-three\n and seventy-four\n and seventy-five\n and seventy-six\n and seventy-seven\n and seventy-eight\n and seventy-nine\n and eighty\n and eighty-one\n and eighty-two\n and eighty-three\n and eighty-four\n and eighty-five\n and eighty-six\n and eighty-seven\n and eighty-eight\n and eighty-nine\n and ninety\n and ninety-one\n and ninety-two\n and ninety-three\n and ninety-four\n and ninety-five\n and ninety-six\n and ninety-seven\n and ninety-eight\n and ninety-nine\n one hundred\n one hundred and one\n one hundred and two\n one hundred and three\n one hundred and four\n one hundred and five\n one hundred and six\n one hundred and seven\n one hundred and eight\n one hundred and nine\n one hundred and ten\n one hundred and eleven\n one hundred and twelve\n one hundred and thirteen\n one hundred and fourteen\n one hundred and fifteen\n one hundred and sixteen\n one hundred and seventeen\n one hundred and eighteen\n one hundred and nineteen\n one hundred and twenty\n one hundred and twenty-one\n one hundred and twenty-two\n one hundred and twenty-three\n one hundred and twenty-four\n one hundred and twenty-five\n one hundred and twenty-six\n one hundred and twenty-seven\n one hundred and twenty-eight\n one hundred and twenty-nine\n one hundred and thirty\n one hundred and thirty-one\n one hundred and thirty-two\n one hundred and thirty-three\n one hundred and thirty-four\n one hundred and thirty-five\n one hundred and thirty-six\n one hundred and thirty-seven\n one hundred and thirty-eight\n one hundred and thirty-nine\n one hundred and forty\n one hundred and forty-one\n one hundred and forty-two\n one hundred and forty-three\n one hundred and forty-four\n one hundred and forty-five\n one hundred and forty-six\n one hundred and forty-seven\n one hundred and forty-eight\n one hundred and forty-nine\n one hundred and fifty\n one hundred and fifty-one\n one hundred and fifty-two\n one hundred and fifty-three\n one hundred and fifty-four\n one hundred and fifty-five\n one hundred and fifty-six\n one hundred and fifty-seven\n one hundred and fifty-eight\n one hundred and fifty-nine\n one hundred and sixty\n one hundred and sixty-one\n one hundred and sixty-two\n one hundred and sixty-three\n one hundred and sixty-four\n one hundred and sixty-five\n one hundred and sixty-six\n one hundred and sixty-seven\n one hundred and sixty-eight\n one hundred and sixty-nine\n one hundred and seventy\n one hundred and seventy-one\n one hundred and seventy-two\n one hundred and seventy-three\n one hundred and seventy-four\n one hundred and seventy-five\n one hundred and seventy-six\n one hundred and seventy-seven\n one hundred and seventy-eight\n one hundred and seventy-nine\n one hundred and eighty\n one hundred and eighty-one\n one hundred and eighty-two\n one hundred and eighty-three\n one hundred and eighty-four\n one hundred and eighty-five\n one hundred and eighty-six\n one hundred and eighty-seven\n one hundred and eighty-eight\n one hundred and eighty-nine\n one hundred and ninety\n one hundred and ninety-one\n one hundred and ninety-two\n one hundred and ninety-three\n one hundred and ninety-four\n one hundred and ninety-five\n one hundred and ninety-six\n one hundred and ninety-seven\n one hundred and ninety-eight\n one hundred and ninety-nine\n two hundred\n two hundred and one\n two hundred and two\n two hundred and three\n two hundred and four\n two hundred and five\n two hundred and six\n two hundred and seven\n two hundred and eight\n two hundred and nine\n two hundred and ten\n two hundred and eleven\n two hundred and twelve\n two hundred and thirteen\n two hundred and fourteen\n two hundred and fifteen\n two hundred and sixteen\n two hundred and seventeen\n two hundred and eighteen\n two hundred and nineteen\n two hundred and twenty\n two hundred and twenty-one\n two hundred and twenty-two\n two hundred and twenty-three\n two hundred and twenty-four\n two hundred and twenty-five\n two hundred and twenty-six\n two hundred and twenty-seven\n two hundred and twenty-eight\n two hundred and twenty-nine\n two hundred and thirty\n two hundred and thirty-one\n two hundred and thirty-two\n two hundred and thirty-three\n two hundred and thirty-four\n two hundred and thirty-five\n two hundred and thirty-six\n two hundred and thirty-seven\n two hundred and thirty-eight\n two hundred and thirty-nine\n two hundred and forty\n two hundred and forty-one\n two hundred and forty-two\n two hundred and forty-three\n two hundred and forty-four\n two hundred and forty-five\n two hundred and forty-six\n two hundred and forty-seven\n two hundred and forty-eight\n two hundred and forty-nine\n two hundred and fifty\n two hundred and fifty-one\n two hundred and fifty-two\n two hundred and fifty-three\n two hundred and fifty-four\n two hundred and fifty-five\n two hundred and fifty-six\n two hundred and fifty-seven\n two hundred and fifty-eight\n two hundred and fifty-nine\n two hundred and sixty\n two hundred and sixty-one\n two hundred and sixty-two\n two hundred and sixty-three\n two hundred and sixty-four\n two hundred and sixty-five\n two hundred and sixty-six\n two hundred and sixty-seven\n two hundred and sixty-eight\n two hundred and sixty-nine\n two hundred and seventy\n two hundred and seventy-one\n two hundred and seventy-two\n two hundred and seventy-three\n two hundred and seventy-four\n two hundred and seventy-five\n two hundred and seventy-six\n two hundred and seventy-seven\n two hundred and seventy-eight\n two hundred and seventy-nine\n two hundred and eighty\n two hundred and eighty-one\n two hundred and eighty-two\n two hundred and eighty-three\n two hundred and eighty-four\n two hundred and eighty-five\n two hundred and eighty-six\n two hundred and eighty-seven\n two hundred and eighty-eight\n two hundred and eighty-nine\n two hundred and ninety\n two hundred and ninety-one\n two hundred and ninety-two\n two hundred and ninety-three\n two hundred and ninety-four\n two hundred and ninety-five\n two hundred and ninety-six\n two hundred and ninety-seven\n two hundred and ninety-eight\n two hundred and ninety-nine\n three hundred\n three hundred and one\n three hundred and two\n three hundred and three\n three hundred and four\n three hundred and five\n three hundred and six\n three hundred and seven\n three hundred and eight\n three hundred and nine\n three hundred and ten\n three hundred and eleven\n three hundred and twelve\n three hundred and thirteen\n three hundred and fourteen\n three hundred and fifteen\n three hundred and sixteen\n three hundred and seventeen\n three hundred and eighteen\n three hundred and nineteen\n three hundred and twenty\n three hundred and twenty-one\n three hundred and twenty-two\n three hundred and twenty-three\n three hundred and twenty-four\n three hundred and twenty-five\n three hundred and twenty-six\n three hundred and twenty-seven\n three hundred and twenty-eight\n three hundred and twenty-nine\n three hundred and thirty\n three hundred and thirty-one\n three hundred and thirty-two\n three hundred and thirty-three\n three hundred and thirty-four\n three hundred and thirty-five\n three hundred and thirty-six\n three hundred and thirty-seven\n three hundred and thirty-eight\n three hundred and thirty-nine\n three hundred and forty\n three hundred and forty-one\n three hundred and forty-two\n three hundred and forty-three\n three hundred and forty-four\n three hundred and forty-five\n three hundred and forty-six\n three hundred and forty-seven\n three hundred and forty-eight\n three hundred and forty-nine\n three hundred and fifty\n three hundred and fifty-one\n three hundred and fifty-two\n three hundred and fifty-three\n three hundred and fifty-four\n three hundred and fifty-five\n three hundred and fifty-six\n three hundred and fifty-seven\n three hundred and fifty-eight\n three hundred and fifty-nine\n three hundred and sixty\n three hundred and sixty-one\n three hundred and sixty-two\n three hundred and sixty-three\n three hundred and sixty-four\n three hundred and sixty-five\n three hundred and sixty-six\n three hundred and sixty-seven\n three hundred and sixty-eight\n three hundred and sixty-nine\n three hundred and seventy\n three hundred and seventy-one\n three hundred and seventy-two\n three hundred and seventy-three\n three hundred and seventy-four\n three hundred and seventy-five\n three hundred and seventy-six\n three hundred and seventy-seven\n three hundred and seventy-eight\n three hundred and seventy-nine\n three hundred and eighty\n three hundred and eighty-one\n three hundred and eighty-two\n three hundred and eighty-three\n three hundred and eighty-four\n three hundred and eighty-five\n three hundred and eighty-six\n three hundred and eighty-seven\n three hundred and eighty-eight\n three hundred and eighty-nine\n three hundred and ninety\n three hundred and ninety-one\n three hundred and ninety-two\n three hundred and ninety-three\n three hundred and ninety-four\n three hundred and ninety-five\n three hundred and ninety-six\n three hundred and ninety-seven\n three hundred and ninety-eight\n three hundred and ninety-nine\n four hundred\n four hundred and one\n four hundred and two\n four hundred and three\n four hundred and four\n four hundred and five\n four hundred and six\n four hundred and seven\n four hundred and eight\n four hundred and nine\n four hundred and ten\n four hundred and eleven\n four hundred and twelve\n four hundred and thirteen\n four hundred and fourteen\n four hundred and fifteen\n four hundred and sixteen\n four hundred and seventeen\n four hundred and eighteen\n four hundred and nineteen\n four hundred and twenty\n four hundred and twenty-one\n four hundred and twenty-two\n four hundred and twenty-three\n four hundred and twenty-four\n four hundred and twenty-five\n four hundred and twenty-six\n four hundred and twenty-seven\n four hundred and twenty-eight\n four hundred and twenty-nine\n four hundred and thirty\n four hundred and thirty-one\n four hundred and thirty-two\n four hundred and thirty-three\n four hundred and thirty-four\n four hundred and thirty-five\n four hundred and thirty-six\n four hundred and thirty-seven\n four hundred and thirty-eight\n four hundred and thirty-nine\n four hundred and forty\n four hundred and forty-one\n four hundred and forty-two\n four hundred and forty-three\n four hundred and forty-four\n four hundred and forty-five\n four hundred and forty-six\n four hundred and forty-seven\n four hundred and forty-eight\n four hundred and forty-nine\n four hundred and fifty\n four hundred and fifty-one\n four hundred and fifty-two\n four hundred and fifty-three\n four hundred and fifty-four\n four hundred and fifty-five\n four hundred and fifty-six\n four hundred and fifty-seven\n four hundred and fifty-eight\n four hundred and fifty-nine\n four hundred and sixty\n four hundred and sixty-one\n four hundred and sixty-two\n four hundred and sixty-three\n four hundred and sixty-four\n four hundred and sixty-five\n four hundred and sixty-six\n four hundred and sixty-seven\n four hundred and sixty-eight\n four hundred and sixty-nine\n four hundred and seventy\n four hundred and seventy-one\n four hundred and seventy-two\n four hundred and seventy-three\n four hundred and seventy-four\n four hundred and seventy-five\n four hundred and seventy-six\n four hundred and seventy-seven\n four hundred and seventy-eight\n four hundred and seventy-nine\n four hundred and eighty\n four hundred and eighty-one\n four hundred and eighty-two\n four hundred and eighty-three\n four hundred and eighty-four\n four hundred and eighty-five\n four hundred and eighty-six\n four hundred and eighty-seven\n four hundred and eighty-eight\n four hundred and eighty-nine\n four hundred and ninety\n four hundred and ninety-one\n four hundred and ninety-two\n four hundred and ninety-three\n four hundred and ninety-four\n four hundred and ninety-five\n four hundred and ninety-six\n four hundred and ninety-seven\n four hundred and ninety-eight\n four hundred and ninety-nine\n five hundred\n five hundred and one\n five hundred and two\n five hundred and three\n five hundred and four\n five hundred and five\n five hundred and six\n five hundred and seven\n five hundred and eight\n five hundred and nine\n five hundred and ten\n five hundred and eleven\n five hundred and twelve\n five hundred and thirteen\n five hundred and fourteen\n five hundred and fifteen\n five hundred and sixteen\n five hundred and seventeen\n five hundred and eighteen\n five hundred and nineteen\n five hundred and twenty\n five hundred and twenty-one\n five hundred and twenty-two\n five hundred and twenty-three\n five hundred and twenty-four\n five hundred and twenty-five\n five hundred and twenty-six\n five hundred and twenty-seven\n five hundred and twenty-eight\n five hundred and twenty-nine\n five hundred and thirty\n five hundred and thirty-one\n five hundred and thirty-two\n five hundred and thirty-three\n five hundred and thirty-four\n five hundred and thirty-five\n five hundred and thirty-six\n five hundred and thirty-seven\n five hundred and thirty-eight\n five hundred and thirty-nine\n five hundred and forty\n five hundred and forty-one\n five hundred and forty-two\n five hundred and forty-three\n five hundred and forty-four\n five hundred and forty-five\n five hundred and forty-six\n five hundred and forty-seven\n five hundred and forty-eight\n five hundred and forty-nine\n five hundred and fifty\n five hundred and fifty-one\n five hundred and fifty-two\n five hundred and fifty-three\n five hundred and fifty-four\n five hundred and fifty-five\n five hundred and fifty-six\n five hundred and fifty-seven\n five hundred and fifty-eight\n five hundred and fifty-nine\n five hundred and sixty\n five hundred and sixty-one\n five hundred and sixty-two\n five hundred and sixty-three\n five hundred and sixty-four\n five hundred and sixty-five\n five hundred and sixty-six\n five hundred and sixty-seven\n five hundred and sixty-eight\n five hundred and sixty-nine\n five hundred and seventy\n five hundred and seventy-one\n five hundred and seventy-two\n five hundred and seventy-three\n five hundred and seventy-four\n five hundred and seventy-five\n five hundred and seventy-six\n five hundred and seventy-seven\n five hundred and seventy-eight\n five hundred and seventy-nine\n five hundred and eighty\n five hundred and eighty-one\n five hundred and eighty-two\n five hundred and eighty-three\n five hundred and eighty-four\n five hundred and eighty-five\n five hundred and eighty-six\n five hundred and eighty-seven\n five hundred and eighty-eight\n five hundred and eighty-nine\n five hundred and ninety\n five hundred and ninety-one\n five hundred and ninety-two\n five hundred and ninety-three\n five hundred and ninety-four\n five hundred and ninety-five\n five hundred and ninety-six\n five hundred and ninety-seven\n five hundred and ninety-eight\n five hundred and ninety-nine\n six hundred\n six hundred and one\n six hundred and two\n six hundred and three\n six hundred and four\n six hundred and five\n six hundred and six\n six hundred and seven\n six hundred and eight\n six hundred and nine\n six hundred and ten\n six hundred and eleven\n six hundred and twelve\n six hundred and thirteen\n six hundred and fourteen\n six hundred and fifteen\n six hundred and sixteen\n six hundred and seventeen\n six hundred and eighteen\n six hundred and nineteen\n six hundred and twenty\n six hundred and twenty-one\n six hundred and twenty-two\n six hundred and twenty-three\n six hundred and twenty-four\n six hundred and twenty-five\n six hundred and twenty-six\n six hundred and twenty-seven\n six hundred and twenty-eight\n six hundred and twenty-nine\n six hundred and thirty\n six hundred and thirty-one\n six hundred and thirty-two\n six hundred and thirty-three\n six hundred and thirty-four\n six hundred and thirty-five\n six hundred and thirty-six\n six hundred and thirty-seven\n six hundred and thirty-eight\n six hundred and thirty-nine\n six hundred and forty\n six hundred and forty-one\n six hundred and forty-two\n six hundred and forty-three\n six hundred and forty-four\n six hundred and forty-five\n six hundred and forty-six\n six hundred and forty-seven\n six hundred and forty-eight\n six hundred and forty-nine\n six hundred and fifty\n six hundred and fifty-one\n six hundred and fifty-two\n six hundred and fifty-three\n six hundred and fifty-four\n six hundred and fifty-five\n six hundred and fifty-six\n six hundred and fifty-seven\n six hundred and fifty-eight\n six hundred and fifty-nine\n six hundred and sixty\n six hundred and sixty-one\n six hundred and sixty-two\n six hundred and sixty-three\n six hundred and sixty-four\n six hundred and sixty-five\n six hundred and sixty-six\n six hundred and sixty-seven\n six hundred and sixty-eight\n six hundred and sixty-nine\n six hundred and seventy\n six hundred and seventy-one\n six hundred and seventy-two\n six hundred and seventy-three\n six hundred and seventy-four\n six hundred and seventy-five\n six hundred and seventy-six\n six hundred and seventy-seven\n six hundred and seventy-eight\n six hundred and seventy-nine\n six hundred and eighty\n six hundred and eighty-one\n six hundred and eighty-two\n six hundred and eighty-three\n six hundred and eighty-four\n six hundred and eighty-five\n six hundred and eighty-six\n six hundred and eighty-seven\n six hundred and eighty-eight\n six hundred and eighty-nine\n six hundred and ninety\n six hundred and ninety-one\n six hundred and ninety-two\n six hundred and ninety-three\n six hundred and ninety-four\n six hundred and ninety-five\n six hundred and ninety-six\n six hundred and ninety-seven\n six hundred and ninety-eight\n six hundred and ninety-nine\n seven hundred\n seven hundred and one\n seven hundred and two\n seven hundred and three\n seven hundred and four\n seven hundred and five\n seven hundred and six\n seven hundred and seven\n seven hundred and eight\n seven hundred and nine\n seven hundred and ten\n seven hundred and eleven\n seven hundred and twelve\n seven hundred and thirteen\n seven hundred and fourteen\n seven hundred and fifteen\n seven hundred and sixteen\n seven hundred and seventeen\n seven hundred and eighteen\n seven hundred and nineteen\n seven hundred and twenty\n seven hundred and twenty-one\n seven hundred and twenty-two\n seven hundred and twenty-three\n seven hundred and twenty-four\n seven hundred and twenty-five\n seven hundred and twenty-six\n seven hundred and twenty-seven\n seven hundred and twenty-eight\n seven hundred and twenty-nine\n seven hundred and thirty\n seven hundred and thirty-one\n seven hundred and thirty-two\n seven hundred and thirty-three\n seven hundred and thirty-four\n seven hundred and thirty-five\n seven hundred and thirty-six\n seven hundred and thirty-seven\n seven hundred and thirty-eight\n seven hundred and thirty-nine\n seven hundred and forty\n seven hundred and forty-one\n seven hundred and forty-two\n seven hundred and forty-three\n seven hundred and forty-four\n seven hundred and forty-five\n seven hundred and forty-six\n seven hundred and forty-seven\n seven hundred and forty-eight\n seven hundred and forty-nine\n seven hundred and fifty\n seven hundred and fifty-one\n seven hundred and fifty-two\n seven hundred and fifty-three\n seven hundred and fifty-four\n seven hundred and fifty-five\n seven hundred and fifty-six\n seven hundred and fifty-seven\n seven hundred and fifty-eight\n seven hundred and fifty-nine\n seven hundred and sixty\n seven hundred and sixty-one\n seven hundred and sixty-two\n seven hundred and sixty-three\n seven hundred and sixty-four\n seven hundred and sixty-five\n seven hundred and sixty-six\n seven hundred and sixty-seven\n seven hundred and sixty-eight\n seven hundred and sixty-nine\n seven hundred and seventy\n seven hundred and seventy-one\n seven hundred and seventy-two\n seven hundred and seventy-three\n seven hundred and seventy-four\n seven hundred and seventy-five\n seven hundred and seventy-six\n seven hundred and seventy-seven\n seven hundred and seventy-eight\n seven hundred and seventy-nine\n seven hundred and eighty\n seven hundred and eighty-one\n seven hundred and eighty-two\n seven hundred and eighty-three\n seven hundred and eighty-four\n seven hundred and eighty-five\n seven hundred and eighty-six\n seven hundred and eighty-seven\n seven hundred and eighty-eight\n seven hundred and eighty-nine\n seven hundred and ninety\n seven hundred and ninety-one\n seven hundred and ninety-two\n seven hundred and ninety-three\n seven hundred and ninety-four\n seven hundred and ninety-five\n seven hundred and ninety-six\n seven hundred and ninety-seven\n seven hundred and ninety-eight\n seven hundred and ninety-nine\n eight hundred\n eight hundred and one\n eight hundred and two\n eight hundred and three\n eight hundred and four\n eight hundred and five\n eight hundred and six\n eight hundred and seven\n eight hundred and eight\n eight hundred and nine\n eight hundred and ten\n eight hundred and eleven\n eight hundred and twelve\n eight hundred and thirteen\n eight hundred and fourteen\n eight hundred and fifteen\n eight hundred and sixteen\n eight hundred and seventeen\n eight hundred and eighteen\n eight hundred and nineteen\n eight hundred and twenty\n eight hundred and twenty-one\n eight hundred and twenty-two\n eight hundred and twenty-three\n eight hundred and twenty-four\n eight hundred and twenty-five\n eight hundred and twenty-six\n eight hundred and twenty-seven\n eight hundred and twenty-eight\n eight hundred and twenty-nine\n eight hundred and thirty\n eight hundred and thirty-one\n eight hundred and thirty-two\n eight hundred and thirty-three\n eight hundred and thirty-four\n eight hundred and thirty-five\n eight hundred and thirty-six\n eight hundred and thirty-seven\n eight hundred and thirty-eight\n eight hundred and thirty-nine\n eight hundred and forty\n eight hundred and forty-one\n eight hundred and forty-two\n eight hundred and forty-three\n eight hundred and forty-four\n eight hundred and forty-five\n eight hundred and forty-six\n eight hundred and forty-seven\n eight hundred and forty-eight\n eight hundred and forty-nine\n eight hundred and fifty\n eight hundred and fifty-one\n eight hundred and fifty-two\n eight hundred and fifty-three\n eight hundred and fifty-four\n eight hundred and fifty-five\n eight hundred and fifty-six\n eight hundred and fifty-seven\n eight hundred and fifty-eight\n eight hundred and fifty-nine\n eight hundred and sixty\n eight hundred and sixty-one\n eight hundred and sixty-two\n eight hundred and sixty-three\n eight hundred and sixty-four\n eight hundred and sixty-five\n eight hundred and sixty-six\n eight hundred and sixty-seven\n eight hundred and sixty-eight\n eight hundred and sixty-nine\n eight hundred and seventy\n eight hundred and seventy-one\n eight hundred and seventy-two\n eight hundred and seventy-three\n eight hundred and seventy-four\n eight hundred and seventy-five\n eight hundred and seventy-six\n eight hundred and seventy-seven\n eight hundred and seventy-eight\n eight hundred and seventy-nine\n eight hundred and eighty\n eight hundred and eighty-one\n eight hundred and eighty-two\n eight hundred and eighty-three\n eight hundred and eighty-four\n eight hundred and eighty-five\n eight hundred and eighty-six\n eight hundred and eighty-seven\n eight hundred and eighty-eight\n eight hundred and eighty-nine\n eight hundred and ninety\n eight hundred and ninety-one\n eight hundred and ninety-two\n eight hundred and ninety-three\n eight hundred and ninety-four\n eight hundred and ninety-five\n eight hundred and ninety-six\n eight hundred and ninety-seven\n eight hundred and ninety-eight\n eight hundred and ninety-nine\n nine hundred\n nine hundred and one\n nine hundred and two\n nine hundred and three\n nine hundred and four\n nine hundred and five\n nine hundred and six\n nine hundred and seven\n nine hundred and eight\n nine hundred and nine\n nine hundred and ten\n nine hundred and eleven\n nine hundred and twelve\n nine hundred and thirteen\n nine hundred and fourteen\n nine hundred and fifteen\n nine hundred and sixteen\n nine hundred and seventeen\n nine hundred and eighteen\n nine hundred and nineteen\n nine hundred and twenty\n nine hundred and twenty-one\n nine hundred and twenty-two\n nine hundred and twenty-three\n nine hundred and twenty-four\n nine hundred and twenty-five\n nine hundred and twenty-six\n nine hundred and twenty-seven\n nine hundred and twenty-eight\n nine hundred and twenty-nine\n nine hundred and thirty\n nine hundred and thirty-one\n nine hundred and thirty-two\n nine hundred and thirty-three\n nine hundred and thirty-four\n nine hundred and thirty-five\n nine hundred and thirty-six\n nine hundred and thirty-seven\n nine hundred and thirty-eight\n nine hundred and thirty-nine\n nine hundred and forty\n nine hundred and forty-one\n nine hundred and forty-two\n nine hundred and forty-three\n nine hundred and forty-four\n nine hundred and forty-five\n nine hundred and forty-six\n nine hundred and forty-seven\n nine hundred and forty-eight\n nine hundred and forty-nine\n nine hundred and fifty\n nine hundred and fifty-one\n nine hundred and fifty-two\n nine hundred and fifty-three\n nine hundred and fifty-four\n nine hundred and fifty-five\n nine hundred and fifty-six\n nine hundred and fifty-seven\n nine hundred and fifty-eight\n nine hundred and fifty-nine\n nine hundred and sixty\n nine hundred and sixty-one\n nine hundred and sixty-two\n nine hundred and sixty-three\n nine hundred and sixty-four\n nine hundred and sixty-five\n nine hundred and sixty-six\n nine hundred and sixty-seven\n nine hundred and sixty-eight\n nine hundred and sixty-nine\n nine hundred and seventy\n nine hundred and seventy-one\n nine hundred and seventy-two\n nine hundred and seventy-three\n nine hundred and seventy-four\n nine hundred and seventy-five\n nine hundred and seventy-six\n nine hundred and seventy-seven\n nine hundred and seventy-eight\n nine hundred and seventy-nine\n nine hundred and eighty\n nine hundred and eighty-one\n nine hundred and eighty-two\n nine hundred and eighty-three\n nine hundred and eighty-four\n nine hundred and eighty-five\n nine hundred and eighty-six\n nine hundred and eighty-seven\n nine hundred and eighty-eight\n nine hundred and eighty-nine\n nine hundred and ninety\n nine hundred and ninety-one\n nine hundred and ninety-two\n nine hundred and ninety-three\n nine hundred and ninety-four\n nine hundred and ninety-five\n nine hundred and ninety-six\n nine hundred and ninety-seven\n nine hundred and ninety-eight\n nine hundred and ninety-nine')
+
+_block_3 = '\none\ntwo\nthree\nfour\nfive\nsix\nseven\neight\nnine\nten\neleven\ntwelve\nthirteen\nfourteen\nfifteen\nsixteen\nseventeen\neighteen\nnineteen\ntwenty\ntwenty-one\ntwenty-two\ntwenty-three\ntwenty-four\ntwenty-five\ntwenty-six\ntwenty-seven\ntwenty-eight\ntwenty-nine\nthirty\nthirty-one\nthirty-two\nthirty-three\nthirty-four\nthirty-five\nthirty-six\nthirty-seven\nthirty-eight\nthirty-nine\nforty\nforty-one\nforty-two\nforty-three\nforty-four\nforty-five\nforty-six\nforty-seven\nforty-eight\nforty-nine\nfifty\nfifty-one\nfifty-two\nfifty-three\nfifty-four\nfifty-five\nfifty-six\nfifty-seven\nfifty-eight\nfifty-nine\nsixty\nsixty-one\nsixty-two\nsixty-three\nsixty-four\nsixty-five\nsixty-six\nsixty-seven\nsixty-eight\nsixty-nine\nseventy\nseventy-one\nseventy-two\nseventy-three\nseventy-four\nseventy-five\nseventy-six\nseventy-seven\nseventy-eight\nseventy-nine\neighty\neighty-one\neighty-two\neighty-three\neighty-four\neighty-five\neighty-six\neighty-seven\neighty-eight\neighty-nine\nninety\nninety-one\nninety-two\nninety-three\nninety-four\nninety-five\nninety-six\nninety-seven\nninety-eight\nninety-nine\none hundred\none hundred one\none hundred two\none hundred three\none hundred four\none hundred five\none hundred six\none hundred seven\none hundred eight\none hundred nine\none hundred ten\none hundred eleven\none hundred twelve\none hundred thirteen\none hundred fourteen\none hundred fifteen\none hundred sixteen\none hundred seventeen\none hundred eighteen\none hundred nineteen\none hundred twenty\none hundred twenty-one\none hundred twenty-two\none hundred twenty-three\none hundred twenty-four\none hundred twenty-five\none hundred twenty-six\none hundred twenty-seven\none hundred twenty-eight\none hundred twenty-nine\none hundred thirty\none hundred thirty-one\none hundred thirty-two\none hundred thirty-three\none hundred thirty-four\none hundred thirty-five\none hundred thirty-six\none hundred thirty-seven\none hundred thirty-eight\none hundred thirty-nine\none hundred forty\none hundred forty-one\none hundred forty-two\none hundred forty-three\none hundred forty-four\none hundred forty-five\none hundred forty-six\none hundred forty-seven\none hundred forty-eight\none hundred forty-nine\none hundred fifty\none hundred fifty-one\none hundred fifty-two\none hundred fifty-three\none hundred fifty-four\none hundred fifty-five\none hundred fifty-six\none hundred fifty-seven\none hundred fifty-eight\none hundred fifty-nine\none hundred sixty\none hundred sixty-one\none hundred sixty-two\none hundred sixty-three\none hundred sixty-four\none hundred sixty-five\none hundred sixty-six\none hundred sixty-seven\none hundred sixty-eight\none hundred sixty-nine\none hundred seventy\none hundred seventy-one\none hundred seventy-two\none hundred seventy-three\none hundred seventy-four\none hundred seventy-five\none hundred seventy-six\none hundred seventy-seven\none hundred seventy-eight\none hundred seventy-nine\none hundred eighty\none hundred eighty-one\none hundred eighty-two\none hundred eighty-three\none hundred eighty-four\none hundred eighty-five\none hundred eighty-six\none hundred eighty-seven\none hundred eighty-eight\none hundred eighty-nine\none hundred ninety\none hundred ninety-one\none hundred ninety-two\none hundred ninety-three\none hundred ninety-four\none hundred ninety-five\none hundred ninety-six\none hundred ninety-seven\none hundred ninety-eight\none hundred ninety-nine\ntwo hundred\ntwo hundred one\ntwo hundred two\ntwo hundred three\ntwo hundred four\ntwo hundred five\ntwo hundred six\ntwo hundred seven\ntwo hundred eight\ntwo hundred nine\ntwo hundred ten\ntwo hundred eleven\ntwo hundred twelve\ntwo hundred thirteen\ntwo hundred fourteen\ntwo hundred fifteen\ntwo hundred sixteen\ntwo hundred seventeen\ntwo hundred eighteen\ntwo hundred nineteen\ntwo hundred twenty\ntwo hundred twenty-one\ntwo hundred twenty-two\ntwo hundred twenty-three\ntwo hundred twenty-four\ntwo hundred twenty-five\ntwo hundred twenty-six\ntwo hundred twenty-seven\ntwo hundred twenty-eight\ntwo hundred twenty-nine\ntwo hundred thirty\ntwo hundred thirty-one\ntwo hundred thirty-two\ntwo hundred thirty-three\ntwo hundred thirty-four\ntwo hundred thirty-five\ntwo hundred thirty-six\ntwo hundred thirty-seven\ntwo hundred thirty-eight\ntwo hundred thirty-nine\ntwo hundred forty\ntwo hundred forty-one\ntwo hundred forty-two\ntwo hundred forty-three\ntwo hundred forty-four\ntwo hundred forty-five\ntwo hundred forty-six\ntwo hundred forty-seven\ntwo hundred forty-eight\ntwo hundred forty-nine\ntwo hundred fifty\ntwo hundred fifty-one\ntwo hundred fifty-two\ntwo hundred fifty-three\ntwo hundred fifty-four\ntwo hundred fifty-five\ntwo hundred fifty-six\ntwo hundred fifty-seven\ntwo hundred fifty-eight\ntwo hundred fifty-nine\ntwo hundred sixty\ntwo hundred sixty-one\ntwo hundred sixty-two\ntwo hundred sixty-three\ntwo hundred sixty-four\ntwo hundred sixty-five\ntwo hundred sixty-six\ntwo hundred sixty-seven\ntwo hundred sixty-eight\ntwo hundred sixty-nine\ntwo hundred seventy\ntwo hundred seventy-one\ntwo hundred seventy-two\ntwo hundred seventy-three\ntwo hundred seventy-four\ntwo hundred seventy-five\ntwo hundred seventy-six\ntwo hundred seventy-seven\ntwo hundred seventy-eight\ntwo hundred seventy-nine\ntwo hundred eighty\ntwo hundred eighty-one\ntwo hundred eighty-two\ntwo hundred eighty-three\ntwo hundred eighty-four\ntwo hundred eighty-five\ntwo hundred eighty-six\ntwo hundred eighty-seven\ntwo hundred eighty-eight\ntwo hundred eighty-nine\ntwo hundred ninety\ntwo hundred ninety-one\ntwo hundred ninety-two\ntwo hundred ninety-three\ntwo hundred ninety-four\ntwo hundred ninety-five\ntwo hundred ninety-six\ntwo hundred ninety-seven\ntwo hundred ninety-eight\ntwo hundred ninety-nine\nthree hundred\nthree hundred one\nthree hundred two\nthree hundred three\nthree hundred four\nthree hundred five\nthree hundred six\nthree hundred seven\nthree hundred eight\nthree hundred nine\nthree hundred ten\nthree hundred eleven\nthree hundred twelve\nthree hundred thirteen\nthree hundred fourteen\nthree hundred fifteen\nthree hundred sixteen\nthree hundred seventeen\nthree hundred eighteen\nthree hundred nineteen\nthree hundred twenty\nthree hundred twenty-one\nthree hundred twenty-two\nthree hundred twenty-three\nthree hundred twenty-four\nthree hundred twenty-five\nthree hundred twenty-six\nthree hundred twenty-seven\nthree hundred twenty-eight\nthree hundred twenty-nine\nthree hundred thirty\nthree hundred thirty-one\nthree hundred thirty-two\nthree hundred thirty-three\nthree hundred thirty-four\nthree hundred thirty-five\nthree hundred thirty-six\nthree hundred thirty-seven\nthree hundred thirty-eight\nthree hundred thirty-nine\nthree hundred forty\nthree hundred forty-one\nthree hundred forty-two\nthree hundred forty-three\nthree hundred forty-four\nthree hundred forty-five\nthree hundred forty-six\nthree hundred forty-seven\nthree hundred forty-eight\nthree hundred forty-nine\nthree hundred fifty\nthree hundred fifty-one\nthree hundred fifty-two\nthree hundred fifty-three\nthree hundred fifty-four\nthree hundred fifty-five\nthree hundred fifty-six\nthree hundred fifty-seven\nthree hundred fifty-eight\nthree hundred fifty-nine\nthree hundred sixty\nthree hundred sixty-one\nthree hundred sixty-two\nthree hundred sixty-three\nthree hundred sixty-four\nthree hundred sixty-five\nthree hundred sixty-six\nthree hundred sixty-seven\nthree hundred sixty-eight\nthree hundred sixty-nine\nthree hundred seventy\nthree hundred seventy-one\nthree hundred seventy-two\nthree hundred seventy-three\nthree hundred seventy-four\nthree hundred seventy-five\nthree hundred seventy-six\nthree hundred seventy-seven\nthree hundred seventy-eight\nthree hundred seventy-nine\nthree hundred eighty\nthree hundred eighty-one\nthree hundred eighty-two\nthree hundred eighty-three\nthree hundred eighty-four\nthree hundred eighty-five\nthree hundred eighty-six\nthree hundred eighty-seven\nthree hundred eighty-eight\nthree hundred eighty-nine\nthree hundred ninety\nthree hundred ninety-one\nthree hundred ninety-two\nthree hundred ninety-three\nthree hundred ninety-four\nthree hundred ninety-five\nthree hundred ninety-six\nthree hundred ninety-seven\nthree hundred ninety-eight\nthree hundred ninety-nine\nfour hundred\nfour hundred one\nfour hundred two\nfour hundred three\nfour hundred four\nfour hundred five\nfour hundred six\nfour hundred seven\nfour hundred eight\nfour hundred nine\nfour hundred ten\nfour hundred eleven\nfour hundred twelve\nfour hundred thirteen\nfour hundred fourteen\nfour hundred fifteen\nfour hundred sixteen\nfour hundred seventeen\nfour hundred eighteen\nfour hundred nineteen\nfour hundred twenty\nfour hundred twenty-one\nfour hundred twenty-two\nfour hundred twenty-three\nfour hundred twenty-four\nfour hundred twenty-five\nfour hundred twenty-six\nfour hundred twenty-seven\nfour hundred twenty-eight\nfour hundred twenty-nine\nfour hundred thirty\nfour hundred thirty-one\nfour hundred thirty-two\nfour hundred thirty-three\nfour hundred thirty-four\nfour hundred thirty-five\nfour hundred thirty-six\nfour hundred thirty-seven\nfour hundred thirty-eight\nfour hundred thirty-nine\nfour hundred forty\nfour hundred forty-one\nfour hundred forty-two\nfour hundred forty-three\nfour hundred forty-four\nfour hundred forty-five\nfour hundred forty-six\nfour hundred forty-seven\nfour hundred forty-eight\nfour hundred forty-nine\nfour hundred fifty\nfour hundred fifty-one\nfour hundred fifty-two\nfour hundred fifty-three\nfour hundred fifty-four\nfour hundred fifty-five\nfour hundred fifty-six\nfour hundred fifty-seven\nfour hundred fifty-eight\nfour hundred fifty-nine\nfour hundred sixty\nfour hundred sixty-one\nfour hundred sixty-two\nfour hundred sixty-three\nfour hundred sixty-four\nfour hundred sixty-five\nfour hundred sixty-six\nfour hundred sixty-seven\nfour hundred sixty-eight\nfour hundred sixty-nine\nfour hundred seventy\nfour hundred seventy-one\nfour hundred seventy-two\nfour hundred seventy-three\nfour hundred seventy-four\nfour hundred seventy-five\nfour hundred seventy-six\nfour hundred seventy-seven\nfour hundred seventy-eight\nfour hundred seventy-nine\nfour hundred eighty\nfour hundred eighty-one\nfour hundred eighty-two\nfour hundred eighty-three\nfour hundred eighty-four\nfour hundred eighty-five\nfour hundred eighty-six\nfour hundred eighty-seven\nfour hundred eighty-eight\nfour hundred eighty-nine\nfour hundred ninety\nfour hundred ninety-one\nfour hundred ninety-two\nfour hundred ninety-three\nfour hundred ninety-four\nfour hundred ninety-five\nfour hundred ninety-six\nfour hundred ninety-seven\nfour hundred ninety-eight\nfour hundred ninety-nine\nfive hundred\nfive hundred one\nfive hundred two\nfive hundred three\nfive hundred four\nfive hundred five\nfive hundred six\nfive hundred seven\nfive hundred eight\nfive hundred nine\nfive hundred ten\nfive hundred eleven\nfive hundred twelve\nfive hundred thirteen\nfive hundred fourteen\nfive hundred fifteen\nfive hundred sixteen\nfive hundred seventeen\nfive hundred eighteen\nfive hundred nineteen\nfive hundred twenty\nfive hundred twenty-one\nfive hundred twenty-two\nfive hundred twenty-three\nfive hundred twenty-four\nfive hundred twenty-five\nfive hundred twenty-six\nfive hundred twenty-seven\nfive hundred twenty-eight\nfive hundred twenty-nine\nfive hundred thirty\nfive hundred thirty-one\nfive hundred thirty-two\nfive hundred thirty-three\nfive hundred thirty-four\nfive hundred thirty-five\nfive hundred thirty-six\nfive hundred thirty-seven\nfive hundred thirty-eight\nfive hundred thirty-nine\nfive hundred forty\nfive hundred forty-one\nfive hundred forty-two\nfive hundred forty-three\nfive hundred forty-four\nfive hundred forty-five\nfive hundred forty-six\nfive hundred forty-seven\nfive hundred forty-eight\nfive hundred forty-nine\nfive hundred fifty\nfive hundred fifty-one\nfive hundred fifty-two\nfive hundred fifty-three\nfive hundred fifty-four\nfive hundred fifty-five\nfive hundred fifty-six\nfive hundred fifty-seven\nfive hundred fifty-eight\nfive hundred fifty-nine\nfive hundred sixty\nfive hundred sixty-one\nfive hundred sixty-two\nfive hundred sixty-three\nfive hundred sixty-four\nfive hundred sixty-five\nfive hundred sixty-six\nfive hundred sixty-seven\nfive hundred sixty-eight\nfive hundred sixty-nine\nfive hundred seventy\nfive hundred seventy-one\nfive hundred seventy-two\nfive hundred seventy-three\nfive hundred seventy-four\nfive hundred seventy-five\nfive hundred seventy-six\nfive hundred seventy-seven\nfive hundred seventy-eight\nfive hundred seventy-nine\nfive hundred eighty\nfive hundred eighty-one\nfive hundred eighty-two\nfive hundred eighty-three\nfive hundred eighty-four\nfive hundred eighty-five\nfive hundred eighty-six\nfive hundred eighty-seven\nfive hundred eighty-eight\nfive hundred eighty-nine\nfive hundred ninety\nfive hundred ninety-one\nfive hundred ninety-two\nfive hundred ninety-three\nfive hundred ninety-four\nfive hundred ninety-five\nfive hundred ninety-six\nfive hundred ninety-seven\nfive hundred ninety-eight\nfive hundred ninety-nine\nsix hundred\nsix hundred one\nsix hundred two\nsix hundred three\nsix hundred four\nsix hundred five\nsix hundred six\nsix hundred seven\nsix hundred eight\nsix hundred nine\nsix hundred ten\nsix hundred eleven\nsix hundred twelve\nsix hundred thirteen\nsix hundred fourteen\nsix hundred fifteen\nsix hundred sixteen\nsix hundred seventeen\nsix hundred eighteen\nsix hundred nineteen\nsix hundred twenty\nsix hundred twenty-one\nsix hundred twenty-two\nsix hundred twenty-three\nsix hundred twenty-four\nsix hundred twenty-five\nsix hundred twenty-six\nsix hundred twenty-seven\nsix hundred twenty-eight\nsix hundred twenty-nine\nsix hundred thirty\nsix hundred thirty-one\nsix hundred thirty-two\nsix hundred thirty-three\nsix hundred thirty-four\nsix hundred thirty-five\nsix hundred thirty-six\nsix hundred thirty-seven\nsix hundred thirty-eight\nsix hundred thirty-nine\nsix hundred forty\nsix hundred forty-one\nsix hundred forty-two\nsix hundred forty-three\nsix hundred forty-four\nsix hundred forty-five\nsix hundred forty-six\nsix hundred forty-seven\nsix hundred forty-eight\nsix hundred forty-nine\nsix hundred fifty\nsix hundred fifty-one\nsix hundred fifty-two\nsix hundred fifty-three\nsix hundred fifty-four\nsix hundred fifty-five\nsix hundred fifty-six\nsix hundred fifty-seven\nsix hundred fifty-eight\nsix hundred fifty-nine\nsix hundred sixty\nsix hundred sixty-one\nsix hundred sixty-two\nsix hundred sixty-three\nsix hundred sixty-four\nsix hundred sixty-five\nsix hundred sixty-six\nsix hundred sixty-seven\nsix hundred sixty-eight\nsix hundred sixty-nine\nsix hundred seventy\nsix hundred seventy-one\nsix hundred seventy-two\nsix hundred seventy-three\nsix hundred seventy-four\nsix hundred seventy-five\nsix hundred seventy-six\nsix hundred seventy-seven\nsix hundred seventy-eight\nsix hundred seventy-nine\nsix hundred eighty\nsix hundred eighty-one\nsix hundred eighty-two\nsix hundred eighty-three\nsix hundred eighty-four\nsix hundred eighty-five\nsix hundred eighty-six\nsix hundred eighty-seven\nsix hundred eighty-eight\nsix hundred eighty-nine\nsix hundred ninety\nsix hundred ninety-one\nsix hundred ninety-two\nsix hundred ninety-three\nsix hundred ninety-four\nsix hundred ninety-five\nsix hundred ninety-six\nsix hundred ninety-seven\nsix hundred ninety-eight\nsix hundred ninety-nine\nseven hundred\nseven hundred one\nseven hundred two\nseven hundred three\nseven hundred four\nseven hundred five\nseven hundred six\nseven hundred seven\nseven hundred eight\nseven hundred nine\nseven hundred ten\nseven hundred eleven\nseven hundred twelve\nseven hundred thirteen\nseven hundred fourteen\nseven hundred fifteen\nseven hundred sixteen\nseven hundred seventeen\nseven hundred eighteen\nseven hundred nineteen\nseven hundred twenty\nseven hundred twenty-one\nseven hundred twenty-two\nseven hundred twenty-three\nseven hundred twenty-four\nseven hundred twenty-five\nseven hundred twenty-six\nseven hundred twenty-seven\nseven hundred twenty-eight\nseven hundred twenty-nine\nseven hundred thirty\nseven hundred thirty-one\nseven hundred thirty-two\nseven hundred thirty-three\nseven hundred thirty-four\nseven hundred thirty-five\nseven hundred thirty-six\nseven hundred thirty-seven\nseven hundred thirty-eight\nseven hundred thirty-nine\nseven hundred forty\nseven hundred forty-one\nseven hundred forty-two\nseven hundred forty-three\nseven hundred forty-four\nseven hundred forty-five\nseven hundred forty-six\nseven hundred forty-seven\nseven hundred forty-eight\nseven hundred forty-nine\nseven hundred fifty\nseven hundred fifty-one\nseven hundred fifty-two\nseven hundred fifty-three\nseven hundred fifty-four\nseven hundred fifty-five\nseven hundred fifty-six\nseven hundred fifty-seven\nseven hundred fifty-eight\nseven hundred fifty-nine\nseven hundred sixty\nseven hundred sixty-one\nseven hundred sixty-two\nseven hundred sixty-three\nseven hundred sixty-four\nseven hundred sixty-five\nseven hundred sixty-six\nseven hundred sixty-seven\nseven hundred sixty-eight\nseven hundred sixty-nine\nseven hundred seventy\nseven hundred seventy-one\nseven hundred seventy-two\nseven hundred seventy-three\nseven hundred seventy-four\nseven hundred seventy-five\nseven hundred seventy-six\nseven hundred seventy-seven\nseven hundred seventy-eight\nseven hundred seventy-nine\nseven hundred eighty\nseven hundred eighty-one\nseven hundred eighty-two\nseven hundred eighty-three\nseven hundred eighty-four\nseven hundred eighty-five\nseven hundred eighty-six\nseven hundred eighty-seven\nseven hundred eighty-eight\nseven hundred eighty-nine\nseven hundred ninety\nseven hundred ninety-one\nseven hundred ninety-two\nseven hundred ninety-three\nseven hundred ninety-four\nseven hundred ninety-five\nseven hundred ninety-six\nseven hundred ninety-seven\nseven hundred ninety-eight\nseven hundred ninety-nine\neight hundred\neight hundred one\neight hundred two\neight hundred three\neight hundred four\neight hundred five\neight hundred six\neight hundred seven\neight hundred eight\neight hundred nine\neight hundred ten\neight hundred eleven\neight hundred twelve\neight hundred thirteen\neight hundred fourteen\neight hundred fifteen\neight hundred sixteen\neight hundred seventeen\neight hundred eighteen\neight hundred nineteen\neight hundred twenty\neight hundred twenty-one\neight hundred twenty-two\neight hundred twenty-three\neight hundred twenty-four\neight hundred twenty-five\neight hundred twenty-six\neight hundred twenty-seven\neight hundred twenty-eight\neight hundred twenty-nine\neight hundred thirty\neight hundred thirty-one\neight hundred thirty-two\neight hundred thirty-three\neight hundred thirty-four\neight hundred thirty-five\neight hundred thirty-six\neight hundred thirty-seven\neight hundred thirty-eight\neight hundred thirty-nine\neight hundred forty\neight hundred forty-one\neight hundred forty-two\neight hundred forty-three\neight hundred forty-four\neight hundred forty-five\neight hundred forty-six\neight hundred forty-seven\neight hundred forty-eight\neight hundred forty-nine\neight hundred fifty\neight hundred fifty-one\neight hundred fifty-two\neight hundred fifty-three\neight hundred fifty-four\neight hundred fifty-five\neight hundred fifty-six\neight hundred fifty-seven\neight hundred fifty-eight\neight hundred fifty-nine\neight hundred sixty\neight hundred sixty-one\neight hundred sixty-two\neight hundred sixty-three\neight hundred sixty-four\neight hundred sixty-five\neight hundred sixty-six\neight hundred sixty-seven\neight hundred sixty-eight\neight hundred sixty-nine\neight hundred seventy\neight hundred seventy-one\neight hundred seventy-two\neight hundred seventy-three\neight hundred seventy-four\neight hundred seventy-five\neight hundred seventy-six\neight hundred seventy-seven\neight hundred seventy-eight\neight hundred seventy-nine\neight hundred eighty\neight hundred eighty-one\neight hundred eighty-two\neight hundred eighty-three\neight hundred eighty-four\neight hundred eighty-five\neight hundred eighty-six\neight hundred eighty-seven\neight hundred eighty-eight\neight hundred eighty-nine\neight hundred ninety\neight hundred ninety-one\neight hundred ninety-two\neight hundred ninety-three\neight hundred ninety-four\neight hundred ninety-five\neight hundred ninety-six\neight hundred ninety-seven\neight hundred ninety-eight\neight hundred ninety-nine\nnine hundred\nnine hundred one\nnine hundred two\nnine hundred three\nnine hundred four\nnine hundred five\nnine hundred six\nnine hundred seven\nnine hundred eight\nnine hundred nine\nnine hundred ten\nnine hundred eleven\nnine hundred twelve\nnine hundred thirteen\nnine hundred fourteen\nnine hundred fifteen\nnine hundred sixteen\nnine hundred seventeen\nnine hundred eighteen\nnine hundred nineteen\nnine hundred twenty\nnine hundred twenty-one\nnine hundred twenty-two\nnine hundred twenty-three\nnine hundred twenty-four\nnine hundred twenty-five\nnine hundred twenty-six\nnine hundred twenty-seven\nnine hundred twenty-eight\nnine hundred twenty-nine\nnine hundred thirty\nnine hundred thirty-one\nnine hundred thirty-two\nnine hundred thirty-three\nnine hundred thirty-four\nnine hundred thirty-five\nnine hundred thirty-six\nnine hundred thirty-seven\nnine hundred thirty-eight\nnine hundred thirty-nine\nnine hundred forty\nnine hundred forty-one\nnine hundred forty-two\nnine hundred forty-three\nnine hundred forty-four\nnine hundred forty-five\nnine hundred forty-six\nnine hundred forty-seven\nnine hundred forty-eight\nnine hundred forty-nine\nnine hundred fifty\nnine hundred fifty-one\nnine hundred fifty-two\nnine hundred fifty-three\nnine hundred fifty-four\nnine hundred fifty-five\nnine hundred fifty-six\nnine hundred fifty-seven\nnine hundred fifty-eight\nnine hundred fifty-nine\nnine hundred sixty\nnine hundred sixty-one\nnine hundred sixty-two\nnine hundred sixty-three\nnine hundred sixty-four\nnine hundred sixty-five\nnine hundred sixty-six\nnine hundred sixty-seven\nnine hundred sixty-eight\nnine hundred sixty-nine\nnine hundred seventy\nnine hundred seventy-one\nnine hundred seventy-two\nnine hundred seventy-three\nnine hundred seventy-four\nnine hundred seventy-five\nnine hundred seventy-six\nnine hundred seventy-seven\nnine hundred seventy-eight\nnine hundred seventy-nine\nnine hundred eighty\nnine hundred eighty-one\nnine hundred eighty-two\nnine hundred eighty-three\nnine hundred eighty-four\nnine hundred eighty-five\nnine hundred eighty-six\nnine hundred eighty-seven\nnine hundred eighty-eight\nnine hundred eighty-nine\nnine hundred ninety\nnine hundred ninety-one\nnine hundred ninety-two\nnine hundred ninety-three\nnine hundred ninety-four\nnine hundred ninety-five\nnine hundred ninety-six\nnine hundred ninety-seven\nnine hundred ninety-eight\nnine hundred ninety-nine'
+
+_tail_4 = ('\none\ntwo\nthree\nfour\nfive\nsix\nseven\neight\nnine\nten\neleven\ntwelve\nthirteen\nfourteen\nfifteen\nsixteen\nseventeen\neighteen\nnineteen\ntwenty\ntwenty-one\ntwenty-two\ntwenty-three\ntwenty-four\ntwenty-five\ntwenty-six\ntwenty-seven\ntwenty-eight\ntwenty-nine\nthirty\nthirty-one\nthirty-two\nthirty-three\nthirty-four\nthirty-five\nthirty-six\nthirty-seven\nthirty-eight\nthirty-nine\nforty\nforty-one\nforty-two\nforty-three\nforty-four\nforty-five\nforty-six\nforty-seven\nforty-eight\nforty-nine\nfifty\nfifty-one\nfifty-two\nfifty-three\nfifty-four\nfifty-five\nfifty-six\nfifty-seven\nfifty-eight\nfifty-nine\nsixty\nsixty-one\nsixty-two\nsixty-three\nsixty-four\nsixty-five\nsixty-six\nsixty-seven\nsixty-eight\nsixty-nine\nseventy\nseventy-one\nseventy-two\nseventy-three\nseventy-four\nseventy-five\nseventy-six\nseventy-seven\nseventy-eight\nseventy-nine\neighty\neighty-one\neighty-two\neighty-three\neighty-four\neighty-five\neighty-six\neighty-seven\neighty-eight\neighty-nine\nninety\nninety-one\nninety-two\nninety-three\nninety-four\nninety-five\nninety-six\nninety-seven\nninety-eight\nninety-nine\none hundred\none hundred one\none hundred two\none hundred three\none hundred four\none hundred five\none hundred six\none hundred seven\none hundred eight\none hundred nine\none hundred ten\none hundred eleven\none hundred twelve\none hundred thirteen\none hundred fourteen\none hundred fifteen\none hundred sixteen\none hundred seventeen\none hundred eighteen\none hundred nineteen\none hundred twenty\none hundred twenty-one\none hundred twenty-two\none hundred twenty-three\none hundred twenty-four\none hundred twenty-five\none hundred twenty-six\none hundred twenty-seven\none hundred twenty-eight\none hundred twenty-nine\none hundred thirty\none hundred thirty-one\none hundred thirty-two\none hundred thirty-three\none hundred thirty-four\none hundred thirty-five\none hundred thirty-six\none hundred thirty-seven\none hundred thirty-eight\none hundred thirty-nine\none hundred forty\none hundred forty-one\none hundred forty-two\none hundred forty-three\none hundred forty-four\none hundred forty-five\none hundred forty-six\none hundred forty-seven\none hundred forty-eight\none hundred forty-nine\none hundred fifty\none hundred fifty-one\none hundred fifty-two\none hundred fifty-three\none hundred fifty-four\none hundred fifty-five\none hundred fifty-six\none hundred fifty-seven\none hundred fifty-eight\none hundred fifty-nine\none hundred sixty\none hundred sixty-one\none hundred sixty-two\none hundred sixty-three\none hundred sixty-four\none hundred sixty-five\none hundred sixty-six\none hundred sixty-seven\none hundred sixty-eight\none hundred sixty-nine\none hundred seventy\none hundred seventy-one\none hundred seventy-two\none hundred seventy-three\none hundred seventy-four\none hundred seventy-five\none hundred seventy-six\none hundred seventy-seven\none hundred seventy-eight\none hundred seventy-nine\none hundred eighty\none hundred eighty-one\none hundred eighty-two\none hundred eighty-three\none hundred eighty-four\none hundred eighty-five\none hundred eighty-six\none hundred eighty-seven\none hundred eighty-eight\none hundred eighty-nine\none hundred ninety\none hundred ninety-one\none hundred ninety-two\none hundred ninety-three\none hundred ninety-four\none hundred ninety-five\none hundred ninety-six\none hundred ninety-seven\none hundred ninety-eight\none hundred ninety-nine\ntwo hundred\ntwo hundred one\ntwo hundred two\ntwo hundred three\ntwo hundred four\ntwo hundred five\ntwo hundred six\ntwo hundred seven\ntwo hundred eight\ntwo hundred nine\ntwo hundred ten\ntwo hundred eleven\ntwo hundred twelve\ntwo hundred thirteen\ntwo hundred fourteen\ntwo hundred fifteen\ntwo hundred sixteen\ntwo hundred seventeen\ntwo hundred eighteen\ntwo hundred nineteen\ntwo hundred twenty\ntwo hundred twenty-one\ntwo hundred twenty-two\ntwo hundred twenty-three\ntwo hundred twenty-four\ntwo hundred twenty-five\ntwo hundred twenty-six\ntwo hundred twenty-seven\ntwo hundred twenty-eight\ntwo hundred twenty-nine\ntwo hundred thirty\ntwo hundred thirty-one\ntwo hundred thirty-two\ntwo hundred thirty-three\ntwo hundred thirty-four\ntwo hundred thirty-five\ntwo hundred thirty-six\ntwo hundred thirty-seven\ntwo hundred thirty-eight\ntwo hundred thirty-nine\ntwo hundred forty\ntwo hundred forty-one\ntwo hundred forty-two\ntwo hundred forty-three\ntwo hundred forty-four\ntwo hundred forty-five\ntwo hundred forty-six\ntwo hundred forty-seven\ntwo hundred forty-eight\ntwo hundred forty-nine\ntwo hundred fifty\ntwo hundred fifty-one\ntwo hundred fifty-two\ntwo hundred fifty-three\ntwo hundred fifty-four\ntwo hundred fifty-five\ntwo hundred fifty-six\ntwo hundred fifty-seven\ntwo hundred fifty-eight\ntwo hundred fifty-nine\ntwo hundred sixty\ntwo hundred sixty-one\ntwo hundred sixty-two\ntwo hundred sixty-three\ntwo hundred sixty-four\ntwo hundred sixty-five\ntwo hundred sixty-six\ntwo hundred sixty-seven\ntwo hundred sixty-eight\ntwo hundred sixty-nine\ntwo hundred seventy\ntwo hundred seventy-one\ntwo hundred seventy-two\ntwo hundred seventy-three\ntwo hundred seventy-four\ntwo hundred seventy-five\ntwo hundred seventy-six\ntwo hundred seventy-seven\ntwo hundred seventy-eight\ntwo hundred seventy-nine\ntwo hundred eighty\ntwo hundred eighty-one\ntwo hundred eighty-two\ntwo hundred eighty-three\ntwo hundred eighty-four\ntwo hundred eighty-five\ntwo hundred eighty-six\ntwo hundred eighty-seven\ntwo hundred eighty-eight\ntwo hundred eighty-nine\ntwo hundred ninety\ntwo hundred ninety-one\ntwo hundred ninety-two\ntwo hundred ninety-three\ntwo hundred ninety-four\ntwo hundred ninety-five\ntwo hundred ninety-six\ntwo hundred ninety-seven\ntwo hundred ninety-eight\ntwo hundred ninety-nine\nthree hundred\nthree hundred one\nthree hundred two\nthree hundred three\nthree hundred four\nthree hundred five\nthree hundred six\nthree hundred seven\nthree hundred eight\nthree hundred nine\nthree hundred ten\nthree hundred eleven\nthree hundred twelve\nthree hundred thirteen\nthree hundred fourteen\nthree hundred fifteen\nthree hundred sixteen\nthree hundred seventeen\nthree hundred eighteen\nthree hundred nineteen\nthree hundred twenty\nthree hundred twenty-one\nthree hundred twenty-two\nthree hundred twenty-three\nthree hundred twenty-four\nthree hundred twenty-five\nthree hundred twenty-six\nthree hundred twenty-seven\nthree hundred twenty-eight\nthree hundred twenty-nine\nthree hundred thirty\nthree hundred thirty-one\nthree hundred thirty-two\nthree hundred thirty-three\nthree hundred thirty-four\nthree hundred thirty-five\nthree hundred thirty-six\nthree hundred thirty-seven\nthree hundred thirty-eight\nthree hundred thirty-nine\nthree hundred forty\nthree hundred forty-one\nthree hundred forty-two\nthree hundred forty-three\nthree hundred forty-four\nthree hundred forty-five\nthree hundred forty-six\nthree hundred forty-seven\nthree hundred forty-eight\nthree hundred forty-nine\nthree hundred fifty\nthree hundred fifty-one\nthree hundred fifty-two\nthree hundred fifty-three\nthree hundred fifty-four\nthree hundred fifty-five\nthree hundred fifty-six\nthree hundred fifty-seven\nthree hundred fifty-eight\nthree hundred fifty-nine\nthree hundred sixty\nthree hundred sixty-one\nthree hundred sixty-two\nthree hundred sixty-three\nthree hundred sixty-four\nthree hundred sixty-five\nthree hundred sixty-six\nthree hundred sixty-seven\nthree hundred sixty-eight\nthree hundred sixty-nine\nthree hundred seventy\nthree hundred seventy-one\nthree hundred seventy-two\nthree hundred seventy-three\nthree hundred seventy-four\nthree hundred seventy-five\nthree hundred seventy-six\nthree hundred seventy-seven\nthree hundred seventy-eight\nthree hundred seventy-nine\nthree hundred eighty\nthree hundred eighty-one\nthree hundred eighty-two\nthree hundred eighty-three\nthree hundred eighty-four\nthree hundred eighty-five\nthree hundred eighty-six\nthree hundred eighty-seven\nthree hundred eighty-eight\nthree hundred eighty-nine\nthree hundred ninety\nthree hundred ninety-one\nthree hundred ninety-two\nthree hundred ninety-three\nthree hundred ninety-four\nthree hundred ninety-five\nthree hundred ninety-six\nthree hundred ninety-seven\nthree hundred ninety-eight\nthree hundred ninety-nine\nfour hundred\nfour hundred one\nfour hundred two\nfour hundred three\nfour hundred four\nfour hundred five\nfour hundred six\nfour hundred seven\nfour hundred eight\nfour hundred nine\nfour hundred ten\nfour hundred eleven\nfour hundred twelve\nfour hundred thirteen\nfour hundred fourteen\nfour hundred fifteen\nfour hundred sixteen\nfour hundred seventeen\nfour hundred eighteen\nfour hundred nineteen\nfour hundred twenty\nfour hundred twenty-one\nfour hundred twenty-two\nfour hundred twenty-three\nfour hundred twenty-four\nfour hundred twenty-five\nfour hundred twenty-six\nfour hundred twenty-seven\nfour hundred twenty-eight\nfour hundred twenty-nine\nfour hundred thirty\nfour hundred thirty-one\nfour hundred thirty-two\nfour hundred thirty-three\nfour hundred thirty-four\nfour hundred thirty-five\nfour hundred thirty-six\nfour hundred thirty-seven\nfour hundred thirty-eight\nfour hundred thirty-nine\nfour hundred forty\nfour hundred forty-one\nfour hundred forty-two\nfour hundred forty-three\nfour hundred forty-four\nfour hundred forty-five\nfour hundred forty-six\nfour hundred forty-seven\nfour hundred forty-eight\nfour hundred forty-nine\nfour hundred fifty\nfour hundred fifty-one\nfour hundred fifty-two\nfour hundred fifty-three\nfour hundred fifty-four\nfour hundred fifty-five\nfour hundred fifty-six\nfour hundred fifty-seven\nfour hundred fifty-eight\nfour hundred fifty-nine\nfour hundred sixty\nfour hundred sixty-one\nfour hundred sixty-two\nfour hundred sixty-three\nfour hundred sixty-four\nfour hundred sixty-five\nfour hundred sixty-six\nfour hundred sixty-seven\nfour hundred sixty-eight\nfour hundred sixty-nine\nfour hundred seventy\nfour hundred seventy-one\nfour hundred seventy-two\nfour hundred seventy-three\nfour hundred seventy-four\nfour hundred seventy-five\nfour hundred seventy-six\nfour hundred seventy-seven\nfour hundred seventy-eight\nfour hundred seventy-nine\nfour hundred eighty\nfour hundred eighty-one\nfour hundred eighty-two\nfour hundred eighty-three\nfour hundred eighty-four\nfour hundred eighty-five\nfour hundred eighty-six\nfour hundred eighty-seven\nfour hundred eighty-eight\nfour hundred eighty-nine\nfour hundred ninety\nfour hundred ninety-one\nfour hundred ninety-two\nfour hundred ninety-three\nfour hundred ninety-four\nfour hundred ninety-five\nfour hundred ninety-six\nfour hundred ninety-seven\nfour hundred ninety-eight\nfour hundred ninety-nine\nfive hundred\nfive hundred one\nfive hundred two\nfive hundred three\nfive hundred four\nfive hundred five\nfive hundred six\nfive hundred seven\nfive hundred eight\nfive hundred nine\nfive hundred ten\nfive hundred eleven\nfive hundred twelve\nfive hundred thirteen\nfive hundred fourteen\nfive hundred fifteen\nfive hundred sixteen\nfive hundred seventeen\nfive hundred eighteen\nfive hundred nineteen\nfive hundred twenty\nfive hundred twenty-one\nfive hundred twenty-two\nfive hundred twenty-three\nfive hundred twenty-four\nfive hundred twenty-five\nfive hundred twenty-six\nfive hundred twenty-seven\nfive hundred twenty-eight\nfive hundred twenty-nine\nfive hundred thirty\nfive hundred thirty-one\nfive hundred thirty-two\nfive hundred thirty-three\nfive hundred thirty-four\nfive hundred thirty-five\nfive hundred thirty-six\nfive hundred thirty-seven\nfive hundred thirty-eight\nfive hundred thirty-nine\nfive hundred forty\nfive hundred forty-one\nfive hundred forty-two\nfive hundred forty-three\nfive hundred forty-four\nfive hundred forty-five\nfive hundred forty-six\nfive hundred forty-seven\nfive hundred forty-eight\nfive hundred forty-nine\nfive hundred fifty\nfive hundred fifty-one\nfive hundred fifty-two\nfive hundred fifty-three\nfive hundred fifty-four\nfive hundred fifty-five\nfive hundred fifty-six\nfive hundred fifty-seven\nfive hundred fifty-eight\nfive hundred fifty-nine\nfive hundred sixty\nfive hundred sixty-one\nfive hundred sixty-two\nfive hundred sixty-three\nfive hundred sixty-four\nfive hundred sixty-five\nfive hundred sixty-six\nfive hundred sixty-seven\nfive hundred sixty-eight\nfive hundred sixty-nine\nfive hundred seventy\nfive hundred seventy-one\nfive hundred seventy-two\nfive hundred seventy-three\nfive hundred seventy-four\nfive hundred seventy-five\nfive hundred seventy-six\nfive hundred seventy-seven\nfive hundred seventy-eight\nfive hundred seventy-nine\nfive hundred eighty\nfive hundred eighty-one\nfive hundred eighty-two\nfive hundred eighty-three\nfive hundred eighty-four\nfive hundred eighty-five\nfive hundred eighty-six\nfive hundred eighty-seven\nfive hundred eighty-eight\nfive hundred eighty-nine\nfive hundred ninety\nfive hundred ninety-one\nfive hundred ninety-two\nfive hundred ninety-three\nfive hundred ninety-four\nfive hundred ninety-five\nfive hundred ninety-six\nfive hundred ninety-seven\nfive hundred ninety-eight\nfive hundred ninety-nine\nsix hundred\nsix hundred one\nsix hundred two\nsix hundred three\nsix hundred four\nsix hundred five\nsix hundred six\nsix hundred seven\nsix hundred eight\nsix hundred nine\nsix hundred ten\nsix hundred eleven\nsix hundred twelve\nsix hundred thirteen\nsix hundred fourteen\nsix hundred fifteen\nsix hundred sixteen\nsix hundred seventeen\nsix hundred eighteen\nsix hundred nineteen\nsix hundred twenty\nsix hundred twenty-one\nsix hundred twenty-two\nsix hundred twenty-three\nsix hundred twenty-four\nsix hundred twenty-five\nsix hundred twenty-six\nsix hundred twenty-seven\nsix hundred twenty-eight\nsix hundred twenty-nine\nsix hundred thirty\nsix hundred thirty-one\nsix hundred thirty-two\nsix hundred thirty-three\nsix hundred thirty-four\nsix hundred thirty-five\nsix hundred thirty-six\nsix hundred thirty-seven\nsix hundred thirty-eight\nsix hundred thirty-nine\nsix hundred forty\nsix hundred forty-one\nsix hundred forty-two\nsix hundred forty-three\nsix hundred forty-four\nsix hundred forty-five\nsix hundred forty-six\nsix hundred forty-seven\nsix hundred forty-eight\nsix hundred forty-nine\nsix hundred fifty\nsix hundred fifty-one\nsix hundred fifty-two\nsix hundred fifty-three\nsix hundred fifty-four\nsix hundred fifty-five\nsix hundred fifty-six\nsix hundred fifty-seven\nsix hundred fifty-eight\nsix hundred fifty-nine\nsix hundred sixty\nsix hundred sixty-one\nsix hundred sixty-two\nsix hundred sixty-three\nsix hundred sixty-four\nsix hundred sixty-five\nsix hundred sixty-six\nsix hundred sixty-seven\nsix hundred sixty-eight\nsix hundred sixty-nine\nsix hundred seventy\nsix hundred seventy-one\nsix hundred seventy-two\nsix hundred seventy-three\nsix hundred seventy-four\nsix hundred seventy-five\nsix hundred seventy-six\nsix hundred seventy-seven\nsix hundred seventy-eight\nsix hundred seventy-nine\nsix hundred eighty\nsix hundred eighty-one\nsix hundred eighty-two\nsix hundred eighty-three\nsix hundred eighty-four\nsix hundred eighty-five\nsix hundred eighty-six\nsix hundred eighty-seven\nsix hundred eighty-eight\nsix hundred eighty-nine\nsix hundred ninety\nsix hundred ninety-one\nsix hundred ninety-two\nsix hundred ninety-three\nsix hundred ninety-four\nsix hundred ninety-five\nsix hundred ninety-six\nsix hundred ninety-seven\nsix hundred ninety-eight\nsix hundred ninety-nine\nseven hundred\nseven hundred one\nseven hundred two\nseven hundred three\nseven hundred four\nseven hundred five\nseven hundred six\nseven hundred seven\nseven hundred eight\nseven hundred nine\nseven hundred ten\nseven hundred eleven\nseven hundred twelve\nseven hundred thirteen\nseven hundred fourteen\nseven hundred fifteen\nseven hundred sixteen\nseven hundred seventeen\nseven hundred eighteen\nseven hundred nineteen\nseven hundred twenty\nseven hundred twenty-one\nseven hundred twenty-two\nseven hundred twenty-three\nseven hundred twenty-four\nseven hundred twenty-five\nseven hundred twenty-six\nseven hundred twenty-seven\nseven hundred twenty-eight\nseven hundred twenty-nine\nseven hundred thirty\nseven hundred thirty-one\nseven hundred thirty-two\nseven hundred thirty-three\nseven hundred thirty-four\nseven hundred thirty-five\nseven hundred thirty-six\nseven hundred thirty-seven\nseven hundred thirty-eight\nseven hundred thirty-nine\nseven hundred forty\nseven hundred forty-one\nseven hundred forty-two\nseven hundred forty-three\nseven hundred forty-four\nseven hundred forty-five\nseven hundred forty-six\nseven hundred forty-seven\nseven hundred forty-eight\nseven hundred forty-nine\nseven hundred fifty\nseven hundred fifty-one\nseven hundred fifty-two\nseven hundred fifty-three\nseven hundred fifty-four\nseven hundred fifty-five\nseven hundred fifty-six\nseven hundred fifty-seven\nseven hundred fifty-eight\nseven hundred fifty-nine\nseven hundred sixty\nseven hundred sixty-one\nseven hundred sixty-two\nseven hundred sixty-three\nseven hundred sixty-four\nseven hundred sixty-five\nseven hundred sixty-six\nseven hundred sixty-seven\nseven hundred sixty-eight\nseven hundred sixty-nine\nseven hundred seventy\nseven hundred seventy-one\nseven hundred seventy-two\nseven hundred seventy-three\nseven hundred seventy-four\nseven hundred seventy-five\nseven hundred seventy-six\nseven hundred seventy-seven\nseven hundred seventy-eight\nseven hundred seventy-nine\nseven hundred eighty\nseven hundred eighty-one\nseven hundred eighty-two\nseven hundred eighty-three\nseven hundred eighty-four\nseven hundred eighty-five\nseven hundred eighty-six\nseven hundred eighty-seven\nseven hundred eighty-eight\nseven hundred eighty-nine\nseven hundred ninety\nseven hundred ninety-one\nseven hundred ninety-two\nseven hundred ninety-three\nseven hundred ninety-four\nseven hundred ninety-five\nseven hundred ninety-six\nseven hundred ninety-seven\nseven hundred ninety-eight\nseven hundred ninety-nine\neight hundred\neight hundred one\neight hundred two\neight hundred three\neight hundred four\neight hundred five\neight hundred six\neight hundred seven\neight hundred eight\neight hundred nine\neight hundred ten\neight hundred eleven\neight hundred twelve\neight hundred thirteen\neight hundred fourteen\neight hundred fifteen\neight hundred sixteen\neight hundred seventeen\neight hundred eighteen\neight hundred nineteen\neight hundred twenty\neight hundred twenty-one\neight hundred twenty-two\neight hundred twenty-three\neight hundred twenty-four\neight hundred twenty-five\neight hundred twenty-six\neight hundred twenty-seven\neight hundred twenty-eight\neight hundred twenty-nine\neight hundred thirty\neight hundred thirty-one\neight hundred thirty-two\neight hundred thirty-three\neight hundred thirty-four\neight hundred thirty-five\neight hundred thirty-six\neight hundred thirty-seven\neight hundred thirty-eight\neight hundred thirty-nine\neight hundred forty\neight hundred forty-one\neight hundred forty-two\neight hundred forty-three\neight hundred forty-four\neight hundred forty-five\neight hundred forty-six\neight hundred forty-seven\neight hundred forty-eight\neight hundred forty-nine\neight hundred fifty\neight hundred fifty-one\neight hundred fifty-two\neight hundred fifty-three\neight hundred fifty-four\neight hundred fifty-five\neight hundred fifty-six\neight hundred fifty-seven\neight hundred fifty-eight\neight hundred fifty-nine\neight hundred sixty\neight hundred sixty-one\neight hundred sixty-two\neight hundred sixty-three\neight hundred sixty-four\neight hundred sixty-five\neight hundred sixty-six\neight hundred sixty-seven\neight hundred sixty-eight\neight hundred sixty-nine\neight hundred seventy\neight hundred seventy-one\neight hundred seventy-two\neight hundred seventy-three\neight hundred seventy-four\neight hundred seventy-five\neight hundred seventy-six\neight hundred seventy-seven\neight hundred seventy-eight\neight hundred seventy-nine\neight hundred eighty\neight hundred eighty-one\neight hundred eighty-two\neight hundred eighty-three\neight hundred eighty-four\neight hundred eighty-five\neight hundred eighty-six\neight hundred eighty-seven\neight hundred eighty-eight\neight hundred eighty-nine\neight hundred ninety\neight hundred ninety-one\neight hundred ninety-two\neight hundred ninety-three\neight hundred ninety-four\neight hundred ninety-five\neight hundred ninety-six\neight hundred ninety-seven\neight hundred ninety-eight\neight hundred ninety-nine\nnine hundred\nnine hundred one\nnine hundred two\nnine hundred three\nnine hundred four\nnine hundred five\nnine hundred six\nnine hundred seven\nnine hundred eight\nnine hundred nine\nnine hundred ten\nnine hundred eleven\nnine hundred twelve\nnine hundred thirteen\nnine hundred fourteen\nnine hundred fifteen\nnine hundred sixteen\nnine hundred seventeen\nnine hundred eighteen\nnine hundred nineteen\nnine hundred twenty\nnine hundred twenty-one\nnine hundred twenty-two\nnine hundred twenty-three\nnine hundred twenty-four\nnine hundred twenty-five\nnine hundred twenty-six\nnine hundred twenty-seven\nnine hundred twenty-eight\nnine hundred twenty-nine\nnine hundred thirty\nnine hundred thirty-one\nnine hundred thirty-two\nnine hundred thirty-three\nnine hundred thirty-four\nnine hundred thirty-five\nnine hundred thirty-six\nnine hundred thirty-seven\nnine hundred thirty-eight\nnine hundred thirty-nine\nnine hundred forty\nnine hundred forty-one\nnine hundred forty-two\nnine hundred forty-three\nnine hundred forty-four\nnine hundred forty-five\nnine hundred forty-six\nnine hundred forty-seven\nnine hundred forty-eight\nnine hundred forty-nine\nnine hundred fifty\nnine hundred fifty-one\nnine hundred fifty-two\nnine hundred fifty-three\nnine hundred fifty-four\nnine hundred fifty-five\nnine hundred fifty-six\nnine hundred fifty-seven\nnine hundred fifty-eight\nnine hundred fifty-nine\nnine hundred sixty\nnine hundred sixty-one\nnine hundred sixty-two\nnine hundred sixty-three\nnine hundred sixty-four\nnine hundred sixty-five\nnine hundred sixty-six\nnine hundred sixty-seven\nnine hundred sixty-eight\nnine hundred sixty-nine\nnine hundred seventy\nnine hundred seventy-one\nnine hundred seventy-two\nnine hundred seventy-three\nnine hundred seventy-four\nnine hundred seventy-five\nnine hundred seventy-six\nnine hundred seventy-seven\nnine hundred seventy-eight\nnine hundred seventy-nine\nnine hundred eighty\nnine hundred eighty-one\nnine hundred eighty-two\nnine hundred eighty-three\nnine hundred eighty-four\nnine hundred eighty-five\nnine hundred eighty-six\nnine hundred eighty-seven\nnine hundred eighty-eight\nnine hundred eighty-nine\nnine hundred ninety\nnine hundred ninety-one\nnine hundred ninety-two\nnine hundred ninety-three\nnine hundred ninety-four\nnine hundred ninety-five\nnine hundred ninety-six\nnine hundred ninety-seven\nnine hundred ninety-eight\nnine hundred ninety-nine', '\n, one\n, two\n, three\n, four\n, five\n, six\n, seven\n, eight\n, nine\n, ten\n, eleven\n, twelve\n, thirteen\n, fourteen\n, fifteen\n, sixteen\n, seventeen\n, eighteen\n, nineteen\n, twenty\n, twenty-one\n, twenty-two\n, twenty-three\n, twenty-four\n, twenty-five\n, twenty-six\n, twenty-seven\n, twenty-eight\n, twenty-nine\n, thirty\n, thirty-one\n, thirty-two\n, thirty-three\n, thirty-four\n, thirty-five\n, thirty-six\n, thirty-seven\n, thirty-eight\n, thirty-nine\n, forty\n, forty-one\n, forty-two\n, forty-three\n, forty-four\n, forty-five\n, forty-six\n, forty-seven\n, forty-eight\n, forty-nine\n, fifty\n, fifty-one\n, fifty-two\n, fifty-three\n, fifty-four\n, fifty-five\n, fifty-six\n, fifty-seven\n, fifty-eight\n, fifty-nine\n, sixty\n, sixty-one\n, sixty-two\n, sixty-three\n, sixty-four\n, sixty-five\n, sixty-six\n, sixty-seven\n, sixty-eight\n, sixty-nine\n, seventy\n, seventy-one\n, seventy-two\n, seventy-three\n, seventy-four\n, seventy-five\n, seventy-six\n, seventy-seven\n, seventy-eight\n, seventy-nine\n, eighty\n, eighty-one\n, eighty-two\n, eighty-three\n, eighty-four\n, eighty-five\n, eighty-six\n, eighty-seven\n, eighty-eight\n, eighty-nine\n, ninety\n, ninety-one\n, ninety-two\n, ninety-three\n, ninety-four\n, ninety-five\n, ninety-six\n, ninety-seven\n, ninety-eight\n, ninety-nine\n, one hundred\n, one hundred one\n, one hundred two\n, one hundred three\n, one hundred four\n, one hundred five\n, one hundred six\n, one hundred seven\n, one hundred eight\n, one hundred nine\n, one hundred ten\n, one hundred eleven\n, one hundred twelve\n, one hundred thirteen\n, one hundred fourteen\n, one hundred fifteen\n, one hundred sixteen\n, one hundred seventeen\n, one hundred eighteen\n, one hundred nineteen\n, one hundred twenty\n, one hundred twenty-one\n, one hundred twenty-two\n, one hundred twenty-three\n, one hundred twenty-four\n, one hundred twenty-five\n, one hundred twenty-six\n, one hundred twenty-seven\n, one hundred twenty-eight\n, one hundred twenty-nine\n, one hundred thirty\n, one hundred thirty-one\n, one hundred thirty-two\n, one hundred thirty-three\n, one hundred thirty-four\n, one hundred thirty-five\n, one hundred thirty-six\n, one hundred thirty-seven\n, one hundred thirty-eight\n, one hundred thirty-nine\n, one hundred forty\n, one hundred forty-one\n, one hundred forty-two\n, one hundred forty-three\n, one hundred forty-four\n, one hundred forty-five\n, one hundred forty-six\n, one hundred forty-seven\n, one hundred forty-eight\n, one hundred forty-nine\n, one hundred fifty\n, one hundred fifty-one\n, one hundred fifty-two\n, one hundred fifty-three\n, one hundred fifty-four\n, one hundred fifty-five\n, one hundred fifty-six\n, one hundred fifty-seven\n, one hundred fifty-eight\n, one hundred fifty-nine\n, one hundred sixty\n, one hundred sixty-one\n, one hundred sixty-two\n, one hundred sixty-three\n, one hundred sixty-four\n, one hundred sixty-five\n, one hundred sixty-six\n, one hundred sixty-seven\n, one hundred sixty-eight\n, one hundred sixty-nine\n, one hundred seventy\n, one hundred seventy-one\n, one hundred seventy-two\n, one hundred seventy-three\n, one hundred seventy-four\n, one hundred seventy-five\n, one hundred seventy-six\n, one hundred seventy-seven\n, one hundred seventy-eight\n, one hundred seventy-nine\n, one hundred eighty\n, one hundred eighty-one\n, one hundred eighty-two\n, one hundred eighty-three\n, one hundred eighty-four\n, one hundred eighty-five\n, one hundred eighty-six\n, one hundred eighty-seven\n, one hundred eighty-eight\n, one hundred eighty-nine\n, one hundred ninety\n, one hundred ninety-one\n, one hundred ninety-two\n, one hundred ninety-three\n, one hundred ninety-four\n, one hundred ninety-five\n, one hundred ninety-six\n, one hundred ninety-seven\n, one hundred ninety-eight\n, one hundred ninety-nine\n, two hundred\n, two hundred one\n, two hundred two\n, two hundred three\n, two hundred four\n, two hundred five\n, two hundred six\n, two hundred seven\n, two hundred eight\n, two hundred nine\n, two hundred ten\n, two hundred eleven\n, two hundred twelve\n, two hundred thirteen\n, two hundred fourteen\n, two hundred fifteen\n, two hundred sixteen\n, two hundred seventeen\n, two hundred eighteen\n, two hundred nineteen\n, two hundred twenty\n, two hundred twenty-one\n, two hundred twenty-two\n, two hundred twenty-three\n, two hundred twenty-four\n, two hundred twenty-five\n, two hundred twenty-six\n, two hundred twenty-seven\n, two hundred twenty-eight\n, two hundred twenty-nine\n, two hundred thirty\n, two hundred thirty-one\n, two hundred thirty-two\n, two hundred thirty-three\n, two hundred thirty-four\n, two hundred thirty-five\n, two hundred thirty-six\n, two hundred thirty-seven\n, two hundred thirty-eight\n, two hundred thirty-nine\n, two hundred forty\n, two hundred forty-one\n, two hundred forty-two\n, two hundred forty-three\n, two hundred forty-four\n, two hundred forty-five\n, two hundred forty-six\n, two hundred forty-seven\n, two hundred forty-eight\n, two hundred forty-nine\n, two hundred fifty\n, two hundred fifty-one\n, two hundred fifty-two\n, two hundred fifty-three\n, two hundred fifty-four\n, two hundred fifty-five\n, two hundred fifty-six\n, two hundred fifty-seven\n, two hundred fifty-eight\n, two hundred fifty-nine\n, two hundred sixty\n, two hundred sixty-one\n, two hundred sixty-two\n, two hundred sixty-three\n, two hundred sixty-four\n, two hundred sixty-five\n, two hundred sixty-six\n, two hundred sixty-seven\n, two hundred sixty-eight\n, two hundred sixty-nine\n, two hundred seventy\n, two hundred seventy-one\n, two hundred seventy-two\n, two hundred seventy-three\n, two hundred seventy-four\n, two hundred seventy-five\n, two hundred seventy-six\n, two hundred seventy-seven\n, two hundred seventy-eight\n, two hundred seventy-nine\n, two hundred eighty\n, two hundred eighty-one\n, two hundred eighty-two\n, two hundred eighty-three\n, two hundred eighty-four\n, two hundred eighty-five\n, two hundred eighty-six\n, two hundred eighty-seven\n, two hundred eighty-eight\n, two hundred eighty-nine\n, two hundred ninety\n, two hundred ninety-one\n, two hundred ninety-two\n, two hundred ninety-three\n, two hundred ninety-four\n, two hundred ninety-five\n, two hundred ninety-six\n, two hundred ninety-seven\n, two hundred ninety-eight\n, two hundred ninety-nine\n, three hundred\n, three hundred one\n, three hundred two\n, three hundred three\n, three hundred four\n, three hundred five\n, three hundred six\n, three hundred seven\n, three hundred eight\n, three hundred nine\n, three hundred ten\n, three hundred eleven\n, three hundred twelve\n, three hundred thirteen\n, three hundred fourteen\n, three hundred fifteen\n, three hundred sixteen\n, three hundred seventeen\n, three hundred eighteen\n, three hundred nineteen\n, three hundred twenty\n, three hundred twenty-one\n, three hundred twenty-two\n, three hundred twenty-three\n, three hundred twenty-four\n, three hundred twenty-five\n, three hundred twenty-six\n, three hundred twenty-seven\n, three hundred twenty-eight\n, three hundred twenty-nine\n, three hundred thirty\n, three hundred thirty-one\n, three hundred thirty-two\n, three hundred thirty-three\n, three hundred thirty-four\n, three hundred thirty-five\n, three hundred thirty-six\n, three hundred thirty-seven\n, three hundred thirty-eight\n, three hundred thirty-nine\n, three hundred forty\n, three hundred forty-one\n, three hundred forty-two\n, three hundred forty-three\n, three hundred forty-four\n, three hundred forty-five\n, three hundred forty-six\n, three hundred forty-seven\n, three hundred forty-eight\n, three hundred forty-nine\n, three hundred fifty\n, three hundred fifty-one\n, three hundred fifty-two\n, three hundred fifty-three\n, three hundred fifty-four\n, three hundred fifty-five\n, three hundred fifty-six\n, three hundred fifty-seven\n, three hundred fifty-eight\n, three hundred fifty-nine\n, three hundred sixty\n, three hundred sixty-one\n, three hundred sixty-two\n, three hundred sixty-three\n, three hundred sixty-four\n, three hundred sixty-five\n, three hundred sixty-six\n, three hundred sixty-seven\n, three hundred sixty-eight\n, three hundred sixty-nine\n, three hundred seventy\n, three hundred seventy-one\n, three hundred seventy-two\n, three hundred seventy-three\n, three hundred seventy-four\n, three hundred seventy-five\n, three hundred seventy-six\n, three hundred seventy-seven\n, three hundred seventy-eight\n, three hundred seventy-nine\n, three hundred eighty\n, three hundred eighty-one\n, three hundred eighty-two\n, three hundred eighty-three\n, three hundred eighty-four\n, three hundred eighty-five\n, three hundred eighty-six\n, three hundred eighty-seven\n, three hundred eighty-eight\n, three hundred eighty-nine\n, three hundred ninety\n, three hundred ninety-one\n, three hundred ninety-two\n, three hundred ninety-three\n, three hundred ninety-four\n, three hundred ninety-five\n, three hundred ninety-six\n, three hundred ninety-seven\n, three hundred ninety-eight\n, three hundred ninety-nine\n, four hundred\n, four hundred one\n, four hundred two\n, four hundred three\n, four hundred four\n, four hundred five\n, four hundred six\n, four hundred seven\n, four hundred eight\n, four hundred nine\n, four hundred ten\n, four hundred eleven\n, four hundred twelve\n, four hundred thirteen\n, four hundred fourteen\n, four hundred fifteen\n, four hundred sixteen\n, four hundred seventeen\n, four hundred eighteen\n, four hundred nineteen\n, four hundred twenty\n, four hundred twenty-one\n, four hundred twenty-two\n, four hundred twenty-three\n, four hundred twenty-four\n, four hundred twenty-five\n, four hundred twenty-six\n, four hundred twenty-seven\n, four hundred twenty-eight\n, four hundred twenty-nine\n, four hundred thirty\n, four hundred thirty-one\n, four hundred thirty-two\n, four hundred thirty-three\n, four hundred thirty-four\n, four hundred thirty-five\n, four hundred thirty-six\n, four hundred thirty-seven\n, four hundred thirty-eight\n, four hundred thirty-nine\n, four hundred forty\n, four hundred forty-one\n, four hundred forty-two\n, four hundred forty-three\n, four hundred forty-four\n, four hundred forty-five\n, four hundred forty-six\n, four hundred forty-seven\n, four hundred forty-eight\n, four hundred forty-nine\n, four hundred fifty\n, four hundred fifty-one\n, four hundred fifty-two\n, four hundred fifty-three\n, four hundred fifty-four\n, four hundred fifty-five\n, four hundred fifty-six\n, four hundred fifty-seven\n, four hundred fifty-eight\n, four hundred fifty-nine\n, four hundred sixty\n, four hundred sixty-one\n, four hundred sixty-two\n, four hundred sixty-three\n, four hundred sixty-four\n, four hundred sixty-five\n, four hundred sixty-six\n, four hundred sixty-seven\n, four hundred sixty-eight\n, four hundred sixty-nine\n, four hundred seventy\n, four hundred seventy-one\n, four hundred seventy-two\n, four hundred seventy-three\n, four hundred seventy-four\n, four hundred seventy-five\n, four hundred seventy-six\n, four hundred seventy-seven\n, four hundred seventy-eight\n, four hundred seventy-nine\n, four hundred eighty\n, four hundred eighty-one\n, four hundred eighty-two\n, four hundred eighty-three\n, four hundred eighty-four\n, four hundred eighty-five\n, four hundred eighty-six\n, four hundred eighty-seven\n, four hundred eighty-eight\n, four hundred eighty-nine\n, four hundred ninety\n, four hundred ninety-one\n, four hundred ninety-two\n, four hundred ninety-three\n, four hundred ninety-four\n, four hundred ninety-five\n, four hundred ninety-six\n, four hundred ninety-seven\n, four hundred ninety-eight\n, four hundred ninety-nine\n, five hundred\n, five hundred one\n, five hundred two\n, five hundred three\n, five hundred four\n, five hundred five\n, five hundred six\n, five hundred seven\n, five hundred eight\n, five hundred nine\n, five hundred ten\n, five hundred eleven\n, five hundred twelve\n, five hundred thirteen\n, five hundred fourteen\n, five hundred fifteen\n, five hundred sixteen\n, five hundred seventeen\n, five hundred eighteen\n, five hundred nineteen\n, five hundred twenty\n, five hundred twenty-one\n, five hundred twenty-two\n, five hundred twenty-three\n, five hundred twenty-four\n, five hundred twenty-five\n, five hundred twenty-six\n, five hundred twenty-seven\n, five hundred twenty-eight\n, five hundred twenty-nine\n, five hundred thirty\n, five hundred thirty-one\n, five hundred thirty-two\n, five hundred thirty-three\n, five hundred thirty-four\n, five hundred thirty-five\n, five hundred thirty-six\n, five hundred thirty-seven\n, five hundred thirty-eight\n, five hundred thirty-nine\n, five hundred forty\n, five hundred forty-one\n, five hundred forty-two\n, five hundred forty-three\n, five hundred forty-four\n, five hundred forty-five\n, five hundred forty-six\n, five hundred forty-seven\n, five hundred forty-eight\n, five hundred forty-nine\n, five hundred fifty\n, five hundred fifty-one\n, five hundred fifty-two\n, five hundred fifty-three\n, five hundred fifty-four\n, five hundred fifty-five\n, five hundred fifty-six\n, five hundred fifty-seven\n, five hundred fifty-eight\n, five hundred fifty-nine\n, five hundred sixty\n, five hundred sixty-one\n, five hundred sixty-two\n, five hundred sixty-three\n, five hundred sixty-four\n, five hundred sixty-five\n, five hundred sixty-six\n, five hundred sixty-seven\n, five hundred sixty-eight\n, five hundred sixty-nine\n, five hundred seventy\n, five hundred seventy-one\n, five hundred seventy-two\n, five hundred seventy-three\n, five hundred seventy-four\n, five hundred seventy-five\n, five hundred seventy-six\n, five hundred seventy-seven\n, five hundred seventy-eight\n, five hundred seventy-nine\n, five hundred eighty\n, five hundred eighty-one\n, five hundred eighty-two\n, five hundred eighty-three\n, five hundred eighty-four\n, five hundred eighty-five\n, five hundred eighty-six\n, five hundred eighty-seven\n, five hundred eighty-eight\n, five hundred eighty-nine\n, five hundred ninety\n, five hundred ninety-one\n, five hundred ninety-two\n, five hundred ninety-three\n, five hundred ninety-four\n, five hundred ninety-five\n, five hundred ninety-six\n, five hundred ninety-seven\n, five hundred ninety-eight\n, five hundred ninety-nine\n, six hundred\n, six hundred one\n, six hundred two\n, six hundred three\n, six hundred four\n, six hundred five\n, six hundred six\n, six hundred seven\n, six hundred eight\n, six hundred nine\n, six hundred ten\n, six hundred eleven\n, six hundred twelve\n, six hundred thirteen\n, six hundred fourteen\n, six hundred fifteen\n, six hundred sixteen\n, six hundred seventeen\n, six hundred eighteen\n, six hundred nineteen\n, six hundred twenty\n, six hundred twenty-one\n, six hundred twenty-two\n, six hundred twenty-three\n, six hundred twenty-four\n, six hundred twenty-five\n, six hundred twenty-six\n, six hundred twenty-seven\n, six hundred twenty-eight\n, six hundred twenty-nine\n, six hundred thirty\n, six hundred thirty-one\n, six hundred thirty-two\n, six hundred thirty-three\n, six hundred thirty-four\n, six hundred thirty-five\n, six hundred thirty-six\n, six hundred thirty-seven\n, six hundred thirty-eight\n, six hundred thirty-nine\n, six hundred forty\n, six hundred forty-one\n, six hundred forty-two\n, six hundred forty-three\n, six hundred forty-four\n, six hundred forty-five\n, six hundred forty-six\n, six hundred forty-seven\n, six hundred forty-eight\n, six hundred forty-nine\n, six hundred fifty\n, six hundred fifty-one\n, six hundred fifty-two\n, six hundred fifty-three\n, six hundred fifty-four\n, six hundred fifty-five\n, six hundred fifty-six\n, six hundred fifty-seven\n, six hundred fifty-eight\n, six hundred fifty-nine\n, six hundred sixty\n, six hundred sixty-one\n, six hundred sixty-two\n, six hundred sixty-three\n, six hundred sixty-four\n, six hundred sixty-five\n, six hundred sixty-six\n, six hundred sixty-seven\n, six hundred sixty-eight\n, six hundred sixty-nine\n, six hundred seventy\n, six hundred seventy-one\n, six hundred seventy-two\n, six hundred seventy-three\n, six hundred seventy-four\n, six hundred seventy-five\n, six hundred seventy-six\n, six hundred seventy-seven\n, six hundred seventy-eight\n, six hundred seventy-nine\n, six hundred eighty\n, six hundred eighty-one\n, six hundred eighty-two\n, six hundred eighty-three\n, six hundred eighty-four\n, six hundred eighty-five\n, six hundred eighty-six\n, six hundred eighty-seven\n, six hundred eighty-eight\n, six hundred eighty-nine\n, six hundred ninety\n, six hundred ninety-one\n, six hundred ninety-two\n, six hundred ninety-three\n, six hundred ninety-four\n, six hundred ninety-five\n, six hundred ninety-six\n, six hundred ninety-seven\n, six hundred ninety-eight\n, six hundred ninety-nine\n, seven hundred\n, seven hundred one\n, seven hundred two\n, seven hundred three\n, seven hundred four\n, seven hundred five\n, seven hundred six\n, seven hundred seven\n, seven hundred eight\n, seven hundred nine\n, seven hundred ten\n, seven hundred eleven\n, seven hundred twelve\n, seven hundred thirteen\n, seven hundred fourteen\n, seven hundred fifteen\n, seven hundred sixteen\n, seven hundred seventeen\n, seven hundred eighteen\n, seven hundred nineteen\n, seven hundred twenty\n, seven hundred twenty-one\n, seven hundred twenty-two\n, seven hundred twenty-three\n, seven hundred twenty-four\n, seven hundred twenty-five\n, seven hundred twenty-six\n, seven hundred twenty-seven\n, seven hundred twenty-eight\n, seven hundred twenty-nine\n, seven hundred thirty\n, seven hundred thirty-one\n, seven hundred thirty-two\n, seven hundred thirty-three\n, seven hundred thirty-four\n, seven hundred thirty-five\n, seven hundred thirty-six\n, seven hundred thirty-seven\n, seven hundred thirty-eight\n, seven hundred thirty-nine\n, seven hundred forty\n, seven hundred forty-one\n, seven hundred forty-two\n, seven hundred forty-three\n, seven hundred forty-four\n, seven hundred forty-five\n, seven hundred forty-six\n, seven hundred forty-seven\n, seven hundred forty-eight\n, seven hundred forty-nine\n, seven hundred fifty\n, seven hundred fifty-one\n, seven hundred fifty-two\n, seven hundred fifty-three\n, seven hundred fifty-four\n, seven hundred fifty-five\n, seven hundred fifty-six\n, seven hundred fifty-seven\n, seven hundred fifty-eight\n, seven hundred fifty-nine\n, seven hundred sixty\n, seven hundred sixty-one\n, seven hundred sixty-two\n, seven hundred sixty-three\n, seven hundred sixty-four\n, seven hundred sixty-five\n, seven hundred sixty-six\n, seven hundred sixty-seven\n, seven hundred sixty-eight\n, seven hundred sixty-nine\n, seven hundred seventy\n, seven hundred seventy-one\n, seven hundred seventy-two\n, seven hundred seventy-three\n, seven hundred seventy-four\n, seven hundred seventy-five\n, seven hundred seventy-six\n, seven hundred seventy-seven\n, seven hundred seventy-eight\n, seven hundred seventy-nine\n, seven hundred eighty\n, seven hundred eighty-one\n, seven hundred eighty-two\n, seven hundred eighty-three\n, seven hundred eighty-four\n, seven hundred eighty-five\n, seven hundred eighty-six\n, seven hundred eighty-seven\n, seven hundred eighty-eight\n, seven hundred eighty-nine\n, seven hundred ninety\n, seven hundred ninety-one\n, seven hundred ninety-two\n, seven hundred ninety-three\n, seven hundred ninety-four\n, seven hundred ninety-five\n, seven hundred ninety-six\n, seven hundred ninety-seven\n, seven hundred ninety-eight\n, seven hundred ninety-nine\n, eight hundred\n, eight hundred one\n, eight hundred two\n, eight hundred three\n, eight hundred four\n, eight hundred five\n, eight hundred six\n, eight hundred seven\n, eight hundred eight\n, eight hundred nine\n, eight hundred ten\n, eight hundred eleven\n, eight hundred twelve\n, eight hundred thirteen\n, eight hundred fourteen\n, eight hundred fifteen\n, eight hundred sixteen\n, eight hundred seventeen\n, eight hundred eighteen\n, eight hundred nineteen\n, eight hundred twenty\n, eight hundred twenty-one\n, eight hundred twenty-two\n, eight hundred twenty-three\n, eight hundred twenty-four\n, eight hundred twenty-five\n, eight hundred twenty-six\n, eight hundred twenty-seven\n, eight hundred twenty-eight\n, eight hundred twenty-nine\n, eight hundred thirty\n, eight hundred thirty-one\n, eight hundred thirty-two\n, eight hundred thirty-three\n, eight hundred thirty-four\n, eight hundred thirty-five\n, eight hundred thirty-six\n, eight hundred thirty-seven\n, eight hundred thirty-eight\n, eight hundred thirty-nine\n, eight hundred forty\n, eight hundred forty-one\n, eight hundred forty-two\n, eight hundred forty-three\n, eight hundred forty-four\n, eight hundred forty-five\n, eight hundred forty-six\n, eight hundred forty-seven\n, eight hundred forty-eight\n, eight hundred forty-nine\n, eight hundred fifty\n, eight hundred fifty-one\n, eight hundred fifty-two\n, eight hundred fifty-three\n, eight hundred fifty-four\n, eight hundred fifty-five\n, eight hundred fifty-six\n, eight hundred fifty-seven\n, eight hundred fifty-eight\n, eight hundred fifty-nine\n, eight hundred sixty\n, eight hundred sixty-one\n, eight hundred sixty-two\n, eight hundred sixty-three\n, eight hundred sixty-four\n, eight hundred sixty-five\n, eight hundred sixty-six\n, eight hundred sixty-seven\n, eight hundred sixty-eight\n, eight hundred sixty-nine\n, eight hundred seventy\n, eight hundred seventy-one\n, eight hundred seventy-two\n, eight hundred seventy-three\n, eight hundred seventy-four\n, eight hundred seventy-five\n, eight hundred seventy-six\n, eight hundred seventy-seven\n, eight hundred seventy-eight\n, eight hundred seventy-nine\n, eight hundred eighty\n, eight hundred eighty-one\n, eight hundred eighty-two\n, eight hundred eighty-three\n, eight hundred eighty-four\n, eight hundred eighty-five\n, eight hundred eighty-six\n, eight hundred eighty-seven\n, eight hundred eighty-eight\n, eight hundred eighty-nine\n, eight hundred ninety\n, eight hundred ninety-one\n, eight hundred ninety-two\n, eight hundred ninety-three\n, eight hundred ninety-four\n, eight hundred ninety-five\n, eight hundred ninety-six\n, eight hundred ninety-seven\n, eight hundred ninety-eight\n, eight hundred ninety-nine\n, nine hundred\n, nine hundred one\n, nine hundred two\n, nine hundred three\n, nine hundred four\n, nine hundred five\n, nine hundred six\n, nine hundred seven\n, nine hundred eight\n, nine hundred nine\n, nine hundred ten\n, nine hundred eleven\n, nine hundred twelve\n, nine hundred thirteen\n, nine hundred fourteen\n, nine hundred fifteen\n, nine hundred sixteen\n, nine hundred seventeen\n, nine hundred eighteen\n, nine hundred nineteen\n, nine hundred twenty\n, nine hundred twenty-one\n, nine hundred twenty-two\n, nine hundred twenty-three\n, nine hundred twenty-four\n, nine hundred twenty-five\n, nine hundred twenty-six\n, nine hundred twenty-seven\n, nine hundred twenty-eight\n, nine hundred twenty-nine\n, nine hundred thirty\n, nine hundred thirty-one\n, nine hundred thirty-two\n, nine hundred thirty-three\n, nine hundred thirty-four\n, nine hundred thirty-five\n, nine hundred thirty-six\n, nine hundred thirty-seven\n, nine hundred thirty-eight\n, nine hundred thirty-nine\n, nine hundred forty\n, nine hundred forty-one\n, nine hundred forty-two\n, nine hundred forty-three\n, nine hundred forty-four\n, nine hundred forty-five\n, nine hundred forty-six\n, nine hundred forty-seven\n, nine hundred forty-eight\n, nine hundred forty-nine\n, nine hundred fifty\n, nine hundred fifty-one\n, nine hundred fifty-two\n, nine hundred fifty-three\n, nine hundred fifty-four\n, nine hundred fifty-five\n, nine hundred fifty-six\n, nine hundred fifty-seven\n, nine hundred fifty-eight\n, nine hundred fifty-nine\n, nine hundred sixty\n, nine hundred sixty-one\n, nine hundred sixty-two\n, nine hundred sixty-three\n, nine hundred sixty-four\n, nine hundred sixty-five\n, nine hundred sixty-six\n, nine hundred sixty-seven\n, nine hundred sixty-eight\n, nine hundred sixty-nine\n, nine hundred seventy\n, nine hundred seventy-one\n, nine hundred seventy-two\n, nine hundred seventy-three\n, nine hundred seventy-four\n, nine hundred seventy-five\n, nine hundred seventy-six\n, nine hundred seventy-seven\n, nine hundred seventy-eight\n, nine hundred seventy-nine\n, nine hundred eighty\n, nine hundred eighty-one\n, nine hundred eighty-two\n, nine hundred eighty-three\n, nine hundred eighty-four\n, nine hundred eighty-five\n, nine hundred eighty-six\n, nine hundred eighty-seven\n, nine hundred eighty-eight\n, nine hundred eighty-nine\n, nine hundred ninety\n, nine hundred ninety-one\n, nine hundred ninety-two\n, nine hundred ninety-three\n, nine hundred ninety-four\n, nine hundred ninety-five\n, nine hundred ninety-six\n, nine hundred ninety-seven\n, nine hundred ninety-eight\n, nine hundred ninety-nine', '\n, one\n, two\n, three\n, four\n, five\n, six\n, seven\n, eight\n, nine\n, ten\n, eleven\n, twelve\n, thirteen\n, fourteen\n, fifteen\n, sixteen\n, seventeen\n, eighteen\n, nineteen\n, twenty\n, twenty-one\n, twenty-two\n, twenty-three\n, twenty-four\n, twenty-five\n, twenty-six\n, twenty-seven\n, twenty-eight\n, twenty-nine\n, thirty\n, thirty-one\n, thirty-two\n, thirty-three\n, thirty-four\n, thirty-five\n, thirty-six\n, thirty-seven\n, thirty-eight\n, thirty-nine\n, forty\n, forty-one\n, forty-two\n, forty-three\n, forty-four\n, forty-five\n, forty-six\n, forty-seven\n, forty-eight\n, forty-nine\n, fifty\n, fifty-one\n, fifty-two\n, fifty-three\n, fifty-four\n, fifty-five\n, fifty-six\n, fifty-seven\n, fifty-eight\n, fifty-nine\n, sixty\n, sixty-one\n, sixty-two\n, sixty-three\n, sixty-four\n, sixty-five\n, sixty-six\n, sixty-seven\n, sixty-eight\n, sixty-nine\n, seventy\n, seventy-one\n, seventy-two\n, seventy-three\n, seventy-four\n, seventy-five\n, seventy-six\n, seventy-seven\n, seventy-eight\n, seventy-nine\n, eighty\n, eighty-one\n, eighty-two\n, eighty-three\n, eighty-four\n, eighty-five\n, eighty-six\n, eighty-seven\n, eighty-eight\n, eighty-nine\n, ninety\n, ninety-one\n, ninety-two\n, ninety-three\n, ninety-four\n, ninety-five\n, ninety-six\n, ninety-seven\n, ninety-eight\n, ninety-nine\n, one hundred\n, one hundred one\n, one hundred two\n, one hundred three\n, one hundred four\n, one hundred five\n, one hundred six\n, one hundred seven\n, one hundred eight\n, one hundred nine\n, one hundred ten\n, one hundred eleven\n, one hundred twelve\n, one hundred thirteen\n, one hundred fourteen\n, one hundred fifteen\n, one hundred sixteen\n, one hundred seventeen\n, one hundred eighteen\n, one hundred nineteen\n, one hundred twenty\n, one hundred twenty-one\n, one hundred twenty-two\n, one hundred twenty-three\n, one hundred twenty-four\n, one hundred twenty-five\n, one hundred twenty-six\n, one hundred twenty-seven\n, one hundred twenty-eight\n, one hundred twenty-nine\n, one hundred thirty\n, one hundred thirty-one\n, one hundred thirty-two\n, one hundred thirty-three\n, one hundred thirty-four\n, one hundred thirty-five\n, one hundred thirty-six\n, one hundred thirty-seven\n, one hundred thirty-eight\n, one hundred thirty-nine\n, one hundred forty\n, one hundred forty-one\n, one hundred forty-two\n, one hundred forty-three\n, one hundred forty-four\n, one hundred forty-five\n, one hundred forty-six\n, one hundred forty-seven\n, one hundred forty-eight\n, one hundred forty-nine\n, one hundred fifty\n, one hundred fifty-one\n, one hundred fifty-two\n, one hundred fifty-three\n, one hundred fifty-four\n, one hundred fifty-five\n, one hundred fifty-six\n, one hundred fifty-seven\n, one hundred fifty-eight\n, one hundred fifty-nine\n, one hundred sixty\n, one hundred sixty-one\n, one hundred sixty-two\n, one hundred sixty-three\n, one hundred sixty-four\n, one hundred sixty-five\n, one hundred sixty-six\n, one hundred sixty-seven\n, one hundred sixty-eight\n, one hundred sixty-nine\n, one hundred seventy\n, one hundred seventy-one\n, one hundred seventy-two\n, one hundred seventy-three\n, one hundred seventy-four\n, one hundred seventy-five\n, one hundred seventy-six\n, one hundred seventy-seven\n, one hundred seventy-eight\n, one hundred seventy-nine\n, one hundred eighty\n, one hundred eighty-one\n, one hundred eighty-two\n, one hundred eighty-three\n, one hundred eighty-four\n, one hundred eighty-five\n, one hundred eighty-six\n, one hundred eighty-seven\n, one hundred eighty-eight\n, one hundred eighty-nine\n, one hundred ninety\n, one hundred ninety-one\n, one hundred ninety-two\n, one hundred ninety-three\n, one hundred ninety-four\n, one hundred ninety-five\n, one hundred ninety-six\n, one hundred ninety-seven\n, one hundred ninety-eight\n, one hundred ninety-nine\n, two hundred\n, two hundred one\n, two hundred two\n, two hundred three\n, two hundred four\n, two hundred five\n, two hundred six\n, two hundred seven\n, two hundred eight\n, two hundred nine\n, two hundred ten\n, two hundred eleven\n, two hundred twelve\n, two hundred thirteen\n, two hundred fourteen\n, two hundred fifteen\n, two hundred sixteen\n, two hundred seventeen\n, two hundred eighteen\n, two hundred nineteen\n, two hundred twenty\n, two hundred twenty-one\n, two hundred twenty-two\n, two hundred twenty-three\n, two hundred twenty-four\n, two hundred twenty-five\n, two hundred twenty-six\n, two hundred twenty-seven\n, two hundred twenty-eight\n, two hundred twenty-nine\n, two hundred thirty\n, two hundred thirty-one\n, two hundred thirty-two\n, two hundred thirty-three\n, two hundred thirty-four\n, two hundred thirty-five\n, two hundred thirty-six\n, two hundred thirty-seven\n, two hundred thirty-eight\n, two hundred thirty-nine\n, two hundred forty\n, two hundred forty-one\n, two hundred forty-two\n, two hundred forty-three\n, two hundred forty-four\n, two hundred forty-five\n, two hundred forty-six\n, two hundred forty-seven\n, two hundred forty-eight\n, two hundred forty-nine\n, two hundred fifty\n, two hundred fifty-one\n, two hundred fifty-two\n, two hundred fifty-three\n, two hundred fifty-four\n, two hundred fifty-five\n, two hundred fifty-six\n, two hundred fifty-seven\n, two hundred fifty-eight\n, two hundred fifty-nine\n, two hundred sixty\n, two hundred sixty-one\n, two hundred sixty-two\n, two hundred sixty-three\n, two hundred sixty-four\n, two hundred sixty-five\n, two hundred sixty-six\n, two hundred sixty-seven\n, two hundred sixty-eight\n, two hundred sixty-nine\n, two hundred seventy\n, two hundred seventy-one\n, two hundred seventy-two\n, two hundred seventy-three\n, two hundred seventy-four\n, two hundred seventy-five\n, two hundred seventy-six\n, two hundred seventy-seven\n, two hundred seventy-eight\n, two hundred seventy-nine\n, two hundred eighty\n, two hundred eighty-one\n, two hundred eighty-two\n, two hundred eighty-three\n, two hundred eighty-four\n, two hundred eighty-five\n, two hundred eighty-six\n, two hundred eighty-seven\n, two hundred eighty-eight\n, two hundred eighty-nine\n, two hundred ninety\n, two hundred ninety-one\n, two hundred ninety-two\n, two hundred ninety-three\n, two hundred ninety-four\n, two hundred ninety-five\n, two hundred ninety-six\n, two hundred ninety-seven\n, two hundred ninety-eight\n, two hundred ninety-nine\n, three hundred\n, three hundred one\n, three hundred two\n, three hundred three\n, three hundred four\n, three hundred five\n, three hundred six\n, three hundred seven\n, three hundred eight\n, three hundred nine\n, three hundred ten\n, three hundred eleven\n, three hundred twelve\n, three hundred thirteen\n, three hundred fourteen\n, three hundred fifteen\n, three hundred sixteen\n, three hundred seventeen\n, three hundred eighteen\n, three hundred nineteen\n, three hundred twenty\n, three hundred twenty-one\n, three hundred twenty-two\n, three hundred twenty-three\n, three hundred twenty-four\n, three hundred twenty-five\n, three hundred twenty-six\n, three hundred twenty-seven\n, three hundred twenty-eight\n, three hundred twenty-nine\n, three hundred thirty\n, three hundred thirty-one\n, three hundred thirty-two\n, three hundred thirty-three\n, three hundred thirty-four\n, three hundred thirty-five\n, three hundred thirty-six\n, three hundred thirty-seven\n, three hundred thirty-eight\n, three hundred thirty-nine\n, three hundred forty\n, three hundred forty-one\n, three hundred forty-two\n, three hundred forty-three\n, three hundred forty-four\n, three hundred forty-five\n, three hundred forty-six\n, three hundred forty-seven\n, three hundred forty-eight\n, three hundred forty-nine\n, three hundred fifty\n, three hundred fifty-one\n, three hundred fifty-two\n, three hundred fifty-three\n, three hundred fifty-four\n, three hundred fifty-five\n, three hundred fifty-six\n, three hundred fifty-seven\n, three hundred fifty-eight\n, three hundred fifty-nine\n, three hundred sixty\n, three hundred sixty-one\n, three hundred sixty-two\n, three hundred sixty-three\n, three hundred sixty-four\n, three hundred sixty-five\n, three hundred sixty-six\n, three hundred sixty-seven\n, three hundred sixty-eight\n, three hundred sixty-nine\n, three hundred seventy\n, three hundred seventy-one\n, three hundred seventy-two\n, three hundred seventy-three\n, three hundred seventy-four\n, three hundred seventy-five\n, three hundred seventy-six\n, three hundred seventy-seven\n, three hundred seventy-eight\n, three hundred seventy-nine\n, three hundred eighty\n, three hundred eighty-one\n, three hundred eighty-two\n, three hundred eighty-three\n, three hundred eighty-four\n, three hundred eighty-five\n, three hundred eighty-six\n, three hundred eighty-seven\n, three hundred eighty-eight\n, three hundred eighty-nine\n, three hundred ninety\n, three hundred ninety-one\n, three hundred ninety-two\n, three hundred ninety-three\n, three hundred ninety-four\n, three hundred ninety-five\n, three hundred ninety-six\n, three hundred ninety-seven\n, three hundred ninety-eight\n, three hundred ninety-nine\n, four hundred\n, four hundred one\n, four hundred two\n, four hundred three\n, four hundred four\n, four hundred five\n, four hundred six\n, four hundred seven\n, four hundred eight\n, four hundred nine\n, four hundred ten\n, four hundred eleven\n, four hundred twelve\n, four hundred thirteen\n, four hundred fourteen\n, four hundred fifteen\n, four hundred sixteen\n, four hundred seventeen\n, four hundred eighteen\n, four hundred nineteen\n, four hundred twenty\n, four hundred twenty-one\n, four hundred twenty-two\n, four hundred twenty-three\n, four hundred twenty-four\n, four hundred twenty-five\n, four hundred twenty-six\n, four hundred twenty-seven\n, four hundred twenty-eight\n, four hundred twenty-nine\n, four hundred thirty\n, four hundred thirty-one\n, four hundred thirty-two\n, four hundred thirty-three\n, four hundred thirty-four\n, four hundred thirty-five\n, four hundred thirty-six\n, four hundred thirty-seven\n, four hundred thirty-eight\n, four hundred thirty-nine\n, four hundred forty\n, four hundred forty-one\n, four hundred forty-two\n, four hundred forty-three\n, four hundred forty-four\n, four hundred forty-five\n, four hundred forty-six\n, four hundred forty-seven\n, four hundred forty-eight\n, four hundred forty-nine\n, four hundred fifty\n, four hundred fifty-one\n, four hundred fifty-two\n, four hundred fifty-three\n, four hundred fifty-four\n, four hundred fifty-five\n, four hundred fifty-six\n, four hundred fifty-seven\n, four hundred fifty-eight\n, four hundred fifty-nine\n, four hundred sixty\n, four hundred sixty-one\n, four hundred sixty-two\n, four hundred sixty-three\n, four hundred sixty-four\n, four hundred sixty-five\n, four hundred sixty-six\n, four hundred sixty-seven\n, four hundred sixty-eight\n, four hundred sixty-nine\n, four hundred seventy\n, four hundred seventy-one\n, four hundred seventy-two\n, four hundred seventy-three\n, four hundred seventy-four\n, four hundred seventy-five\n, four hundred seventy-six\n, four hundred seventy-seven\n, four hundred seventy-eight\n, four hundred seventy-nine\n, four hundred eighty\n, four hundred eighty-one\n, four hundred eighty-two\n, four hundred eighty-three\n, four hundred eighty-four\n, four hundred eighty-five\n, four hundred eighty-six\n, four hundred eighty-seven\n, four hundred eighty-eight\n, four hundred eighty-nine\n, four hundred ninety\n, four hundred ninety-one\n, four hundred ninety-two\n, four hundred ninety-three\n, four hundred ninety-four\n, four hundred ninety-five\n, four hundred ninety-six\n, four hundred ninety-seven\n, four hundred ninety-eight\n, four hundred ninety-nine\n, five hundred\n, five hundred one\n, five hundred two\n, five hundred three\n, five hundred four\n, five hundred five\n, five hundred six\n, five hundred seven\n, five hundred eight\n, five hundred nine\n, five hundred ten\n, five hundred eleven\n, five hundred twelve\n, five hundred thirteen\n, five hundred fourteen\n, five hundred fifteen\n, five hundred sixteen\n, five hundred seventeen\n, five hundred eighteen\n, five hundred nineteen\n, five hundred twenty\n, five hundred twenty-one\n, five hundred twenty-two\n, five hundred twenty-three\n, five hundred twenty-four\n, five hundred twenty-five\n, five hundred twenty-six\n, five hundred twenty-seven\n, five hundred twenty-eight\n, five hundred twenty-nine\n, five hundred thirty\n, five hundred thirty-one\n, five hundred thirty-two\n, five hundred thirty-three\n, five hundred thirty-four\n, five hundred thirty-five\n, five hundred thirty-six\n, five hundred thirty-seven\n, five hundred thirty-eight\n, five hundred thirty-nine\n, five hundred forty\n, five hundred forty-one\n, five hundred forty-two\n, five hundred forty-three\n, five hundred forty-four\n, five hundred forty-five\n, five hundred forty-six\n, five hundred forty-seven\n, five hundred forty-eight\n, five hundred forty-nine\n, five hundred fifty\n, five hundred fifty-one\n, five hundred fifty-two\n, five hundred fifty-three\n, five hundred fifty-four\n, five hundred fifty-five\n, five hundred fifty-six\n, five hundred fifty-seven\n, five hundred fifty-eight\n, five hundred fifty-nine\n, five hundred sixty\n, five hundred sixty-one\n, five hundred sixty-two\n, five hundred sixty-three\n, five hundred sixty-four\n, five hundred sixty-five\n, five hundred sixty-six\n, five hundred sixty-seven\n, five hundred sixty-eight\n, five hundred sixty-nine\n, five hundred seventy\n, five hundred seventy-one\n, five hundred seventy-two\n, five hundred seventy-three\n, five hundred seventy-four\n, five hundred seventy-five\n, five hundred seventy-six\n, five hundred seventy-seven\n, five hundred seventy-eight\n, five hundred seventy-nine\n, five hundred eighty\n, five hundred eighty-one\n, five hundred eighty-two\n, five hundred eighty-three\n, five hundred eighty-four\n, five hundred eighty-five\n, five hundred eighty-six\n, five hundred eighty-seven\n, five hundred eighty-eight\n, five hundred eighty-nine\n, five hundred ninety\n, five hundred ninety-one\n, five hundred ninety-two\n, five hundred ninety-three\n, five hundred ninety-four\n, five hundred ninety-five\n, five hundred ninety-six\n, five hundred ninety-seven\n, five hundred ninety-eight\n, five hundred ninety-nine\n, six hundred\n, six hundred one\n, six hundred two\n, six hundred three\n, six hundred four\n, six hundred five\n, six hundred six\n, six hundred seven\n, six hundred eight\n, six hundred nine\n, six hundred ten\n, six hundred eleven\n, six hundred twelve\n, six hundred thirteen\n, six hundred fourteen\n, six hundred fifteen\n, six hundred sixteen\n, six hundred seventeen\n, six hundred eighteen\n, six hundred nineteen\n, six hundred twenty\n, six hundred twenty-one\n, six hundred twenty-two\n, six hundred twenty-three\n, six hundred twenty-four\n, six hundred twenty-five\n, six hundred twenty-six\n, six hundred twenty-seven\n, six hundred twenty-eight\n, six hundred twenty-nine\n, six hundred thirty\n, six hundred thirty-one\n, six hundred thirty-two\n, six hundred thirty-three\n, six hundred thirty-four\n, six hundred thirty-five\n, six hundred thirty-six\n, six hundred thirty-seven\n, six hundred thirty-eight\n, six hundred thirty-nine\n, six hundred forty\n, six hundred forty-one\n, six hundred forty-two\n, six hundred forty-three\n, six hundred forty-four\n, six hundred forty-five\n, six hundred forty-six\n, six hundred forty-seven\n, six hundred forty-eight\n, six hundred forty-nine\n, six hundred fifty\n, six hundred fifty-one\n, six hundred fifty-two\n, six hundred fifty-three\n, six hundred fifty-four\n, six hundred fifty-five\n, six hundred fifty-six\n, six hundred fifty-seven\n, six hundred fifty-eight\n, six hundred fifty-nine\n, six hundred sixty\n, six hundred sixty-one\n, six hundred sixty-two\n, six hundred sixty-three\n, six hundred sixty-four\n, six hundred sixty-five\n, six hundred sixty-six\n, six hundred sixty-seven\n, six hundred sixty-eight\n, six hundred sixty-nine\n, six hundred seventy\n, six hundred seventy-one\n, six hundred seventy-two\n, six hundred seventy-three\n, six hundred seventy-four\n, six hundred seventy-five\n, six hundred seventy-six\n, six hundred seventy-seven\n, six hundred seventy-eight\n, six hundred seventy-nine\n, six hundred eighty\n, six hundred eighty-one\n, six hundred eighty-two\n, six hundred eighty-three\n, six hundred eighty-four\n, six hundred eighty-five\n, six hundred eighty-six\n, six hundred eighty-seven\n, six hundred eighty-eight\n, six hundred eighty-nine\n, six hundred ninety\n, six hundred ninety-one\n, six hundred ninety-two\n, six hundred ninety-three\n, six hundred ninety-four\n, six hundred ninety-five\n, six hundred ninety-six\n, six hundred ninety-seven\n, six hundred ninety-eight\n, six hundred ninety-nine\n, seven hundred\n, seven hundred one\n, seven hundred two\n, seven hundred three\n, seven hundred four\n, seven hundred five\n, seven hundred six\n, seven hundred seven\n, seven hundred eight\n, seven hundred nine\n, seven hundred ten\n, seven hundred eleven\n, seven hundred twelve\n, seven hundred thirteen\n, seven hundred fourteen\n, seven hundred fifteen\n, seven hundred sixteen\n, seven hundred seventeen\n, seven hundred eighteen\n, seven hundred nineteen\n, seven hundred twenty\n, seven hundred twenty-one\n, seven hundred twenty-two\n, seven hundred twenty-three\n, seven hundred twenty-four\n, seven hundred twenty-five\n, seven hundred twenty-six\n, seven hundred twenty-seven\n, seven hundred twenty-eight\n, seven hundred twenty-nine\n, seven hundred thirty\n, seven hundred thirty-one\n, seven hundred thirty-two\n, seven hundred thirty-three\n, seven hundred thirty-four\n, seven hundred thirty-five\n, seven hundred thirty-six\n, seven hundred thirty-seven\n, seven hundred thirty-eight\n, seven hundred thirty-nine\n, seven hundred forty\n, seven hundred forty-one\n, seven hundred forty-two\n, seven hundred forty-three\n, seven hundred forty-four\n, seven hundred forty-five\n, seven hundred forty-six\n, seven hundred forty-seven\n, seven hundred forty-eight\n, seven hundred forty-nine\n, seven hundred fifty\n, seven hundred fifty-one\n, seven hundred fifty-two\n, seven hundred fifty-three\n, seven hundred fifty-four\n, seven hundred fifty-five\n, seven hundred fifty-six\n, seven hundred fifty-seven\n, seven hundred fifty-eight\n, seven hundred fifty-nine\n, seven hundred sixty\n, seven hundred sixty-one\n, seven hundred sixty-two\n, seven hundred sixty-three\n, seven hundred sixty-four\n, seven hundred sixty-five\n, seven hundred sixty-six\n, seven hundred sixty-seven\n, seven hundred sixty-eight\n, seven hundred sixty-nine\n, seven hundred seventy\n, seven hundred seventy-one\n, seven hundred seventy-two\n, seven hundred seventy-three\n, seven hundred seventy-four\n, seven hundred seventy-five\n, seven hundred seventy-six\n, seven hundred seventy-seven\n, seven hundred seventy-eight\n, seven hundred seventy-nine\n, seven hundred eighty\n, seven hundred eighty-one\n, seven hundred eighty-two\n, seven hundred eighty-three\n, seven hundred eighty-four\n, seven hundred eighty-five\n, seven hundred eighty-six\n, seven hundred eighty-seven\n, seven hundred eighty-eight\n, seven hundred eighty-nine\n, seven hundred ninety\n, seven hundred ninety-one\n, seven hundred ninety-two\n, seven hundred ninety-three\n, seven hundred ninety-four\n, seven hundred ninety-five\n, seven hundred ninety-six\n, seven hundred ninety-seven\n, seven hundred ninety-eight\n, seven hundred ninety-nine\n, eight hundred\n, eight hundred one\n, eight hundred two\n, eight hundred three\n, eight hundred four\n, eight hundred five\n, eight hundred six\n, eight hundred seven\n, eight hundred eight\n, eight hundred nine\n, eight hundred ten\n, eight hundred eleven\n, eight hundred twelve\n, eight hundred thirteen\n, eight hundred fourteen\n, eight hundred fifteen\n, eight hundred sixteen\n, eight hundred seventeen\n, eight hundred eighteen\n, eight hundred nineteen\n, eight hundred twenty\n, eight hundred twenty-one\n, eight hundred twenty-two\n, eight hundred twenty-three\n, eight hundred twenty-four\n, eight hundred twenty-five\n, eight hundred twenty-six\n, eight hundred twenty-seven\n, eight hundred twenty-eight\n, eight hundred twenty-nine\n, eight hundred thirty\n, eight hundred thirty-one\n, eight hundred thirty-two\n, eight hundred thirty-three\n, eight hundred thirty-four\n, eight hundred thirty-five\n, eight hundred thirty-six\n, eight hundred thirty-seven\n, eight hundred thirty-eight\n, eight hundred thirty-nine\n, eight hundred forty\n, eight hundred forty-one\n, eight hundred forty-two\n, eight hundred forty-three\n, eight hundred forty-four\n, eight hundred forty-five\n, eight hundred forty-six\n, eight hundred forty-seven\n, eight hundred forty-eight\n, eight hundred forty-nine\n, eight hundred fifty\n, eight hundred fifty-one\n, eight hundred fifty-two\n, eight hundred fifty-three\n, eight hundred fifty-four\n, eight hundred fifty-five\n, eight hundred fifty-six\n, eight hundred fifty-seven\n, eight hundred fifty-eight\n, eight hundred fifty-nine\n, eight hundred sixty\n, eight hundred sixty-one\n, eight hundred sixty-two\n, eight hundred sixty-three\n, eight hundred sixty-four\n, eight hundred sixty-five\n, eight hundred sixty-six\n, eight hundred sixty-seven\n, eight hundred sixty-eight\n, eight hundred sixty-nine\n, eight hundred seventy\n, eight hundred seventy-one\n, eight hundred seventy-two\n, eight hundred seventy-three\n, eight hundred seventy-four\n, eight hundred seventy-five\n, eight hundred seventy-six\n, eight hundred seventy-seven\n, eight hundred seventy-eight\n, eight hundred seventy-nine\n, eight hundred eighty\n, eight hundred eighty-one\n, eight hundred eighty-two\n, eight hundred eighty-three\n, eight hundred eighty-four\n, eight hundred eighty-five\n, eight hundred eighty-six\n, eight hundred eighty-seven\n, eight hundred eighty-eight\n, eight hundred eighty-nine\n, eight hundred ninety\n, eight hundred ninety-one\n, eight hundred ninety-two\n, eight hundred ninety-three\n, eight hundred ninety-four\n, eight hundred ninety-five\n, eight hundred ninety-six\n, eight hundred ninety-seven\n, eight hundred ninety-eight\n, eight hundred ninety-nine\n, nine hundred\n, nine hundred one\n, nine hundred two\n, nine hundred three\n, nine hundred four\n, nine hundred five\n, nine hundred six\n, nine hundred seven\n, nine hundred eight\n, nine hundred nine\n, nine hundred ten\n, nine hundred eleven\n, nine hundred twelve\n, nine hundred thirteen\n, nine hundred fourteen\n, nine hundred fifteen\n, nine hundred sixteen\n, nine hundred seventeen\n, nine hundred eighteen\n, nine hundred nineteen\n, nine hundred twenty\n, nine hundred twenty-one\n, nine hundred twenty-two\n, nine hundred twenty-three\n, nine hundred twenty-four\n, nine hundred twenty-five\n, nine hundred twenty-six\n, nine hundred twenty-seven\n, nine hundred twenty-eight\n, nine hundred twenty-nine\n, nine hundred thirty\n, nine hundred thirty-one\n, nine hundred thirty-two\n, nine hundred thirty-three\n, nine hundred thirty-four\n, nine hundred thirty-five\n, nine hundred thirty-six\n, nine hundred thirty-seven\n, nine hundred thirty-eight\n, nine hundred thirty-nine\n, nine hundred forty\n, nine hundred forty-one\n, nine hundred forty-two\n, nine hundred forty-three\n, nine hundred forty-four\n, nine hundred forty-five\n, nine hundred forty-six\n, nine hundred forty-seven\n, nine hundred forty-eight\n, nine hundred forty-nine\n, nine hundred fifty\n, nine hundred fifty-one\n, nine hundred fifty-two\n, nine hundred fifty-three\n, nine hundred fifty-four\n, nine hundred fifty-five\n, nine hundred fifty-six\n, nine hundred fifty-seven\n, nine hundred fifty-eight\n, nine hundred fifty-nine\n, nine hundred sixty\n, nine hundred sixty-one\n, nine hundred sixty-two\n, nine hundred sixty-three\n, nine hundred sixty-four\n, nine hundred sixty-five\n, nine hundred sixty-six\n, nine hundred sixty-seven\n, nine hundred sixty-eight\n, nine hundred sixty-nine\n, nine hundred seventy\n, nine hundred seventy-one\n, nine hundred seventy-two\n, nine hundred seventy-three\n, nine hundred seventy-four\n, nine hundred seventy-five\n, nine hundred seventy-six\n, nine hundred seventy-seven\n, nine hundred seventy-eight\n, nine hundred seventy-nine\n, nine hundred eighty\n, nine hundred eighty-one\n, nine hundred eighty-two\n, nine hundred eighty-three\n, nine hundred eighty-four\n, nine hundred eighty-five\n, nine hundred eighty-six\n, nine hundred eighty-seven\n, nine hundred eighty-eight\n, nine hundred eighty-nine\n, nine hundred ninety\n, nine hundred ninety-one\n, nine hundred ninety-two\n, nine hundred ninety-three\n, nine hundred ninety-four\n, nine hundred ninety-five\n, nine hundred ninety-six\n, nine hundred ninety-seven\n, nine hundred ninety-eight\n, nine hundred ninety-nine')
+
+_tail_5 = ('\none\ntwo\nthree\nfour\nfive\nsix\nseven\neight\nnine\nten\neleven\ntwelve\nthirteen\nfourteen\nfifteen\nsixteen\nseventeen\neighteen\nnineteen\ntwenty\ntwenty-one\ntwenty-two\ntwenty-three\ntwenty-four\ntwenty-five\ntwenty-six\ntwenty-seven\ntwenty-eight\ntwenty-nine\nthirty\nthirty-one\nthirty-two\nthirty-three\nthirty-four\nthirty-five\nthirty-six\nthirty-seven\nthirty-eight\nthirty-nine\nforty\nforty-one\nforty-two\nforty-three\nforty-four\nforty-five\nforty-six\nforty-seven\nforty-eight\nforty-nine\nfifty\nfifty-one\nfifty-two\nfifty-three\nfifty-four\nfifty-five\nfifty-six\nfifty-seven\nfifty-eight\nfifty-nine\nsixty\nsixty-one\nsixty-two\nsixty-three\nsixty-four\nsixty-five\nsixty-six\nsixty-seven\nsixty-eight\nsixty-nine\nseventy\nseventy-one\nseventy-two\nseventy-three\nseventy-four\nseventy-five\nseventy-six\nseventy-seven\nseventy-eight\nseventy-nine\neighty\neighty-one\neighty-two\neighty-three\neighty-four\neighty-five\neighty-six\neighty-seven\neighty-eight\neighty-nine\nninety\nninety-one\nninety-two\nninety-three\nninety-four\nninety-five\nninety-six\nninety-seven\nninety-eight\nninety-nine\none hundred\none hundred one\none hundred two\none hundred three\none hundred four\none hundred five\none hundred six\none hundred seven\none hundred eight\none hundred nine\none hundred ten\none hundred eleven\none hundred twelve\none hundred thirteen\none hundred fourteen\none hundred fifteen\none hundred sixteen\none hundred seventeen\none hundred eighteen\none hundred nineteen\none hundred twenty\none hundred twenty-one\none hundred twenty-two\none hundred twenty-three\none hundred twenty-four\none hundred twenty-five\none hundred twenty-six\none hundred twenty-seven\none hundred twenty-eight\none hundred twenty-nine\none hundred thirty\none hundred thirty-one\none hundred thirty-two\none hundred thirty-three\none hundred thirty-four\none hundred thirty-five\none hundred thirty-six\none hundred thirty-seven\none hundred thirty-eight\none hundred thirty-nine\none hundred forty\none hundred forty-one\none hundred forty-two\none hundred forty-three\none hundred forty-four\none hundred forty-five\none hundred forty-six\none hundred forty-seven\none hundred forty-eight\none hundred forty-nine\none hundred fifty\none hundred fifty-one\none hundred fifty-two\none hundred fifty-three\none hundred fifty-four\none hundred fifty-five\none hundred fifty-six\none hundred fifty-seven\none hundred fifty-eight\none hundred fifty-nine\none hundred sixty\none hundred sixty-one\none hundred sixty-two\none hundred sixty-three\none hundred sixty-four\none hundred sixty-five\none hundred sixty-six\none hundred sixty-seven\none hundred sixty-eight\none hundred sixty-nine\none hundred seventy\none hundred seventy-one\none hundred seventy-two\none hundred seventy-three\none hundred seventy-four\none hundred seventy-five\none hundred seventy-six\none hundred seventy-seven\none hundred seventy-eight\none hundred seventy-nine\none hundred eighty\none hundred eighty-one\none hundred eighty-two\none hundred eighty-three\none hundred eighty-four\none hundred eighty-five\none hundred eighty-six\none hundred eighty-seven\none hundred eighty-eight\none hundred eighty-nine\none hundred ninety\none hundred ninety-one\none hundred ninety-two\none hundred ninety-three\none hundred ninety-four\none hundred ninety-five\none hundred ninety-six\none hundred ninety-seven\none hundred ninety-eight\none hundred ninety-nine\ntwo hundred\ntwo hundred one\ntwo hundred two\ntwo hundred three\ntwo hundred four\ntwo hundred five\ntwo hundred six\ntwo hundred seven\ntwo hundred eight\ntwo hundred nine\ntwo hundred ten\ntwo hundred eleven\ntwo hundred twelve\ntwo hundred thirteen\ntwo hundred fourteen\ntwo hundred fifteen\ntwo hundred sixteen\ntwo hundred seventeen\ntwo hundred eighteen\ntwo hundred nineteen\ntwo hundred twenty\ntwo hundred twenty-one\ntwo hundred twenty-two\ntwo hundred twenty-three\ntwo hundred twenty-four\ntwo hundred twenty-five\ntwo hundred twenty-six\ntwo hundred twenty-seven\ntwo hundred twenty-eight\ntwo hundred twenty-nine\ntwo hundred thirty\ntwo hundred thirty-one\ntwo hundred thirty-two\ntwo hundred thirty-three\ntwo hundred thirty-four\ntwo hundred thirty-five\ntwo hundred thirty-six\ntwo hundred thirty-seven\ntwo hundred thirty-eight\ntwo hundred thirty-nine\ntwo hundred forty\ntwo hundred forty-one\ntwo hundred forty-two\ntwo hundred forty-three\ntwo hundred forty-four\ntwo hundred forty-five\ntwo hundred forty-six\ntwo hundred forty-seven\ntwo hundred forty-eight\ntwo hundred forty-nine\ntwo hundred fifty\ntwo hundred fifty-one\ntwo hundred fifty-two\ntwo hundred fifty-three\ntwo hundred fifty-four\ntwo hundred fifty-five\ntwo hundred fifty-six\ntwo hundred fifty-seven\ntwo hundred fifty-eight\ntwo hundred fifty-nine\ntwo hundred sixty\ntwo hundred sixty-one\ntwo hundred sixty-two\ntwo hundred sixty-three\ntwo hundred sixty-four\ntwo hundred sixty-five\ntwo hundred sixty-six\ntwo hundred sixty-seven\ntwo hundred sixty-eight\ntwo hundred sixty-nine\ntwo hundred seventy\ntwo hundred seventy-one\ntwo hundred seventy-two\ntwo hundred seventy-three\ntwo hundred seventy-four\ntwo hundred seventy-five\ntwo hundred seventy-six\ntwo hundred seventy-seven\ntwo hundred seventy-eight\ntwo hundred seventy-nine\ntwo hundred eighty\ntwo hundred eighty-one\ntwo hundred eighty-two\ntwo hundred eighty-three\ntwo hundred eighty-four\ntwo hundred eighty-five\ntwo hundred eighty-six\ntwo hundred eighty-seven\ntwo hundred eighty-eight\ntwo hundred eighty-nine\ntwo hundred ninety\ntwo hundred ninety-one\ntwo hundred ninety-two\ntwo hundred ninety-three\ntwo hundred ninety-four\ntwo hundred ninety-five\ntwo hundred ninety-six\ntwo hundred ninety-seven\ntwo hundred ninety-eight\ntwo hundred ninety-nine\nthree hundred\nthree hundred one\nthree hundred two\nthree hundred three\nthree hundred four\nthree hundred five\nthree hundred six\nthree hundred seven\nthree hundred eight\nthree hundred nine\nthree hundred ten\nthree hundred eleven\nthree hundred twelve\nthree hundred thirteen\nthree hundred fourteen\nthree hundred fifteen\nthree hundred sixteen\nthree hundred seventeen\nthree hundred eighteen\nthree hundred nineteen\nthree hundred twenty\nthree hundred twenty-one\nthree hundred twenty-two\nthree hundred twenty-three\nthree hundred twenty-four\nthree hundred twenty-five\nthree hundred twenty-six\nthree hundred twenty-seven\nthree hundred twenty-eight\nthree hundred twenty-nine\nthree hundred thirty\nthree hundred thirty-one\nthree hundred thirty-two\nthree hundred thirty-three\nthree hundred thirty-four\nthree hundred thirty-five\nthree hundred thirty-six\nthree hundred thirty-seven\nthree hundred thirty-eight\nthree hundred thirty-nine\nthree hundred forty\nthree hundred forty-one\nthree hundred forty-two\nthree hundred forty-three\nthree hundred forty-four\nthree hundred forty-five\nthree hundred forty-six\nthree hundred forty-seven\nthree hundred forty-eight\nthree hundred forty-nine\nthree hundred fifty\nthree hundred fifty-one\nthree hundred fifty-two\nthree hundred fifty-three\nthree hundred fifty-four\nthree hundred fifty-five\nthree hundred fifty-six\nthree hundred fifty-seven\nthree hundred fifty-eight\nthree hundred fifty-nine\nthree hundred sixty\nthree hundred sixty-one\nthree hundred sixty-two\nthree hundred sixty-three\nthree hundred sixty-four\nthree hundred sixty-five\nthree hundred sixty-six\nthree hundred sixty-seven\nthree hundred sixty-eight\nthree hundred sixty-nine\nthree hundred seventy\nthree hundred seventy-one\nthree hundred seventy-two\nthree hundred seventy-three\nthree hundred seventy-four\nthree hundred seventy-five\nthree hundred seventy-six\nthree hundred seventy-seven\nthree hundred seventy-eight\nthree hundred seventy-nine\nthree hundred eighty\nthree hundred eighty-one\nthree hundred eighty-two\nthree hundred eighty-three\nthree hundred eighty-four\nthree hundred eighty-five\nthree hundred eighty-six\nthree hundred eighty-seven\nthree hundred eighty-eight\nthree hundred eighty-nine\nthree hundred ninety\nthree hundred ninety-one\nthree hundred ninety-two\nthree hundred ninety-three\nthree hundred ninety-four\nthree hundred ninety-five\nthree hundred ninety-six\nthree hundred ninety-seven\nthree hundred ninety-eight\nthree hundred ninety-nine\nfour hundred\nfour hundred one\nfour hundred two\nfour hundred three\nfour hundred four\nfour hundred five\nfour hundred six\nfour hundred seven\nfour hundred eight\nfour hundred nine\nfour hundred ten\nfour hundred eleven\nfour hundred twelve\nfour hundred thirteen\nfour hundred fourteen\nfour hundred fifteen\nfour hundred sixteen\nfour hundred seventeen\nfour hundred eighteen\nfour hundred nineteen\nfour hundred twenty\nfour hundred twenty-one\nfour hundred twenty-two\nfour hundred twenty-three\nfour hundred twenty-four\nfour hundred twenty-five\nfour hundred twenty-six\nfour hundred twenty-seven\nfour hundred twenty-eight\nfour hundred twenty-nine\nfour hundred thirty\nfour hundred thirty-one\nfour hundred thirty-two\nfour hundred thirty-three\nfour hundred thirty-four\nfour hundred thirty-five\nfour hundred thirty-six\nfour hundred thirty-seven\nfour hundred thirty-eight\nfour hundred thirty-nine\nfour hundred forty\nfour hundred forty-one\nfour hundred forty-two\nfour hundred forty-three\nfour hundred forty-four\nfour hundred forty-five\nfour hundred forty-six\nfour hundred forty-seven\nfour hundred forty-eight\nfour hundred forty-nine\nfour hundred fifty\nfour hundred fifty-one\nfour hundred fifty-two\nfour hundred fifty-three\nfour hundred fifty-four\nfour hundred fifty-five\nfour hundred fifty-six\nfour hundred fifty-seven\nfour hundred fifty-eight\nfour hundred fifty-nine\nfour hundred sixty\nfour hundred sixty-one\nfour hundred sixty-two\nfour hundred sixty-three\nfour hundred sixty-four\nfour hundred sixty-five\nfour hundred sixty-six\nfour hundred sixty-seven\nfour hundred sixty-eight\nfour hundred sixty-nine\nfour hundred seventy\nfour hundred seventy-one\nfour hundred seventy-two\nfour hundred seventy-three\nfour hundred seventy-four\nfour hundred seventy-five\nfour hundred seventy-six\nfour hundred seventy-seven\nfour hundred seventy-eight\nfour hundred seventy-nine\nfour hundred eighty\nfour hundred eighty-one\nfour hundred eighty-two\nfour hundred eighty-three\nfour hundred eighty-four\nfour hundred eighty-five\nfour hundred eighty-six\nfour hundred eighty-seven\nfour hundred eighty-eight\nfour hundred eighty-nine\nfour hundred ninety\nfour hundred ninety-one\nfour hundred ninety-two\nfour hundred ninety-three\nfour hundred ninety-four\nfour hundred ninety-five\nfour hundred ninety-six\nfour hundred ninety-seven\nfour hundred ninety-eight\nfour hundred ninety-nine\nfive hundred\nfive hundred one\nfive hundred two\nfive hundred three\nfive hundred four\nfive hundred five\nfive hundred six\nfive hundred seven\nfive hundred eight\nfive hundred nine\nfive hundred ten\nfive hundred eleven\nfive hundred twelve\nfive hundred thirteen\nfive hundred fourteen\nfive hundred fifteen\nfive hundred sixteen\nfive hundred seventeen\nfive hundred eighteen\nfive hundred nineteen\nfive hundred twenty\nfive hundred twenty-one\nfive hundred twenty-two\nfive hundred twenty-three\nfive hundred twenty-four\nfive hundred twenty-five\nfive hundred twenty-six\nfive hundred twenty-seven\nfive hundred twenty-eight\nfive hundred twenty-nine\nfive hundred thirty\nfive hundred thirty-one\nfive hundred thirty-two\nfive hundred thirty-three\nfive hundred thirty-four\nfive hundred thirty-five\nfive hundred thirty-six\nfive hundred thirty-seven\nfive hundred thirty-eight\nfive hundred thirty-nine\nfive hundred forty\nfive hundred forty-one\nfive hundred forty-two\nfive hundred forty-three\nfive hundred forty-four\nfive hundred forty-five\nfive hundred forty-six\nfive hundred forty-seven\nfive hundred forty-eight\nfive hundred forty-nine\nfive hundred fifty\nfive hundred fifty-one\nfive hundred fifty-two\nfive hundred fifty-three\nfive hundred fifty-four\nfive hundred fifty-five\nfive hundred fifty-six\nfive hundred fifty-seven\nfive hundred fifty-eight\nfive hundred fifty-nine\nfive hundred sixty\nfive hundred sixty-one\nfive hundred sixty-two\nfive hundred sixty-three\nfive hundred sixty-four\nfive hundred sixty-five\nfive hundred sixty-six\nfive hundred sixty-seven\nfive hundred sixty-eight\nfive hundred sixty-nine\nfive hundred seventy\nfive hundred seventy-one\nfive hundred seventy-two\nfive hundred seventy-three\nfive hundred seventy-four\nfive hundred seventy-five\nfive hundred seventy-six\nfive hundred seventy-seven\nfive hundred seventy-eight\nfive hundred seventy-nine\nfive hundred eighty\nfive hundred eighty-one\nfive hundred eighty-two\nfive hundred eighty-three\nfive hundred eighty-four\nfive hundred eighty-five\nfive hundred eighty-six\nfive hundred eighty-seven\nfive hundred eighty-eight\nfive hundred eighty-nine\nfive hundred ninety\nfive hundred ninety-one\nfive hundred ninety-two\nfive hundred ninety-three\nfive hundred ninety-four\nfive hundred ninety-five\nfive hundred ninety-six\nfive hundred ninety-seven\nfive hundred ninety-eight\nfive hundred ninety-nine\nsix hundred\nsix hundred one\nsix hundred two\nsix hundred three\nsix hundred four\nsix hundred five\nsix hundred six\nsix hundred seven\nsix hundred eight\nsix hundred nine\nsix hundred ten\nsix hundred eleven\nsix hundred twelve\nsix hundred thirteen\nsix hundred fourteen\nsix hundred fifteen\nsix hundred sixteen\nsix hundred seventeen\nsix hundred eighteen\nsix hundred nineteen\nsix hundred twenty\nsix hundred twenty-one\nsix hundred twenty-two\nsix hundred twenty-three\nsix hundred twenty-four\nsix hundred twenty-five\nsix hundred twenty-six\nsix hundred twenty-seven\nsix hundred twenty-eight\nsix hundred twenty-nine\nsix hundred thirty\nsix hundred thirty-one\nsix hundred thirty-two\nsix hundred thirty-three\nsix hundred thirty-four\nsix hundred thirty-five\nsix hundred thirty-six\nsix hundred thirty-seven\nsix hundred thirty-eight\nsix hundred thirty-nine\nsix hundred forty\nsix hundred forty-one\nsix hundred forty-two\nsix hundred forty-three\nsix hundred forty-four\nsix hundred forty-five\nsix hundred forty-six\nsix hundred forty-seven\nsix hundred forty-eight\nsix hundred forty-nine\nsix hundred fifty\nsix hundred fifty-one\nsix hundred fifty-two\nsix hundred fifty-three\nsix hundred fifty-four\nsix hundred fifty-five\nsix hundred fifty-six\nsix hundred fifty-seven\nsix hundred fifty-eight\nsix hundred fifty-nine\nsix hundred sixty\nsix hundred sixty-one\nsix hundred sixty-two\nsix hundred sixty-three\nsix hundred sixty-four\nsix hundred sixty-five\nsix hundred sixty-six\nsix hundred sixty-seven\nsix hundred sixty-eight\nsix hundred sixty-nine\nsix hundred seventy\nsix hundred seventy-one\nsix hundred seventy-two\nsix hundred seventy-three\nsix hundred seventy-four\nsix hundred seventy-five\nsix hundred seventy-six\nsix hundred seventy-seven\nsix hundred seventy-eight\nsix hundred seventy-nine\nsix hundred eighty\nsix hundred eighty-one\nsix hundred eighty-two\nsix hundred eighty-three\nsix hundred eighty-four\nsix hundred eighty-five\nsix hundred eighty-six\nsix hundred eighty-seven\nsix hundred eighty-eight\nsix hundred eighty-nine\nsix hundred ninety\nsix hundred ninety-one\nsix hundred ninety-two\nsix hundred ninety-three\nsix hundred ninety-four\nsix hundred ninety-five\nsix hundred ninety-six\nsix hundred ninety-seven\nsix hundred ninety-eight\nsix hundred ninety-nine\nseven hundred\nseven hundred one\nseven hundred two\nseven hundred three\nseven hundred four\nseven hundred five\nseven hundred six\nseven hundred seven\nseven hundred eight\nseven hundred nine\nseven hundred ten\nseven hundred eleven\nseven hundred twelve\nseven hundred thirteen\nseven hundred fourteen\nseven hundred fifteen\nseven hundred sixteen\nseven hundred seventeen\nseven hundred eighteen\nseven hundred nineteen\nseven hundred twenty\nseven hundred twenty-one\nseven hundred twenty-two\nseven hundred twenty-three\nseven hundred twenty-four\nseven hundred twenty-five\nseven hundred twenty-six\nseven hundred twenty-seven\nseven hundred twenty-eight\nseven hundred twenty-nine\nseven hundred thirty\nseven hundred thirty-one\nseven hundred thirty-two\nseven hundred thirty-three\nseven hundred thirty-four\nseven hundred thirty-five\nseven hundred thirty-six\nseven hundred thirty-seven\nseven hundred thirty-eight\nseven hundred thirty-nine\nseven hundred forty\nseven hundred forty-one\nseven hundred forty-two\nseven hundred forty-three\nseven hundred forty-four\nseven hundred forty-five\nseven hundred forty-six\nseven hundred forty-seven\nseven hundred forty-eight\nseven hundred forty-nine\nseven hundred fifty\nseven hundred fifty-one\nseven hundred fifty-two\nseven hundred fifty-three\nseven hundred fifty-four\nseven hundred fifty-five\nseven hundred fifty-six\nseven hundred fifty-seven\nseven hundred fifty-eight\nseven hundred fifty-nine\nseven hundred sixty\nseven hundred sixty-one\nseven hundred sixty-two\nseven hundred sixty-three\nseven hundred sixty-four\nseven hundred sixty-five\nseven hundred sixty-six\nseven hundred sixty-seven\nseven hundred sixty-eight\nseven hundred sixty-nine\nseven hundred seventy\nseven hundred seventy-one\nseven hundred seventy-two\nseven hundred seventy-three\nseven hundred seventy-four\nseven hundred seventy-five\nseven hundred seventy-six\nseven hundred seventy-seven\nseven hundred seventy-eight\nseven hundred seventy-nine\nseven hundred eighty\nseven hundred eighty-one\nseven hundred eighty-two\nseven hundred eighty-three\nseven hundred eighty-four\nseven hundred eighty-five\nseven hundred eighty-six\nseven hundred eighty-seven\nseven hundred eighty-eight\nseven hundred eighty-nine\nseven hundred ninety\nseven hundred ninety-one\nseven hundred ninety-two\nseven hundred ninety-three\nseven hundred ninety-four\nseven hundred ninety-five\nseven hundred ninety-six\nseven hundred ninety-seven\nseven hundred ninety-eight\nseven hundred ninety-nine\neight hundred\neight hundred one\neight hundred two\neight hundred three\neight hundred four\neight hundred five\neight hundred six\neight hundred seven\neight hundred eight\neight hundred nine\neight hundred ten\neight hundred eleven\neight hundred twelve\neight hundred thirteen\neight hundred fourteen\neight hundred fifteen\neight hundred sixteen\neight hundred seventeen\neight hundred eighteen\neight hundred nineteen\neight hundred twenty\neight hundred twenty-one\neight hundred twenty-two\neight hundred twenty-three\neight hundred twenty-four\neight hundred twenty-five\neight hundred twenty-six\neight hundred twenty-seven\neight hundred twenty-eight\neight hundred twenty-nine\neight hundred thirty\neight hundred thirty-one\neight hundred thirty-two\neight hundred thirty-three\neight hundred thirty-four\neight hundred thirty-five\neight hundred thirty-six\neight hundred thirty-seven\neight hundred thirty-eight\neight hundred thirty-nine\neight hundred forty\neight hundred forty-one\neight hundred forty-two\neight hundred forty-three\neight hundred forty-four\neight hundred forty-five\neight hundred forty-six\neight hundred forty-seven\neight hundred forty-eight\neight hundred forty-nine\neight hundred fifty\neight hundred fifty-one\neight hundred fifty-two\neight hundred fifty-three\neight hundred fifty-four\neight hundred fifty-five\neight hundred fifty-six\neight hundred fifty-seven\neight hundred fifty-eight\neight hundred fifty-nine\neight hundred sixty\neight hundred sixty-one\neight hundred sixty-two\neight hundred sixty-three\neight hundred sixty-four\neight hundred sixty-five\neight hundred sixty-six\neight hundred sixty-seven\neight hundred sixty-eight\neight hundred sixty-nine\neight hundred seventy\neight hundred seventy-one\neight hundred seventy-two\neight hundred seventy-three\neight hundred seventy-four\neight hundred seventy-five\neight hundred seventy-six\neight hundred seventy-seven\neight hundred seventy-eight\neight hundred seventy-nine\neight hundred eighty\neight hundred eighty-one\neight hundred eighty-two\neight hundred eighty-three\neight hundred eighty-four\neight hundred eighty-five\neight hundred eighty-six\neight hundred eighty-seven\neight hundred eighty-eight\neight hundred eighty-nine\neight hundred ninety\neight hundred ninety-one\neight hundred ninety-two\neight hundred ninety-three\neight hundred ninety-four\neight hundred ninety-five\neight hundred ninety-six\neight hundred ninety-seven\neight hundred ninety-eight\neight hundred ninety-nine\nnine hundred\nnine hundred one\nnine hundred two\nnine hundred three\nnine hundred four\nnine hundred five\nnine hundred six\nnine hundred seven\nnine hundred eight\nnine hundred nine\nnine hundred ten\nnine hundred eleven\nnine hundred twelve\nnine hundred thirteen\nnine hundred fourteen\nnine hundred fifteen\nnine hundred sixteen\nnine hundred seventeen\nnine hundred eighteen\nnine hundred nineteen\nnine hundred twenty\nnine hundred twenty-one\nnine hundred twenty-two\nnine hundred twenty-three\nnine hundred twenty-four\nnine hundred twenty-five\nnine hundred twenty-six\nnine hundred twenty-seven\nnine hundred twenty-eight\nnine hundred twenty-nine\nnine hundred thirty\nnine hundred thirty-one\nnine hundred thirty-two\nnine hundred thirty-three\nnine hundred thirty-four\nnine hundred thirty-five\nnine hundred thirty-six\nnine hundred thirty-seven\nnine hundred thirty-eight\nnine hundred thirty-nine\nnine hundred forty\nnine hundred forty-one\nnine hundred forty-two\nnine hundred forty-three\nnine hundred forty-four\nnine hundred forty-five\nnine hundred forty-six\nnine hundred forty-seven\nnine hundred forty-eight\nnine hundred forty-nine\nnine hundred fifty\nnine hundred fifty-one\nnine hundred fifty-two\nnine hundred fifty-three\nnine hundred fifty-four\nnine hundred fifty-five\nnine hundred fifty-six\nnine hundred fifty-seven\nnine hundred fifty-eight\nnine hundred fifty-nine\nnine hundred sixty\nnine hundred sixty-one\nnine hundred sixty-two\nnine hundred sixty-three\nnine hundred sixty-four\nnine hundred sixty-five\nnine hundred sixty-six\nnine hundred sixty-seven\nnine hundred sixty-eight\nnine hundred sixty-nine\nnine hundred seventy\nnine hundred seventy-one\nnine hundred seventy-two\nnine hundred seventy-three\nnine hundred seventy-four\nnine hundred seventy-five\nnine hundred seventy-six\nnine hundred seventy-seven\nnine hundred seventy-eight\nnine hundred seventy-nine\nnine hundred eighty\nnine hundred eighty-one\nnine hundred eighty-two\nnine hundred eighty-three\nnine hundred eighty-four\nnine hundred eighty-five\nnine hundred eighty-six\nnine hundred eighty-seven\nnine hundred eighty-eight\nnine hundred eighty-nine\nnine hundred ninety\nnine hundred ninety-one\nnine hundred ninety-two\nnine hundred ninety-three\nnine hundred ninety-four\nnine hundred ninety-five\nnine hundred ninety-six\nnine hundred ninety-seven\nnine hundred ninety-eight\nnine hundred ninety-nine', '\n one\n two\n three\n four\n five\n six\n seven\n eight\n nine\n ten\n eleven\n twelve\n thirteen\n fourteen\n fifteen\n sixteen\n seventeen\n eighteen\n nineteen\n twenty\n twenty-one\n twenty-two\n twenty-three\n twenty-four\n twenty-five\n twenty-six\n twenty-seven\n twenty-eight\n twenty-nine\n thirty\n thirty-one\n thirty-two\n thirty-three\n thirty-four\n thirty-five\n thirty-six\n thirty-seven\n thirty-eight\n thirty-nine\n forty\n forty-one\n forty-two\n forty-three\n forty-four\n forty-five\n forty-six\n forty-seven\n forty-eight\n forty-nine\n fifty\n fifty-one\n fifty-two\n fifty-three\n fifty-four\n fifty-five\n fifty-six\n fifty-seven\n fifty-eight\n fifty-nine\n sixty\n sixty-one\n sixty-two\n sixty-three\n sixty-four\n sixty-five\n sixty-six\n sixty-seven\n sixty-eight\n sixty-nine\n seventy\n seventy-one\n seventy-two\n seventy-three\n seventy-four\n seventy-five\n seventy-six\n seventy-seven\n seventy-eight\n seventy-nine\n eighty\n eighty-one\n eighty-two\n eighty-three\n eighty-four\n eighty-five\n eighty-six\n eighty-seven\n eighty-eight\n eighty-nine\n ninety\n ninety-one\n ninety-two\n ninety-three\n ninety-four\n ninety-five\n ninety-six\n ninety-seven\n ninety-eight\n ninety-nine\n one hundred\n one hundred one\n one hundred two\n one hundred three\n one hundred four\n one hundred five\n one hundred six\n one hundred seven\n one hundred eight\n one hundred nine\n one hundred ten\n one hundred eleven\n one hundred twelve\n one hundred thirteen\n one hundred fourteen\n one hundred fifteen\n one hundred sixteen\n one hundred seventeen\n one hundred eighteen\n one hundred nineteen\n one hundred twenty\n one hundred twenty-one\n one hundred twenty-two\n one hundred twenty-three\n one hundred twenty-four\n one hundred twenty-five\n one hundred twenty-six\n one hundred twenty-seven\n one hundred twenty-eight\n one hundred twenty-nine\n one hundred thirty\n one hundred thirty-one\n one hundred thirty-two\n one hundred thirty-three\n one hundred thirty-four\n one hundred thirty-five\n one hundred thirty-six\n one hundred thirty-seven\n one hundred thirty-eight\n one hundred thirty-nine\n one hundred forty\n one hundred forty-one\n one hundred forty-two\n one hundred forty-three\n one hundred forty-four\n one hundred forty-five\n one hundred forty-six\n one hundred forty-seven\n one hundred forty-eight\n one hundred forty-nine\n one hundred fifty\n one hundred fifty-one\n one hundred fifty-two\n one hundred fifty-three\n one hundred fifty-four\n one hundred fifty-five\n one hundred fifty-six\n one hundred fifty-seven\n one hundred fifty-eight\n one hundred fifty-nine\n one hundred sixty\n one hundred sixty-one\n one hundred sixty-two\n one hundred sixty-three\n one hundred sixty-four\n one hundred sixty-five\n one hundred sixty-six\n one hundred sixty-seven\n one hundred sixty-eight\n one hundred sixty-nine\n one hundred seventy\n one hundred seventy-one\n one hundred seventy-two\n one hundred seventy-three\n one hundred seventy-four\n one hundred seventy-five\n one hundred seventy-six\n one hundred seventy-seven\n one hundred seventy-eight\n one hundred seventy-nine\n one hundred eighty\n one hundred eighty-one\n one hundred eighty-two\n one hundred eighty-three\n one hundred eighty-four\n one hundred eighty-five\n one hundred eighty-six\n one hundred eighty-seven\n one hundred eighty-eight\n one hundred eighty-nine\n one hundred ninety\n one hundred ninety-one\n one hundred ninety-two\n one hundred ninety-three\n one hundred ninety-four\n one hundred ninety-five\n one hundred ninety-six\n one hundred ninety-seven\n one hundred ninety-eight\n one hundred ninety-nine\n two hundred\n two hundred one\n two hundred two\n two hundred three\n two hundred four\n two hundred five\n two hundred six\n two hundred seven\n two hundred eight\n two hundred nine\n two hundred ten\n two hundred eleven\n two hundred twelve\n two hundred thirteen\n two hundred fourteen\n two hundred fifteen\n two hundred sixteen\n two hundred seventeen\n two hundred eighteen\n two hundred nineteen\n two hundred twenty\n two hundred twenty-one\n two hundred twenty-two\n two hundred twenty-three\n two hundred twenty-four\n two hundred twenty-five\n two hundred twenty-six\n two hundred twenty-seven\n two hundred twenty-eight\n two hundred twenty-nine\n two hundred thirty\n two hundred thirty-one\n two hundred thirty-two\n two hundred thirty-three\n two hundred thirty-four\n two hundred thirty-five\n two hundred thirty-six\n two hundred thirty-seven\n two hundred thirty-eight\n two hundred thirty-nine\n two hundred forty\n two hundred forty-one\n two hundred forty-two\n two hundred forty-three\n two hundred forty-four\n two hundred forty-five\n two hundred forty-six\n two hundred forty-seven\n two hundred forty-eight\n two hundred forty-nine\n two hundred fifty\n two hundred fifty-one\n two hundred fifty-two\n two hundred fifty-three\n two hundred fifty-four\n two hundred fifty-five\n two hundred fifty-six\n two hundred fifty-seven\n two hundred fifty-eight\n two hundred fifty-nine\n two hundred sixty\n two hundred sixty-one\n two hundred sixty-two\n two hundred sixty-three\n two hundred sixty-four\n two hundred sixty-five\n two hundred sixty-six\n two hundred sixty-seven\n two hundred sixty-eight\n two hundred sixty-nine\n two hundred seventy\n two hundred seventy-one\n two hundred seventy-two\n two hundred seventy-three\n two hundred seventy-four\n two hundred seventy-five\n two hundred seventy-six\n two hundred seventy-seven\n two hundred seventy-eight\n two hundred seventy-nine\n two hundred eighty\n two hundred eighty-one\n two hundred eighty-two\n two hundred eighty-three\n two hundred eighty-four\n two hundred eighty-five\n two hundred eighty-six\n two hundred eighty-seven\n two hundred eighty-eight\n two hundred eighty-nine\n two hundred ninety\n two hundred ninety-one\n two hundred ninety-two\n two hundred ninety-three\n two hundred ninety-four\n two hundred ninety-five\n two hundred ninety-six\n two hundred ninety-seven\n two hundred ninety-eight\n two hundred ninety-nine\n three hundred\n three hundred one\n three hundred two\n three hundred three\n three hundred four\n three hundred five\n three hundred six\n three hundred seven\n three hundred eight\n three hundred nine\n three hundred ten\n three hundred eleven\n three hundred twelve\n three hundred thirteen\n three hundred fourteen\n three hundred fifteen\n three hundred sixteen\n three hundred seventeen\n three hundred eighteen\n three hundred nineteen\n three hundred twenty\n three hundred twenty-one\n three hundred twenty-two\n three hundred twenty-three\n three hundred twenty-four\n three hundred twenty-five\n three hundred twenty-six\n three hundred twenty-seven\n three hundred twenty-eight\n three hundred twenty-nine\n three hundred thirty\n three hundred thirty-one\n three hundred thirty-two\n three hundred thirty-three\n three hundred thirty-four\n three hundred thirty-five\n three hundred thirty-six\n three hundred thirty-seven\n three hundred thirty-eight\n three hundred thirty-nine\n three hundred forty\n three hundred forty-one\n three hundred forty-two\n three hundred forty-three\n three hundred forty-four\n three hundred forty-five\n three hundred forty-six\n three hundred forty-seven\n three hundred forty-eight\n three hundred forty-nine\n three hundred fifty\n three hundred fifty-one\n three hundred fifty-two\n three hundred fifty-three\n three hundred fifty-four\n three hundred fifty-five\n three hundred fifty-six\n three hundred fifty-seven\n three hundred fifty-eight\n three hundred fifty-nine\n three hundred sixty\n three hundred sixty-one\n three hundred sixty-two\n three hundred sixty-three\n three hundred sixty-four\n three hundred sixty-five\n three hundred sixty-six\n three hundred sixty-seven\n three hundred sixty-eight\n three hundred sixty-nine\n three hundred seventy\n three hundred seventy-one\n three hundred seventy-two\n three hundred seventy-three\n three hundred seventy-four\n three hundred seventy-five\n three hundred seventy-six\n three hundred seventy-seven\n three hundred seventy-eight\n three hundred seventy-nine\n three hundred eighty\n three hundred eighty-one\n three hundred eighty-two\n three hundred eighty-three\n three hundred eighty-four\n three hundred eighty-five\n three hundred eighty-six\n three hundred eighty-seven\n three hundred eighty-eight\n three hundred eighty-nine\n three hundred ninety\n three hundred ninety-one\n three hundred ninety-two\n three hundred ninety-three\n three hundred ninety-four\n three hundred ninety-five\n three hundred ninety-six\n three hundred ninety-seven\n three hundred ninety-eight\n three hundred ninety-nine\n four hundred\n four hundred one\n four hundred two\n four hundred three\n four hundred four\n four hundred five\n four hundred six\n four hundred seven\n four hundred eight\n four hundred nine\n four hundred ten\n four hundred eleven\n four hundred twelve\n four hundred thirteen\n four hundred fourteen\n four hundred fifteen\n four hundred sixteen\n four hundred seventeen\n four hundred eighteen\n four hundred nineteen\n four hundred twenty\n four hundred twenty-one\n four hundred twenty-two\n four hundred twenty-three\n four hundred twenty-four\n four hundred twenty-five\n four hundred twenty-six\n four hundred twenty-seven\n four hundred twenty-eight\n four hundred twenty-nine\n four hundred thirty\n four hundred thirty-one\n four hundred thirty-two\n four hundred thirty-three\n four hundred thirty-four\n four hundred thirty-five\n four hundred thirty-six\n four hundred thirty-seven\n four hundred thirty-eight\n four hundred thirty-nine\n four hundred forty\n four hundred forty-one\n four hundred forty-two\n four hundred forty-three\n four hundred forty-four\n four hundred forty-five\n four hundred forty-six\n four hundred forty-seven\n four hundred forty-eight\n four hundred forty-nine\n four hundred fifty\n four hundred fifty-one\n four hundred fifty-two\n four hundred fifty-three\n four hundred fifty-four\n four hundred fifty-five\n four hundred fifty-six\n four hundred fifty-seven\n four hundred fifty-eight\n four hundred fifty-nine\n four hundred sixty\n four hundred sixty-one\n four hundred sixty-two\n four hundred sixty-three\n four hundred sixty-four\n four hundred sixty-five\n four hundred sixty-six\n four hundred sixty-seven\n four hundred sixty-eight\n four hundred sixty-nine\n four hundred seventy\n four hundred seventy-one\n four hundred seventy-two\n four hundred seventy-three\n four hundred seventy-four\n four hundred seventy-five\n four hundred seventy-six\n four hundred seventy-seven\n four hundred seventy-eight\n four hundred seventy-nine\n four hundred eighty\n four hundred eighty-one\n four hundred eighty-two\n four hundred eighty-three\n four hundred eighty-four\n four hundred eighty-five\n four hundred eighty-six\n four hundred eighty-seven\n four hundred eighty-eight\n four hundred eighty-nine\n four hundred ninety\n four hundred ninety-one\n four hundred ninety-two\n four hundred ninety-three\n four hundred ninety-four\n four hundred ninety-five\n four hundred ninety-six\n four hundred ninety-seven\n four hundred ninety-eight\n four hundred ninety-nine\n five hundred\n five hundred one\n five hundred two\n five hundred three\n five hundred four\n five hundred five\n five hundred six\n five hundred seven\n five hundred eight\n five hundred nine\n five hundred ten\n five hundred eleven\n five hundred twelve\n five hundred thirteen\n five hundred fourteen\n five hundred fifteen\n five hundred sixteen\n five hundred seventeen\n five hundred eighteen\n five hundred nineteen\n five hundred twenty\n five hundred twenty-one\n five hundred twenty-two\n five hundred twenty-three\n five hundred twenty-four\n five hundred twenty-five\n five hundred twenty-six\n five hundred twenty-seven\n five hundred twenty-eight\n five hundred twenty-nine\n five hundred thirty\n five hundred thirty-one\n five hundred thirty-two\n five hundred thirty-three\n five hundred thirty-four\n five hundred thirty-five\n five hundred thirty-six\n five hundred thirty-seven\n five hundred thirty-eight\n five hundred thirty-nine\n five hundred forty\n five hundred forty-one\n five hundred forty-two\n five hundred forty-three\n five hundred forty-four\n five hundred forty-five\n five hundred forty-six\n five hundred forty-seven\n five hundred forty-eight\n five hundred forty-nine\n five hundred fifty\n five hundred fifty-one\n five hundred fifty-two\n five hundred fifty-three\n five hundred fifty-four\n five hundred fifty-five\n five hundred fifty-six\n five hundred fifty-seven\n five hundred fifty-eight\n five hundred fifty-nine\n five hundred sixty\n five hundred sixty-one\n five hundred sixty-two\n five hundred sixty-three\n five hundred sixty-four\n five hundred sixty-five\n five hundred sixty-six\n five hundred sixty-seven\n five hundred sixty-eight\n five hundred sixty-nine\n five hundred seventy\n five hundred seventy-one\n five hundred seventy-two\n five hundred seventy-three\n five hundred seventy-four\n five hundred seventy-five\n five hundred seventy-six\n five hundred seventy-seven\n five hundred seventy-eight\n five hundred seventy-nine\n five hundred eighty\n five hundred eighty-one\n five hundred eighty-two\n five hundred eighty-three\n five hundred eighty-four\n five hundred eighty-five\n five hundred eighty-six\n five hundred eighty-seven\n five hundred eighty-eight\n five hundred eighty-nine\n five hundred ninety\n five hundred ninety-one\n five hundred ninety-two\n five hundred ninety-three\n five hundred ninety-four\n five hundred ninety-five\n five hundred ninety-six\n five hundred ninety-seven\n five hundred ninety-eight\n five hundred ninety-nine\n six hundred\n six hundred one\n six hundred two\n six hundred three\n six hundred four\n six hundred five\n six hundred six\n six hundred seven\n six hundred eight\n six hundred nine\n six hundred ten\n six hundred eleven\n six hundred twelve\n six hundred thirteen\n six hundred fourteen\n six hundred fifteen\n six hundred sixteen\n six hundred seventeen\n six hundred eighteen\n six hundred nineteen\n six hundred twenty\n six hundred twenty-one\n six hundred twenty-two\n six hundred twenty-three\n six hundred twenty-four\n six hundred twenty-five\n six hundred twenty-six\n six hundred twenty-seven\n six hundred twenty-eight\n six hundred twenty-nine\n six hundred thirty\n six hundred thirty-one\n six hundred thirty-two\n six hundred thirty-three\n six hundred thirty-four\n six hundred thirty-five\n six hundred thirty-six\n six hundred thirty-seven\n six hundred thirty-eight\n six hundred thirty-nine\n six hundred forty\n six hundred forty-one\n six hundred forty-two\n six hundred forty-three\n six hundred forty-four\n six hundred forty-five\n six hundred forty-six\n six hundred forty-seven\n six hundred forty-eight\n six hundred forty-nine\n six hundred fifty\n six hundred fifty-one\n six hundred fifty-two\n six hundred fifty-three\n six hundred fifty-four\n six hundred fifty-five\n six hundred fifty-six\n six hundred fifty-seven\n six hundred fifty-eight\n six hundred fifty-nine\n six hundred sixty\n six hundred sixty-one\n six hundred sixty-two\n six hundred sixty-three\n six hundred sixty-four\n six hundred sixty-five\n six hundred sixty-six\n six hundred sixty-seven\n six hundred sixty-eight\n six hundred sixty-nine\n six hundred seventy\n six hundred seventy-one\n six hundred seventy-two\n six hundred seventy-three\n six hundred seventy-four\n six hundred seventy-five\n six hundred seventy-six\n six hundred seventy-seven\n six hundred seventy-eight\n six hundred seventy-nine\n six hundred eighty\n six hundred eighty-one\n six hundred eighty-two\n six hundred eighty-three\n six hundred eighty-four\n six hundred eighty-five\n six hundred eighty-six\n six hundred eighty-seven\n six hundred eighty-eight\n six hundred eighty-nine\n six hundred ninety\n six hundred ninety-one\n six hundred ninety-two\n six hundred ninety-three\n six hundred ninety-four\n six hundred ninety-five\n six hundred ninety-six\n six hundred ninety-seven\n six hundred ninety-eight\n six hundred ninety-nine\n seven hundred\n seven hundred one\n seven hundred two\n seven hundred three\n seven hundred four\n seven hundred five\n seven hundred six\n seven hundred seven\n seven hundred eight\n seven hundred nine\n seven hundred ten\n seven hundred eleven\n seven hundred twelve\n seven hundred thirteen\n seven hundred fourteen\n seven hundred fifteen\n seven hundred sixteen\n seven hundred seventeen\n seven hundred eighteen\n seven hundred nineteen\n seven hundred twenty\n seven hundred twenty-one\n seven hundred twenty-two\n seven hundred twenty-three\n seven hundred twenty-four\n seven hundred twenty-five\n seven hundred twenty-six\n seven hundred twenty-seven\n seven hundred twenty-eight\n seven hundred twenty-nine\n seven hundred thirty\n seven hundred thirty-one\n seven hundred thirty-two\n seven hundred thirty-three\n seven hundred thirty-four\n seven hundred thirty-five\n seven hundred thirty-six\n seven hundred thirty-seven\n seven hundred thirty-eight\n seven hundred thirty-nine\n seven hundred forty\n seven hundred forty-one\n seven hundred forty-two\n seven hundred forty-three\n seven hundred forty-four\n seven hundred forty-five\n seven hundred forty-six\n seven hundred forty-seven\n seven hundred forty-eight\n seven hundred forty-nine\n seven hundred fifty\n seven hundred fifty-one\n seven hundred fifty-two\n seven hundred fifty-three\n seven hundred fifty-four\n seven hundred fifty-five\n seven hundred fifty-six\n seven hundred fifty-seven\n seven hundred fifty-eight\n seven hundred fifty-nine\n seven hundred sixty\n seven hundred sixty-one\n seven hundred sixty-two\n seven hundred sixty-three\n seven hundred sixty-four\n seven hundred sixty-five\n seven hundred sixty-six\n seven hundred sixty-seven\n seven hundred sixty-eight\n seven hundred sixty-nine\n seven hundred seventy\n seven hundred seventy-one\n seven hundred seventy-two\n seven hundred seventy-three\n seven hundred seventy-four\n seven hundred seventy-five\n seven hundred seventy-six\n seven hundred seventy-seven\n seven hundred seventy-eight\n seven hundred seventy-nine\n seven hundred eighty\n seven hundred eighty-one\n seven hundred eighty-two\n seven hundred eighty-three\n seven hundred eighty-four\n seven hundred eighty-five\n seven hundred eighty-six\n seven hundred eighty-seven\n seven hundred eighty-eight\n seven hundred eighty-nine\n seven hundred ninety\n seven hundred ninety-one\n seven hundred ninety-two\n seven hundred ninety-three\n seven hundred ninety-four\n seven hundred ninety-five\n seven hundred ninety-six\n seven hundred ninety-seven\n seven hundred ninety-eight\n seven hundred ninety-nine\n eight hundred\n eight hundred one\n eight hundred two\n eight hundred three\n eight hundred four\n eight hundred five\n eight hundred six\n eight hundred seven\n eight hundred eight\n eight hundred nine\n eight hundred ten\n eight hundred eleven\n eight hundred twelve\n eight hundred thirteen\n eight hundred fourteen\n eight hundred fifteen\n eight hundred sixteen\n eight hundred seventeen\n eight hundred eighteen\n eight hundred nineteen\n eight hundred twenty\n eight hundred twenty-one\n eight hundred twenty-two\n eight hundred twenty-three\n eight hundred twenty-four\n eight hundred twenty-five\n eight hundred twenty-six\n eight hundred twenty-seven\n eight hundred twenty-eight\n eight hundred twenty-nine\n eight hundred thirty\n eight hundred thirty-one\n eight hundred thirty-two\n eight hundred thirty-three\n eight hundred thirty-four\n eight hundred thirty-five\n eight hundred thirty-six\n eight hundred thirty-seven\n eight hundred thirty-eight\n eight hundred thirty-nine\n eight hundred forty\n eight hundred forty-one\n eight hundred forty-two\n eight hundred forty-three\n eight hundred forty-four\n eight hundred forty-five\n eight hundred forty-six\n eight hundred forty-seven\n eight hundred forty-eight\n eight hundred forty-nine\n eight hundred fifty\n eight hundred fifty-one\n eight hundred fifty-two\n eight hundred fifty-three\n eight hundred fifty-four\n eight hundred fifty-five\n eight hundred fifty-six\n eight hundred fifty-seven\n eight hundred fifty-eight\n eight hundred fifty-nine\n eight hundred sixty\n eight hundred sixty-one\n eight hundred sixty-two\n eight hundred sixty-three\n eight hundred sixty-four\n eight hundred sixty-five\n eight hundred sixty-six\n eight hundred sixty-seven\n eight hundred sixty-eight\n eight hundred sixty-nine\n eight hundred seventy\n eight hundred seventy-one\n eight hundred seventy-two\n eight hundred seventy-three\n eight hundred seventy-four\n eight hundred seventy-five\n eight hundred seventy-six\n eight hundred seventy-seven\n eight hundred seventy-eight\n eight hundred seventy-nine\n eight hundred eighty\n eight hundred eighty-one\n eight hundred eighty-two\n eight hundred eighty-three\n eight hundred eighty-four\n eight hundred eighty-five\n eight hundred eighty-six\n eight hundred eighty-seven\n eight hundred eighty-eight\n eight hundred eighty-nine\n eight hundred ninety\n eight hundred ninety-one\n eight hundred ninety-two\n eight hundred ninety-three\n eight hundred ninety-four\n eight hundred ninety-five\n eight hundred ninety-six\n eight hundred ninety-seven\n eight hundred ninety-eight\n eight hundred ninety-nine\n nine hundred\n nine hundred one\n nine hundred two\n nine hundred three\n nine hundred four\n nine hundred five\n nine hundred six\n nine hundred seven\n nine hundred eight\n nine hundred nine\n nine hundred ten\n nine hundred eleven\n nine hundred twelve\n nine hundred thirteen\n nine hundred fourteen\n nine hundred fifteen\n nine hundred sixteen\n nine hundred seventeen\n nine hundred eighteen\n nine hundred nineteen\n nine hundred twenty\n nine hundred twenty-one\n nine hundred twenty-two\n nine hundred twenty-three\n nine hundred twenty-four\n nine hundred twenty-five\n nine hundred twenty-six\n nine hundred twenty-seven\n nine hundred twenty-eight\n nine hundred twenty-nine\n nine hundred thirty\n nine hundred thirty-one\n nine hundred thirty-two\n nine hundred thirty-three\n nine hundred thirty-four\n nine hundred thirty-five\n nine hundred thirty-six\n nine hundred thirty-seven\n nine hundred thirty-eight\n nine hundred thirty-nine\n nine hundred forty\n nine hundred forty-one\n nine hundred forty-two\n nine hundred forty-three\n nine hundred forty-four\n nine hundred forty-five\n nine hundred forty-six\n nine hundred forty-seven\n nine hundred forty-eight\n nine hundred forty-nine\n nine hundred fifty\n nine hundred fifty-one\n nine hundred fifty-two\n nine hundred fifty-three\n nine hundred fifty-four\n nine hundred fifty-five\n nine hundred fifty-six\n nine hundred fifty-seven\n nine hundred fifty-eight\n nine hundred fifty-nine\n nine hundred sixty\n nine hundred sixty-one\n nine hundred sixty-two\n nine hundred sixty-three\n nine hundred sixty-four\n nine hundred sixty-five\n nine hundred sixty-six\n nine hundred sixty-seven\n nine hundred sixty-eight\n nine hundred sixty-nine\n nine hundred seventy\n nine hundred seventy-one\n nine hundred seventy-two\n nine hundred seventy-three\n nine hundred seventy-four\n nine hundred seventy-five\n nine hundred seventy-six\n nine hundred seventy-seven\n nine hundred seventy-eight\n nine hundred seventy-nine\n nine hundred eighty\n nine hundred eighty-one\n nine hundred eighty-two\n nine hundred eighty-three\n nine hundred eighty-four\n nine hundred eighty-five\n nine hundred eighty-six\n nine hundred eighty-seven\n nine hundred eighty-eight\n nine hundred eighty-nine\n nine hundred ninety\n nine hundred ninety-one\n nine hundred ninety-two\n nine hundred ninety-three\n nine hundred ninety-four\n nine hundred ninety-five\n nine hundred ninety-six\n nine hundred ninety-seven\n nine hundred ninety-eight\n nine hundred ninety-nine', '\n one\n two\n three\n four\n five\n six\n seven\n eight\n nine\n ten\n eleven\n twelve\n thirteen\n fourteen\n fifteen\n sixteen\n seventeen\n eighteen\n nineteen\n twenty\n twenty-one\n twenty-two\n twenty-three\n twenty-four\n twenty-five\n twenty-six\n twenty-seven\n twenty-eight\n twenty-nine\n thirty\n thirty-one\n thirty-two\n thirty-three\n thirty-four\n thirty-five\n thirty-six\n thirty-seven\n thirty-eight\n thirty-nine\n forty\n forty-one\n forty-two\n forty-three\n forty-four\n forty-five\n forty-six\n forty-seven\n forty-eight\n forty-nine\n fifty\n fifty-one\n fifty-two\n fifty-three\n fifty-four\n fifty-five\n fifty-six\n fifty-seven\n fifty-eight\n fifty-nine\n sixty\n sixty-one\n sixty-two\n sixty-three\n sixty-four\n sixty-five\n sixty-six\n sixty-seven\n sixty-eight\n sixty-nine\n seventy\n seventy-one\n seventy-two\n seventy-three\n seventy-four\n seventy-five\n seventy-six\n seventy-seven\n seventy-eight\n seventy-nine\n eighty\n eighty-one\n eighty-two\n eighty-three\n eighty-four\n eighty-five\n eighty-six\n eighty-seven\n eighty-eight\n eighty-nine\n ninety\n ninety-one\n ninety-two\n ninety-three\n ninety-four\n ninety-five\n ninety-six\n ninety-seven\n ninety-eight\n ninety-nine\n one hundred\n one hundred one\n one hundred two\n one hundred three\n one hundred four\n one hundred five\n one hundred six\n one hundred seven\n one hundred eight\n one hundred nine\n one hundred ten\n one hundred eleven\n one hundred twelve\n one hundred thirteen\n one hundred fourteen\n one hundred fifteen\n one hundred sixteen\n one hundred seventeen\n one hundred eighteen\n one hundred nineteen\n one hundred twenty\n one hundred twenty-one\n one hundred twenty-two\n one hundred twenty-three\n one hundred twenty-four\n one hundred twenty-five\n one hundred twenty-six\n one hundred twenty-seven\n one hundred twenty-eight\n one hundred twenty-nine\n one hundred thirty\n one hundred thirty-one\n one hundred thirty-two\n one hundred thirty-three\n one hundred thirty-four\n one hundred thirty-five\n one hundred thirty-six\n one hundred thirty-seven\n one hundred thirty-eight\n one hundred thirty-nine\n one hundred forty\n one hundred forty-one\n one hundred forty-two\n one hundred forty-three\n one hundred forty-four\n one hundred forty-five\n one hundred forty-six\n one hundred forty-seven\n one hundred forty-eight\n one hundred forty-nine\n one hundred fifty\n one hundred fifty-one\n one hundred fifty-two\n one hundred fifty-three\n one hundred fifty-four\n one hundred fifty-five\n one hundred fifty-six\n one hundred fifty-seven\n one hundred fifty-eight\n one hundred fifty-nine\n one hundred sixty\n one hundred sixty-one\n one hundred sixty-two\n one hundred sixty-three\n one hundred sixty-four\n one hundred sixty-five\n one hundred sixty-six\n one hundred sixty-seven\n one hundred sixty-eight\n one hundred sixty-nine\n one hundred seventy\n one hundred seventy-one\n one hundred seventy-two\n one hundred seventy-three\n one hundred seventy-four\n one hundred seventy-five\n one hundred seventy-six\n one hundred seventy-seven\n one hundred seventy-eight\n one hundred seventy-nine\n one hundred eighty\n one hundred eighty-one\n one hundred eighty-two\n one hundred eighty-three\n one hundred eighty-four\n one hundred eighty-five\n one hundred eighty-six\n one hundred eighty-seven\n one hundred eighty-eight\n one hundred eighty-nine\n one hundred ninety\n one hundred ninety-one\n one hundred ninety-two\n one hundred ninety-three\n one hundred ninety-four\n one hundred ninety-five\n one hundred ninety-six\n one hundred ninety-seven\n one hundred ninety-eight\n one hundred ninety-nine\n two hundred\n two hundred one\n two hundred two\n two hundred three\n two hundred four\n two hundred five\n two hundred six\n two hundred seven\n two hundred eight\n two hundred nine\n two hundred ten\n two hundred eleven\n two hundred twelve\n two hundred thirteen\n two hundred fourteen\n two hundred fifteen\n two hundred sixteen\n two hundred seventeen\n two hundred eighteen\n two hundred nineteen\n two hundred twenty\n two hundred twenty-one\n two hundred twenty-two\n two hundred twenty-three\n two hundred twenty-four\n two hundred twenty-five\n two hundred twenty-six\n two hundred twenty-seven\n two hundred twenty-eight\n two hundred twenty-nine\n two hundred thirty\n two hundred thirty-one\n two hundred thirty-two\n two hundred thirty-three\n two hundred thirty-four\n two hundred thirty-five\n two hundred thirty-six\n two hundred thirty-seven\n two hundred thirty-eight\n two hundred thirty-nine\n two hundred forty\n two hundred forty-one\n two hundred forty-two\n two hundred forty-three\n two hundred forty-four\n two hundred forty-five\n two hundred forty-six\n two hundred forty-seven\n two hundred forty-eight\n two hundred forty-nine\n two hundred fifty\n two hundred fifty-one\n two hundred fifty-two\n two hundred fifty-three\n two hundred fifty-four\n two hundred fifty-five\n two hundred fifty-six\n two hundred fifty-seven\n two hundred fifty-eight\n two hundred fifty-nine\n two hundred sixty\n two hundred sixty-one\n two hundred sixty-two\n two hundred sixty-three\n two hundred sixty-four\n two hundred sixty-five\n two hundred sixty-six\n two hundred sixty-seven\n two hundred sixty-eight\n two hundred sixty-nine\n two hundred seventy\n two hundred seventy-one\n two hundred seventy-two\n two hundred seventy-three\n two hundred seventy-four\n two hundred seventy-five\n two hundred seventy-six\n two hundred seventy-seven\n two hundred seventy-eight\n two hundred seventy-nine\n two hundred eighty\n two hundred eighty-one\n two hundred eighty-two\n two hundred eighty-three\n two hundred eighty-four\n two hundred eighty-five\n two hundred eighty-six\n two hundred eighty-seven\n two hundred eighty-eight\n two hundred eighty-nine\n two hundred ninety\n two hundred ninety-one\n two hundred ninety-two\n two hundred ninety-three\n two hundred ninety-four\n two hundred ninety-five\n two hundred ninety-six\n two hundred ninety-seven\n two hundred ninety-eight\n two hundred ninety-nine\n three hundred\n three hundred one\n three hundred two\n three hundred three\n three hundred four\n three hundred five\n three hundred six\n three hundred seven\n three hundred eight\n three hundred nine\n three hundred ten\n three hundred eleven\n three hundred twelve\n three hundred thirteen\n three hundred fourteen\n three hundred fifteen\n three hundred sixteen\n three hundred seventeen\n three hundred eighteen\n three hundred nineteen\n three hundred twenty\n three hundred twenty-one\n three hundred twenty-two\n three hundred twenty-three\n three hundred twenty-four\n three hundred twenty-five\n three hundred twenty-six\n three hundred twenty-seven\n three hundred twenty-eight\n three hundred twenty-nine\n three hundred thirty\n three hundred thirty-one\n three hundred thirty-two\n three hundred thirty-three\n three hundred thirty-four\n three hundred thirty-five\n three hundred thirty-six\n three hundred thirty-seven\n three hundred thirty-eight\n three hundred thirty-nine\n three hundred forty\n three hundred forty-one\n three hundred forty-two\n three hundred forty-three\n three hundred forty-four\n three hundred forty-five\n three hundred forty-six\n three hundred forty-seven\n three hundred forty-eight\n three hundred forty-nine\n three hundred fifty\n three hundred fifty-one\n three hundred fifty-two\n three hundred fifty-three\n three hundred fifty-four\n three hundred fifty-five\n three hundred fifty-six\n three hundred fifty-seven\n three hundred fifty-eight\n three hundred fifty-nine\n three hundred sixty\n three hundred sixty-one\n three hundred sixty-two\n three hundred sixty-three\n three hundred sixty-four\n three hundred sixty-five\n three hundred sixty-six\n three hundred sixty-seven\n three hundred sixty-eight\n three hundred sixty-nine\n three hundred seventy\n three hundred seventy-one\n three hundred seventy-two\n three hundred seventy-three\n three hundred seventy-four\n three hundred seventy-five\n three hundred seventy-six\n three hundred seventy-seven\n three hundred seventy-eight\n three hundred seventy-nine\n three hundred eighty\n three hundred eighty-one\n three hundred eighty-two\n three hundred eighty-three\n three hundred eighty-four\n three hundred eighty-five\n three hundred eighty-six\n three hundred eighty-seven\n three hundred eighty-eight\n three hundred eighty-nine\n three hundred ninety\n three hundred ninety-one\n three hundred ninety-two\n three hundred ninety-three\n three hundred ninety-four\n three hundred ninety-five\n three hundred ninety-six\n three hundred ninety-seven\n three hundred ninety-eight\n three hundred ninety-nine\n four hundred\n four hundred one\n four hundred two\n four hundred three\n four hundred four\n four hundred five\n four hundred six\n four hundred seven\n four hundred eight\n four hundred nine\n four hundred ten\n four hundred eleven\n four hundred twelve\n four hundred thirteen\n four hundred fourteen\n four hundred fifteen\n four hundred sixteen\n four hundred seventeen\n four hundred eighteen\n four hundred nineteen\n four hundred twenty\n four hundred twenty-one\n four hundred twenty-two\n four hundred twenty-three\n four hundred twenty-four\n four hundred twenty-five\n four hundred twenty-six\n four hundred twenty-seven\n four hundred twenty-eight\n four hundred twenty-nine\n four hundred thirty\n four hundred thirty-one\n four hundred thirty-two\n four hundred thirty-three\n four hundred thirty-four\n four hundred thirty-five\n four hundred thirty-six\n four hundred thirty-seven\n four hundred thirty-eight\n four hundred thirty-nine\n four hundred forty\n four hundred forty-one\n four hundred forty-two\n four hundred forty-three\n four hundred forty-four\n four hundred forty-five\n four hundred forty-six\n four hundred forty-seven\n four hundred forty-eight\n four hundred forty-nine\n four hundred fifty\n four hundred fifty-one\n four hundred fifty-two\n four hundred fifty-three\n four hundred fifty-four\n four hundred fifty-five\n four hundred fifty-six\n four hundred fifty-seven\n four hundred fifty-eight\n four hundred fifty-nine\n four hundred sixty\n four hundred sixty-one\n four hundred sixty-two\n four hundred sixty-three\n four hundred sixty-four\n four hundred sixty-five\n four hundred sixty-six\n four hundred sixty-seven\n four hundred sixty-eight\n four hundred sixty-nine\n four hundred seventy\n four hundred seventy-one\n four hundred seventy-two\n four hundred seventy-three\n four hundred seventy-four\n four hundred seventy-five\n four hundred seventy-six\n four hundred seventy-seven\n four hundred seventy-eight\n four hundred seventy-nine\n four hundred eighty\n four hundred eighty-one\n four hundred eighty-two\n four hundred eighty-three\n four hundred eighty-four\n four hundred eighty-five\n four hundred eighty-six\n four hundred eighty-seven\n four hundred eighty-eight\n four hundred eighty-nine\n four hundred ninety\n four hundred ninety-one\n four hundred ninety-two\n four hundred ninety-three\n four hundred ninety-four\n four hundred ninety-five\n four hundred ninety-six\n four hundred ninety-seven\n four hundred ninety-eight\n four hundred ninety-nine\n five hundred\n five hundred one\n five hundred two\n five hundred three\n five hundred four\n five hundred five\n five hundred six\n five hundred seven\n five hundred eight\n five hundred nine\n five hundred ten\n five hundred eleven\n five hundred twelve\n five hundred thirteen\n five hundred fourteen\n five hundred fifteen\n five hundred sixteen\n five hundred seventeen\n five hundred eighteen\n five hundred nineteen\n five hundred twenty\n five hundred twenty-one\n five hundred twenty-two\n five hundred twenty-three\n five hundred twenty-four\n five hundred twenty-five\n five hundred twenty-six\n five hundred twenty-seven\n five hundred twenty-eight\n five hundred twenty-nine\n five hundred thirty\n five hundred thirty-one\n five hundred thirty-two\n five hundred thirty-three\n five hundred thirty-four\n five hundred thirty-five\n five hundred thirty-six\n five hundred thirty-seven\n five hundred thirty-eight\n five hundred thirty-nine\n five hundred forty\n five hundred forty-one\n five hundred forty-two\n five hundred forty-three\n five hundred forty-four\n five hundred forty-five\n five hundred forty-six\n five hundred forty-seven\n five hundred forty-eight\n five hundred forty-nine\n five hundred fifty\n five hundred fifty-one\n five hundred fifty-two\n five hundred fifty-three\n five hundred fifty-four\n five hundred fifty-five\n five hundred fifty-six\n five hundred fifty-seven\n five hundred fifty-eight\n five hundred fifty-nine\n five hundred sixty\n five hundred sixty-one\n five hundred sixty-two\n five hundred sixty-three\n five hundred sixty-four\n five hundred sixty-five\n five hundred sixty-six\n five hundred sixty-seven\n five hundred sixty-eight\n five hundred sixty-nine\n five hundred seventy\n five hundred seventy-one\n five hundred seventy-two\n five hundred seventy-three\n five hundred seventy-four\n five hundred seventy-five\n five hundred seventy-six\n five hundred seventy-seven\n five hundred seventy-eight\n five hundred seventy-nine\n five hundred eighty\n five hundred eighty-one\n five hundred eighty-two\n five hundred eighty-three\n five hundred eighty-four\n five hundred eighty-five\n five hundred eighty-six\n five hundred eighty-seven\n five hundred eighty-eight\n five hundred eighty-nine\n five hundred ninety\n five hundred ninety-one\n five hundred ninety-two\n five hundred ninety-three\n five hundred ninety-four\n five hundred ninety-five\n five hundred ninety-six\n five hundred ninety-seven\n five hundred ninety-eight\n five hundred ninety-nine\n six hundred\n six hundred one\n six hundred two\n six hundred three\n six hundred four\n six hundred five\n six hundred six\n six hundred seven\n six hundred eight\n six hundred nine\n six hundred ten\n six hundred eleven\n six hundred twelve\n six hundred thirteen\n six hundred fourteen\n six hundred fifteen\n six hundred sixteen\n six hundred seventeen\n six hundred eighteen\n six hundred nineteen\n six hundred twenty\n six hundred twenty-one\n six hundred twenty-two\n six hundred twenty-three\n six hundred twenty-four\n six hundred twenty-five\n six hundred twenty-six\n six hundred twenty-seven\n six hundred twenty-eight\n six hundred twenty-nine\n six hundred thirty\n six hundred thirty-one\n six hundred thirty-two\n six hundred thirty-three\n six hundred thirty-four\n six hundred thirty-five\n six hundred thirty-six\n six hundred thirty-seven\n six hundred thirty-eight\n six hundred thirty-nine\n six hundred forty\n six hundred forty-one\n six hundred forty-two\n six hundred forty-three\n six hundred forty-four\n six hundred forty-five\n six hundred forty-six\n six hundred forty-seven\n six hundred forty-eight\n six hundred forty-nine\n six hundred fifty\n six hundred fifty-one\n six hundred fifty-two\n six hundred fifty-three\n six hundred fifty-four\n six hundred fifty-five\n six hundred fifty-six\n six hundred fifty-seven\n six hundred fifty-eight\n six hundred fifty-nine\n six hundred sixty\n six hundred sixty-one\n six hundred sixty-two\n six hundred sixty-three\n six hundred sixty-four\n six hundred sixty-five\n six hundred sixty-six\n six hundred sixty-seven\n six hundred sixty-eight\n six hundred sixty-nine\n six hundred seventy\n six hundred seventy-one\n six hundred seventy-two\n six hundred seventy-three\n six hundred seventy-four\n six hundred seventy-five\n six hundred seventy-six\n six hundred seventy-seven\n six hundred seventy-eight\n six hundred seventy-nine\n six hundred eighty\n six hundred eighty-one\n six hundred eighty-two\n six hundred eighty-three\n six hundred eighty-four\n six hundred eighty-five\n six hundred eighty-six\n six hundred eighty-seven\n six hundred eighty-eight\n six hundred eighty-nine\n six hundred ninety\n six hundred ninety-one\n six hundred ninety-two\n six hundred ninety-three\n six hundred ninety-four\n six hundred ninety-five\n six hundred ninety-six\n six hundred ninety-seven\n six hundred ninety-eight\n six hundred ninety-nine\n seven hundred\n seven hundred one\n seven hundred two\n seven hundred three\n seven hundred four\n seven hundred five\n seven hundred six\n seven hundred seven\n seven hundred eight\n seven hundred nine\n seven hundred ten\n seven hundred eleven\n seven hundred twelve\n seven hundred thirteen\n seven hundred fourteen\n seven hundred fifteen\n seven hundred sixteen\n seven hundred seventeen\n seven hundred eighteen\n seven hundred nineteen\n seven hundred twenty\n seven hundred twenty-one\n seven hundred twenty-two\n seven hundred twenty-three\n seven hundred twenty-four\n seven hundred twenty-five\n seven hundred twenty-six\n seven hundred twenty-seven\n seven hundred twenty-eight\n seven hundred twenty-nine\n seven hundred thirty\n seven hundred thirty-one\n seven hundred thirty-two\n seven hundred thirty-three\n seven hundred thirty-four\n seven hundred thirty-five\n seven hundred thirty-six\n seven hundred thirty-seven\n seven hundred thirty-eight\n seven hundred thirty-nine\n seven hundred forty\n seven hundred forty-one\n seven hundred forty-two\n seven hundred forty-three\n seven hundred forty-four\n seven hundred forty-five\n seven hundred forty-six\n seven hundred forty-seven\n seven hundred forty-eight\n seven hundred forty-nine\n seven hundred fifty\n seven hundred fifty-one\n seven hundred fifty-two\n seven hundred fifty-three\n seven hundred fifty-four\n seven hundred fifty-five\n seven hundred fifty-six\n seven hundred fifty-seven\n seven hundred fifty-eight\n seven hundred fifty-nine\n seven hundred sixty\n seven hundred sixty-one\n seven hundred sixty-two\n seven hundred sixty-three\n seven hundred sixty-four\n seven hundred sixty-five\n seven hundred sixty-six\n seven hundred sixty-seven\n seven hundred sixty-eight\n seven hundred sixty-nine\n seven hundred seventy\n seven hundred seventy-one\n seven hundred seventy-two\n seven hundred seventy-three\n seven hundred seventy-four\n seven hundred seventy-five\n seven hundred seventy-six\n seven hundred seventy-seven\n seven hundred seventy-eight\n seven hundred seventy-nine\n seven hundred eighty\n seven hundred eighty-one\n seven hundred eighty-two\n seven hundred eighty-three\n seven hundred eighty-four\n seven hundred eighty-five\n seven hundred eighty-six\n seven hundred eighty-seven\n seven hundred eighty-eight\n seven hundred eighty-nine\n seven hundred ninety\n seven hundred ninety-one\n seven hundred ninety-two\n seven hundred ninety-three\n seven hundred ninety-four\n seven hundred ninety-five\n seven hundred ninety-six\n seven hundred ninety-seven\n seven hundred ninety-eight\n seven hundred ninety-nine\n eight hundred\n eight hundred one\n eight hundred two\n eight hundred three\n eight hundred four\n eight hundred five\n eight hundred six\n eight hundred seven\n eight hundred eight\n eight hundred nine\n eight hundred ten\n eight hundred eleven\n eight hundred twelve\n eight hundred thirteen\n eight hundred fourteen\n eight hundred fifteen\n eight hundred sixteen\n eight hundred seventeen\n eight hundred eighteen\n eight hundred nineteen\n eight hundred twenty\n eight hundred twenty-one\n eight hundred twenty-two\n eight hundred twenty-three\n eight hundred twenty-four\n eight hundred twenty-five\n eight hundred twenty-six\n eight hundred twenty-seven\n eight hundred twenty-eight\n eight hundred twenty-nine\n eight hundred thirty\n eight hundred thirty-one\n eight hundred thirty-two\n eight hundred thirty-three\n eight hundred thirty-four\n eight hundred thirty-five\n eight hundred thirty-six\n eight hundred thirty-seven\n eight hundred thirty-eight\n eight hundred thirty-nine\n eight hundred forty\n eight hundred forty-one\n eight hundred forty-two\n eight hundred forty-three\n eight hundred forty-four\n eight hundred forty-five\n eight hundred forty-six\n eight hundred forty-seven\n eight hundred forty-eight\n eight hundred forty-nine\n eight hundred fifty\n eight hundred fifty-one\n eight hundred fifty-two\n eight hundred fifty-three\n eight hundred fifty-four\n eight hundred fifty-five\n eight hundred fifty-six\n eight hundred fifty-seven\n eight hundred fifty-eight\n eight hundred fifty-nine\n eight hundred sixty\n eight hundred sixty-one\n eight hundred sixty-two\n eight hundred sixty-three\n eight hundred sixty-four\n eight hundred sixty-five\n eight hundred sixty-six\n eight hundred sixty-seven\n eight hundred sixty-eight\n eight hundred sixty-nine\n eight hundred seventy\n eight hundred seventy-one\n eight hundred seventy-two\n eight hundred seventy-three\n eight hundred seventy-four\n eight hundred seventy-five\n eight hundred seventy-six\n eight hundred seventy-seven\n eight hundred seventy-eight\n eight hundred seventy-nine\n eight hundred eighty\n eight hundred eighty-one\n eight hundred eighty-two\n eight hundred eighty-three\n eight hundred eighty-four\n eight hundred eighty-five\n eight hundred eighty-six\n eight hundred eighty-seven\n eight hundred eighty-eight\n eight hundred eighty-nine\n eight hundred ninety\n eight hundred ninety-one\n eight hundred ninety-two\n eight hundred ninety-three\n eight hundred ninety-four\n eight hundred ninety-five\n eight hundred ninety-six\n eight hundred ninety-seven\n eight hundred ninety-eight\n eight hundred ninety-nine\n nine hundred\n nine hundred one\n nine hundred two\n nine hundred three\n nine hundred four\n nine hundred five\n nine hundred six\n nine hundred seven\n nine hundred eight\n nine hundred nine\n nine hundred ten\n nine hundred eleven\n nine hundred twelve\n nine hundred thirteen\n nine hundred fourteen\n nine hundred fifteen\n nine hundred sixteen\n nine hundred seventeen\n nine hundred eighteen\n nine hundred nineteen\n nine hundred twenty\n nine hundred twenty-one\n nine hundred twenty-two\n nine hundred twenty-three\n nine hundred twenty-four\n nine hundred twenty-five\n nine hundred twenty-six\n nine hundred twenty-seven\n nine hundred twenty-eight\n nine hundred twenty-nine\n nine hundred thirty\n nine hundred thirty-one\n nine hundred thirty-two\n nine hundred thirty-three\n nine hundred thirty-four\n nine hundred thirty-five\n nine hundred thirty-six\n nine hundred thirty-seven\n nine hundred thirty-eight\n nine hundred thirty-nine\n nine hundred forty\n nine hundred forty-one\n nine hundred forty-two\n nine hundred forty-three\n nine hundred forty-four\n nine hundred forty-five\n nine hundred forty-six\n nine hundred forty-seven\n nine hundred forty-eight\n nine hundred forty-nine\n nine hundred fifty\n nine hundred fifty-one\n nine hundred fifty-two\n nine hundred fifty-three\n nine hundred fifty-four\n nine hundred fifty-five\n nine hundred fifty-six\n nine hundred fifty-seven\n nine hundred fifty-eight\n nine hundred fifty-nine\n nine hundred sixty\n nine hundred sixty-one\n nine hundred sixty-two\n nine hundred sixty-three\n nine hundred sixty-four\n nine hundred sixty-five\n nine hundred sixty-six\n nine hundred sixty-seven\n nine hundred sixty-eight\n nine hundred sixty-nine\n nine hundred seventy\n nine hundred seventy-one\n nine hundred seventy-two\n nine hundred seventy-three\n nine hundred seventy-four\n nine hundred seventy-five\n nine hundred seventy-six\n nine hundred seventy-seven\n nine hundred seventy-eight\n nine hundred seventy-nine\n nine hundred eighty\n nine hundred eighty-one\n nine hundred eighty-two\n nine hundred eighty-three\n nine hundred eighty-four\n nine hundred eighty-five\n nine hundred eighty-six\n nine hundred eighty-seven\n nine hundred eighty-eight\n nine hundred eighty-nine\n nine hundred ninety\n nine hundred ninety-one\n nine hundred ninety-two\n nine hundred ninety-three\n nine hundred ninety-four\n nine hundred ninety-five\n nine hundred ninety-six\n nine hundred ninety-seven\n nine hundred ninety-eight\n nine hundred ninety-nine')
+
+_chunk_prefix_6 = 'nilli\nmilli\nbilli\ntrilli\nquadrilli\nquintilli\nsextilli\nseptilli\noctilli\nnonilli\ndecilli\nundecilli\nduodecilli\ntredecilli\nquattuordecilli\nquindecilli\nsexdecilli\nseptendecilli\noctodecilli\nnovemdecilli\nvigintilli\nunvigintilli\nduovigintilli\ntresvigintilli\nquattuorvigintilli\nquinquavigintilli\nsesvigintilli\nseptemvigintilli\noctovigintilli\nnovemvigintilli\ntrigintilli\nuntrigintilli\nduotrigintilli\ntrestrigintilli\nquattuortrigintilli\nquinquatrigintilli\nsestrigintilli\nseptentrigintilli\noctotrigintilli\nnoventrigintilli\nquadragintilli\nunquadragintilli\nduoquadragintilli\ntresquadragintilli\nquattuorquadragintilli\nquinquaquadragintilli\nsesquadragintilli\nseptenquadragintilli\noctoquadragintilli\nnovenquadragintilli\nquinquagintilli\nunquinquagintilli\nduoquinquagintilli\ntresquinquagintilli\nquattuorquinquagintilli\nquinquaquinquagintilli\nsesquinquagintilli\nseptenquinquagintilli\noctoquinquagintilli\nnovenquinquagintilli\nsexagintilli\nunsexagintilli\nduosexagintilli\ntresexagintilli\nquattuorsexagintilli\nquinquasexagintilli\nsesexagintilli\nseptensexagintilli\noctosexagintilli\nnovensexagintilli\nseptuagintilli\nunseptuagintilli\nduoseptuagintilli\ntreseptuagintilli\nquattuorseptuagintilli\nquinquaseptuagintilli\nseseptuagintilli\nseptenseptuagintilli\noctoseptuagintilli\nnovenseptuagintilli\noctogintilli\nunoctogintilli\nduooctogintilli\ntresoctogintilli\nquattuoroctogintilli\nquinquaoctogintilli\nsexoctogintilli\nseptemoctogintilli\noctooctogintilli\nnovemoctogintilli\nnonagintilli\nunnonagintilli\nduononagintilli\ntrenonagintilli\nquattuornonagintilli\nquinquanonagintilli\nsenonagintilli\nseptenonagintilli\noctononagintilli\nnovenonagintilli\ncentilli\nuncentilli\nduocentilli\ntrescentilli\nquattuorcentilli\nquinquacentilli\nsexcentilli\nseptencentilli\noctocentilli\nnovencentilli\ndecicentilli\nundecicentilli\nduodecicentilli\ntredecicentilli\nquattuordecicentilli\nquinquadecicentilli\nsedecicentilli\nseptendecicentilli\noctodecicentilli\nnovendecicentilli\nviginticentilli\nunviginticentilli\nduoviginticentilli\ntresviginticentilli\nquattuorviginticentilli\nquinquaviginticentilli\nsesviginticentilli\nseptemviginticentilli\noctoviginticentilli\nnovemviginticentilli\ntrigintacentilli\nuntrigintacentilli\nduotrigintacentilli\ntrestrigintacentilli\nquattuortrigintacentilli\nquinquatrigintacentilli\nsestrigintacentilli\nseptentrigintacentilli\noctotrigintacentilli\nnoventrigintacentilli\nquadragintacentilli\nunquadragintacentilli\nduoquadragintacentilli\ntresquadragintacentilli\nquattuorquadragintacentilli\nquinquaquadragintacentilli\nsesquadragintacentilli\nseptenquadragintacentilli\noctoquadragintacentilli\nnovenquadragintacentilli\nquinquagintacentilli\nunquinquagintacentilli\nduoquinquagintacentilli\ntresquinquagintacentilli\nquattuorquinquagintacentilli\nquinquaquinquagintacentilli\nsesquinquagintacentilli\nseptenquinquagintacentilli\noctoquinquagintacentilli\nnovenquinquagintacentilli\nsexagintacentilli\nunsexagintacentilli\nduosexagintacentilli\ntresexagintacentilli\nquattuorsexagintacentilli\nquinquasexagintacentilli\nsesexagintacentilli\nseptensexagintacentilli\noctosexagintacentilli\nnovensexagintacentilli\nseptuagintacentilli\nunseptuagintacentilli\nduoseptuagintacentilli\ntreseptuagintacentilli\nquattuorseptuagintacentilli\nquinquaseptuagintacentilli\nseseptuagintacentilli\nseptenseptuagintacentilli\noctoseptuagintacentilli\nnovenseptuagintacentilli\noctogintacentilli\nunoctogintacentilli\nduooctogintacentilli\ntresoctogintacentilli\nquattuoroctogintacentilli\nquinquaoctogintacentilli\nsexoctogintacentilli\nseptemoctogintacentilli\noctooctogintacentilli\nnovemoctogintacentilli\nnonagintacentilli\nunnonagintacentilli\nduononagintacentilli\ntresnonagintacentilli\nquattuornonagintacentilli\nquinquanonagintacentilli\nsexnonagintacentilli\nseptennonagintacentilli\noctononagintacentilli\nnovennonagintacentilli\nducentilli\nunducentilli\nduoducentilli\ntreducentilli\nquattuorducentilli\nquinquaducentilli\nseducentilli\nseptenducentilli\noctoducentilli\nnovenducentilli\ndeciducentilli\nundeciducentilli\nduodeciducentilli\ntredeciducentilli\nquattuordeciducentilli\nquinquadeciducentilli\nsedeciducentilli\nseptendeciducentilli\noctodeciducentilli\nnovendeciducentilli\nvigintiducentilli\nunvigintiducentilli\nduovigintiducentilli\ntresvigintiducentilli\nquattuorvigintiducentilli\nquinquavigintiducentilli\nsesvigintiducentilli\nseptemvigintiducentilli\noctovigintiducentilli\nnovemvigintiducentilli\ntrigintaducentilli\nuntrigintaducentilli\nduotrigintaducentilli\ntrestrigintaducentilli\nquattuortrigintaducentilli\nquinquatrigintaducentilli\nsestrigintaducentilli\nseptentrigintaducentilli\noctotrigintaducentilli\nnoventrigintaducentilli\nquadragintaducentilli\nunquadragintaducentilli\nduoquadragintaducentilli\ntresquadragintaducentilli\nquattuorquadragintaducentilli\nquinquaquadragintaducentilli\nsesquadragintaducentilli\nseptenquadragintaducentilli\noctoquadragintaducentilli\nnovenquadragintaducentilli\nquinquagintaducentilli\nunquinquagintaducentilli\nduoquinquagintaducentilli\ntresquinquagintaducentilli\nquattuorquinquagintaducentilli\nquinquaquinquagintaducentilli\nsesquinquagintaducentilli\nseptenquinquagintaducentilli\noctoquinquagintaducentilli\nnovenquinquagintaducentilli\nsexagintaducentilli\nunsexagintaducentilli\nduosexagintaducentilli\ntresexagintaducentilli\nquattuorsexagintaducentilli\nquinquasexagintaducentilli\nsesexagintaducentilli\nseptensexagintaducentilli\noctosexagintaducentilli\nnovensexagintaducentilli\nseptuagintaducentilli\nunseptuagintaducentilli\nduoseptuagintaducentilli\ntreseptuagintaducentilli\nquattuorseptuagintaducentilli\nquinquaseptuagintaducentilli\nseseptuagintaducentilli\nseptenseptuagintaducentilli\noctoseptuagintaducentilli\nnovenseptuagintaducentilli\noctogintaducentilli\nunoctogintaducentilli\nduooctogintaducentilli\ntresoctogintaducentilli\nquattuoroctogintaducentilli\nquinquaoctogintaducentilli\nsexoctogintaducentilli\nseptemoctogintaducentilli\noctooctogintaducentilli\nnovemoctogintaducentilli\nnonagintaducentilli\nunnonagintaducentilli\nduononagintaducentilli\ntrenonagintaducentilli\nquattuornonagintaducentilli\nquinquanonagintaducentilli\nsenonagintaducentilli\nseptennonagintaducentilli\noctononagintaducentilli\nnovennonagintaducentilli\ntrecentilli\nuntrecentilli\nduotrecentilli\ntrestrecentilli\nquattuortrecentilli\nquinquatrecentilli\nsestrecentilli\nseptentrecentilli\noctotrecentilli\nnoventrecentilli\ndecitrecentilli\nundecitrecentilli\nduodecitrecentilli\ntredecitrecentilli\nquattuordecitrecentilli\nquinquadecitrecentilli\nsedecitrecentilli\nseptendecitrecentilli\noctodecitrecentilli\nnovendecitrecentilli\nvigintitrecentilli\nunvigintitrecentilli\nduovigintitrecentilli\ntresvigintitrecentilli\nquattuorvigintitrecentilli\nquinquavigintitrecentilli\nsesvigintitrecentilli\nseptemvigintitrecentilli\noctovigintitrecentilli\nnovemvigintitrecentilli\ntrigintatrecentilli\nuntrigintatrecentilli\nduotrigintatrecentilli\ntrestrigintatrecentilli\nquattuortrigintatrecentilli\nquinquatrigintatrecentilli\nsestrigintatrecentilli\nseptentrigintatrecentilli\noctotrigintatrecentilli\nnoventrigintatrecentilli\nquadragintatrecentilli\nunquadragintatrecentilli\nduoquadragintatrecentilli\ntresquadragintatrecentilli\nquattuorquadragintatrecentilli\nquinquaquadragintatrecentilli\nsesquadragintatrecentilli\nseptenquadragintatrecentilli\noctoquadragintatrecentilli\nnovenquadragintatrecentilli\nquinquagintatrecentilli\nunquinquagintatrecentilli\nduoquinquagintatrecentilli\ntresquinquagintatrecentilli\nquattuorquinquagintatrecentilli\nquinquaquinquagintatrecentilli\nsesquinquagintatrecentilli\nseptenquinquagintatrecentilli\noctoquinquagintatrecentilli\nnovenquinquagintatrecentilli\nsexagintatrecentilli\nunsexagintatrecentilli\nduosexagintatrecentilli\ntresexagintatrecentilli\nquattuorsexagintatrecentilli\nquinquasexagintatrecentilli\nsesexagintatrecentilli\nseptensexagintatrecentilli\noctosexagintatrecentilli\nnovensexagintatrecentilli\nseptuagintatrecentilli\nunseptuagintatrecentilli\nduoseptuagintatrecentilli\ntreseptuagintatrecentilli\nquattuorseptuagintatrecentilli\nquinquaseptuagintatrecentilli\nseseptuagintatrecentilli\nseptenseptuagintatrecentilli\noctoseptuagintatrecentilli\nnovenseptuagintatrecentilli\noctogintatrecentilli\nunoctogintatrecentilli\nduooctogintatrecentilli\ntresoctogintatrecentilli\nquattuoroctogintatrecentilli\nquinquaoctogintatrecentilli\nsexoctogintatrecentilli\nseptemoctogintatrecentilli\noctooctogintatrecentilli\nnovemoctogintatrecentilli\nnonagintatrecentilli\nunnonagintatrecentilli\nduononagintatrecentilli\ntresnonagintatrecentilli\nquattuornonagintatrecentilli\nquinquanonagintatrecentilli\nsesnonagintatrecentilli\nseptennonagintatrecentilli\noctononagintatrecentilli\nnovennonagintatrecentilli\nquadringentilli\nunquadringentilli\nduoquadringentilli\ntresquadringentilli\nquattuorquadringentilli\nquinquaquadringentilli\nsesquadringentilli\nseptenquadringentilli\noctoquadringentilli\nnovenquadringentilli\ndeciquadringentilli\nundeciquadringentilli\nduodeciquadringentilli\ntredeciquadringentilli\nquattuordeciquadringentilli\nquinquadeciquadringentilli\nsedeciquadringentilli\nseptendeciquadringentilli\noctodeciquadringentilli\nnovendeciquadringentilli\nvigintiquadringentilli\nunvigintiquadringentilli\nduovigintiquadringentilli\ntresvigintiquadringentilli\nquattuorvigintiquadringentilli\nquinquavigintiquadringentilli\nsesvigintiquadringentilli\nseptemvigintiquadringentilli\noctovigintiquadringentilli\nnovemvigintiquadringentilli\ntrigintaquadringentilli\nuntrigintaquadringentilli\nduotrigintaquadringentilli\ntrestrigintaquadringentilli\nquattuortrigintaquadringentilli\nquinquatrigintaquadringentilli\nsestrigintaquadringentilli\nseptentrigintaquadringentilli\noctotrigintaquadringentilli\nnoventrigintaquadringentilli\nquadragintaquadringentilli\nunquadragintaquadringentilli\nduoquadragintaquadringentilli\ntresquadragintaquadringentilli\nquattuorquadragintaquadringentilli\nquinquaquadragintaquadringentilli\nsesquadragintaquadringentilli\nseptenquadragintaquadringentilli\noctoquadragintaquadringentilli\nnovenquadragintaquadringentilli\nquinquagintaquadringentilli\nunquinquagintaquadringentilli\nduoquinquagintaquadringentilli\ntresquinquagintaquadringentilli\nquattuorquinquagintaquadringentilli\nquinquaquinquagintaquadringentilli\nsesquinquagintaquadringentilli\nseptenquinquagintaquadringentilli\noctoquinquagintaquadringentilli\nnovenquinquagintaquadringentilli\nsexagintaquadringentilli\nunsexagintaquadringentilli\nduosexagintaquadringentilli\ntresexagintaquadringentilli\nquattuorsexagintaquadringentilli\nquinquasexagintaquadringentilli\nsesexagintaquadringentilli\nseptensexagintaquadringentilli\noctosexagintaquadringentilli\nnovensexagintaquadringentilli\nseptuagintaquadringentilli\nunseptuagintaquadringentilli\nduoseptuagintaquadringentilli\ntreseptuagintaquadringentilli\nquattuorseptuagintaquadringentilli\nquinquaseptuagintaquadringentilli\nseseptuagintaquadringentilli\nseptenseptuagintaquadringentilli\noctoseptuagintaquadringentilli\nnovenseptuagintaquadringentilli\noctogintaquadringentilli\nunoctogintaquadringentilli\nduooctogintaquadringentilli\ntresoctogintaquadringentilli\nquattuoroctogintaquadringentilli\nquinquaoctogintaquadringentilli\nsexoctogintaquadringentilli\nseptemoctogintaquadringentilli\noctooctogintaquadringentilli\nnovemoctogintaquadringentilli\nnonagintaquadringentilli\nunnonagintaquadringentilli\nduononagintaquadringentilli\ntresnonagintaquadringentilli\nquattuornonagintaquadringentilli\nquinquanonagintaquadringentilli\nsesnonagintaquadringentilli\nseptennonagintaquadringentilli\noctononagintaquadringentilli\nnovennonagintaquadringentilli\nquingentilli\nunquingentilli\nduoquingentilli\ntresquingentilli\nquattuorquingentilli\nquinquaquingentilli\nsesquingentilli\nseptenquingentilli\noctoquingentilli\nnovenquingentilli\ndeciquingentilli\nundeciquingentilli\nduodeciquingentilli\ntredeciquingentilli\nquattuordeciquingentilli\nquinquadeciquingentilli\nsedeciquingentilli\nseptendeciquingentilli\noctodeciquingentilli\nnovendeciquingentilli\nvigintiquingentilli\nunvigintiquingentilli\nduovigintiquingentilli\ntresvigintiquingentilli\nquattuorvigintiquingentilli\nquinquavigintiquingentilli\nsesvigintiquingentilli\nseptemvigintiquingentilli\noctovigintiquingentilli\nnovemvigintiquingentilli\ntrigintaquingentilli\nuntrigintaquingentilli\nduotrigintaquingentilli\ntrestrigintaquingentilli\nquattuortrigintaquingentilli\nquinquatrigintaquingentilli\nsestrigintaquingentilli\nseptentrigintaquingentilli\noctotrigintaquingentilli\nnoventrigintaquingentilli\nquadragintaquingentilli\nunquadragintaquingentilli\nduoquadragintaquingentilli\ntresquadragintaquingentilli\nquattuorquadragintaquingentilli\nquinquaquadragintaquingentilli\nsesquadragintaquingentilli\nseptenquadragintaquingentilli\noctoquadragintaquingentilli\nnovenquadragintaquingentilli\nquinquagintaquingentilli\nunquinquagintaquingentilli\nduoquinquagintaquingentilli\ntresquinquagintaquingentilli\nquattuorquinquagintaquingentilli\nquinquaquinquagintaquingentilli\nsesquinquagintaquingentilli\nseptenquinquagintaquingentilli\noctoquinquagintaquingentilli\nnovenquinquagintaquingentilli\nsexagintaquingentilli\nunsexagintaquingentilli\nduosexagintaquingentilli\ntresexagintaquingentilli\nquattuorsexagintaquingentilli\nquinquasexagintaquingentilli\nsesexagintaquingentilli\nseptensexagintaquingentilli\noctosexagintaquingentilli\nnovensexagintaquingentilli\nseptuagintaquingentilli\nunseptuagintaquingentilli\nduoseptuagintaquingentilli\ntreseptuagintaquingentilli\nquattuorseptuagintaquingentilli\nquinquaseptuagintaquingentilli\nseseptuagintaquingentilli\nseptenseptuagintaquingentilli\noctoseptuagintaquingentilli\nnovenseptuagintaquingentilli\noctogintaquingentilli\nunoctogintaquingentilli\nduooctogintaquingentilli\ntresoctogintaquingentilli\nquattuoroctogintaquingentilli\nquinquaoctogintaquingentilli\nsexoctogintaquingentilli\nseptemoctogintaquingentilli\noctooctogintaquingentilli\nnovemoctogintaquingentilli\nnonagintaquingentilli\nunnonagintaquingentilli\nduononagintaquingentilli\ntresnonagintaquingentilli\nquattuornonagintaquingentilli\nquinquanonagintaquingentilli\nsesnonagintaquingentilli\nseptennonagintaquingentilli\noctononagintaquingentilli\nnovennonagintaquingentilli\nsescentilli\nunsescentilli\nduosescentilli\ntresescentilli\nquattuorsescentilli\nquinquasescentilli\nsesescentilli\nseptensescentilli\noctosescentilli\nnovensescentilli\ndecisescentilli\nundecisescentilli\nduodecisescentilli\ntredecisescentilli\nquattuordecisescentilli\nquinquadecisescentilli\nsedecisescentilli\nseptendecisescentilli\noctodecisescentilli\nnovendecisescentilli\nvigintisescentilli\nunvigintisescentilli\nduovigintisescentilli\ntresvigintisescentilli\nquattuorvigintisescentilli\nquinquavigintisescentilli\nsesvigintisescentilli\nseptemvigintisescentilli\noctovigintisescentilli\nnovemvigintisescentilli\ntrigintasescentilli\nuntrigintasescentilli\nduotrigintasescentilli\ntrestrigintasescentilli\nquattuortrigintasescentilli\nquinquatrigintasescentilli\nsestrigintasescentilli\nseptentrigintasescentilli\noctotrigintasescentilli\nnoventrigintasescentilli\nquadragintasescentilli\nunquadragintasescentilli\nduoquadragintasescentilli\ntresquadragintasescentilli\nquattuorquadragintasescentilli\nquinquaquadragintasescentilli\nsesquadragintasescentilli\nseptenquadragintasescentilli\noctoquadragintasescentilli\nnovenquadragintasescentilli\nquinquagintasescentilli\nunquinquagintasescentilli\nduoquinquagintasescentilli\ntresquinquagintasescentilli\nquattuorquinquagintasescentilli\nquinquaquinquagintasescentilli\nsesquinquagintasescentilli\nseptenquinquagintasescentilli\noctoquinquagintasescentilli\nnovenquinquagintasescentilli\nsexagintasescentilli\nunsexagintasescentilli\nduosexagintasescentilli\ntresexagintasescentilli\nquattuorsexagintasescentilli\nquinquasexagintasescentilli\nsesexagintasescentilli\nseptensexagintasescentilli\noctosexagintasescentilli\nnovensexagintasescentilli\nseptuagintasescentilli\nunseptuagintasescentilli\nduoseptuagintasescentilli\ntreseptuagintasescentilli\nquattuorseptuagintasescentilli\nquinquaseptuagintasescentilli\nseseptuagintasescentilli\nseptenseptuagintasescentilli\noctoseptuagintasescentilli\nnovenseptuagintasescentilli\noctogintasescentilli\nunoctogintasescentilli\nduooctogintasescentilli\ntresoctogintasescentilli\nquattuoroctogintasescentilli\nquinquaoctogintasescentilli\nsexoctogintasescentilli\nseptemoctogintasescentilli\noctooctogintasescentilli\nnovemoctogintasescentilli\nnonagintasescentilli\nunnonagintasescentilli\nduononagintasescentilli\ntrenonagintasescentilli\nquattuornonagintasescentilli\nquinquanonagintasescentilli\nsenonagintasescentilli\nseptennonagintasescentilli\noctononagintasescentilli\nnovennonagintasescentilli\nseptingentilli\nunseptingentilli\nduoseptingentilli\ntreseptingentilli\nquattuorseptingentilli\nquinquaseptingentilli\nseseptingentilli\nseptenseptingentilli\noctoseptingentilli\nnovenseptingentilli\ndeciseptingentilli\nundeciseptingentilli\nduodeciseptingentilli\ntredeciseptingentilli\nquattuordeciseptingentilli\nquinquadeciseptingentilli\nsedeciseptingentilli\nseptendeciseptingentilli\noctodeciseptingentilli\nnovendeciseptingentilli\nvigintiseptingentilli\nunvigintiseptingentilli\nduovigintiseptingentilli\ntresvigintiseptingentilli\nquattuorvigintiseptingentilli\nquinquavigintiseptingentilli\nsesvigintiseptingentilli\nseptemvigintiseptingentilli\noctovigintiseptingentilli\nnovemvigintiseptingentilli\ntrigintaseptingentilli\nuntrigintaseptingentilli\nduotrigintaseptingentilli\ntrestrigintaseptingentilli\nquattuortrigintaseptingentilli\nquinquatrigintaseptingentilli\nsestrigintaseptingentilli\nseptentrigintaseptingentilli\noctotrigintaseptingentilli\nnoventrigintaseptingentilli\nquadragintaseptingentilli\nunquadragintaseptingentilli\nduoquadragintaseptingentilli\ntresquadragintaseptingentilli\nquattuorquadragintaseptingentilli\nquinquaquadragintaseptingentilli\nsesquadragintaseptingentilli\nseptenquadragintaseptingentilli\noctoquadragintaseptingentilli\nnovenquadragintaseptingentilli\nquinquagintaseptingentilli\nunquinquagintaseptingentilli\nduoquinquagintaseptingentilli\ntresquinquagintaseptingentilli\nquattuorquinquagintaseptingentilli\nquinquaquinquagintaseptingentilli\nsesquinquagintaseptingentilli\nseptenquinquagintaseptingentilli\noctoquinquagintaseptingentilli\nnovenquinquagintaseptingentilli\nsexagintaseptingentilli\nunsexagintaseptingentilli\nduosexagintaseptingentilli\ntresexagintaseptingentilli\nquattuorsexagintaseptingentilli\nquinquasexagintaseptingentilli\nsesexagintaseptingentilli\nseptensexagintaseptingentilli\noctosexagintaseptingentilli\nnovensexagintaseptingentilli\nseptuagintaseptingentilli\nunseptuagintaseptingentilli\nduoseptuagintaseptingentilli\ntreseptuagintaseptingentilli\nquattuorseptuagintaseptingentilli\nquinquaseptuagintaseptingentilli\nseseptuagintaseptingentilli\nseptenseptuagintaseptingentilli\noctoseptuagintaseptingentilli\nnovenseptuagintaseptingentilli\noctogintaseptingentilli\nunoctogintaseptingentilli\nduooctogintaseptingentilli\ntresoctogintaseptingentilli\nquattuoroctogintaseptingentilli\nquinquaoctogintaseptingentilli\nsexoctogintaseptingentilli\nseptemoctogintaseptingentilli\noctooctogintaseptingentilli\nnovemoctogintaseptingentilli\nnonagintaseptingentilli\nunnonagintaseptingentilli\nduononagintaseptingentilli\ntrenonagintaseptingentilli\nquattuornonagintaseptingentilli\nquinquanonagintaseptingentilli\nsenonagintaseptingentilli\nseptennonagintaseptingentilli\noctononagintaseptingentilli\nnovennonagintaseptingentilli\noctingentilli\nunoctingentilli\nduooctingentilli\ntresoctingentilli\nquattuoroctingentilli\nquinquaoctingentilli\nsexoctingentilli\nseptemoctingentilli\noctooctingentilli\nnovemoctingentilli\ndecioctingentilli\nundecioctingentilli\nduodecioctingentilli\ntredecioctingentilli\nquattuordecioctingentilli\nquinquadecioctingentilli\nsedecioctingentilli\nseptendecioctingentilli\noctodecioctingentilli\nnovendecioctingentilli\nvigintioctingentilli\nunvigintioctingentilli\nduovigintioctingentilli\ntresvigintioctingentilli\nquattuorvigintioctingentilli\nquinquavigintioctingentilli\nsesvigintioctingentilli\nseptemvigintioctingentilli\noctovigintioctingentilli\nnovemvigintioctingentilli\ntrigintaoctingentilli\nuntrigintaoctingentilli\nduotrigintaoctingentilli\ntrestrigintaoctingentilli\nquattuortrigintaoctingentilli\nquinquatrigintaoctingentilli\nsestrigintaoctingentilli\nseptentrigintaoctingentilli\noctotrigintaoctingentilli\nnoventrigintaoctingentilli\nquadragintaoctingentilli\nunquadragintaoctingentilli\nduoquadragintaoctingentilli\ntresquadragintaoctingentilli\nquattuorquadragintaoctingentilli\nquinquaquadragintaoctingentilli\nsesquadragintaoctingentilli\nseptenquadragintaoctingentilli\noctoquadragintaoctingentilli\nnovenquadragintaoctingentilli\nquinquagintaoctingentilli\nunquinquagintaoctingentilli\nduoquinquagintaoctingentilli\ntresquinquagintaoctingentilli\nquattuorquinquagintaoctingentilli\nquinquaquinquagintaoctingentilli\nsesquinquagintaoctingentilli\nseptenquinquagintaoctingentilli\noctoquinquagintaoctingentilli\nnovenquinquagintaoctingentilli\nsexagintaoctingentilli\nunsexagintaoctingentilli\nduosexagintaoctingentilli\ntresexagintaoctingentilli\nquattuorsexagintaoctingentilli\nquinquasexagintaoctingentilli\nsesexagintaoctingentilli\nseptensexagintaoctingentilli\noctosexagintaoctingentilli\nnovensexagintaoctingentilli\nseptuagintaoctingentilli\nunseptuagintaoctingentilli\nduoseptuagintaoctingentilli\ntreseptuagintaoctingentilli\nquattuorseptuagintaoctingentilli\nquinquaseptuagintaoctingentilli\nseseptuagintaoctingentilli\nseptenseptuagintaoctingentilli\noctoseptuagintaoctingentilli\nnovenseptuagintaoctingentilli\noctogintaoctingentilli\nunoctogintaoctingentilli\nduooctogintaoctingentilli\ntresoctogintaoctingentilli\nquattuoroctogintaoctingentilli\nquinquaoctogintaoctingentilli\nsexoctogintaoctingentilli\nseptemoctogintaoctingentilli\noctooctogintaoctingentilli\nnovemoctogintaoctingentilli\nnonagintaoctingentilli\nunnonagintaoctingentilli\nduononagintaoctingentilli\ntresnonagintaoctingentilli\nquattuornonagintaoctingentilli\nquinquanonagintaoctingentilli\nsexnonagintaoctingentilli\nseptemnonagintaoctingentilli\noctononagintaoctingentilli\nnovemnonagintaoctingentilli\nnongentilli\nunnongentilli\nduonongentilli\ntrenongentilli\nquattuornongentilli\nquinquanongentilli\nsenongentilli\nseptenongentilli\noctonongentilli\nnovenongentilli\ndecinongentilli\nundecinongentilli\nduodecinongentilli\ntredecinongentilli\nquattuordecinongentilli\nquinquadecinongentilli\nsedecinongentilli\nseptendecinongentilli\noctodecinongentilli\nnovendecinongentilli\nvigintinongentilli\nunvigintinongentilli\nduovigintinongentilli\ntresvigintinongentilli\nquattuorvigintinongentilli\nquinquavigintinongentilli\nsesvigintinongentilli\nseptemvigintinongentilli\noctovigintinongentilli\nnovemvigintinongentilli\ntrigintanongentilli\nuntrigintanongentilli\nduotrigintanongentilli\ntrestrigintanongentilli\nquattuortrigintanongentilli\nquinquatrigintanongentilli\nsestrigintanongentilli\nseptentrigintanongentilli\noctotrigintanongentilli\nnoventrigintanongentilli\nquadragintanongentilli\nunquadragintanongentilli\nduoquadragintanongentilli\ntresquadragintanongentilli\nquattuorquadragintanongentilli\nquinquaquadragintanongentilli\nsesquadragintanongentilli\nseptenquadragintanongentilli\noctoquadragintanongentilli\nnovenquadragintanongentilli\nquinquagintanongentilli\nunquinquagintanongentilli\nduoquinquagintanongentilli\ntresquinquagintanongentilli\nquattuorquinquagintanongentilli\nquinquaquinquagintanongentilli\nsesquinquagintanongentilli\nseptenquinquagintanongentilli\noctoquinquagintanongentilli\nnovenquinquagintanongentilli\nsexagintanongentilli\nunsexagintanongentilli\nduosexagintanongentilli\ntresexagintanongentilli\nquattuorsexagintanongentilli\nquinquasexagintanongentilli\nsesexagintanongentilli\nseptensexagintanongentilli\noctosexagintanongentilli\nnovensexagintanongentilli\nseptuagintanongentilli\nunseptuagintanongentilli\nduoseptuagintanongentilli\ntreseptuagintanongentilli\nquattuorseptuagintanongentilli\nquinquaseptuagintanongentilli\nseseptuagintanongentilli\nseptenseptuagintanongentilli\noctoseptuagintanongentilli\nnovenseptuagintanongentilli\noctogintanongentilli\nunoctogintanongentilli\nduooctogintanongentilli\ntresoctogintanongentilli\nquattuoroctogintanongentilli\nquinquaoctogintanongentilli\nsexoctogintanongentilli\nseptemoctogintanongentilli\noctooctogintanongentilli\nnovemoctogintanongentilli\nnonagintanongentilli\nunnonagintanongentilli\nduononagintanongentilli\ntrenonagintanongentilli\nquattuornonagintanongentilli\nquinquanonagintanongentilli\nsenonagintanongentilli\nseptenonagintanongentilli\noctononagintanongentilli\nnovenonagintanongentilli'
+
+_chunk_prefix_7 = 'nilli\nmilli\nbilli\ntrilli\nquadrilli\nquintilli\nsextilli\nseptilli\noctilli\nnonilli\ndecilli\nundecilli\nduodecilli\ntredecilli\nquattuordecilli\nquinquadecilli\nsedecilli\nseptendecilli\noctodecilli\nnovendecilli\nvigintilli\nunvigintilli\nduovigintilli\ntresvigintilli\nquattuorvigintilli\nquinquavigintilli\nsesvigintilli\nseptemvigintilli\noctovigintilli\nnovemvigintilli\ntrigintilli\nuntrigintilli\nduotrigintilli\ntrestrigintilli\nquattuortrigintilli\nquinquatrigintilli\nsestrigintilli\nseptentrigintilli\noctotrigintilli\nnoventrigintilli\nquadragintilli\nunquadragintilli\nduoquadragintilli\ntresquadragintilli\nquattuorquadragintilli\nquinquaquadragintilli\nsesquadragintilli\nseptenquadragintilli\noctoquadragintilli\nnovenquadragintilli\nquinquagintilli\nunquinquagintilli\nduoquinquagintilli\ntresquinquagintilli\nquattuorquinquagintilli\nquinquaquinquagintilli\nsesquinquagintilli\nseptenquinquagintilli\noctoquinquagintilli\nnovenquinquagintilli\nsexagintilli\nunsexagintilli\nduosexagintilli\ntresexagintilli\nquattuorsexagintilli\nquinquasexagintilli\nsesexagintilli\nseptensexagintilli\noctosexagintilli\nnovensexagintilli\nseptuagintilli\nunseptuagintilli\nduoseptuagintilli\ntreseptuagintilli\nquattuorseptuagintilli\nquinquaseptuagintilli\nseseptuagintilli\nseptenseptuagintilli\noctoseptuagintilli\nnovenseptuagintilli\noctogintilli\nunoctogintilli\nduooctogintilli\ntresoctogintilli\nquattuoroctogintilli\nquinquaoctogintilli\nsexoctogintilli\nseptemoctogintilli\noctooctogintilli\nnovemoctogintilli\nnonagintilli\nunnonagintilli\nduononagintilli\ntrenonagintilli\nquattuornonagintilli\nquinquanonagintilli\nsenonagintilli\nseptenonagintilli\noctononagintilli\nnovenonagintilli\ncentilli\nuncentilli\nduocentilli\ntrescentilli\nquattuorcentilli\nquinquacentilli\nsexcentilli\nseptencentilli\noctocentilli\nnovencentilli\ndecicentilli\nundecicentilli\nduodecicentilli\ntredecicentilli\nquattuordecicentilli\nquinquadecicentilli\nsedecicentilli\nseptendecicentilli\noctodecicentilli\nnovendecicentilli\nviginticentilli\nunviginticentilli\nduoviginticentilli\ntresviginticentilli\nquattuorviginticentilli\nquinquaviginticentilli\nsesviginticentilli\nseptemviginticentilli\noctoviginticentilli\nnovemviginticentilli\ntrigintacentilli\nuntrigintacentilli\nduotrigintacentilli\ntrestrigintacentilli\nquattuortrigintacentilli\nquinquatrigintacentilli\nsestrigintacentilli\nseptentrigintacentilli\noctotrigintacentilli\nnoventrigintacentilli\nquadragintacentilli\nunquadragintacentilli\nduoquadragintacentilli\ntresquadragintacentilli\nquattuorquadragintacentilli\nquinquaquadragintacentilli\nsesquadragintacentilli\nseptenquadragintacentilli\noctoquadragintacentilli\nnovenquadragintacentilli\nquinquagintacentilli\nunquinquagintacentilli\nduoquinquagintacentilli\ntresquinquagintacentilli\nquattuorquinquagintacentilli\nquinquaquinquagintacentilli\nsesquinquagintacentilli\nseptenquinquagintacentilli\noctoquinquagintacentilli\nnovenquinquagintacentilli\nsexagintacentilli\nunsexagintacentilli\nduosexagintacentilli\ntresexagintacentilli\nquattuorsexagintacentilli\nquinquasexagintacentilli\nsesexagintacentilli\nseptensexagintacentilli\noctosexagintacentilli\nnovensexagintacentilli\nseptuagintacentilli\nunseptuagintacentilli\nduoseptuagintacentilli\ntreseptuagintacentilli\nquattuorseptuagintacentilli\nquinquaseptuagintacentilli\nseseptuagintacentilli\nseptenseptuagintacentilli\noctoseptuagintacentilli\nnovenseptuagintacentilli\noctogintacentilli\nunoctogintacentilli\nduooctogintacentilli\ntresoctogintacentilli\nquattuoroctogintacentilli\nquinquaoctogintacentilli\nsexoctogintacentilli\nseptemoctogintacentilli\noctooctogintacentilli\nnovemoctogintacentilli\nnonagintacentilli\nunnonagintacentilli\nduononagintacentilli\ntresnonagintacentilli\nquattuornonagintacentilli\nquinquanonagintacentilli\nsexnonagintacentilli\nseptennonagintacentilli\noctononagintacentilli\nnovennonagintacentilli\nducentilli\nunducentilli\nduoducentilli\ntreducentilli\nquattuorducentilli\nquinquaducentilli\nseducentilli\nseptenducentilli\noctoducentilli\nnovenducentilli\ndeciducentilli\nundeciducentilli\nduodeciducentilli\ntredeciducentilli\nquattuordeciducentilli\nquinquadeciducentilli\nsedeciducentilli\nseptendeciducentilli\noctodeciducentilli\nnovendeciducentilli\nvigintiducentilli\nunvigintiducentilli\nduovigintiducentilli\ntresvigintiducentilli\nquattuorvigintiducentilli\nquinquavigintiducentilli\nsesvigintiducentilli\nseptemvigintiducentilli\noctovigintiducentilli\nnovemvigintiducentilli\ntrigintaducentilli\nuntrigintaducentilli\nduotrigintaducentilli\ntrestrigintaducentilli\nquattuortrigintaducentilli\nquinquatrigintaducentilli\nsestrigintaducentilli\nseptentrigintaducentilli\noctotrigintaducentilli\nnoventrigintaducentilli\nquadragintaducentilli\nunquadragintaducentilli\nduoquadragintaducentilli\ntresquadragintaducentilli\nquattuorquadragintaducentilli\nquinquaquadragintaducentilli\nsesquadragintaducentilli\nseptenquadragintaducentilli\noctoquadragintaducentilli\nnovenquadragintaducentilli\nquinquagintaducentilli\nunquinquagintaducentilli\nduoquinquagintaducentilli\ntresquinquagintaducentilli\nquattuorquinquagintaducentilli\nquinquaquinquagintaducentilli\nsesquinquagintaducentilli\nseptenquinquagintaducentilli\noctoquinquagintaducentilli\nnovenquinquagintaducentilli\nsexagintaducentilli\nunsexagintaducentilli\nduosexagintaducentilli\ntresexagintaducentilli\nquattuorsexagintaducentilli\nquinquasexagintaducentilli\nsesexagintaducentilli\nseptensexagintaducentilli\noctosexagintaducentilli\nnovensexagintaducentilli\nseptuagintaducentilli\nunseptuagintaducentilli\nduoseptuagintaducentilli\ntreseptuagintaducentilli\nquattuorseptuagintaducentilli\nquinquaseptuagintaducentilli\nseseptuagintaducentilli\nseptenseptuagintaducentilli\noctoseptuagintaducentilli\nnovenseptuagintaducentilli\noctogintaducentilli\nunoctogintaducentilli\nduooctogintaducentilli\ntresoctogintaducentilli\nquattuoroctogintaducentilli\nquinquaoctogintaducentilli\nsexoctogintaducentilli\nseptemoctogintaducentilli\noctooctogintaducentilli\nnovemoctogintaducentilli\nnonagintaducentilli\nunnonagintaducentilli\nduononagintaducentilli\ntrenonagintaducentilli\nquattuornonagintaducentilli\nquinquanonagintaducentilli\nsenonagintaducentilli\nseptennonagintaducentilli\noctononagintaducentilli\nnovennonagintaducentilli\ntrecentilli\nuntrecentilli\nduotrecentilli\ntrestrecentilli\nquattuortrecentilli\nquinquatrecentilli\nsestrecentilli\nseptentrecentilli\noctotrecentilli\nnoventrecentilli\ndecitrecentilli\nundecitrecentilli\nduodecitrecentilli\ntredecitrecentilli\nquattuordecitrecentilli\nquinquadecitrecentilli\nsedecitrecentilli\nseptendecitrecentilli\noctodecitrecentilli\nnovendecitrecentilli\nvigintitrecentilli\nunvigintitrecentilli\nduovigintitrecentilli\ntresvigintitrecentilli\nquattuorvigintitrecentilli\nquinquavigintitrecentilli\nsesvigintitrecentilli\nseptemvigintitrecentilli\noctovigintitrecentilli\nnovemvigintitrecentilli\ntrigintatrecentilli\nuntrigintatrecentilli\nduotrigintatrecentilli\ntrestrigintatrecentilli\nquattuortrigintatrecentilli\nquinquatrigintatrecentilli\nsestrigintatrecentilli\nseptentrigintatrecentilli\noctotrigintatrecentilli\nnoventrigintatrecentilli\nquadragintatrecentilli\nunquadragintatrecentilli\nduoquadragintatrecentilli\ntresquadragintatrecentilli\nquattuorquadragintatrecentilli\nquinquaquadragintatrecentilli\nsesquadragintatrecentilli\nseptenquadragintatrecentilli\noctoquadragintatrecentilli\nnovenquadragintatrecentilli\nquinquagintatrecentilli\nunquinquagintatrecentilli\nduoquinquagintatrecentilli\ntresquinquagintatrecentilli\nquattuorquinquagintatrecentilli\nquinquaquinquagintatrecentilli\nsesquinquagintatrecentilli\nseptenquinquagintatrecentilli\noctoquinquagintatrecentilli\nnovenquinquagintatrecentilli\nsexagintatrecentilli\nunsexagintatrecentilli\nduosexagintatrecentilli\ntresexagintatrecentilli\nquattuorsexagintatrecentilli\nquinquasexagintatrecentilli\nsesexagintatrecentilli\nseptensexagintatrecentilli\noctosexagintatrecentilli\nnovensexagintatrecentilli\nseptuagintatrecentilli\nunseptuagintatrecentilli\nduoseptuagintatrecentilli\ntreseptuagintatrecentilli\nquattuorseptuagintatrecentilli\nquinquaseptuagintatrecentilli\nseseptuagintatrecentilli\nseptenseptuagintatrecentilli\noctoseptuagintatrecentilli\nnovenseptuagintatrecentilli\noctogintatrecentilli\nunoctogintatrecentilli\nduooctogintatrecentilli\ntresoctogintatrecentilli\nquattuoroctogintatrecentilli\nquinquaoctogintatrecentilli\nsexoctogintatrecentilli\nseptemoctogintatrecentilli\noctooctogintatrecentilli\nnovemoctogintatrecentilli\nnonagintatrecentilli\nunnonagintatrecentilli\nduononagintatrecentilli\ntresnonagintatrecentilli\nquattuornonagintatrecentilli\nquinquanonagintatrecentilli\nsesnonagintatrecentilli\nseptennonagintatrecentilli\noctononagintatrecentilli\nnovennonagintatrecentilli\nquadringentilli\nunquadringentilli\nduoquadringentilli\ntresquadringentilli\nquattuorquadringentilli\nquinquaquadringentilli\nsesquadringentilli\nseptenquadringentilli\noctoquadringentilli\nnovenquadringentilli\ndeciquadringentilli\nundeciquadringentilli\nduodeciquadringentilli\ntredeciquadringentilli\nquattuordeciquadringentilli\nquinquadeciquadringentilli\nsedeciquadringentilli\nseptendeciquadringentilli\noctodeciquadringentilli\nnovendeciquadringentilli\nvigintiquadringentilli\nunvigintiquadringentilli\nduovigintiquadringentilli\ntresvigintiquadringentilli\nquattuorvigintiquadringentilli\nquinquavigintiquadringentilli\nsesvigintiquadringentilli\nseptemvigintiquadringentilli\noctovigintiquadringentilli\nnovemvigintiquadringentilli\ntrigintaquadringentilli\nuntrigintaquadringentilli\nduotrigintaquadringentilli\ntrestrigintaquadringentilli\nquattuortrigintaquadringentilli\nquinquatrigintaquadringentilli\nsestrigintaquadringentilli\nseptentrigintaquadringentilli\noctotrigintaquadringentilli\nnoventrigintaquadringentilli\nquadragintaquadringentilli\nunquadragintaquadringentilli\nduoquadragintaquadringentilli\ntresquadragintaquadringentilli\nquattuorquadragintaquadringentilli\nquinquaquadragintaquadringentilli\nsesquadragintaquadringentilli\nseptenquadragintaquadringentilli\noctoquadragintaquadringentilli\nnovenquadragintaquadringentilli\nquinquagintaquadringentilli\nunquinquagintaquadringentilli\nduoquinquagintaquadringentilli\ntresquinquagintaquadringentilli\nquattuorquinquagintaquadringentilli\nquinquaquinquagintaquadringentilli\nsesquinquagintaquadringentilli\nseptenquinquagintaquadringentilli\noctoquinquagintaquadringentilli\nnovenquinquagintaquadringentilli\nsexagintaquadringentilli\nunsexagintaquadringentilli\nduosexagintaquadringentilli\ntresexagintaquadringentilli\nquattuorsexagintaquadringentilli\nquinquasexagintaquadringentilli\nsesexagintaquadringentilli\nseptensexagintaquadringentilli\noctosexagintaquadringentilli\nnovensexagintaquadringentilli\nseptuagintaquadringentilli\nunseptuagintaquadringentilli\nduoseptuagintaquadringentilli\ntreseptuagintaquadringentilli\nquattuorseptuagintaquadringentilli\nquinquaseptuagintaquadringentilli\nseseptuagintaquadringentilli\nseptenseptuagintaquadringentilli\noctoseptuagintaquadringentilli\nnovenseptuagintaquadringentilli\noctogintaquadringentilli\nunoctogintaquadringentilli\nduooctogintaquadringentilli\ntresoctogintaquadringentilli\nquattuoroctogintaquadringentilli\nquinquaoctogintaquadringentilli\nsexoctogintaquadringentilli\nseptemoctogintaquadringentilli\noctooctogintaquadringentilli\nnovemoctogintaquadringentilli\nnonagintaquadringentilli\nunnonagintaquadringentilli\nduononagintaquadringentilli\ntresnonagintaquadringentilli\nquattuornonagintaquadringentilli\nquinquanonagintaquadringentilli\nsesnonagintaquadringentilli\nseptennonagintaquadringentilli\noctononagintaquadringentilli\nnovennonagintaquadringentilli\nquingentilli\nunquingentilli\nduoquingentilli\ntresquingentilli\nquattuorquingentilli\nquinquaquingentilli\nsesquingentilli\nseptenquingentilli\noctoquingentilli\nnovenquingentilli\ndeciquingentilli\nundeciquingentilli\nduodeciquingentilli\ntredeciquingentilli\nquattuordeciquingentilli\nquinquadeciquingentilli\nsedeciquingentilli\nseptendeciquingentilli\noctodeciquingentilli\nnovendeciquingentilli\nvigintiquingentilli\nunvigintiquingentilli\nduovigintiquingentilli\ntresvigintiquingentilli\nquattuorvigintiquingentilli\nquinquavigintiquingentilli\nsesvigintiquingentilli\nseptemvigintiquingentilli\noctovigintiquingentilli\nnovemvigintiquingentilli\ntrigintaquingentilli\nuntrigintaquingentilli\nduotrigintaquingentilli\ntrestrigintaquingentilli\nquattuortrigintaquingentilli\nquinquatrigintaquingentilli\nsestrigintaquingentilli\nseptentrigintaquingentilli\noctotrigintaquingentilli\nnoventrigintaquingentilli\nquadragintaquingentilli\nunquadragintaquingentilli\nduoquadragintaquingentilli\ntresquadragintaquingentilli\nquattuorquadragintaquingentilli\nquinquaquadragintaquingentilli\nsesquadragintaquingentilli\nseptenquadragintaquingentilli\noctoquadragintaquingentilli\nnovenquadragintaquingentilli\nquinquagintaquingentilli\nunquinquagintaquingentilli\nduoquinquagintaquingentilli\ntresquinquagintaquingentilli\nquattuorquinquagintaquingentilli\nquinquaquinquagintaquingentilli\nsesquinquagintaquingentilli\nseptenquinquagintaquingentilli\noctoquinquagintaquingentilli\nnovenquinquagintaquingentilli\nsexagintaquingentilli\nunsexagintaquingentilli\nduosexagintaquingentilli\ntresexagintaquingentilli\nquattuorsexagintaquingentilli\nquinquasexagintaquingentilli\nsesexagintaquingentilli\nseptensexagintaquingentilli\noctosexagintaquingentilli\nnovensexagintaquingentilli\nseptuagintaquingentilli\nunseptuagintaquingentilli\nduoseptuagintaquingentilli\ntreseptuagintaquingentilli\nquattuorseptuagintaquingentilli\nquinquaseptuagintaquingentilli\nseseptuagintaquingentilli\nseptenseptuagintaquingentilli\noctoseptuagintaquingentilli\nnovenseptuagintaquingentilli\noctogintaquingentilli\nunoctogintaquingentilli\nduooctogintaquingentilli\ntresoctogintaquingentilli\nquattuoroctogintaquingentilli\nquinquaoctogintaquingentilli\nsexoctogintaquingentilli\nseptemoctogintaquingentilli\noctooctogintaquingentilli\nnovemoctogintaquingentilli\nnonagintaquingentilli\nunnonagintaquingentilli\nduononagintaquingentilli\ntresnonagintaquingentilli\nquattuornonagintaquingentilli\nquinquanonagintaquingentilli\nsesnonagintaquingentilli\nseptennonagintaquingentilli\noctononagintaquingentilli\nnovennonagintaquingentilli\nsescentilli\nunsescentilli\nduosescentilli\ntresescentilli\nquattuorsescentilli\nquinquasescentilli\nsesescentilli\nseptensescentilli\noctosescentilli\nnovensescentilli\ndecisescentilli\nundecisescentilli\nduodecisescentilli\ntredecisescentilli\nquattuordecisescentilli\nquinquadecisescentilli\nsedecisescentilli\nseptendecisescentilli\noctodecisescentilli\nnovendecisescentilli\nvigintisescentilli\nunvigintisescentilli\nduovigintisescentilli\ntresvigintisescentilli\nquattuorvigintisescentilli\nquinquavigintisescentilli\nsesvigintisescentilli\nseptemvigintisescentilli\noctovigintisescentilli\nnovemvigintisescentilli\ntrigintasescentilli\nuntrigintasescentilli\nduotrigintasescentilli\ntrestrigintasescentilli\nquattuortrigintasescentilli\nquinquatrigintasescentilli\nsestrigintasescentilli\nseptentrigintasescentilli\noctotrigintasescentilli\nnoventrigintasescentilli\nquadragintasescentilli\nunquadragintasescentilli\nduoquadragintasescentilli\ntresquadragintasescentilli\nquattuorquadragintasescentilli\nquinquaquadragintasescentilli\nsesquadragintasescentilli\nseptenquadragintasescentilli\noctoquadragintasescentilli\nnovenquadragintasescentilli\nquinquagintasescentilli\nunquinquagintasescentilli\nduoquinquagintasescentilli\ntresquinquagintasescentilli\nquattuorquinquagintasescentilli\nquinquaquinquagintasescentilli\nsesquinquagintasescentilli\nseptenquinquagintasescentilli\noctoquinquagintasescentilli\nnovenquinquagintasescentilli\nsexagintasescentilli\nunsexagintasescentilli\nduosexagintasescentilli\ntresexagintasescentilli\nquattuorsexagintasescentilli\nquinquasexagintasescentilli\nsesexagintasescentilli\nseptensexagintasescentilli\noctosexagintasescentilli\nnovensexagintasescentilli\nseptuagintasescentilli\nunseptuagintasescentilli\nduoseptuagintasescentilli\ntreseptuagintasescentilli\nquattuorseptuagintasescentilli\nquinquaseptuagintasescentilli\nseseptuagintasescentilli\nseptenseptuagintasescentilli\noctoseptuagintasescentilli\nnovenseptuagintasescentilli\noctogintasescentilli\nunoctogintasescentilli\nduooctogintasescentilli\ntresoctogintasescentilli\nquattuoroctogintasescentilli\nquinquaoctogintasescentilli\nsexoctogintasescentilli\nseptemoctogintasescentilli\noctooctogintasescentilli\nnovemoctogintasescentilli\nnonagintasescentilli\nunnonagintasescentilli\nduononagintasescentilli\ntrenonagintasescentilli\nquattuornonagintasescentilli\nquinquanonagintasescentilli\nsenonagintasescentilli\nseptennonagintasescentilli\noctononagintasescentilli\nnovennonagintasescentilli\nseptingentilli\nunseptingentilli\nduoseptingentilli\ntreseptingentilli\nquattuorseptingentilli\nquinquaseptingentilli\nseseptingentilli\nseptenseptingentilli\noctoseptingentilli\nnovenseptingentilli\ndeciseptingentilli\nundeciseptingentilli\nduodeciseptingentilli\ntredeciseptingentilli\nquattuordeciseptingentilli\nquinquadeciseptingentilli\nsedeciseptingentilli\nseptendeciseptingentilli\noctodeciseptingentilli\nnovendeciseptingentilli\nvigintiseptingentilli\nunvigintiseptingentilli\nduovigintiseptingentilli\ntresvigintiseptingentilli\nquattuorvigintiseptingentilli\nquinquavigintiseptingentilli\nsesvigintiseptingentilli\nseptemvigintiseptingentilli\noctovigintiseptingentilli\nnovemvigintiseptingentilli\ntrigintaseptingentilli\nuntrigintaseptingentilli\nduotrigintaseptingentilli\ntrestrigintaseptingentilli\nquattuortrigintaseptingentilli\nquinquatrigintaseptingentilli\nsestrigintaseptingentilli\nseptentrigintaseptingentilli\noctotrigintaseptingentilli\nnoventrigintaseptingentilli\nquadragintaseptingentilli\nunquadragintaseptingentilli\nduoquadragintaseptingentilli\ntresquadragintaseptingentilli\nquattuorquadragintaseptingentilli\nquinquaquadragintaseptingentilli\nsesquadragintaseptingentilli\nseptenquadragintaseptingentilli\noctoquadragintaseptingentilli\nnovenquadragintaseptingentilli\nquinquagintaseptingentilli\nunquinquagintaseptingentilli\nduoquinquagintaseptingentilli\ntresquinquagintaseptingentilli\nquattuorquinquagintaseptingentilli\nquinquaquinquagintaseptingentilli\nsesquinquagintaseptingentilli\nseptenquinquagintaseptingentilli\noctoquinquagintaseptingentilli\nnovenquinquagintaseptingentilli\nsexagintaseptingentilli\nunsexagintaseptingentilli\nduosexagintaseptingentilli\ntresexagintaseptingentilli\nquattuorsexagintaseptingentilli\nquinquasexagintaseptingentilli\nsesexagintaseptingentilli\nseptensexagintaseptingentilli\noctosexagintaseptingentilli\nnovensexagintaseptingentilli\nseptuagintaseptingentilli\nunseptuagintaseptingentilli\nduoseptuagintaseptingentilli\ntreseptuagintaseptingentilli\nquattuorseptuagintaseptingentilli\nquinquaseptuagintaseptingentilli\nseseptuagintaseptingentilli\nseptenseptuagintaseptingentilli\noctoseptuagintaseptingentilli\nnovenseptuagintaseptingentilli\noctogintaseptingentilli\nunoctogintaseptingentilli\nduooctogintaseptingentilli\ntresoctogintaseptingentilli\nquattuoroctogintaseptingentilli\nquinquaoctogintaseptingentilli\nsexoctogintaseptingentilli\nseptemoctogintaseptingentilli\noctooctogintaseptingentilli\nnovemoctogintaseptingentilli\nnonagintaseptingentilli\nunnonagintaseptingentilli\nduononagintaseptingentilli\ntrenonagintaseptingentilli\nquattuornonagintaseptingentilli\nquinquanonagintaseptingentilli\nsenonagintaseptingentilli\nseptennonagintaseptingentilli\noctononagintaseptingentilli\nnovennonagintaseptingentilli\noctingentilli\nunoctingentilli\nduooctingentilli\ntresoctingentilli\nquattuoroctingentilli\nquinquaoctingentilli\nsexoctingentilli\nseptemoctingentilli\noctooctingentilli\nnovemoctingentilli\ndecioctingentilli\nundecioctingentilli\nduodecioctingentilli\ntredecioctingentilli\nquattuordecioctingentilli\nquinquadecioctingentilli\nsedecioctingentilli\nseptendecioctingentilli\noctodecioctingentilli\nnovendecioctingentilli\nvigintioctingentilli\nunvigintioctingentilli\nduovigintioctingentilli\ntresvigintioctingentilli\nquattuorvigintioctingentilli\nquinquavigintioctingentilli\nsesvigintioctingentilli\nseptemvigintioctingentilli\noctovigintioctingentilli\nnovemvigintioctingentilli\ntrigintaoctingentilli\nuntrigintaoctingentilli\nduotrigintaoctingentilli\ntrestrigintaoctingentilli\nquattuortrigintaoctingentilli\nquinquatrigintaoctingentilli\nsestrigintaoctingentilli\nseptentrigintaoctingentilli\noctotrigintaoctingentilli\nnoventrigintaoctingentilli\nquadragintaoctingentilli\nunquadragintaoctingentilli\nduoquadragintaoctingentilli\ntresquadragintaoctingentilli\nquattuorquadragintaoctingentilli\nquinquaquadragintaoctingentilli\nsesquadragintaoctingentilli\nseptenquadragintaoctingentilli\noctoquadragintaoctingentilli\nnovenquadragintaoctingentilli\nquinquagintaoctingentilli\nunquinquagintaoctingentilli\nduoquinquagintaoctingentilli\ntresquinquagintaoctingentilli\nquattuorquinquagintaoctingentilli\nquinquaquinquagintaoctingentilli\nsesquinquagintaoctingentilli\nseptenquinquagintaoctingentilli\noctoquinquagintaoctingentilli\nnovenquinquagintaoctingentilli\nsexagintaoctingentilli\nunsexagintaoctingentilli\nduosexagintaoctingentilli\ntresexagintaoctingentilli\nquattuorsexagintaoctingentilli\nquinquasexagintaoctingentilli\nsesexagintaoctingentilli\nseptensexagintaoctingentilli\noctosexagintaoctingentilli\nnovensexagintaoctingentilli\nseptuagintaoctingentilli\nunseptuagintaoctingentilli\nduoseptuagintaoctingentilli\ntreseptuagintaoctingentilli\nquattuorseptuagintaoctingentilli\nquinquaseptuagintaoctingentilli\nseseptuagintaoctingentilli\nseptenseptuagintaoctingentilli\noctoseptuagintaoctingentilli\nnovenseptuagintaoctingentilli\noctogintaoctingentilli\nunoctogintaoctingentilli\nduooctogintaoctingentilli\ntresoctogintaoctingentilli\nquattuoroctogintaoctingentilli\nquinquaoctogintaoctingentilli\nsexoctogintaoctingentilli\nseptemoctogintaoctingentilli\noctooctogintaoctingentilli\nnovemoctogintaoctingentilli\nnonagintaoctingentilli\nunnonagintaoctingentilli\nduononagintaoctingentilli\ntresnonagintaoctingentilli\nquattuornonagintaoctingentilli\nquinquanonagintaoctingentilli\nsexnonagintaoctingentilli\nseptemnonagintaoctingentilli\noctononagintaoctingentilli\nnovemnonagintaoctingentilli\nnongentilli\nunnongentilli\nduonongentilli\ntrenongentilli\nquattuornongentilli\nquinquanongentilli\nsenongentilli\nseptenongentilli\noctonongentilli\nnovenongentilli\ndecinongentilli\nundecinongentilli\nduodecinongentilli\ntredecinongentilli\nquattuordecinongentilli\nquinquadecinongentilli\nsedecinongentilli\nseptendecinongentilli\noctodecinongentilli\nnovendecinongentilli\nvigintinongentilli\nunvigintinongentilli\nduovigintinongentilli\ntresvigintinongentilli\nquattuorvigintinongentilli\nquinquavigintinongentilli\nsesvigintinongentilli\nseptemvigintinongentilli\noctovigintinongentilli\nnovemvigintinongentilli\ntrigintanongentilli\nuntrigintanongentilli\nduotrigintanongentilli\ntrestrigintanongentilli\nquattuortrigintanongentilli\nquinquatrigintanongentilli\nsestrigintanongentilli\nseptentrigintanongentilli\noctotrigintanongentilli\nnoventrigintanongentilli\nquadragintanongentilli\nunquadragintanongentilli\nduoquadragintanongentilli\ntresquadragintanongentilli\nquattuorquadragintanongentilli\nquinquaquadragintanongentilli\nsesquadragintanongentilli\nseptenquadragintanongentilli\noctoquadragintanongentilli\nnovenquadragintanongentilli\nquinquagintanongentilli\nunquinquagintanongentilli\nduoquinquagintanongentilli\ntresquinquagintanongentilli\nquattuorquinquagintanongentilli\nquinquaquinquagintanongentilli\nsesquinquagintanongentilli\nseptenquinquagintanongentilli\noctoquinquagintanongentilli\nnovenquinquagintanongentilli\nsexagintanongentilli\nunsexagintanongentilli\nduosexagintanongentilli\ntresexagintanongentilli\nquattuorsexagintanongentilli\nquinquasexagintanongentilli\nsesexagintanongentilli\nseptensexagintanongentilli\noctosexagintanongentilli\nnovensexagintanongentilli\nseptuagintanongentilli\nunseptuagintanongentilli\nduoseptuagintanongentilli\ntreseptuagintanongentilli\nquattuorseptuagintanongentilli\nquinquaseptuagintanongentilli\nseseptuagintanongentilli\nseptenseptuagintanongentilli\noctoseptuagintanongentilli\nnovenseptuagintanongentilli\noctogintanongentilli\nunoctogintanongentilli\nduooctogintanongentilli\ntresoctogintanongentilli\nquattuoroctogintanongentilli\nquinquaoctogintanongentilli\nsexoctogintanongentilli\nseptemoctogintanongentilli\noctooctogintanongentilli\nnovemoctogintanongentilli\nnonagintanongentilli\nunnonagintanongentilli\nduononagintanongentilli\ntrenonagintanongentilli\nquattuornonagintanongentilli\nquinquanonagintanongentilli\nsenonagintanongentilli\nseptenonagintanongentilli\noctononagintanongentilli\nnovenonagintanongentilli'
+
+tables = {
+    ('PosIntEngStringifier', 'block', (True,)): _block_0,
+    ('PosIntEngStringifier', 'tail', (True, True)): _tail_1,
+    ('PosIntEngStringifier', 'tail', (True, False)): _tail_2,
+    ('PosIntEngStringifier', 'block', (False,)): _block_3,
+    ('PosIntEngStringifier', 'tail', (False, True)): _tail_4,
+    ('PosIntEngStringifier', 'tail', (False, False)): _tail_5,
+    ('IntEngStringifier', 'block', (True,)): _block_0,
+    ('IntEngStringifier', 'tail', (True, True)): _tail_1,
+    ('IntEngStringifier', 'tail', (True, False)): _tail_2,
+    ('IntEngStringifier', 'block', (False,)): _block_3,
+    ('IntEngStringifier', 'tail', (False, True)): _tail_4,
+    ('IntEngStringifier', 'tail', (False, False)): _tail_5,
+    ('PosIntBaseEngStringifier', 'chunk_prefix', (True,)): _chunk_prefix_6,
+    ('PosIntBaseEngStringifier', 'chunk_prefix', (False,)): _chunk_prefix_7,
+    ('PosIntBaseMaxEngStringifier', 'chunk_prefix', (True,)): _chunk_prefix_6,
+    ('PosIntBaseMaxEngStringifier', 'chunk_prefix', (False,)): _chunk_prefix_7,
+}
@@ -0,0 +1,190 @@
+'''
+Aggregate statistics of the strings of ranges of numbers, computed without
+stringifying any of them.
+
+The string of a number is a concatenation of pieces: stringified blocks, power
+names, separators and 'and's. Pieces never split a word, so the statistics of
+a string are the sum of the statistics of its pieces. Summed over a range, each
+piece is weighted by the number of numbers in the range it occurs in, which is
+counted block by block, so the time taken is linear in the number of blocks
+(i.e. logarithmic in the size of the range).
+'''
+
+from numtowords.stringify import IntEngStringifier
+
+
+class TextStats:
+    '''
+    attrs:
+        numbers: Number of strings.
+        chars: Total number of characters.
+        bytes: Total utf-8 length.
+        letters: Total number of letters.
+        words: Total number of words, i.e. tokens separated by whitespace or
+            commas.
+        word_counts: dict of the number of occurrences of each word.
+    '''
+
+    def __init__(self, numbers=0, chars=0, bytes=0, letters=0, words=0, word_counts=None):
+        self.numbers = numbers
+        self.chars = chars
+        self.bytes = bytes
+        self.letters = letters
+        self.words = words
+        self.word_counts = word_counts if word_counts is not None else {}
+
+    @classmethod
+    def from_str(cls, s, numbers=0):
+        word_counts = {}
+        words = s.replace(',', ' ').split()
+        for word in words:
+            word_counts[word] = word_counts.get(word, 0)+1
+        return cls(numbers, len(s), len(s.encode()), sum(c.isalpha() for c in s), len(words), word_counts)
+
+    def _combine(self, other, sign):
+        word_counts = dict(self.word_counts)
+        for word, count in other.word_counts.items():
+            count = word_counts.get(word, 0)+sign*count
+            if count:
+                word_counts[word] = count
+            else:
+                del word_counts[word]
+        return TextStats(
+            self.numbers+sign*other.numbers, self.chars+sign*other.chars, self.bytes+sign*other.bytes,
+            self.letters+sign*other.letters, self.words+sign*other.words, word_counts
+        )
+
+    def __add__(self, other):
+        return self._combine(other, 1)
+
+    def __sub__(self, other):
+        return self._combine(other, -1)
+
+    def __mul__(self, k):
+        if k == 0:
+            return TextStats()
+        return TextStats(
+            k*self.numbers, k*self.chars, k*self.bytes, k*self.letters, k*self.words,
+            {word: k*count for word, count in self.word_counts.items()}
+        )
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        return isinstance(other, TextStats) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return 'TextStats({})'.format(', '.join('{}={!r}'.format(key, val) for key, val in vars(self).items()))
+
+
+# cumulative statistics of block tables, by stringifier class and format
+_block_stats_tables = {}
+
+
+def _get_block_stats(stringifier):
+    '''
+    returns:
+        (statistics of each block, cumulative statistics of blocks below each
+        block)
+    '''
+    key = (type(stringifier), stringifier.british)
+    try:
+        return _block_stats_tables[key]
+    except KeyError:
+        pass
+    block_stats = [TextStats.from_str(block_str) for block_str in stringifier._get_block_table()]
+    cum_stats = [TextStats()]
+    for stats in block_stats:
+        cum_stats.append(cum_stats[-1]+stats)
+    return _block_stats_tables.setdefault(key, (block_stats, cum_stats))
+
+
+def _count_block(n, power, lo, hi):
+    '''
+    Count of numbers in [0, n) whose block of the given power is in [lo, hi).
+    '''
+    quot, rem = divmod(n, 1000*power)
+    return quot*power*(hi-lo) + min(max(rem-lo*power, 0), (hi-lo)*power)
+
+
+def _lowest_block(n):
+    while n % 1000 == 0:
+        n //= 1000
+    return n % 1000
+
+
+def _count_merged(n):
+    '''
+    Count of numbers in [1000, n) with a last block in [1, 100), and a second
+    last non-zero block in [1, 100) (i.e. the last block's 'and' has no comma).
+    '''
+    heads, last = divmod(n, 1000)
+    # heads in [1, heads) by the power of their lowest non-zero block
+    count = 0
+    power = 1
+    while power < heads:
+        count += _count_block(-(-heads//power), 1, 1, 100)
+        power *= 1000
+    count *= 99
+    if heads >= 1 and _lowest_block(heads) < 100:
+        count += min(max(last-1, 0), 99)
+    return count
+
+
+def _positive_stats(stringifier, n):
+    '''
+    Statistics of the strings of [1, n).
+    '''
+    if n <= 1:
+        return TextStats()
+    sep = ', ' if stringifier.commas else ' '
+    block_stats, cum_stats = _get_block_stats(stringifier)
+    num_blocks = len(stringifier._split_blocks(n-1))
+    power_strs = stringifier.num_base_stringifier._get_power_strs(num_blocks)
+    res = TextStats(numbers=n-1)
+    non_zero = 0
+    power = 1
+    for i in range(num_blocks):
+        # blocks with coefficients below digit, then the block of digit
+        quot, rem = divmod(n, 1000*power)
+        digit, digit_rem = divmod(rem, power)
+        res += cum_stats[-1]*(quot*power) + cum_stats[digit]*power + block_stats[digit]*digit_rem
+        block_non_zero = n-_count_block(n, power, 0, 1)
+        if i > 0:
+            res += TextStats.from_str(' '+power_strs[i])*block_non_zero
+        non_zero += block_non_zero
+        power *= 1000
+    # every non-zero block but the first is preceded by a separator
+    res += TextStats.from_str(sep)*(non_zero-(n-1))
+    if stringifier.british and n > 1000:
+        infixed = _count_block(n, 1, 1, 100)-_count_block(1000, 1, 1, 100)
+        res += TextStats.from_str(stringifier.infix+' ')*infixed
+        if stringifier.commas:
+            res += (TextStats.from_str(' ')-TextStats.from_str(sep))*_count_merged(n)
+    return res
+
+
+def range_stats(stringifier, start, stop):
+    '''
+    Statistics of the strings of range(start, stop).
+
+    args:
+        stringifier:
+            A PosIntEngStringifier or IntEngStringifier.
+    '''
+    res = TextStats()
+    if stop <= start:
+        return res
+    if isinstance(stringifier, IntEngStringifier):
+        if start < 0:
+            # negatives in [start, min(stop, 0)) have magnitudes in [max(1, 1-stop), 1-start)
+            magnitude_start = max(1, 1-stop)
+            res += _positive_stats(stringifier, 1-start)-_positive_stats(stringifier, magnitude_start)
+            res += TextStats.from_str(stringifier.negative+' ')*(1-start-magnitude_start)
+        if start <= 0 < stop:
+            res += TextStats.from_str(stringifier.zero, numbers=1)
+    elif start < 1:
+        raise ValueError('start')
+    if stop > 1:
+        res += _positive_stats(stringifier, stop)-_positive_stats(stringifier, max(start, 1))
+    return res
@@ -0,0 +1,160 @@
+'''
+Stringify arrays of machine integers at once.
+
+With numpy, the block coefficients, zero masks and 'and'/comma decisions are
+computed for the whole array with vectorized operations, and the strings are
+assembled from the stringifier's tables. Without numpy every integer is
+stringified in turn.
+'''
+
+from numtowords.stringify import IntEngStringifier
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# blocks needed for the largest 64-bit unsigned integer
+max_blocks = 7
+
+# elements stringified at once, which bounds the memory of the intermediate
+# arrays (several times the size of the slice) however large the array is
+slice_size = 2**16
+
+# struct formats of the integers accepted from buffers
+int_formats = {'b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'n', 'N'}
+
+
+def stringify_array(stringifier, values):
+    '''
+    args:
+        stringifier:
+            A PosIntEngStringifier or IntEngStringifier.
+        values:
+            A numpy integer array, any object supporting the buffer
+            protocol with an integer format (e.g. array.array('q') or bytes),
+            or an iterable of integers, of at most 64 bits.
+
+    returns:
+        A list of the strings of values, in (flattened) order.
+    '''
+    if np is None:
+        return [stringifier.stringify(n) for n in _to_list(values)]
+    if isinstance(values, np.ndarray):
+        arr = values.ravel()
+    else:
+        view = _get_int_view(values)
+        arr = np.asarray(view if view is not None else values).ravel()
+    if arr.dtype.kind not in 'iu' or arr.dtype.itemsize > 8:
+        raise ValueError('values')
+    tables = _get_tables(stringifier)
+    res = []
+    for start in range(0, len(arr), slice_size):
+        res.extend(_stringify_slice(stringifier, tables, arr[start:start+slice_size]))
+    return res
+
+
+def _get_tables(stringifier):
+    '''
+    returns:
+        (object arrays of the block strings with the name of their power for
+        each power, object array of the block table)
+    '''
+    sep = ', ' if stringifier.commas else ' '
+    block_table = stringifier._get_block_table()
+    power_strs = stringifier.num_base_stringifier._get_power_strs(max_blocks)
+    power_block_strs = [None] + [
+        _object_array(
+            ['{} {}'.format(block_str, power_strs[i]) if coeff else '' for coeff, block_str in enumerate(block_table)]
+        )
+        for i in range(1, max_blocks)
+    ]
+    return power_block_strs, _object_array(block_table)
+
+
+def _stringify_slice(stringifier, tables, arr):
+    power_block_strs, block_strs = tables
+    if arr.dtype.kind == 'u':
+        negative = np.zeros(len(arr), dtype=bool)
+        mag = arr.astype(np.uint64)
+    else:
+        arr = arr.astype(np.int64)
+        negative = arr < 0
+        # negate in uint64 so the minimum int64 does not overflow
+        mag = arr.astype(np.uint64)
+        mag[negative] = ~mag[negative]+np.uint64(1)
+    zero = mag == 0
+    if not isinstance(stringifier, IntEngStringifier) and (zero.any() or negative.any()):
+        raise ValueError('n')
+
+    coeffs = np.empty((max_blocks, len(arr)), dtype=np.intp)
+    rest = mag.copy()
+    for i in range(max_blocks):
+        coeffs[i] = rest % np.uint64(1000)
+        rest //= np.uint64(1000)
+    non_zero = coeffs != 0
+    # whether there is a non-zero block above each block
+    has_prev = np.zeros_like(non_zero)
+    has_prev[:-1] = np.logical_or.accumulate(non_zero[:0:-1], axis=0)[::-1]
+
+    sep = ', ' if stringifier.commas else ' '
+    res = np.full(len(arr), '', dtype=object)
+    for i in range(max_blocks-1, 0, -1):
+        res += np.where(non_zero[i] & has_prev[i], sep, '')
+        res += power_block_strs[i][coeffs[i]]
+
+    last_coeffs = coeffs[0]
+    has_last_sep = non_zero[0] & has_prev[0]
+    last_seps = np.where(has_last_sep, sep, '').astype(object)
+    if stringifier.british:
+        # the second last non-zero block
+        prev_coeffs = coeffs[np.argmax(non_zero[1:], axis=0)+1, np.arange(len(arr))]
+        has_infix = has_last_sep & (last_coeffs < 100)
+        if stringifier.commas:
+            last_seps[has_infix & (prev_coeffs < 100)] = ' '
+        last_seps[has_infix] += stringifier.infix + ' '
+    res += last_seps
+    res += block_strs[last_coeffs]
+
+    if isinstance(stringifier, IntEngStringifier):
+        res[negative] = stringifier.negative + ' ' + res[negative]
+        res[zero] = stringifier.zero
+    return res.tolist()
+
+
+def _get_int_view(values):
+    '''
+    returns:
+        A memoryview of values, or None if it doesn't support the buffer
+        protocol.
+
+    raises:
+        ValueError if the buffer isn't of integers.
+    '''
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return None
+    if view.format.lstrip('@=<>!') not in int_formats:
+        view.release()
+        raise ValueError('values')
+    return view
+
+
+def _to_list(values):
+    view = _get_int_view(values)
+    if view is not None:
+        with view:
+            return view.tolist()
+    res = list(values)
+    # the same integers as accepted by numpy
+    for n in res:
+        if not isinstance(n, int) or not -2**63 <= n < 2**64:
+            raise ValueError('values')
+    return res
+
+
+def _object_array(strs):
+    res = np.empty(len(strs), dtype=object)
+    res[:] = strs
+    return res
@@ -0,0 +1,33 @@
+'''
+Performance benchmarks, run each module with `python -m`. The whole suite is
+run with `python -m numtowords.bench`, see suite.py.
+'''
+
+import random
+import sys
+import time
+
+
+def timeit(func, *args, min_time=0.2):
+    '''
+    Best time of a single call to func, repeated for at least min_time seconds.
+    '''
+    best = float('inf')
+    total = 0
+    while total < min_time:
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter()-start
+        best = min(best, elapsed)
+        total += elapsed
+    return best
+
+
+def random_int(digits, seed=0):
+    '''
+    A random integer with exactly digits decimal digits.
+    '''
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+    rand = random.Random(seed)
+    return rand.randrange(10**(digits-1), 10**digits)
@@ -0,0 +1,3 @@
+from numtowords.bench import suite
+
+suite.main()
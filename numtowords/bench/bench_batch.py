@@ -0,0 +1,49 @@
+'''
+Compare stringify_array on int64 arrays against a Python loop over
+IntEngStringifier.stringify.
+
+Arrays are generated and stringified a slice at a time with the strings
+dropped, since 10**8 strings wouldn't fit in memory. The loop is timed on at
+most --loop-max elements and scaled to the size, as it takes minutes for the
+largest sizes.
+'''
+
+import argparse
+import time
+from numtowords import batch
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('sizes', type=int, nargs='*', default=[10**6, 10**7, 10**8])
+    arg_parser.add_argument('--slice-size', type=int, default=10**6, help='elements generated and stringified at once')
+    arg_parser.add_argument('--loop-max', type=int, default=10**6, help='most elements the loop is timed on')
+    args = arg_parser.parse_args()
+    if batch.np is None:
+        arg_parser.error('numpy is required')
+    np = batch.np
+
+    stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+    rng = np.random.default_rng(0)
+    print('{:>12} {:>12} {:>12} {:>8}'.format('size', 'loop (s)', 'batch (s)', 'speedup'))
+    for size in args.sizes:
+        loop_time = 0
+        batch_time = 0
+        looped = 0
+        for start in range(0, size, args.slice_size):
+            values = rng.integers(-2**63, 2**63-1, size=min(args.slice_size, size-start), dtype=np.int64)
+            if looped < args.loop_max:
+                loop_values = values[:args.loop_max-looped].tolist()
+                loop_start = time.perf_counter()
+                [stringifier.stringify(n) for n in loop_values]
+                loop_time += time.perf_counter()-loop_start
+                looped += len(loop_values)
+            batch_start = time.perf_counter()
+            batch.stringify_array(stringifier, values)
+            batch_time += time.perf_counter()-batch_start
+        loop_time *= size/looped
+        print('{:>12} {:>12.3g} {:>12.3g} {:>8.2f}'.format(size, loop_time, batch_time, loop_time/batch_time))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+'''
+Throughput of IntEngStringifier.stringify on random 64-bit integers.
+'''
+
+import argparse
+import random
+import time
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier, PosIntBaseMaxEngStringifier
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--count', type=int, default=200000)
+    args = arg_parser.parse_args()
+
+    rand = random.Random(0)
+    nums = [rand.randrange(-2**63, 2**63) for _ in range(args.count)]
+    for name, base_stringifier in (
+        ('base', PosIntBaseEngStringifier()),
+        ('basemax', PosIntBaseMaxEngStringifier(9)),
+    ):
+        for british in (True, False):
+            stringifier = IntEngStringifier(base_stringifier, british=british)
+            start = time.perf_counter()
+            for n in nums:
+                stringifier.stringify(n)
+            elapsed = time.perf_counter()-start
+            print('{:<8} {:<9} {:>12,.0f} numbers/s'.format(name, 'british' if british else 'american', len(nums)/elapsed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+'''
+Peak memory and time of streaming and measuring numbers whose power names
+are long runs of repeated max powers, i.e. PosIntBaseMaxEngStringifier with a
+small max power.
+'''
+
+import argparse
+import io
+import time
+import tracemalloc
+from numtowords.stringify import IntEngStringifier, PosIntBaseMaxEngStringifier
+
+
+class NullWriter(io.TextIOBase):
+    def write(self, s):
+        return len(s)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter()-start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('blocks', type=int, nargs='*', default=[1000, 2000, 4000])
+    arg_parser.add_argument('--max-power', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    stringifier = IntEngStringifier(PosIntBaseMaxEngStringifier(args.max_power))
+    print('{:>8} {:>14} {:>14} {:>14} {:>14}'.format(
+        'blocks', 'write (s)', 'write peak', 'length (s)', 'length peak'
+    ))
+    for num_blocks in args.blocks:
+        # every block non-zero
+        n = (1000**num_blocks-1)//999
+        write_time, write_peak = measure(stringifier.write_stringify, n, NullWriter())
+        length_time, length_peak = measure(stringifier.stringify_length, n)
+        print('{:>8} {:>14.3g} {:>14,} {:>14.3g} {:>14,}'.format(
+            num_blocks, write_time, write_peak, length_time, length_peak
+        ))
+
+if __name__ == '__main__':
+    main()
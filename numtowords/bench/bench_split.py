@@ -0,0 +1,24 @@
+'''
+Compare the divide and conquer block split against repeated division by 1000,
+to find the crossover point.
+'''
+
+import argparse
+from numtowords.bench import random_int, timeit
+from numtowords.stringify import PosIntEngStringifier
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('digits', type=int, nargs='*', default=[30, 100, 300, 1000, 3000, 10000, 30000, 100000])
+    args = arg_parser.parse_args()
+
+    print('{:>10} {:>12} {:>12} {:>8}'.format('digits', 'simple (s)', 'split (s)', 'speedup'))
+    for digits in args.digits:
+        n = random_int(digits)
+        simple_time = timeit(PosIntEngStringifier._split_blocks_simple, n)
+        split_time = timeit(PosIntEngStringifier._split_blocks, n)
+        print('{:>10} {:>12.3g} {:>12.3g} {:>8.2f}'.format(digits, simple_time, split_time, simple_time/split_time))
+
+if __name__ == '__main__':
+    main()
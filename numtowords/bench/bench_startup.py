@@ -0,0 +1,78 @@
+'''
+Startup time of the CLI and of importing the package, as the best of several
+runs of a new interpreter, with the slowest imports of each from
+`python -X importtime` (excluding those of the interpreter's own startup).
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import numtowords
+
+package_dir = os.path.dirname(os.path.abspath(numtowords.__file__))
+
+cases = [
+    ('python', ['-c', 'pass']),
+    ('import numtowords', ['-c', 'import numtowords']),
+    ('import stringify', ['-c', 'import numtowords.stringify']),
+    ('cli/args', [os.path.join(package_dir, 'bin', 'main.py'), '123456789']),
+    ('cli/options', [os.path.join(package_dir, 'bin', 'main.py'), '--format', 'american', '123456789']),
+]
+
+
+def get_env():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(package_dir), env.get('PYTHONPATH')]))
+    # bytecode is written by the first run, as it would be by an install
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def time_startup(args, runs, env):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, env=env, stdout=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter()-start)
+    return best
+
+
+def get_imports(args, env):
+    '''
+    returns:
+        [(cumulative microseconds, module)] of all imports.
+    '''
+    res = subprocess.run(
+        [sys.executable, '-X', 'importtime'] + args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    )
+    imports = []
+    for line in res.stderr.splitlines():
+        # 'import time: self [us] | cumulative | imported package'
+        fields = line.split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        imports.append((int(fields[1]), fields[2].strip()))
+    return imports
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--runs', type=int, default=20)
+    arg_parser.add_argument('--imports', type=int, default=5, help='number of slowest imports shown per case')
+    args = arg_parser.parse_args()
+
+    env = get_env()
+    interpreter_modules = {module for _, module in get_imports(['-c', 'pass'], env)}
+    for name, case_args in cases:
+        print('{:<20} {:>8.1f} ms'.format(name, time_startup(case_args, args.runs, env)*1000))
+        imports = sorted(
+            (item for item in get_imports(case_args, env) if item[1] not in interpreter_modules), reverse=True
+        )
+        for cumulative, module in imports[:args.imports]:
+            print('    {:<32} {:>8.1f} ms'.format(module, cumulative/1000))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+'''
+Throughput of one IntEngStringifier shared by several threads, stringifying
+random 64-bit integers, relative to a single thread. Throughput only scales
+with the number of threads on free-threaded builds (python -X gil=0), given
+that many cpus.
+'''
+
+import argparse
+import random
+import sys
+import threading
+import time
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier
+
+
+def run_threads(stringifier, nums, threads):
+    '''
+    returns:
+        Numbers stringified per second, each thread stringifying all of nums.
+    '''
+    barrier = threading.Barrier(threads+1)
+
+    def stringify_all():
+        barrier.wait()
+        for n in nums:
+            stringifier.stringify(n)
+
+    workers = [threading.Thread(target=stringify_all) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads*len(nums)/(time.perf_counter()-start)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--count', type=int, default=100000, help='numbers stringified by each thread')
+    arg_parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = arg_parser.parse_args()
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('gil {}'.format('enabled' if is_gil_enabled else 'disabled'))
+    rand = random.Random(0)
+    nums = [rand.randrange(-2**63, 2**63) for _ in range(args.count)]
+    stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+    # build the tables first, so they aren't timed
+    stringifier.stringify(nums[0])
+    base_throughput = None
+    for threads in args.threads:
+        throughput = run_threads(stringifier, nums, threads)
+        if base_throughput is None:
+            base_throughput = throughput/threads
+        print('{:>3} threads {:>12,.0f} numbers/s {:>6.2f}x'.format(threads, throughput, throughput/base_throughput))
+
+if __name__ == '__main__':
+    main()
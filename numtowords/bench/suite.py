@@ -0,0 +1,207 @@
+'''
+The benchmark suite, covering every stringifier over the input sizes they're
+used for, and the CLI end to end. Results are written as json, and can be
+compared against a saved baseline.
+
+Each case is timed call by call for at least min_time seconds, giving its
+throughput (calls/s) and latency percentiles. Peak memory is measured in a
+separate call with tracemalloc, since tracing slows calls down (for the CLI,
+the peak rss of a separate run of the process is used).
+'''
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numtowords
+from numtowords.bench import random_int
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier, PosIntBaseMaxEngStringifier, \
+    PosIntEngStringifier
+
+# a regression is a median latency this much higher than the baseline's
+default_tolerance = 0.1
+
+
+class NullWriter(io.TextIOBase):
+    def write(self, s):
+        return len(s)
+
+
+def iter_cases(quick, tmp_dir):
+    '''
+    Yield (name, func, args) for each case, where args is a list of argument
+    tuples cycled through by the calls. Input files of the CLI are written to
+    tmp_dir.
+    '''
+    for use_standard_prefs in (False, True):
+        base_stringifier = PosIntBaseEngStringifier(use_standard_prefs)
+        prefs_name = 'std' if use_standard_prefs else 'nonstd'
+        for power in (3, 33, 3003, 3*10**6+3) + (() if quick else (3*10**9+3,)):
+            yield 'base/{}/power={}'.format(prefs_name, power), base_stringifier.stringify, [(power,)]
+
+    for max_power in (3, 9):
+        base_stringifier = PosIntBaseMaxEngStringifier(max_power)
+        for power in (30, 3000, 300000):
+            yield 'basemax/{}/power={}'.format(max_power, power), base_stringifier.stringify, [(power,)]
+
+    rand = random.Random(0)
+    int64s = [(rand.randrange(-2**63, 2**63),) for _ in range(1000)]
+    for base_name, base_stringifier in (('base', PosIntBaseEngStringifier()), ('basemax', PosIntBaseMaxEngStringifier(9))):
+        for british in (True, False):
+            format_name = 'british' if british else 'american'
+            stringifier = IntEngStringifier(base_stringifier, british=british)
+            yield 'int/{}/{}/int64'.format(base_name, format_name), stringifier.stringify, int64s
+    stringifier = PosIntEngStringifier(PosIntBaseEngStringifier())
+    yield 'posint/base/british/int64', stringifier.stringify, [(abs(n) or 1,) for n, in int64s]
+    stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+    for digits in (10**3, 10**5) + (() if quick else (10**6,)):
+        n = random_int(digits)
+        yield 'int/base/british/digits={}'.format(digits), stringifier.stringify, [(n,)]
+        yield 'int/base/british/digits={}/write'.format(digits), stringifier.write_stringify, [(n, NullWriter())]
+        yield 'int/base/british/digits={}/from-digits'.format(digits), stringifier.stringify_digits, [(str(n),)]
+
+    yield 'cli/args/int64', run_cli, [tuple(str(n) for n, in int64s[:100])]
+    lines_path = os.path.join(tmp_dir, 'lines.txt')
+    with open(lines_path, 'w') as lines_file:
+        lines_file.writelines('{}\n'.format(rand.randrange(-2**63, 2**63)) for _ in range(10**4))
+    yield 'cli/input/int64x10000', run_cli, [('--input', lines_path)]
+    digits_path = os.path.join(tmp_dir, 'digits.txt')
+    with open(digits_path, 'w') as digits_file:
+        digits_file.write(str(random_int(10**5)))
+    yield 'cli/digits-file/digits=100000', run_cli, [('--digits-file', digits_path)]
+
+
+def run_cli(*args):
+    '''
+    returns:
+        The peak rss of the process in bytes, or None where it isn't
+        available (without os.wait4, e.g. on windows).
+    '''
+    package_dir = os.path.dirname(os.path.abspath(numtowords.__file__))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(package_dir), env.get('PYTHONPATH')]))
+    cmd = [sys.executable, os.path.join(package_dir, 'bin', 'main.py')] + list(args)
+    if not hasattr(os, 'wait4'):
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, check=True)
+        return None
+    process = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL)
+    # waited for here rather than by process, for the usage of this process
+    # alone (RUSAGE_CHILDREN is the largest of all children so far)
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+    # ru_maxrss is in bytes on macos, and in kilobytes on linux and the bsds
+    if sys.platform == 'darwin':
+        return usage.ru_maxrss
+    return usage.ru_maxrss*1024
+
+
+def measure(func, args, min_time, max_calls):
+    '''
+    returns:
+        dict of the results of a case.
+    '''
+    latencies = []
+    total = 0
+    while total < min_time and len(latencies) < max_calls:
+        call_args = args[len(latencies) % len(args)]
+        start = time.perf_counter()
+        func(*call_args)
+        elapsed = time.perf_counter()-start
+        latencies.append(elapsed)
+        total += elapsed
+    latencies.sort()
+    res = {
+        'calls': len(latencies),
+        'calls_per_s': len(latencies)/total,
+        'latency_s': {
+            'min': latencies[0],
+            'p50': latencies[len(latencies)//2],
+            'p90': latencies[len(latencies)*9//10],
+            'p99': latencies[len(latencies)*99//100],
+            'max': latencies[-1],
+        },
+    }
+    if func is run_cli:
+        peak_rss = run_cli(*args[0])
+        if peak_rss is not None:
+            res['peak_rss_bytes'] = peak_rss
+    else:
+        tracemalloc.start()
+        func(*args[0])
+        res['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return res
+
+
+def run(name_filter=None, min_time=0.5, max_calls=100000, quick=False, log=None):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, func, args in iter_cases(quick, tmp_dir):
+            if name_filter is not None and name_filter not in name:
+                continue
+            results[name] = measure(func, args, min_time, max_calls)
+            if log is not None:
+                print('{:<45} {:>14,.1f} calls/s'.format(name, results[name]['calls_per_s']), file=log)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(report, baseline, tolerance=default_tolerance, out=sys.stdout):
+    '''
+    Print the median latency of each case relative to the baseline. Medians
+    are compared rather than throughputs, as they're less affected by other
+    processes.
+
+    returns:
+        Names of the cases which regressed by more than tolerance.
+    '''
+    regressions = []
+    print('{:<45} {:>14} {:>14} {:>8}'.format('case', 'baseline p50', 'current p50', 'ratio'), file=out)
+    for name, res in report['results'].items():
+        base_res = baseline['results'].get(name)
+        if base_res is None:
+            continue
+        ratio = res['latency_s']['p50']/base_res['latency_s']['p50']
+        regressed = ratio > 1+tolerance
+        if regressed:
+            regressions.append(name)
+        print('{:<45} {:>14.3g} {:>14.3g} {:>7.2f}x{}'.format(
+            name, base_res['latency_s']['p50'], res['latency_s']['p50'], ratio, ' REGRESSED' if regressed else ''
+        ), file=out)
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--output', help='file to write the json results to, - for stdout')
+    arg_parser.add_argument('--baseline', help='json results to compare against')
+    arg_parser.add_argument('--tolerance', type=float, default=default_tolerance)
+    arg_parser.add_argument('--filter', help='only run cases whose names contain this')
+    arg_parser.add_argument('--min-time', type=float, default=0.5, help='seconds to time each case for')
+    arg_parser.add_argument('--quick', action='store_true', help='skip the slowest cases')
+    args = arg_parser.parse_args()
+
+    report = run(args.filter, args.min_time, quick=args.quick, log=sys.stderr)
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.output is not None:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        if compare(report, baseline, args.tolerance, sys.stderr):
+            sys.exit(1)
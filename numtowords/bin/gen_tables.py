@@ -0,0 +1,81 @@
+'''
+Generate numtowords/_tables.py, the tables of the stringifiers precomputed so
+they're loaded rather than built when a process first stringifies. Run this
+after changing any words or naming rules.
+'''
+
+import argparse
+import os
+from numtowords import stringify
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier, PosIntBaseMaxEngStringifier, \
+    PosIntEngStringifier
+
+
+def iter_tables():
+    '''
+    Yield (class name, table name, config, table) for each precomputed table.
+    '''
+    for cls in (PosIntEngStringifier, IntEngStringifier):
+        for british in (True, False):
+            stringifier = cls(PosIntBaseEngStringifier(), british=british)
+            yield cls.__name__, 'block', (british,), [stringifier._string_block_coeff(coeff) for coeff in range(1000)]
+            for commas in (True, False):
+                stringifier = cls(PosIntBaseEngStringifier(), british=british, commas=commas)
+                yield cls.__name__, 'tail', (british, commas), [
+                    [''.join(stringifier._iter_tail(coeff, prev_coeff)) for coeff in range(1000)]
+                    for prev_coeff in (None, 1, 100)
+                ]
+    for cls in (PosIntBaseEngStringifier, PosIntBaseMaxEngStringifier):
+        for use_standard_prefs in (True, False):
+            # the prefixes of chunks don't depend on max_power
+            stringifier = cls(use_standard_prefs=use_standard_prefs) if cls is PosIntBaseEngStringifier else \
+                cls(3, use_standard_prefs=use_standard_prefs)
+            yield cls.__name__, 'chunk_prefix', (use_standard_prefs,), [
+                stringifier._make_chunk_prefix(chunk) for chunk in range(1000)
+            ]
+
+
+def make_source():
+    # the tables are built from the words, not the current precomputed tables
+    use_precomputed_tables = stringify.use_precomputed_tables
+    stringify.use_precomputed_tables = False
+    try:
+        return _make_source()
+    finally:
+        stringify.use_precomputed_tables = use_precomputed_tables
+
+
+def _make_source():
+    lines = ["'''", 'Generated by bin/gen_tables.py, do not edit.', "'''", '']
+    # equal tables (e.g. of classes with the same words) are written once
+    names = {}
+    keys = []
+    for cls_name, table_name, config, table in iter_tables():
+        # tables are stored joined by newlines, as one string is loaded much
+        # faster than many, and only the tables used are split
+        if isinstance(table[0], list):
+            text = repr(tuple('\n'.join(sub_table) for sub_table in table))
+        else:
+            text = repr('\n'.join(table))
+        if text not in names:
+            names[text] = '_{}_{}'.format(table_name, len(names))
+            lines.extend(['{} = {}'.format(names[text], text), ''])
+        keys.append(((cls_name, table_name, config), names[text]))
+    lines.append('tables = {')
+    lines.extend('    {!r}: {},'.format(key, name) for key, name in keys)
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        '--output', default=os.path.join(os.path.dirname(os.path.abspath(stringify.__file__)), '_tables.py')
+    )
+    args = arg_parser.parse_args()
+    source = make_source()
+    with open(args.output, 'w') as fp:
+        fp.write(source)
+
+if __name__ == '__main__':
+    main()
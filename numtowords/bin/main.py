@@ -1,21 +1,171 @@
 
 '''
 Convert number to English words.
+
+`main.py transform FILE --field FIELD` adds a column of words to a CSV or
+JSONL file instead, see `main.py transform -h`.
 '''
 
-import argparse
-from numtowords.stringify import *
+import mmap
+import sys
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier, PosIntBaseMaxEngStringifier
 
 
 def main():
-    arg_parser = argparse.ArgumentParser(description=__doc__)
-    arg_parser.add_argument('nums', type=int, nargs='+')
+    if sys.argv[1:2] == ['transform']:
+        transform_main(sys.argv[2:])
+        return
+
+    nums = parse_nums(sys.argv[1:])
+    if nums is not None:
+        # only numbers were given, the common case, so the options (and
+        # argparse) are skipped, the stringifier is as make_stringifier makes
+        # it by default
+        write_nums(IntEngStringifier(PosIntBaseEngStringifier(use_standard_prefs=False)), nums)
+        return
+
+    import argparse
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('nums', type=int, nargs='*')
+    arg_parser.add_argument(
+        '--digits-file', action='append', default=[],
+        help='file containing the decimal digits of a number, which is memory-mapped'
+    )
+    arg_parser.add_argument('--stdin', action='store_true', help='read numbers from stdin, one per line')
+    arg_parser.add_argument('--input', help='read numbers from a file, one per line')
+    arg_parser.add_argument(
+        '--jobs', type=int, default=1,
+        help='number of worker processes for --stdin and --input, 0 for one per cpu'
+    )
+    arg_parser.add_argument('--chunk-size', type=int, default=10000, help='number of lines sent to a worker at once')
+    arg_parser.add_argument(
+        '--profile', action='store_true',
+        help='print the time spent in each phase to stderr, excluding worker processes'
+    )
+    add_stringifier_args(arg_parser)
+    args = arg_parser.parse_args()
+    if not args.nums and not args.digits_file and not args.stdin and args.input is None:
+        arg_parser.error('no numbers given')
+    if args.stdin and args.input is not None:
+        arg_parser.error('--stdin and --input are mutually exclusive')
+    if args.jobs < 0:
+        arg_parser.error('--jobs must be non-negative')
+
+    stringifier = make_stringifier(args)
+    if args.profile:
+        from numtowords import instrument
+        instrument.enable()
+
+    write_nums(stringifier, args.nums)
+
+    for path in args.digits_file:
+        try:
+            with open(path, 'rb') as digits_file, \
+                    mmap.mmap(digits_file.fileno(), 0, access=mmap.ACCESS_READ) as digits:
+                sys.stdout.writelines(stringifier.iter_stringify_digits(digits))
+                print()
+        except ValueError as e:
+            print('Error: {}'.format(e))
+
+    if args.stdin:
+        write_lines(stringifier, sys.stdin, args)
+    elif args.input is not None:
+        with open(args.input) as lines:
+            write_lines(stringifier, lines, args)
+
+    if args.profile:
+        sys.stdout.flush()
+        print(instrument.format_snapshot(instrument.snapshot()), file=sys.stderr)
+
+
+def transform_main(argv):
+    '''
+    The transform subcommand, adding a column of words to a CSV or JSONL file.
+    '''
+    import argparse
+    from numtowords import transform
+    arg_parser = argparse.ArgumentParser(
+        prog='main.py transform', description=transform_main.__doc__.strip()
+    )
+    arg_parser.add_argument('input', help='CSV or JSONL file, - for stdin')
+    arg_parser.add_argument('--output', default='-', help='file to write to, stdout by default')
+    arg_parser.add_argument(
+        '--type', choices=['csv', 'jsonl'],
+        help='type of the input, by default jsonl if its name ends with .jsonl, otherwise csv'
+    )
+    arg_parser.add_argument('--field', required=True, help='column (or key) of the numbers, an index with --no-header')
+    arg_parser.add_argument('--output-field', help='name of the added column, by default FIELD_words')
+    arg_parser.add_argument('--no-header', action='store_true', help='the CSV has no header row')
+    arg_parser.add_argument('--delimiter', default=',', help='delimiter of the CSV')
+    arg_parser.add_argument(
+        '--jobs', type=int, default=1, help='number of worker processes, 0 for one per cpu'
+    )
+    arg_parser.add_argument('--chunk-size', type=int, default=10000, help='number of rows sent to a worker at once')
+    add_stringifier_args(arg_parser)
+    args = arg_parser.parse_args(argv)
+    if args.jobs < 0:
+        arg_parser.error('--jobs must be non-negative')
+    file_type = args.type or ('jsonl' if args.input.endswith('.jsonl') else 'csv')
+    field = args.field
+    if file_type == 'csv' and args.no_header:
+        try:
+            field = int(field)
+        except ValueError:
+            arg_parser.error('--field must be an index with --no-header')
+
+    stringifier = make_stringifier(args)
+    with open_text(args.input, 'r') as in_file, open_text(args.output, 'w') as out_file:
+        if file_type == 'csv':
+            transform.transform_csv(
+                stringifier, in_file, out_file, field, args.output_field, header=not args.no_header,
+                jobs=args.jobs or None, chunk_size=args.chunk_size, delimiter=args.delimiter
+            )
+        else:
+            transform.transform_jsonl(
+                stringifier, in_file, out_file, field, args.output_field, jobs=args.jobs or None,
+                chunk_size=args.chunk_size
+            )
+
+
+def open_text(path, mode):
+    '''
+    Open a file (or stdin/stdout for -) for transform with a large buffer,
+    newlines are left untranslated for the csv module.
+    '''
+    if path == '-':
+        return open((sys.stdin if mode == 'r' else sys.stdout).fileno(), mode, buffering=2**20, encoding='utf-8',
+                    newline='', closefd=False)
+    return open(path, mode, buffering=2**20, encoding='utf-8', newline='')
+
+
+def parse_nums(argv):
+    '''
+    returns:
+        The numbers of argv, or None if it has anything else (or nothing).
+    '''
+    try:
+        return [int(arg) for arg in argv] or None
+    except ValueError:
+        return None
+
+
+def write_nums(stringifier, nums):
+    for n in nums:
+        try:
+            stringifier.write_stringify(n, sys.stdout)
+            print()
+        except ValueError as e:
+            print('Error: {}'.format(e))
+
+
+def add_stringifier_args(arg_parser):
     arg_parser.add_argument('--format', choices=['american', 'british'], default='british')
     arg_parser.add_argument('--basemaxpower', type=int, default=None)
     arg_parser.add_argument('--basestandardprefs', action='store_true')
     arg_parser.add_argument('--nocommas', action='store_true')
-    args = arg_parser.parse_args()
 
+
+def make_stringifier(args):
     if args.basemaxpower is None:
         base_stringifier = PosIntBaseEngStringifier(
             use_standard_prefs=args.basestandardprefs
@@ -26,17 +176,19 @@ def main():
             use_standard_prefs=args.basestandardprefs
         )
 
-    stringifier = IntEngStringifier(
+    return IntEngStringifier(
         base_stringifier,
         british=(args.format == 'british'),
         commas=not args.nocommas
     )
 
-    for n in args.nums:
-        try:
-            print(stringifier.stringify(n))
-        except ValueError as e:
-            print('Error: {}'.format(e))    
+
+def write_lines(stringifier, lines, args):
+    from numtowords import bulk
+    res = bulk.stringify_lines(stringifier, lines, jobs=args.jobs or None, chunk_size=args.chunk_size)
+    for chunk in bulk.iter_chunks(res, args.chunk_size):
+        chunk.append('')
+        sys.stdout.write('\n'.join(chunk))
 
 if __name__ == '__main__':
     main()
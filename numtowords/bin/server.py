@@ -0,0 +1,61 @@
+'''
+Serve number to English words conversions, one number per line.
+'''
+
+import argparse
+import asyncio
+import concurrent.futures
+import sys
+from numtowords.bin.main import add_stringifier_args, make_stringifier
+from numtowords.server import ConversionServer
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=8765)
+    arg_parser.add_argument('--unix', help='listen on a unix socket at this path instead of tcp')
+    arg_parser.add_argument(
+        '--jobs', type=int, default=1, help='number of worker processes for numbers with many digits'
+    )
+    arg_parser.add_argument(
+        '--batch-size', type=int, default=ConversionServer.batch_size,
+        help='maximum number of queued numbers stringified at once'
+    )
+    arg_parser.add_argument(
+        '--max-pending', type=int, default=ConversionServer.max_pending,
+        help='maximum number of unanswered numbers of a connection before reading from it stops'
+    )
+    arg_parser.add_argument(
+        '--report-interval', type=float, default=10,
+        help='seconds between latency reports on stderr, 0 for none'
+    )
+    add_stringifier_args(arg_parser)
+    args = arg_parser.parse_args()
+    if args.jobs < 1:
+        arg_parser.error('--jobs must be positive')
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+async def serve(args):
+    conversion_server = ConversionServer(
+        make_stringifier(args), executor=concurrent.futures.ProcessPoolExecutor(args.jobs)
+    )
+    conversion_server.batch_size = args.batch_size
+    conversion_server.max_pending = args.max_pending
+    server = await conversion_server.start(args.host, args.port, args.unix)
+    try:
+        async with server:
+            while True:
+                await asyncio.sleep(args.report_interval or 3600)
+                if args.report_interval:
+                    print(conversion_server.report(), file=sys.stderr)
+    finally:
+        print(conversion_server.report(), file=sys.stderr)
+        conversion_server.close()
+
+if __name__ == '__main__':
+    main()
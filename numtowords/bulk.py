@@ -0,0 +1,92 @@
+'''
+Stringify streams of numbers given one per line, optionally spread over a pool
+of worker processes.
+'''
+
+import collections
+import itertools
+import multiprocessing
+
+# stringifier of each worker process
+_worker_stringifier = None
+
+
+def _init_worker(stringifier):
+    global _worker_stringifier
+    _worker_stringifier = stringifier
+
+
+def stringify_chunk(stringifier, lines):
+    '''
+    Stringify a chunk of lines in the current process, as stringify_lines.
+
+    returns:
+        A list of the strings of lines, in order.
+    '''
+    res = []
+    for line in lines:
+        try:
+            res.append(stringifier.stringify_digits(line))
+        except ValueError as e:
+            # other int literals, e.g. '+5' or '1_000', are accepted as they
+            # are in main.py's arguments
+            try:
+                res.append(stringifier.stringify(int(line)))
+            except ValueError:
+                res.append('Error: {}'.format(e))
+    return res
+
+
+def _worker_stringify_lines(lines):
+    return stringify_chunk(_worker_stringifier, lines)
+
+
+def iter_chunks(iterable, chunk_size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def map_chunks(func, chunks, jobs, initializer=None, initargs=()):
+    '''
+    Yield func(chunk) for each chunk in order, computed by a pool of jobs
+    processes. Only a few chunks per process are read ahead, so memory stays
+    bounded however long chunks is.
+    '''
+    with multiprocessing.Pool(jobs, initializer=initializer, initargs=initargs) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(func, (chunk,)))
+            if len(pending) >= 2*jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def stringify_lines(stringifier, lines, jobs=1, chunk_size=10000):
+    '''
+    Stringify numbers given as decimal digits one per line, yielding a string
+    for each line in order. Lines can also be any literal int accepts (e.g.
+    '+5' or '1_000'), which are parsed by int rather than from the digits.
+    Invalid lines give an error string rather than raising.
+
+    args:
+        jobs:
+            Number of worker processes, None for one per cpu.
+        chunk_size:
+            Number of lines sent to a worker at once.
+    '''
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    chunks = iter_chunks(lines, chunk_size)
+    if jobs == 1:
+        for chunk in chunks:
+            yield from stringify_chunk(stringifier, chunk)
+        return
+    for res in map_chunks(
+        _worker_stringify_lines, chunks, jobs, initializer=_init_worker, initargs=(stringifier,)
+    ):
+        yield from res
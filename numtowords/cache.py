@@ -0,0 +1,69 @@
+'''
+A bounded, thread-safe cache of stringified numbers.
+'''
+
+import collections
+import threading
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    '''
+    Maps keys to values, evicting the least recently used key once maxsize
+    keys are held. All operations take a lock, so a cache can be shared by
+    threads.
+
+    Pickling a cache gives an empty cache of the same size (e.g. for worker
+    processes), since the lock can't be pickled and the contents wouldn't
+    be worth sending.
+    '''
+
+    def __init__(self, maxsize):
+        if maxsize <= 0:
+            raise ValueError('maxsize')
+        self.maxsize = maxsize
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        '''
+        returns:
+            The value of key, or None if it isn't cached.
+        '''
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            data = self._data
+            data[key] = value
+            data.move_to_end(key)
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __reduce__(self):
+        return (type(self), (self.maxsize,))
@@ -0,0 +1,204 @@
+'''
+Opt-in timings of the phases of stringification.
+
+enable() wraps the methods of each phase with timers, and disable() restores
+them, so nothing is measured (or slowed down) unless enabled. Phase times are
+exclusive: the time of a call excludes the calls of other phases it makes,
+e.g. 'assemble' (making the pieces of strings from the tables) excludes the
+time to split the number into blocks. Joining and writing the pieces is left
+unmeasured.
+
+Work done by worker processes (e.g. stringify with workers, or bulk with
+jobs) isn't measured.
+'''
+
+import threading
+import time
+from numtowords.cache import LRUCache
+from numtowords.stringify import PosIntBaseEngStringifier, PosIntEngStringifier
+
+# (class, method name, phase) of the wrapped methods, the pieces yielded by
+# the generators returned by the _iter_ methods are timed too
+phase_methods = [
+    (PosIntEngStringifier, '_iter_blocks', 'assemble'),
+    (PosIntEngStringifier, '_iter_blocks_bytes', 'assemble'),
+    (PosIntEngStringifier, '_split_blocks', 'split'),
+    (PosIntEngStringifier, '_split_digit_blocks', 'split'),
+    (PosIntEngStringifier, '_split_segments', 'split'),
+    (PosIntEngStringifier, '_string_block_coeff', 'block'),
+    (PosIntBaseEngStringifier, '_make_power_str', 'power'),
+    (PosIntBaseEngStringifier, '_iter_power_names', 'power'),
+    (LRUCache, 'get', 'cache'),
+]
+
+_originals = {}
+_local = threading.local()
+# guards _phases and _counters, which are updated by every thread
+_lock = threading.Lock()
+_phases = {}
+_counters = {}
+_start_time = None
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def enable():
+    if is_enabled():
+        return
+    reset()
+    for cls, name, phase in phase_methods:
+        method = cls.__dict__[name]
+        _originals[cls, name] = method
+        setattr(cls, name, _wrap(method, phase, name))
+
+
+def disable():
+    for (cls, name), method in _originals.items():
+        setattr(cls, name, method)
+    _originals.clear()
+
+
+def reset():
+    global _start_time
+    with _lock:
+        _phases.clear()
+        _counters.clear()
+        _start_time = time.perf_counter()
+
+
+def count(name, n=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0)+n
+
+
+def snapshot():
+    '''
+    returns:
+        dict with:
+            'phases': {phase: {'calls': calls, 'time_s': exclusive time}}
+            'counters': {name: count}, e.g. 'blocks' split from numbers,
+                'power_chunks' split from the bases of power names and
+                'power_names' made.
+            'total_s': time since enabled or reset.
+    '''
+    with _lock:
+        return {
+            'phases': {phase: {'calls': calls, 'time_s': elapsed} for phase, (calls, elapsed) in _phases.items()},
+            'counters': dict(_counters),
+            'total_s': time.perf_counter()-_start_time if _start_time is not None else 0,
+        }
+
+
+def format_snapshot(snap):
+    lines = ['{:<12} {:>12} {:>12} {:>8}'.format('phase', 'calls', 'time (s)', '%')]
+    total = snap['total_s'] or 1
+    measured = 0
+    for phase, stats in sorted(snap['phases'].items(), key=lambda item: -item[1]['time_s']):
+        measured += stats['time_s']
+        lines.append('{:<12} {:>12,} {:>12.4f} {:>7.1f}%'.format(
+            phase, stats['calls'], stats['time_s'], 100*stats['time_s']/total
+        ))
+    lines.append('{:<12} {:>12} {:>12.4f} {:>7.1f}%'.format(
+        'other', '', snap['total_s']-measured, 100*(snap['total_s']-measured)/total
+    ))
+    for name, n in sorted(snap['counters'].items()):
+        lines.append('{:<12} {:>12,}'.format(name, n))
+    return '\n'.join(lines)
+
+
+def _get_stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _enter(phase):
+    # the phase of each call, and the time of other phases called by it
+    _get_stack().append([phase, 0])
+    return time.perf_counter()
+
+
+def _exit(phase, start, calls):
+    elapsed = time.perf_counter()-start
+    stack = _local.stack
+    child_elapsed = stack.pop()[1]
+    if stack:
+        stack[-1][1] += elapsed
+    with _lock:
+        phase_calls, total = _phases.get(phase, (0, 0))
+        _phases[phase] = (phase_calls+calls, total+elapsed-child_elapsed)
+
+
+def _get_caller_phase():
+    '''
+    The phase of the wrapped call the current call was made by, if any.
+    '''
+    stack = _get_stack()
+    return stack[-1][0] if stack else None
+
+
+def _wrap(method, phase, name):
+    wrapper_type = type(method) if isinstance(method, (classmethod, staticmethod)) else None
+    func = method.__func__ if wrapper_type is not None else method
+    counter = _result_counters.get(name)
+    piece_counter = _piece_counters.get(name)
+    is_iter = name.startswith('_iter_')
+
+    def wrapper(*args, **kwargs):
+        start = _enter(phase)
+        try:
+            res = func(*args, **kwargs)
+        finally:
+            _exit(phase, start, 1)
+        if counter is not None:
+            counter(res)
+        if is_iter:
+            res = _iter_timed(res, phase, piece_counter)
+        return res
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper_type(wrapper) if wrapper_type is not None else wrapper
+
+
+def _iter_timed(iterator, phase, piece_counter=None):
+    iterator = iter(iterator)
+    while True:
+        start = _enter(phase)
+        try:
+            piece = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _exit(phase, start, 0)
+        if piece_counter is not None:
+            piece_counter(piece)
+        yield piece
+
+
+def _count_cache_get(res):
+    count('cache_hits' if res is not None else 'cache_misses')
+
+
+def _count_split_blocks(blocks):
+    # the bases of power names are split into chunks as numbers are
+    count('power_chunks' if _get_caller_phase() == 'power' else 'blocks', len(blocks))
+
+
+# functions counting the results of wrapped methods, called after the call
+# has exited
+_result_counters = {
+    '_split_blocks': _count_split_blocks,
+    '_split_digit_blocks': lambda res: count('blocks', len(res[1])),
+    '_make_power_str': lambda power_str: count('power_names'),
+    'get': _count_cache_get,
+}
+
+# functions counting the pieces yielded by wrapped _iter_ methods
+_piece_counters = {
+    '_iter_power_names': lambda power_name: count('power_names'),
+}
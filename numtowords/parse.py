@@ -0,0 +1,209 @@
+'''
+Parse numbers written in words, the reverse of IntEngStringifier.
+'''
+
+from numtowords.stringify import IntEngStringifier, PosIntBaseEngStringifier, PosIntEngStringifier
+
+
+class IntEngParser:
+    '''
+    Parses the strings of IntEngStringifier with any of its options: british or
+    american, with or without commas, standard prefixes or not, and powers
+    composed of several power names (from PosIntBaseMaxEngStringifier).
+
+    # Power Names
+
+    Powers composed of several names are only accepted in the form
+    PosIntBaseMaxEngStringifier writes them: an optional smaller power, then
+    repeats of the max power, which is the same throughout a number. So 'one
+    thousand million' (as written with a max power of 6) is accepted, but not
+    'one million thousand'.
+
+    A Conway-Guy-Wechsler name is the concatenation of a prefix ending in
+    'illi' for each chunk of 3 digits of its base, followed by 'on' (see
+    PosIntBaseEngStringifier). No chunk prefix is a prefix of another, so names
+    are split into chunks in a single pass by walking a trie of the prefixes of
+    chunks 0-999 (both standard and not). The names of the powers stringified
+    most often are also indexed directly.
+    '''
+
+    # number of powers (from 10**3) whose names are indexed directly
+    power_index_size = 1000
+
+    _tables = None
+
+    def __init__(self):
+        if IntEngParser._tables is None:
+            IntEngParser._tables = self._build_tables()
+        self.words, self.power_index, self.chunk_trie = self._tables
+
+    @classmethod
+    def _build_tables(cls):
+        # words of block coefficients, as (kind, value)
+        words = {word: ('unit', i) for i, word in enumerate(PosIntEngStringifier.units) if word}
+        words.update((word, ('unit', i+10)) for i, word in enumerate(PosIntEngStringifier.ten_units))
+        words.update((word, ('ten', i*10)) for i, word in enumerate(PosIntEngStringifier.tens) if i >= 2)
+        # hyphenated tens are single words, so no spaces are accepted around
+        # the hyphen
+        words.update(
+            ('{}-{}'.format(ten, unit), ('ten', i*10+j))
+            for i, ten in enumerate(PosIntEngStringifier.tens) if i >= 2
+            for j, unit in enumerate(PosIntEngStringifier.units) if j >= 1
+        )
+        words[PosIntEngStringifier.hundred] = ('hundred', 100)
+        words[PosIntEngStringifier.infix] = ('and', None)
+        words[IntEngStringifier.zero] = ('zero', 0)
+        words[IntEngStringifier.negative] = ('negative', None)
+
+        power_index = {}
+        chunk_trie = {}
+        for use_standard_prefs in (False, True):
+            base_stringifier = PosIntBaseEngStringifier(use_standard_prefs)
+            power_strs = base_stringifier._get_power_strs(cls.power_index_size)
+            for i in range(1, cls.power_index_size):
+                power_index[power_strs[i]] = 3*i
+            for chunk, prefix in enumerate(base_stringifier._get_chunk_prefix_table()):
+                node = chunk_trie
+                for c in prefix:
+                    node = node.setdefault(c, {})
+                node[None] = chunk
+        return words, power_index, chunk_trie
+
+    def parse_power(self, name):
+        '''
+        The power of 10 named by a single power name, e.g. 6 for 'million'.
+        '''
+        try:
+            return self.power_index[name]
+        except KeyError:
+            pass
+        suffix = PosIntBaseEngStringifier.suffix
+        if not name.endswith(suffix):
+            raise ValueError('power')
+        chunks = []
+        node = self.chunk_trie
+        for c in name[:-len(suffix)]:
+            try:
+                node = node[c]
+            except KeyError:
+                raise ValueError('power') from None
+            if None in node:
+                chunks.append(node[None])
+                node = self.chunk_trie
+        if node is not self.chunk_trie or not chunks or chunks[0] == 0:
+            raise ValueError('power')
+        chunks.reverse()
+        return PosIntBaseEngStringifier._base_num_to_power(PosIntEngStringifier._join_blocks(chunks))
+
+    def _parse_coeff(self, tokens, pos):
+        '''
+        Parse a block coefficient starting at tokens[pos].
+
+        returns:
+            (coefficient, position after it)
+        '''
+        words = self.words
+        coeff = 0
+        kind, val = words.get(tokens[pos], (None, None)) if pos < len(tokens) else (None, None)
+        if kind == 'unit' and val < 10 and pos+1 < len(tokens) and tokens[pos+1] == PosIntEngStringifier.hundred:
+            coeff = val*100
+            pos += 2
+            if pos < len(tokens) and tokens[pos] == PosIntEngStringifier.infix:
+                pos += 1
+            elif pos >= len(tokens) or words.get(tokens[pos], (None,))[0] not in ('unit', 'ten'):
+                return coeff, pos
+            kind, val = words.get(tokens[pos], (None, None)) if pos < len(tokens) else (None, None)
+        if kind == 'unit':
+            return coeff+val, pos+1
+        if kind == 'ten':
+            return coeff+val, pos+1
+        raise ValueError('s')
+
+    def parse(self, s):
+        '''
+        Parse a number written in words.
+
+        raises:
+            ValueError if s isn't a number written by IntEngStringifier.
+        '''
+        # words are separated by exactly one space, and a comma is a token of
+        # its own after the word it ends
+        tokens = []
+        for word in s.split(' '):
+            if word.endswith(','):
+                tokens += (word[:-1], ',')
+            else:
+                tokens.append(word)
+        if '' in tokens:
+            raise ValueError('s')
+        if tokens == [IntEngStringifier.zero]:
+            return 0
+        pos = 0
+        negative = tokens[:1] == [IntEngStringifier.negative]
+        if negative:
+            pos += 1
+        # (coefficient, power) of each non-zero block
+        terms = []
+        # the max power of composed powers, and whether a power of one name
+        # was seen (which is larger than the powers after it)
+        max_power = None
+        has_single_power = False
+        # the separator between blocks, ',' or ' ', which is the same
+        # throughout a number
+        sep = None
+        # whether the last block had an 'and' of its own
+        has_infix = False
+        while pos < len(tokens):
+            infixed = False
+            if terms:
+                term_sep = ' '
+                if tokens[pos] == ',':
+                    term_sep = ','
+                    pos += 1
+                    if pos == len(tokens):
+                        raise ValueError('s')
+                if tokens[pos] == PosIntEngStringifier.infix:
+                    infixed = True
+                    pos += 1
+                    # the separator is only written before the infix after a
+                    # block with an 'and', e.g. 'one hundred and one million,
+                    # and five'
+                    if not has_infix:
+                        if term_sep == ',':
+                            raise ValueError('s')
+                        term_sep = None
+                if term_sep is not None:
+                    if sep not in (None, term_sep):
+                        raise ValueError('s')
+                    sep = term_sep
+            start = pos
+            coeff, pos = self._parse_coeff(tokens, pos)
+            has_infix = PosIntEngStringifier.infix in tokens[start:pos]
+            # the infix is only written before a last block below 100
+            if infixed and coeff >= 100:
+                raise ValueError('s')
+            powers = []
+            while pos < len(tokens) and tokens[pos] not in self.words and tokens[pos] != ',':
+                powers.append(self.parse_power(tokens[pos]))
+                pos += 1
+            if len(powers) > 1:
+                term_max_power = powers[-1]
+                if powers[0] > term_max_power or any(p != term_max_power for p in powers[1:-1]) or \
+                        max_power not in (None, term_max_power) or has_single_power:
+                    raise ValueError('s')
+                max_power = term_max_power
+            elif powers:
+                if max_power is not None and powers[0] > max_power:
+                    raise ValueError('s')
+                has_single_power = True
+            power = sum(powers)
+            if terms and power >= terms[-1][1] or infixed and power != 0:
+                raise ValueError('s')
+            terms.append((coeff, power))
+        if not terms:
+            raise ValueError('s')
+        blocks = [0]*(terms[0][1]//3+1)
+        for coeff, power in terms:
+            blocks[power//3] = coeff
+        n = PosIntEngStringifier._join_blocks(blocks)
+        return -n if negative else n
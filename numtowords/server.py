@@ -0,0 +1,158 @@
+'''
+An asyncio server stringifying numbers sent one per line over TCP or unix
+sockets.
+
+Each line sent is answered by a line with its string, or 'Error: ...' if it
+isn't a number, in the order the lines were sent. Requests from all
+connections are queued and stringified in batches by the bulk conversion
+path, while numbers of many digits are sent to an executor so they don't
+block the event loop.
+'''
+
+import asyncio
+import collections
+import concurrent.futures
+import time
+from numtowords import bulk
+
+
+class ConversionServer:
+    '''
+    attrs:
+        batch_size:
+            Maximum number of queued lines stringified at once.
+        executor_min_digits:
+            Lines at least this long are stringified by the executor.
+        max_pending:
+            Maximum number of lines of a connection not yet answered, reading
+            from a connection stops until its oldest line is answered.
+        max_line_length:
+            Longest line accepted, longer lines close their connection.
+    '''
+
+    batch_size = 256
+    executor_min_digits = 2000
+    max_pending = 1024
+    max_line_length = 2**24
+    # latencies of the most recent requests are kept for percentiles
+    latency_samples = 100000
+
+    def __init__(self, stringifier, executor=None):
+        '''
+        args:
+            executor:
+                A concurrent.futures.Executor, by default a process pool of
+                one worker.
+        '''
+        self.stringifier = stringifier
+        self.executor = executor
+        self.latencies = collections.deque(maxlen=self.latency_samples)
+        self.requests = 0
+        self._queue = None
+        self._batcher = None
+
+    async def start(self, host=None, port=None, path=None):
+        '''
+        Listen on a unix socket if path is given, otherwise on host and port.
+
+        returns:
+            The asyncio.Server.
+        '''
+        if self.executor is None:
+            self.executor = concurrent.futures.ProcessPoolExecutor(1)
+        self._queue = asyncio.Queue(self.batch_size*4)
+        self._batcher = asyncio.ensure_future(self._run_batches())
+        if path is not None:
+            return await asyncio.start_unix_server(self._handle, path, limit=self.max_line_length)
+        return await asyncio.start_server(self._handle, host, port, limit=self.max_line_length)
+
+    def close(self):
+        if self._batcher is not None:
+            self._batcher.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+    def latency_percentiles(self, percentiles=(50, 90, 99, 100)):
+        '''
+        returns:
+            dict of the latencies of the most recent requests at each
+            percentile in seconds, from the line being read to its answer
+            being written.
+        '''
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {}
+        return {p: latencies[min(len(latencies)*p//100, len(latencies)-1)] for p in percentiles}
+
+    def report(self):
+        return 'requests={} {}'.format(self.requests, ' '.join(
+            'p{}={:.3f}ms'.format(p, latency*1000) for p, latency in self.latency_percentiles().items()
+        ))
+
+    async def _handle(self, reader, writer):
+        # answers of the connection in order, as (start time, future), the
+        # queue being full stops reading
+        answers = asyncio.Queue(self.max_pending)
+        writing = asyncio.ensure_future(self._write_answers(writer, answers))
+        try:
+            while not writing.done():
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # line too long
+                    break
+                if not line:
+                    break
+                line = line.strip()
+                future = asyncio.get_running_loop().create_future()
+                await answers.put((time.perf_counter(), future))
+                if len(line) >= self.executor_min_digits:
+                    self._submit_executor(line, future)
+                else:
+                    await self._queue.put((line, future))
+            if not writing.done():
+                await answers.put(None)
+            await writing
+        except ConnectionError:
+            pass
+        finally:
+            writing.cancel()
+            writer.close()
+
+    async def _write_answers(self, writer, answers):
+        while True:
+            item = await answers.get()
+            if item is None:
+                return
+            start, future = item
+            res = await future
+            writer.write(res.encode() + b'\n')
+            await writer.drain()
+            self.latencies.append(time.perf_counter()-start)
+            self.requests += 1
+
+    def _submit_executor(self, line, future):
+        def set_result(executor_future):
+            try:
+                res = executor_future.result()[0]
+            except Exception as e:
+                res = 'Error: {}'.format(e)
+            if not future.cancelled():
+                future.set_result(res)
+        executor_future = asyncio.get_running_loop().run_in_executor(
+            self.executor, bulk.stringify_chunk, self.stringifier, [line]
+        )
+        executor_future.add_done_callback(set_result)
+
+    async def _run_batches(self):
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            for (_, future), res in zip(batch, bulk.stringify_chunk(self.stringifier, [line for line, _ in batch])):
+                if not future.cancelled():
+                    future.set_result(res)
+            # let connections read more lines
+            await asyncio.sleep(0)
+
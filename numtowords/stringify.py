@@ -1,5 +1,34 @@
+import itertools
+import math
+import sys
 
-class PosIntBaseEngStringifier:
+
+class _Frozen:
+    '''
+    Stringifiers are immutable once made, so one can be shared by any number
+    of threads without locking (the shared tables are only ever replaced or
+    added to, never changed). Attributes are set once by __init__ through
+    _set_attrs, and tunables such as parallel_min_blocks are changed by
+    subclassing.
+    '''
+
+    __slots__ = ()
+
+    def _set_attrs(self, **attrs):
+        for name, value in attrs.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(name)
+
+    def __delattr__(self, name):
+        raise AttributeError(name)
+
+    def __reduce__(self):
+        return (type(self), self._get_init_args())
+
+
+class PosIntBaseEngStringifier(_Frozen):
     '''
     # Naming Scheme
 
@@ -30,11 +59,21 @@ class PosIntBaseEngStringifier:
     [Landon Curt Noll](http://www.isthe.com/chongo/tech/math/number/howhigh.html)
     '''
 
+    __slots__ = ('use_standard_prefixes',)
+
     def __init__(self, use_standard_prefs=True):
-        self.use_standard_prefixes = use_standard_prefs
+        self._set_attrs(use_standard_prefixes=use_standard_prefs)
+
+    def _get_init_args(self):
+        return (self.use_standard_prefixes,)
 
     thousand = 'thousand'
 
+    # names of powers below 3*power_table_size are cached
+    power_table_size = 1000
+    _power_tables = {}
+    _chunk_prefix_tables = {}
+
     # only used for powers 6-33 (i.e. the smallest) for every 3000 increase in
     # power
     small_prefixes = ['', 'mi', 'bi', 'tri', 'quadri', 'quinti', 'sexti', 'septi', 'octi', 'noni', 'deci']
@@ -122,22 +161,41 @@ class PosIntBaseEngStringifier:
         return ''
 
     def _get_prefix_from_base(self, base):
-        cur_base = base % 1000
-        pref_base = base // 1000
-        prefix = self._get_prefix_from_base(pref_base) if pref_base > 0 else ''
-        if cur_base == 0:
-            if prefix:
-                res = self.placeholder_infix
-            else:
-                return ''
-        elif 1 <= cur_base <= 10:
-            res = self.small_prefixes[cur_base]
-        elif self.use_standard_prefixes and self._base_num_to_power(cur_base) in self.standard_prefixes:
-            res = self.standard_prefixes[self._base_num_to_power(cur_base)]
+        '''
+        The chunks of base are mapped through the chunk prefix table and
+        joined once, so long bases take linear time (after splitting).
+        '''
+        if base == 0:
+            return ''
+        table = self._get_chunk_prefix_table()
+        return ''.join([table[chunk] for chunk in reversed(PosIntEngStringifier._split_blocks(base))])
+
+    def _get_chunk_prefix_table(self):
+        '''
+        Prefixes of chunks 0-999, where chunk 0 is the placeholder. Shared by
+        all stringifiers of the same class and prefixes.
+        '''
+        key = (type(self), self.use_standard_prefixes)
+        try:
+            return self._chunk_prefix_tables[key]
+        except KeyError:
+            pass
+        table = _get_precomputed_table(type(self), 'chunk_prefix', (self.use_standard_prefixes,))
+        if table is None:
+            table = [self._make_chunk_prefix(chunk) for chunk in range(1000)]
+        return self._chunk_prefix_tables.setdefault(key, _intern_table(table))
+
+    def _make_chunk_prefix(self, chunk):
+        if chunk == 0:
+            res = self.placeholder_infix
+        elif 1 <= chunk <= 10:
+            res = self.small_prefixes[chunk]
+        elif self.use_standard_prefixes and self._base_num_to_power(chunk) in self.standard_prefixes:
+            res = self.standard_prefixes[self._base_num_to_power(chunk)]
         else:
-            hundred_num = cur_base // 100
-            ten_num = (cur_base // 10) % 10
-            unit_num = cur_base % 10
+            hundred_num = chunk // 100
+            ten_num = (chunk // 10) % 10
+            unit_num = chunk % 10
             hundred_prefix, hundred_rule = self.hundreds[hundred_num]
             ten_prefix, ten_rule = self.tens[ten_num]
             unit_prefix = self.units[unit_num]
@@ -147,7 +205,7 @@ class PosIntBaseEngStringifier:
                 unit_prefix += self._get_unit_suffix(unit_num, hundred_rule)
             res = unit_prefix + ten_prefix + hundred_prefix
         # change 'a' to 'i' if res ends with 'a'
-        return prefix+res[:-1]+self.infix
+        return res[:-1]+self.infix
 
     def _get_prefix_from_power(self, power):
         return self._get_prefix_from_base(self._power_to_base_num(power))
@@ -156,15 +214,101 @@ class PosIntBaseEngStringifier:
     def is_power_valid(power):
         return isinstance(power, int) and power > 0 and power % 3 == 0
 
-    def stringify(self, power):
-        if not self.is_power_valid(power):
-            raise ValueError('power')
+    def _make_power_str(self, power):
         if power == 3:
             return self.thousand
         return self._get_prefix_from_power(power) + self.suffix
 
+    def _get_power_table(self, size):
+        '''
+        Power names indexed by power//3, with at least size entries. Tables are
+        shared by all stringifiers of the same class and prefixes, and are
+        replaced rather than modified when grown.
+        '''
+        key = (type(self), self.use_standard_prefixes)
+        table = self._power_tables.get(key, [None])
+        if len(table) < size:
+            size = max(size, min(2*len(table), self.power_table_size))
+            table = table + list(self._iter_power_names(len(table), size))
+            self._power_tables[key] = table
+        return table
+
+    def _get_power_str(self, power):
+        i = power//3
+        if i >= self.power_table_size:
+            return self._make_power_str(power)
+        return self._get_power_table(i+1)[i]
+
+    def _get_power_strs(self, num_blocks):
+        '''
+        Names of the powers of num_blocks blocks, indexed by block.
+        '''
+        if num_blocks > self.power_table_size:
+            return _PowerStrs(self)
+        return self._get_power_table(num_blocks)
+
+    def _iter_power_runs(self, power):
+        '''
+        The name of a power as (piece, repeat count) runs.
+        '''
+        yield self._get_power_str(power), 1
+
+    def _iter_power_names(self, start, stop):
+        '''
+        Names of the powers 3*i for i in range(start, stop), where start > 0.
+        Consecutive bases share the prefix of all but their last chunk, which
+        is made once per 1000 names.
+        '''
+        table = self._get_chunk_prefix_table()
+        i = start
+        if i == 1 and i < stop:
+            yield self.thousand
+            i += 1
+        while i < stop:
+            high, low = divmod(self._power_to_base_num(3*i), 1000)
+            head = self._get_prefix_from_base(high)
+            end = min(stop, i+1000-low)
+            for chunk in range(low, low+end-i):
+                yield head + table[chunk] + self.suffix
+            i = end
+
+    def names_for_powers(self, start, stop):
+        '''
+        Yield (power, name) for each valid power in range(start, stop), in
+        order. Each name takes amortized constant time plus its length, as
+        the work of the higher chunks is shared between consecutive names.
+        '''
+        i = max(-(-start//3), 1)
+        return zip(itertools.count(3*i, 3), self._iter_power_names(i, -(-stop//3)))
+
+    def stringify(self, power):
+        if not self.is_power_valid(power):
+            raise ValueError('power')
+        return self._get_power_str(power)
+
+
+class _PowerStrs:
+    '''
+    Names of the powers of blocks, for numbers with too many blocks to keep
+    a table of.
+    '''
+
+    __slots__ = ('base_stringifier',)
+
+    def __init__(self, base_stringifier):
+        self.base_stringifier = base_stringifier
+
+    def __getitem__(self, i):
+        return self.base_stringifier.stringify(3*i)
+
 
 class PosIntBaseMaxEngStringifier(PosIntBaseEngStringifier):
+    # the names are composed of repeated max power names, so less are cached
+    max_power_table_size = 64
+    _max_power_tables = {}
+
+    __slots__ = ('maxPower', 'maxPowerStr')
+
     def __init__(self, max_power, use_standard_prefs=True):
         '''
         args:
@@ -175,29 +319,65 @@ class PosIntBaseMaxEngStringifier(PosIntBaseEngStringifier):
         if not self.is_power_valid(max_power) or max_power == 0:
             raise ValueError('max_power')
         super().__init__(use_standard_prefs)
-        self.maxPower = max_power
-        self.maxPowerStr = super().stringify(self.maxPower)
+        self._set_attrs(maxPower=max_power, maxPowerStr=super().stringify(max_power))
 
-    def stringify(self, power):
-        if not self.is_power_valid(power):
-            raise ValueError('power')
+    def _get_init_args(self):
+        return (self.maxPower, self.use_standard_prefixes)
+
+    def _get_power_strs(self, num_blocks):
+        if num_blocks > self.max_power_table_size:
+            return _PowerStrs(self)
+        key = (type(self), self.use_standard_prefixes, self.maxPower)
+        table = self._max_power_tables.get(key, [None])
+        if len(table) < num_blocks:
+            table = table + [self.stringify(3*i) for i in range(len(table), num_blocks)]
+            self._max_power_tables[key] = table
+        return table
+
+    def _iter_power_runs(self, power):
+        '''
+        The max power name is repeated up to power/max_power times, so it's
+        kept as a single run.
+        '''
         cur_power = power % self.maxPower
         max_power_num = power // self.maxPower
-        if cur_power == 0:
-            tokens = []
+        if cur_power != 0:
+            yield self._get_power_str(cur_power), 1
         else:
-            tokens = [super().stringify(cur_power)]
-        tokens.extend([self.maxPowerStr]*max_power_num)
-        return ' '.join(tokens)
+            yield self.maxPowerStr, 1
+            max_power_num -= 1
+        if max_power_num > 0:
+            yield ' '+self.maxPowerStr, max_power_num
+
+    def names_for_powers(self, start, stop):
+        '''
+        The names are made of names of powers below max_power, which are in
+        the power table, so they're just stringified in turn.
+        '''
+        i = max(-(-start//3), 1)
+        return ((power, self.stringify(power)) for power in range(3*i, stop, 3))
+
+    def stringify(self, power):
+        if not self.is_power_valid(power):
+            raise ValueError('power')
+        return ''.join(piece*count for piece, count in self._iter_power_runs(power))
 
 
-class PosIntEngStringifier:
+class PosIntEngStringifier(_Frozen):
     '''
     # Use of 'and'
 
     American english does not use 'and' anywhere (see wikitionary). Nobody
     does this, but not enforcing this also might introduces ambiguity which
     isn't resolved.
+
+    # Block Decomposition
+
+    Numbers are split into base 1000 blocks by divide and conquer: n is
+    divided by the largest precomputed 1000**(2**k) not exceeding it, and both
+    halves are split recursively (the lower half zero padded to 2**k blocks).
+    With repeated n % 1000 this is quadratic in the number of digits, which is
+    unusable for numbers with millions of digits.
     '''
 
     units = ['', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine']
@@ -209,10 +389,249 @@ class PosIntEngStringifier:
     thousand = 'thousand'
     infix = 'and'
 
-    def __init__(self, num_base_stringifier, british=True, commas=True):
-        self.num_base_stringifier = num_base_stringifier
-        self.british = british
-        self.commas = commas
+    _block_tables = {}
+    _tail_tables = {}
+    _byte_tables = {}
+    # ascii encoded power tables, by id of the power table they encode
+    _power_byte_tables = {}
+
+    __slots__ = ('num_base_stringifier', 'british', 'commas', 'cache')
+
+    def __init__(self, num_base_stringifier, british=True, commas=True, cache_size=0):
+        '''
+        args:
+            cache_size:
+                Number of results of stringify to keep, least recently used
+                first out, 0 for no cache. Numbers of more than
+                cache_max_bits bits are never cached. The cache has its own
+                lock, so it's the one part of a stringifier that changes.
+        '''
+        cache = None
+        if cache_size:
+            from numtowords.cache import LRUCache
+            cache = LRUCache(cache_size)
+        self._set_attrs(num_base_stringifier=num_base_stringifier, british=british, commas=commas, cache=cache)
+
+    def _get_init_args(self):
+        # the cache isn't sent, only its size
+        return (self.num_base_stringifier, self.british, self.commas, self.cache.maxsize if self.cache else 0)
+
+    # larger numbers are rarely repeated, and their strings are large
+    cache_max_bits = 256
+
+    # numbers below this are split by repeated division by 1000
+    split_threshold = 1000**64
+
+    # 1000**(2**k), extended on demand by _get_split_powers
+    _split_powers = [1000]
+
+    digits_chunk_size = 3*4096
+
+    # numbers with less blocks are always stringified in the current process
+    parallel_min_blocks = 4096
+    digit_spaces = b' \t\r\n'
+
+    @staticmethod
+    def _split_blocks_simple(n, pad=0):
+        '''
+        Split n into base 1000 blocks, least significant first, zero padding up
+        to pad blocks.
+        '''
+        blocks = []
+        while True:
+            n, rem = divmod(n, 1000)
+            blocks.append(rem)
+            if n == 0:
+                break
+        if len(blocks) < pad:
+            blocks.extend([0]*(pad-len(blocks)))
+        return blocks
+
+    @staticmethod
+    def _get_split_powers(size):
+        '''
+        1000**(2**k) for k < size at least. The list is shared by all
+        threads, so it's replaced rather than appended to when extended.
+        Callers index the list they're given, which never changes, rather
+        than the current one.
+        '''
+        powers = PosIntEngStringifier._split_powers
+        if len(powers) >= size:
+            return powers
+        powers = list(powers)
+        while len(powers) < size:
+            powers.append(powers[-1]**2)
+        if len(powers) > len(PosIntEngStringifier._split_powers):
+            PosIntEngStringifier._split_powers = powers
+        return powers
+
+    @classmethod
+    def _split_blocks(cls, n):
+        '''
+        Split n into base 1000 blocks, least significant first. The most
+        significant block is non-zero unless n is 0.
+        '''
+        if n < cls.split_threshold:
+            return cls._split_blocks_simple(n)
+        powers = cls._get_split_powers(1)
+        k = 0
+        while powers[k]**2 <= n:
+            k += 1
+            if k == len(powers):
+                powers = cls._get_split_powers(k+1)
+        blocks = []
+        cls._split_blocks_rec(n, k, False, blocks)
+        return blocks
+
+    @classmethod
+    def _join_blocks(cls, blocks):
+        '''
+        The inverse of _split_blocks, blocks are joined by divide and conquer
+        as well.
+        '''
+        if len(blocks) <= 64:
+            n = 0
+            for coeff in reversed(blocks):
+                n = n*1000+coeff
+            return n
+        k = (len(blocks)-1).bit_length()-1
+        powers = cls._get_split_powers(k+1)
+        return cls._join_blocks(blocks[:2**k]) + cls._join_blocks(blocks[2**k:])*powers[k]
+
+    @classmethod
+    def _split_digit_blocks(cls, digits):
+        '''
+        Split a number given as ascii decimal digits into base 1000 blocks,
+        least significant first.
+
+        returns:
+            (negative, blocks), the most significant block is non-zero unless
+            the number is 0.
+        '''
+        if isinstance(digits, str):
+            digits = digits.encode('ascii')
+        with memoryview(digits) as view:
+            start = 0
+            stop = len(view)
+            while start < stop and view[start] in cls.digit_spaces:
+                start += 1
+            while stop > start and view[stop-1] in cls.digit_spaces:
+                stop -= 1
+            negative = start < stop and view[start] == ord('-')
+            if negative:
+                start += 1
+            if start == stop:
+                raise ValueError('digits')
+            blocks = []
+            # the chunk size is a multiple of 3 so chunks end on block boundaries
+            while stop > start:
+                chunk_start = max(start, stop-cls.digits_chunk_size)
+                chunk = bytes(view[chunk_start:stop])
+                if not chunk.isdigit():
+                    raise ValueError('digits')
+                blocks.extend(int(chunk[max(i-3, 0):i]) for i in range(len(chunk), 0, -3))
+                stop = chunk_start
+        while len(blocks) > 1 and blocks[-1] == 0:
+            blocks.pop()
+        return negative, blocks
+
+    @staticmethod
+    def _add_blocks(blocks, delta_blocks):
+        '''
+        Add delta_blocks to blocks in place.
+
+        returns:
+            The index of the highest changed block.
+        '''
+        carry = 0
+        i = 0
+        while i < len(delta_blocks) or carry:
+            if i == len(blocks):
+                blocks.append(0)
+            carry, blocks[i] = divmod(blocks[i]+(delta_blocks[i] if i < len(delta_blocks) else 0)+carry, 1000)
+            i += 1
+        return i-1
+
+    @staticmethod
+    def _sub_blocks(blocks, delta_blocks):
+        '''
+        Subtract delta_blocks from blocks in place, the result must not be
+        negative. Zero blocks are removed from the top.
+
+        returns:
+            The index of the highest changed block, which might have been
+            removed.
+        '''
+        borrow = 0
+        i = 0
+        while i < len(delta_blocks) or borrow:
+            borrow, blocks[i] = divmod(blocks[i]-(delta_blocks[i] if i < len(delta_blocks) else 0)-borrow, 1000)
+            borrow = -borrow
+            i += 1
+        while len(blocks) > 1 and blocks[-1] == 0:
+            blocks.pop()
+        return i-1
+
+    @classmethod
+    def _split_segments(cls, n, level):
+        '''
+        Split n into segments of 2**level blocks, least significant first.
+        '''
+        powers = cls._get_split_powers(level+1)
+        k = level
+        while powers[k]**2 <= n:
+            k += 1
+            if k == len(powers):
+                powers = cls._get_split_powers(k+1)
+        segments = []
+        cls._split_segments_rec(n, k, level, False, segments)
+        return segments
+
+    @classmethod
+    def _split_segments_rec(cls, n, k, level, pad, segments):
+        # n < 1000**(2**(k+1)), padded to 2**(k+1-level) segments if pad is set,
+        # where k >= level
+        powers = cls._get_split_powers(k+1)
+        while not pad and k > level and n < powers[k]:
+            k -= 1
+        quot, rem = divmod(n, powers[k])
+        if k == level:
+            segments.append(rem)
+            if pad or quot:
+                segments.append(quot)
+            return
+        cls._split_segments_rec(rem, k-1, level, True, segments)
+        if pad or quot:
+            cls._split_segments_rec(quot, k-1, level, pad, segments)
+
+    @classmethod
+    def _split_blocks_rec(cls, n, k, pad, blocks):
+        # n < 1000**(2**(k+1)), padded to 2**(k+1) blocks if pad is set
+        powers = cls._get_split_powers(k+1)
+        while not pad and k > 0 and n < powers[k]:
+            k -= 1
+        if powers[k] < cls.split_threshold:
+            blocks.extend(cls._split_blocks_simple(n, 2**(k+1) if pad else 0))
+            return
+        quot, rem = divmod(n, powers[k])
+        cls._split_blocks_rec(rem, k-1, True, blocks)
+        if pad or quot:
+            cls._split_blocks_rec(quot, k-1, pad, blocks)
+
+    def _get_block_table(self):
+        '''
+        Stringified block coefficients 0-999, shared by all stringifiers of
+        the same class and format.
+        '''
+        key = (type(self), self.british)
+        try:
+            return self._block_tables[key]
+        except KeyError:
+            pass
+        table = _get_precomputed_table(type(self), 'block', (self.british,))
+        if table is None:
+            table = [self._string_block_coeff(coeff) for coeff in range(1000)]
+        return self._block_tables.setdefault(key, _intern_table(table))
 
     def _string_block_coeff(self, n):
         hundred_rem = n % 100
@@ -242,7 +661,7 @@ class PosIntEngStringifier:
     def is_n_valid(self, n):
         return isinstance(n, int) and n > 0
 
-    def stringify(self, n):
+    def stringify(self, n, workers=None):
         '''
         # Algorithm (british)
 
@@ -267,65 +686,500 @@ class PosIntEngStringifier:
         
         This is just the algorithm for british nuemrals being stripped of
         'and's.
+
+        # Parallel Stringification
+
+        If workers is given, huge numbers are split into segments which are
+        stringified by a pool of processes, see _iter_stringify_parallel.
+        '''
+        cache = self.cache
+        if cache is None or not self.is_n_valid(n) or n.bit_length() > self.cache_max_bits:
+            return ''.join(self.iter_stringify(n, workers))
+        res = cache.get(n)
+        if res is None:
+            res = ''.join(self.iter_stringify(n, workers))
+            cache.put(n, res)
+        return res
+
+    def cache_info(self):
+        '''
+        returns:
+            The CacheInfo (hits, misses, evictions, maxsize, currsize) of the
+            stringify cache, or None if there's no cache.
+        '''
+        return self.cache.info() if self.cache is not None else None
+
+    def stringify_digits(self, digits):
+        '''
+        Stringify a number given as decimal digits, the blocks are formed
+        straight from the text so no int is ever constructed.
+
+        args:
+            digits:
+                A str, bytes or any bytes-like object (e.g. an mmap) of ascii
+                digits, surrounding whitespace is ignored.
+        '''
+        return ''.join(self.iter_stringify_digits(digits))
+
+    def iter_stringify(self, n, workers=None):
+        '''
+        Stringify n in pieces, most significant first, so huge outputs never
+        have to be held in memory at once.
+
+        args:
+            workers:
+                Number of processes to stringify numbers of at least
+                parallel_min_blocks blocks with, by default the current process
+                is used.
+        '''
+        if not self.is_n_valid(n):
+            raise ValueError('n')
+        if workers is not None and workers > 1 and n >= 1000**self.parallel_min_blocks:
+            return self._iter_stringify_parallel(n, workers)
+        return self._iter_blocks(self._split_blocks(n))
+
+    def iter_stringify_digits(self, digits):
+        negative, blocks = self._split_digit_blocks(digits)
+        if negative or blocks[-1] == 0:
+            raise ValueError('digits')
+        return self._iter_blocks(blocks)
+
+    def write_stringify(self, n, fp, workers=None):
+        fp.writelines(self.iter_stringify(n, workers))
+
+    def stringify_bytes(self, n):
+        '''
+        self.stringify(n) ascii encoded, assembled from encoded tables so no
+        str is built.
+        '''
+        return b''.join(self.iter_stringify_bytes(n))
+
+    def stringify_buffers(self, n):
+        '''
+        The pieces of stringify_bytes as a list of bytes, e.g. for
+        socket.sendmsg or os.writev. Most pieces are shared table entries.
+        '''
+        return list(self.iter_stringify_bytes(n))
+
+    # pieces copied to the buffer at once by stringify_into
+    into_chunk_pieces = 256
+
+    def stringify_into(self, n, buf, offset=0):
         '''
+        Write stringify_bytes(n) into buf at offset.
+
+        args:
+            buf:
+                A writable bytes-like object, e.g. a bytearray or memoryview.
+
+        returns:
+            The number of bytes written.
+
+        raises:
+            ValueError if buf is too small, buf is partly written then.
+        '''
+        pieces = self.iter_stringify_bytes(n)
+        with memoryview(buf) as view, view.cast('B') as view:
+            pos = offset
+            while True:
+                # pieces are copied in joined chunks, since copying each
+                # small piece is slower than joining them
+                chunk = b''.join(itertools.islice(pieces, self.into_chunk_pieces))
+                if not chunk:
+                    break
+                end = pos+len(chunk)
+                if end > len(view):
+                    raise ValueError('buf')
+                view[pos:end] = chunk
+                pos = end
+        return pos-offset
+
+    def iter_stringify_bytes(self, n):
         if not self.is_n_valid(n):
             raise ValueError('n')
+        return self._iter_blocks_bytes(self._split_blocks(n))
+
+    def _iter_blocks_bytes(self, blocks):
+        '''
+        Like _iter_blocks, but ascii encoded. The last block is taken whole
+        from the tail tables.
+        '''
+        block_table, tail_tables = self._get_byte_tables()
+        sep = b', ' if self.commas else b' '
+        power_bytes = self._get_power_bytes(len(blocks))
+        prev_coeff = None
+        first = True
+        for i in range(len(blocks)-1, 0, -1):
+            coeff = blocks[i]
+            if coeff == 0:
+                continue
+            if not first:
+                yield sep
+            first = False
+            prev_coeff = coeff
+            yield block_table[coeff]
+            yield b' '
+            if power_bytes is not None:
+                yield power_bytes[i]
+            else:
+                for piece, count in self.num_base_stringifier._iter_power_runs(3*i):
+                    for chunk in _expand_run(piece, count):
+                        yield chunk.encode('ascii')
+        tail = tail_tables[0 if prev_coeff is None else 1 if prev_coeff < 100 else 2][blocks[0]]
+        if tail:
+            yield tail
+
+    def _get_byte_tables(self):
+        '''
+        The block table and tail tables, ascii encoded.
+        '''
+        key = (type(self), self.british, self.commas)
+        try:
+            return self._byte_tables[key]
+        except KeyError:
+            return self._byte_tables.setdefault(key, (
+                [block_str.encode('ascii') for block_str in self._get_block_table()],
+                [[tail.encode('ascii') for tail in tail_table] for tail_table in self._get_tail_tables()],
+            ))
+
+    def _get_power_bytes(self, num_blocks):
+        '''
+        The power names of _get_power_strs ascii encoded, or None if there's
+        no table for num_blocks blocks. Power tables are replaced rather than
+        modified, so an encoded table is valid as long as its table is
+        current.
+        '''
+        power_strs = self.num_base_stringifier._get_power_strs(num_blocks)
+        if not isinstance(power_strs, list):
+            return None
+        try:
+            table, power_bytes = self._power_byte_tables[id(power_strs)]
+            if table is power_strs:
+                return power_bytes
+        except KeyError:
+            pass
+        power_bytes = [b''] + [power_str.encode('ascii') for power_str in power_strs[1:]]
+        self._power_byte_tables[id(power_strs)] = (power_strs, power_bytes)
+        return power_bytes
+
+    def stringify_length(self, n):
+        '''
+        len(self.stringify(n)), summed over the pieces of the string so it's
+        never built.
+        '''
+        return sum(len(piece)*count for piece, count in self._iter_stringify_runs(n))
+
+    def stringify_slice(self, n, start=None, stop=None):
+        '''
+        self.stringify(n)[start:stop], only keeping the pieces of the string
+        which overlap the slice. Negative indices need a pass to find the
+        length first.
+        '''
+        if start is None:
+            start = 0
+        if start < 0 or stop is not None and stop < 0:
+            start, stop, _ = slice(start, stop).indices(self.stringify_length(n))
         res = []
-        cur_pow = 0
-        block_coeffs = []
-        block_coeffs_non_zero = []
-        while True:
-            rem = n % 1000
-            quot = n // 1000
-            block_res = []
-            if len(block_coeffs) < 2:
-                block_coeffs.append(rem)
-            if rem != 0:
-                if len(block_coeffs_non_zero) < 2:
-                    block_coeffs_non_zero.append(rem)
-                # stringify the digit in base 1000
-                block_res.append(self._string_block_coeff(rem))
-                if cur_pow > 0:
-                    # concatenate power
-                    block_res.append(self.num_base_stringifier.stringify(cur_pow))
-                res.append(' '.join(block_res))
-            if quot == 0:
+        pos = 0
+        for piece, count in self._iter_stringify_runs(n):
+            if stop is not None and pos >= stop:
                 break
-            n = quot
-            cur_pow += 3
-        if self.british:
-            try:
-                # there's more than 1 block, and the last block has no 'and'
-                if 0 < block_coeffs[0] < 100 and block_coeffs[1] is not None:
-                    res[0] = self.infix + ' ' + res[0]
-                    if self.commas:
-                        # the last block has an 'and' prefix, and the second
-                        # last non-zero block has an 'and' remove the comma by
-                        # merging
-                        if 0 < block_coeffs[0] < 100 and 0 < block_coeffs_non_zero[1] < 100:
-                            res0 = res.pop(0)
-                            res1 = res.pop(0)
-                            res.insert(0, '{} {}'.format(res1, res0))
-            except IndexError:
-                pass
-
-        if self.commas:
-            return ', '.join(reversed(res))
-        else:
-            return ' '.join(reversed(res))
+            end = pos+len(piece)*count
+            if end > start:
+                # only repeat the pieces of the run overlapping the slice
+                skip = max(start-pos, 0)//len(piece)
+                pos += skip*len(piece)
+                repeat = count-skip if stop is None else min(count-skip, -(-(stop-pos)//len(piece)))
+                res.append((piece*repeat)[max(start-pos, 0):None if stop is None else stop-pos])
+            pos = end
+        return ''.join(res)
+
+    def _iter_stringify_runs(self, n):
+        '''
+        Stringify n as (piece, repeat count) runs, most significant first.
+        '''
+        if not self.is_n_valid(n):
+            raise ValueError('n')
+        return self._iter_runs(self._split_blocks(n))
+
+    def _iter_blocks(self, blocks):
+        '''
+        The 'and' and comma rules only depend on the last block and the second
+        last non-zero block, both are found upfront so pieces can be yielded
+        from the most significant block.
+        '''
+        prev_coeff = next((coeff for coeff in itertools.islice(blocks, 1, None) if coeff != 0), None)
+        yield from self._iter_head(blocks, 0, 1)
+        yield from self._iter_tail(blocks[0], prev_coeff)
+
+    def _iter_runs(self, blocks):
+        '''
+        Like _iter_blocks, but as (piece, repeat count) runs.
+        '''
+        prev_coeff = next((coeff for coeff in itertools.islice(blocks, 1, None) if coeff != 0), None)
+        yield from self._iter_head_runs(blocks, 0, 1)
+        for piece in self._iter_tail(blocks[0], prev_coeff):
+            yield piece, 1
+
+    def _iter_head(self, blocks, offset, start):
+        '''
+        Pieces of blocks[start:], where blocks[0] is block number offset of the
+        whole number.
+        '''
+        sep = ', ' if self.commas else ' '
+        block_table = self._get_block_table()
+        power_strs = self.num_base_stringifier._get_power_strs(offset+len(blocks))
+        # names of powers beyond the tables can be long, e.g. repeated max
+        # powers, so they're expanded from runs in bounded chunks
+        iter_power_runs = None if isinstance(power_strs, list) else self.num_base_stringifier._iter_power_runs
+        first = True
+        for i in range(len(blocks)-1, start-1, -1):
+            coeff = blocks[i]
+            if coeff == 0:
+                continue
+            if not first:
+                yield sep
+            first = False
+            yield block_table[coeff]
+            yield ' '
+            if iter_power_runs is None:
+                yield power_strs[offset+i]
+            else:
+                for piece, count in iter_power_runs(3*(offset+i)):
+                    yield from _expand_run(piece, count)
+
+    def _iter_head_runs(self, blocks, offset, start):
+        '''
+        Like _iter_head, but as (piece, repeat count) runs, so repeated max
+        powers can be measured and skipped over without expanding them.
+        '''
+        sep = ', ' if self.commas else ' '
+        block_table = self._get_block_table()
+        power_strs = self.num_base_stringifier._get_power_strs(offset+len(blocks))
+        iter_power_runs = None if isinstance(power_strs, list) else self.num_base_stringifier._iter_power_runs
+        first = True
+        for i in range(len(blocks)-1, start-1, -1):
+            coeff = blocks[i]
+            if coeff == 0:
+                continue
+            if not first:
+                yield sep, 1
+            first = False
+            yield block_table[coeff], 1
+            yield ' ', 1
+            if iter_power_runs is None:
+                yield power_strs[offset+i], 1
+            else:
+                yield from iter_power_runs(3*(offset+i))
+
+    def _iter_tail(self, last_coeff, prev_coeff):
+        '''
+        Pieces of the last block, prev_coeff is the second last non-zero block
+        or None if there's none.
+        '''
+        if last_coeff == 0:
+            return
+        sep = ', ' if self.commas else ' '
+        if prev_coeff is not None:
+            # there's more than 1 block, and the last block has no 'and'
+            if self.british and last_coeff < 100:
+                # the second last non-zero block has no 'and' either, so no
+                # comma is needed
+                yield ' ' if self.commas and prev_coeff < 100 else sep
+                yield self.infix
+                yield ' '
+            else:
+                yield sep
+        yield self._get_block_table()[last_coeff]
+
+    def _get_tail_tables(self):
+        '''
+        Stringified last blocks 0-999, for when there's no other block, when
+        the second last non-zero block is below 100, and when it's not. Shared
+        by all stringifiers of the same class and format.
+        '''
+        key = (type(self), self.british, self.commas)
+        try:
+            return self._tail_tables[key]
+        except KeyError:
+            pass
+        tables = _get_precomputed_table(type(self), 'tail', (self.british, self.commas))
+        if tables is None:
+            tables = [
+                [''.join(self._iter_tail(coeff, prev_coeff)) for coeff in range(1000)]
+                for prev_coeff in (None, 1, 100)
+            ]
+        return self._tail_tables.setdefault(key, [_intern_table(table) for table in tables])
+
+    def _iter_stringify_parallel(self, n, workers):
+        '''
+        n is split into segments of 2**level blocks, about workers of them,
+        which are split and stringified (except the last block) by separate
+        processes. The last block is stringified here, since it depends on
+        the second last non-zero block, which the segments report.
+        '''
+        import multiprocessing
+        num_blocks = n.bit_length()*math.log10(2)/3+1
+        level = max(math.ceil(math.log2(num_blocks/workers)), 0)
+        segments = self._split_segments(n, level)
+        tasks = [(self, segment, i*2**level) for i, segment in enumerate(segments)]
+        sep = ', ' if self.commas else ' '
+        prev_coeff = None
+        first = True
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            for segment_str, segment_prev_coeff in pool.imap(_stringify_segment, reversed(tasks)):
+                if segment_prev_coeff is not None:
+                    prev_coeff = segment_prev_coeff
+                if segment_str:
+                    if not first:
+                        yield sep
+                    first = False
+                    yield segment_str
+        yield from self._iter_tail(n % 1000, prev_coeff)
+
+
+# whether the tables of numtowords._tables are used
+use_precomputed_tables = True
+
+
+def _get_precomputed_table(cls, name, config):
+    '''
+    A table generated by bin/gen_tables.py, so it isn't built at first use.
+    The tables are only valid for the classes of this module, subclasses may
+    change their words.
+
+    returns:
+        The table, or None if there's none.
+    '''
+    if not use_precomputed_tables or cls.__module__ != __name__:
+        return None
+    from numtowords import _tables
+    table = _tables.tables.get((cls.__name__, name, config))
+    if table is None:
+        return None
+    # tables are stored joined by newlines
+    if isinstance(table, tuple):
+        return [sub_table.split('\n') for sub_table in table]
+    return table.split('\n')
+
+
+def _intern_table(table):
+    '''
+    The strings of tables are interned, so the equal strings of the tables of
+    different classes and options (e.g. the blocks below 100 of british and
+    american tables) are shared by all of them.
+    '''
+    return [sys.intern(s) for s in table]
+
+
+def _expand_run(piece, count, chunk_size=256):
+    chunk = piece*chunk_size
+    for _ in range(count//chunk_size):
+        yield chunk
+    if count % chunk_size:
+        yield piece*(count % chunk_size)
+
+
+def _stringify_segment(task):
+    '''
+    Stringify a segment of a number in a worker process.
+
+    returns:
+        (stringified segment, lowest non-zero block or None)
+    '''
+    stringifier, segment, offset = task
+    blocks = stringifier._split_blocks(segment)
+    start = 1 if offset == 0 else 0
+    prev_coeff = next((coeff for coeff in itertools.islice(blocks, start, None) if coeff != 0), None)
+    return ''.join(stringifier._iter_head(blocks, offset, start)), prev_coeff
 
 
 class IntEngStringifier(PosIntEngStringifier):
+    __slots__ = ()
+
     zero = 'zero'
     negative = 'negative'
 
     def is_n_valid(self, n):
         return isinstance(n, int)
 
-    def stringify(self, n):
+    def iter_stringify(self, n, workers=None):
         if n == 0:
-            return self.zero
+            return iter((self.zero,))
         elif n < 0:
-            return '{} {}'.format(self.negative, super().stringify(-n))
+            return itertools.chain((self.negative, ' '), super().iter_stringify(-n, workers))
         else:
-            return super().stringify(n)
+            return super().iter_stringify(n, workers)
+
+    def _iter_stringify_runs(self, n):
+        if n == 0:
+            return iter(((self.zero, 1),))
+        elif n < 0:
+            return itertools.chain(((self.negative, 1), (' ', 1)), super()._iter_stringify_runs(-n))
+        else:
+            return super()._iter_stringify_runs(n)
+
+    def iter_stringify_bytes(self, n):
+        if n == 0:
+            return iter((self.zero.encode('ascii'),))
+        elif n < 0:
+            return itertools.chain((self.negative.encode('ascii'), b' '), super().iter_stringify_bytes(-n))
+        else:
+            return super().iter_stringify_bytes(n)
+
+    def iter_stringify_digits(self, digits):
+        negative, blocks = self._split_digit_blocks(digits)
+        if blocks[-1] == 0:
+            return iter((self.zero,))
+        elif negative:
+            return itertools.chain((self.negative, ' '), self._iter_blocks(blocks))
+        else:
+            return self._iter_blocks(blocks)
+
+    def iter_range(self, start, stop, step=1):
+        '''
+        Stringify each number of range(start, stop, step). The blocks of each
+        number are derived from the previous number's, and only the blocks
+        which changed are stringified again, e.g. with step 1 the blocks
+        above the last only change every 1000 numbers.
+        '''
+        if step == 0:
+            raise ValueError('step')
+        return self._iter_range(range(start, stop, step))
+
+    def _iter_range(self, numbers):
+        step_blocks = self._split_blocks(abs(numbers.step))
+        sep = ', ' if self.commas else ' '
+        block_table = self._get_block_table()
+        tail_tables = self._get_tail_tables()
+        negative_prefix = self.negative + ' '
+        prev_n = 0
+        for n in numbers:
+            if n == 0:
+                prev_n = n
+                yield self.zero
+                continue
+            if (prev_n > 0) != (n > 0) or prev_n == 0:
+                blocks = self._split_blocks(abs(n))
+                block_strs = [None]*len(blocks)
+                # make sure the blocks above the last are stringified even
+                # if there's none
+                changed = max(len(blocks)-1, 1)
+            elif (n > prev_n) == (n > 0):
+                changed = self._add_blocks(blocks, step_blocks)
+            else:
+                changed = self._sub_blocks(blocks, step_blocks)
+            prev_n = n
+            if changed > 0:
+                # restringify the changed blocks, then the blocks above the last
+                del block_strs[len(blocks):]
+                block_strs.extend([None]*(len(blocks)-len(block_strs)))
+                power_strs = self.num_base_stringifier._get_power_strs(len(blocks))
+                for i in range(1, min(changed+1, len(blocks))):
+                    coeff = blocks[i]
+                    block_strs[i] = '{} {}'.format(block_table[coeff], power_strs[i]) if coeff != 0 else None
+                head = sep.join(block_str for block_str in reversed(block_strs) if block_str is not None)
+                prev_coeff = next((coeff for coeff in itertools.islice(blocks, 1, None) if coeff != 0), None)
+                tail_table = tail_tables[0 if prev_coeff is None else 1 if prev_coeff < 100 else 2]
+            res = head + tail_table[blocks[0]]
+            yield negative_prefix + res if n < 0 else res
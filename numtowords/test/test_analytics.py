@@ -0,0 +1,36 @@
+import unittest
+from numtowords.analytics import *
+from numtowords.stringify import *
+
+
+class TestRangeStats(unittest.TestCase):
+    def brute_stats(self, stringifier, start, stop):
+        res = TextStats()
+        for n in range(start, stop):
+            res += TextStats.from_str(stringifier.stringify(n), numbers=1)
+        return res
+
+    def test_range_stats(self):
+        for british in (True, False):
+            for commas in (True, False):
+                for base_stringifier in (PosIntBaseEngStringifier(), PosIntBaseMaxEngStringifier(3)):
+                    stringifier = IntEngStringifier(base_stringifier, british=british, commas=commas)
+                    for start, stop in (
+                        (-2000, 2000), (-5, -2), (0, 1), (3, 3), (999000, 1003000), (1000**3-100, 1000**3+2100),
+                        (5*1000**2-1500, 5*1000**2+1500), (101*1000**2-1500, 101*1000**2+1500),
+                    ):
+                        self.assertEqual(self.brute_stats(stringifier, start, stop), range_stats(stringifier, start, stop))
+
+    def test_large_range(self):
+        stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+        stats = range_stats(stringifier, 1, 10**12)
+        self.assertEqual(10**12-1, stats.numbers)
+        self.assertEqual(stats.words, sum(stats.word_counts.values()))
+        # numbers with a non-zero billion block
+        self.assertEqual(999*10**9, stats.word_counts['billion'])
+
+    def test_pos_int(self):
+        stringifier = PosIntEngStringifier(PosIntBaseEngStringifier())
+        self.assertEqual(self.brute_stats(stringifier, 1, 1500), range_stats(stringifier, 1, 1500))
+        with self.assertRaises(ValueError):
+            range_stats(stringifier, 0, 10)
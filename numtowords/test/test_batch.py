@@ -0,0 +1,71 @@
+import array
+import random
+import unittest
+from unittest import mock
+from numtowords import batch
+from numtowords.stringify import *
+
+
+class TestStringifyArray(unittest.TestCase):
+    def setUp(self):
+        rand = random.Random(0)
+        self.values = [0, 1, -1, 1001, 101024, -102000003, 2**63-1, -2**63]
+        self.values.extend(rand.randrange(-2**63, 2**63) for _ in range(1000))
+        # small coefficients, to exercise the 'and' and comma rules
+        self.values.extend(
+            rand.choice([1, 99, 101])*1000**rand.randrange(1, 6) + rand.choice([0, 5, 99, 100, 999])
+            for _ in range(1000)
+        )
+
+    def check(self, values):
+        for british in (True, False):
+            for commas in (True, False):
+                for base_stringifier in (PosIntBaseEngStringifier(), PosIntBaseMaxEngStringifier(9)):
+                    stringifier = IntEngStringifier(base_stringifier, british=british, commas=commas)
+                    self.assertEqual(
+                        [stringifier.stringify(n) for n in self.values],
+                        batch.stringify_array(stringifier, values)
+                    )
+
+    @unittest.skipIf(batch.np is None, 'numpy is not installed')
+    def test_numpy(self):
+        self.check(batch.np.array(self.values, dtype=batch.np.int64))
+
+    @unittest.skipIf(batch.np is None, 'numpy is not installed')
+    def test_numpy_unsigned(self):
+        stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+        values = [0, 7, 2**64-1]
+        self.assertEqual(
+            [stringifier.stringify(n) for n in values],
+            batch.stringify_array(stringifier, batch.np.array(values, dtype=batch.np.uint64))
+        )
+
+    def test_buffer(self):
+        self.check(array.array('q', self.values))
+
+    def test_no_numpy(self):
+        with mock.patch.object(batch, 'np', None):
+            self.check(array.array('q', self.values))
+            with self.assertRaises(ValueError):
+                batch.stringify_array(IntEngStringifier(PosIntBaseEngStringifier()), array.array('d', [1.0]))
+
+    @unittest.skipIf(batch.np is None, 'numpy is not installed')
+    def test_slices(self):
+        with mock.patch.object(batch, 'slice_size', 7):
+            self.check(batch.np.array(self.values, dtype=batch.np.int64))
+
+    def test_inputs(self):
+        stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+        for np in ((batch.np, None) if batch.np is not None else (None,)):
+            with mock.patch.object(batch, 'np', np):
+                self.assertEqual(['seven', 'two hundred and fifty-five'], batch.stringify_array(stringifier, b'\x07\xff'))
+                self.assertEqual(['one', 'negative two'], batch.stringify_array(stringifier, [1, -2]))
+                self.assertEqual([], batch.stringify_array(stringifier, array.array('q')))
+                for values in (array.array('d', [1.0]), memoryview(b'ab').cast('c'), [2**64], [1.0]):
+                    with self.assertRaises(ValueError):
+                        batch.stringify_array(stringifier, values)
+
+    def test_pos_int(self):
+        stringifier = PosIntEngStringifier(PosIntBaseEngStringifier())
+        with self.assertRaises(ValueError):
+            batch.stringify_array(stringifier, array.array('q', [1, 0]))
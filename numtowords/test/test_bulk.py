@@ -0,0 +1,27 @@
+import unittest
+from numtowords import bulk
+from numtowords.stringify import *
+
+
+class TestStringifyLines(unittest.TestCase):
+    def setUp(self):
+        self.stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+        self.lines = ['{}\n'.format(n) for n in range(-1500, 1500, 7)] + ['abc\n', '\n', '10' + '0'*5000]
+
+    def test_stringify_lines(self):
+        expected = []
+        for line in self.lines:
+            try:
+                expected.append(self.stringifier.stringify_digits(line))
+            except ValueError as e:
+                expected.append('Error: {}'.format(e))
+        self.assertEqual(expected, list(bulk.stringify_lines(self.stringifier, self.lines, chunk_size=16)))
+        self.assertEqual(expected, list(bulk.stringify_lines(self.stringifier, iter(self.lines), jobs=2, chunk_size=16)))
+        self.assertEqual(expected, bulk.stringify_chunk(self.stringifier, self.lines))
+
+    def test_int_literals(self):
+        self.assertEqual(
+            ['five', 'one thousand', 'negative twelve', 'Error: digits', 'Error: digits'],
+            bulk.stringify_chunk(self.stringifier, ['+5\n', '1_000\n', ' -1_2 ', '0x10\n', '+\n'])
+        )
+        self.assertEqual(['Error: digits'], bulk.stringify_chunk(PosIntEngStringifier(PosIntBaseEngStringifier()), ['-5']))
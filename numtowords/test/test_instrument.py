@@ -0,0 +1,49 @@
+import threading
+import unittest
+from numtowords import instrument
+from numtowords.stringify import *
+
+
+class TestInstrument(unittest.TestCase):
+    def setUp(self):
+        self.stringifier = IntEngStringifier(PosIntBaseEngStringifier(), cache_size=4)
+
+    def tearDown(self):
+        instrument.disable()
+
+    def test_snapshot(self):
+        expected = [self.stringifier.stringify(n) for n in (-1001, 10**3003+5, 7, 7)]
+        split_blocks = PosIntEngStringifier.__dict__['_split_blocks']
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        self.assertEqual(expected, [self.stringifier.stringify(n) for n in (-1001, 10**3003+5, 7, 7)])
+        self.assertEqual('one million', self.stringifier.stringify_digits('1000000'))
+        snap = instrument.snapshot()
+        instrument.disable()
+        self.assertIs(split_blocks, PosIntEngStringifier.__dict__['_split_blocks'])
+
+        # -1001 and 7 are cached, 10**3003+5 is too large to be, and the base
+        # of its largest power name is split into 2 chunks too
+        self.assertEqual(2, snap['phases']['assemble']['calls'])
+        self.assertEqual(3, snap['phases']['split']['calls'])
+        self.assertEqual({'blocks': 1002+3, 'power_chunks': 2, 'cache_hits': 3, 'cache_misses': 0, 'power_names': 1}, {
+            name: snap['counters'].get(name, 0)
+            for name in ('blocks', 'power_chunks', 'cache_hits', 'cache_misses', 'power_names')
+        })
+        self.assertLessEqual(sum(stats['time_s'] for stats in snap['phases'].values()), snap['total_s'])
+        self.assertIn('assemble', instrument.format_snapshot(snap))
+
+    def test_power_names(self):
+        instrument.enable()
+        names = list(PosIntBaseEngStringifier().names_for_powers(3, 3*1500))
+        # names made a table at a time are counted as they're yielded
+        self.assertEqual(len(names), instrument.snapshot()['counters']['power_names'])
+
+    def test_threads(self):
+        instrument.enable()
+        threads = [threading.Thread(target=lambda: [instrument.count('n') for _ in range(10000)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(40000, instrument.snapshot()['counters']['n'])
@@ -0,0 +1,77 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from numtowords import instrument
+from numtowords.bin import main
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def run_main(self, argv, stdin=''):
+        out_file = io.StringIO()
+        with mock.patch.object(sys, 'argv', ['main.py'] + argv), mock.patch.object(sys, 'stdout', out_file), \
+                mock.patch.object(sys, 'stdin', io.StringIO(stdin) if isinstance(stdin, str) else stdin):
+            main.main()
+        return out_file.getvalue()
+
+    def write_file(self, name, text):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_default_options(self):
+        nums = ['0', '-1001', '123456789', '1' + '0'*48, '1' + '0'*3003]
+        self.assertIsNotNone(main.parse_nums(nums))
+        # nums alone take the path skipping argparse
+        res = self.run_main(nums)
+        self.assertEqual(res, self.run_main(['--format', 'british'] + nums))
+        self.assertIn('one quinquadecillion\n', res)
+
+    def test_lines(self):
+        nums = ['5', '-1001', '+5', '1_000', '1' + '0'*4000]
+        expected = self.run_main(nums)
+        lines = ''.join(num + '\n' for num in nums)
+        self.assertEqual(expected, self.run_main(['--stdin'], lines))
+        path = self.write_file('nums.txt', lines)
+        self.assertEqual(expected, self.run_main(['--input', path]))
+        self.assertEqual(expected, self.run_main(['--input', path, '--jobs', '2', '--chunk-size', '2']))
+        self.assertEqual('Error: digits\n', self.run_main(['--stdin'], 'abc\n'))
+
+    def test_digits_file(self):
+        path = self.write_file('digits.txt', '1' + '0'*3003 + '\n')
+        self.assertEqual(self.run_main(['1' + '0'*3003]), self.run_main(['--digits-file', path]))
+        self.assertEqual('Error: digits\n', self.run_main(['--digits-file', self.write_file('bad.txt', '12a')]))
+
+    def test_profile(self):
+        self.addCleanup(instrument.disable)
+        err_file = io.StringIO()
+        with mock.patch.object(sys, 'stderr', err_file):
+            res = self.run_main(['--profile', '1000001'])
+        self.assertEqual('one million and one\n', res)
+        self.assertIn('assemble', err_file.getvalue())
+        self.assertIn('blocks', err_file.getvalue())
+
+    def test_transform(self):
+        out_path = os.path.join(self.tmp_dir.name, 'out.csv')
+        self.run_main(['transform', self.write_file('in.csv', '7;8\n9;10\n'), '--output', out_path,
+                       '--no-header', '--field', '1', '--delimiter', ';'])
+        with open(out_path, newline='') as out_file:
+            self.assertEqual('7;8;eight\r\n9;10;ten\r\n', out_file.read())
+
+        # the type is inferred from the name, and - reads stdin
+        in_path = self.write_file('in.jsonl', '{"n": 1001}\n')
+        out_path = os.path.join(self.tmp_dir.name, 'out.jsonl')
+        with open(in_path) as in_file:
+            self.run_main(['transform', '-', '--type', 'jsonl', '--field', 'n', '--output', out_path], in_file)
+        self.run_main(['transform', in_path, '--field', 'n', '--output', out_path + '2'])
+        for path in (out_path, out_path + '2'):
+            with open(path) as out_file:
+                self.assertEqual({'n': 1001, 'n_words': 'one thousand and one'}, json.loads(out_file.read()))
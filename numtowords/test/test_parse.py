@@ -0,0 +1,54 @@
+import random
+import unittest
+from numtowords.parse import *
+from numtowords.stringify import *
+
+
+class TestIntEngParser(unittest.TestCase):
+    def test_round_trip(self):
+        rand = random.Random(0)
+        nums = list(range(-1100, 1100)) + [
+            10**6, 10**9+7, 101*10**6+5, 10**3000, 10**3003-1,
+        ] + [rand.getrandbits(rand.randrange(1, 2000))*rand.choice((1, -1)) for _ in range(50)]
+        parser = IntEngParser()
+        for use_standard_prefs in (False, True):
+            for base_stringifier in (
+                PosIntBaseEngStringifier(use_standard_prefs), PosIntBaseMaxEngStringifier(9, use_standard_prefs)
+            ):
+                for british in (True, False):
+                    for commas in (True, False):
+                        stringifier = IntEngStringifier(base_stringifier, british=british, commas=commas)
+                        for n in nums:
+                            self.assertEqual(n, parser.parse(stringifier.stringify(n)))
+
+    def test_parse_power(self):
+        parser = IntEngParser()
+        stringifier = PosIntBaseEngStringifier()
+        for power in (3, 6, 33, 303, 3003, 3*10**6+3, 3*10**9+3, 3*(10**30+7)+3):
+            self.assertEqual(power, parser.parse_power(stringifier.stringify(power)))
+        self.assertEqual(3*10**6+3, parser.parse_power(PosIntBaseEngStringifier(True).stringify(3*10**6+3)))
+
+    def test_composed_powers(self):
+        parser = IntEngParser()
+        for max_power in (3, 6, 9, 33):
+            stringifier = IntEngStringifier(PosIntBaseMaxEngStringifier(max_power))
+            for n in (10**9, 10**9+10**6, 10**12+10**9+10**3, 10**99+7*10**66+1):
+                self.assertEqual(n, parser.parse(stringifier.stringify(n)))
+        self.assertEqual(10**9, parser.parse('one thousand million'))
+
+    def test_invalid(self):
+        parser = IntEngParser()
+        for s in (
+            '', 'foo', 'one,', 'and one', 'twenty one', 'one hundred and', 'negative zero', 'one million and two thousand',
+            'two million, three billion', 'one nillimillion', 'one nillion', 'one millionillion', 'eleven hundred',
+            'one million thousand', 'one thousand thousand million', 'one billion million',
+            'one million million, one billion', 'one billion, one thousand thousand',
+            'one million million, one thousand thousand',
+            'one million, and one hundred', 'one thousand and one hundred', 'one million, and one',
+            'twenty - one', 'ninety- nine', 'twenty -one', 'one million,two', 'one thousand , one', 'one  million',
+            ' one', 'one ', 'one million, two thousand three', 'one million two thousand, three',
+            'one hundred and one billion, one hundred and one million and five',
+            'one hundred and one billion one hundred and one million, and five',
+        ):
+            with self.assertRaises(ValueError):
+                parser.parse(s)
@@ -0,0 +1,42 @@
+import asyncio
+import concurrent.futures
+import unittest
+from numtowords import bulk
+from numtowords.server import *
+from numtowords.stringify import *
+
+
+class TestConversionServer(unittest.TestCase):
+    def setUp(self):
+        self.stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+        self.lines = ['{}\n'.format(n) for n in range(-1500, 1500, 7)] + ['abc\n', '10' + '0'*5000 + '\n', '5\n']
+
+    async def convert(self, server, lines):
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        writer.write(''.join(lines).encode())
+        writer.write_eof()
+        res = (await reader.read()).decode().split('\n')
+        writer.close()
+        return res[:-1]
+
+    async def serve(self):
+        conversion_server = ConversionServer(self.stringifier, executor=concurrent.futures.ThreadPoolExecutor(1))
+        conversion_server.max_pending = 16
+        server = await conversion_server.start('127.0.0.1', 0)
+        try:
+            return conversion_server, await asyncio.gather(*(self.convert(server, self.lines) for _ in range(3)))
+        finally:
+            server.close()
+            conversion_server.close()
+
+    def test_serve(self):
+        conversion_server, results = asyncio.run(self.serve())
+        expected = bulk.stringify_chunk(self.stringifier, self.lines)
+        for res in results:
+            self.assertEqual(expected, res)
+        self.assertEqual(3*len(self.lines), conversion_server.requests)
+        percentiles = conversion_server.latency_percentiles()
+        self.assertLessEqual(percentiles[50], percentiles[100])
+
+    def test_close_unstarted(self):
+        ConversionServer(self.stringifier).close()
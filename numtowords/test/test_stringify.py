@@ -1,5 +1,11 @@
 
+import io
+import pickle
+import random
+import sys
+import threading
 import unittest
+import unittest.mock
 from numtowords.stringify import *
 
 
@@ -90,6 +96,25 @@ class TestPosIntBaseEngStringifier(unittest.TestCase):
 
     def test_get_prefix_base(self):
         self.assertEqual('', self.stringifier._get_prefix_from_base(0))
+        self.assertEqual('quinquadecilli', self.stringifier._get_prefix_from_base(15))
+        self.assertEqual('quindecilli', PosIntBaseEngStringifier()._get_prefix_from_base(15))
+        # far more chunks than the recursion limit
+        self.assertEqual(
+            'milli' + 'nilli'*4999 + 'quinquadecitrecentilli', self.stringifier._get_prefix_from_base(1000**5000+315)
+        )
+
+    def test_names_for_powers(self):
+        for start, stop in ((-5, 10), (2995, 9000), (3*10**6-50, 3*10**6+3010)):
+            self.assertEqual(
+                [(power, self.stringifier.stringify(power)) for power in range(start, stop) if power > 0 and power % 3 == 0],
+                list(self.stringifier.names_for_powers(start, stop))
+            )
+
+    def test_power_table(self):
+        power_strs = self.stringifier._get_power_strs(1200)
+        for power in (3, 6, 3*999, 3*1000, 3*1199):
+            self.assertEqual(self.stringifier._make_power_str(power), self.stringifier.stringify(power))
+            self.assertEqual(self.stringifier._make_power_str(power), power_strs[power//3])
 
 
 class TestPosIntBaseMaxEngStringifier(unittest.TestCase):
@@ -100,6 +125,28 @@ class TestPosIntBaseMaxEngStringifier(unittest.TestCase):
         self.assertEqual('million billion', self.stringifier.stringify(15))
         self.assertEqual('billion billion', self.stringifier.stringify(18))
 
+    def test_names_for_powers(self):
+        self.assertEqual([(3, 'thousand'), (27, 'billion billion billion')], list(self.stringifier.names_for_powers(1, 28))[::8])
+
+    def test_power_runs(self):
+        self.assertEqual([('million', 1), (' billion', 1)], list(self.stringifier._iter_power_runs(15)))
+        self.assertEqual([('billion', 1), (' billion', 2)], list(self.stringifier._iter_power_runs(27)))
+
+    def test_stringify_slice(self):
+        # more blocks than the table, so the power names are runs
+        stringifier = PosIntEngStringifier(PosIntBaseMaxEngStringifier(3))
+        n = 10**600 + 7*10**300 + 1
+        s = stringifier.stringify(n)
+        self.assertEqual(len(s), stringifier.stringify_length(n))
+        for start, stop in ((0, 100), (3000, 3010), (5, None), (-1000, -3), (2000, 100)):
+            self.assertEqual(s[start:stop], stringifier.stringify_slice(n, start, stop))
+
+    def test_power_table(self):
+        for num_blocks in (8, 100):
+            power_strs = self.stringifier._get_power_strs(num_blocks)
+            for i in range(1, num_blocks):
+                self.assertEqual(self.stringifier.stringify(3*i), power_strs[i])
+
 
 class TestPosIntEngStrinfier(unittest.TestCase):
     def setUp(self):
@@ -179,6 +226,138 @@ class TestPosIntEngStrinfier(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.stringifier.stringify(0)
 
+    def test_split_blocks(self):
+        rand = random.Random(0)
+        for bits in (1, 10, 64, 700, 2000, 5000, 20000):
+            for _ in range(5):
+                n = rand.getrandbits(bits)
+                self.assertEqual(self.stringifier._split_blocks_simple(n), self.stringifier._split_blocks(n))
+        # zero blocks on either side of the split points
+        for n in (1000**200, 1000**256+1, 1000**511, 1000**512-1, 7*1000**300+5*1000**128):
+            self.assertEqual(self.stringifier._split_blocks_simple(n), self.stringifier._split_blocks(n))
+
+    def test_stringify_digits(self):
+        rand = random.Random(0)
+        for digits in (1, 2, 3, 4, 7, 100, 4000):
+            n = rand.randrange(10**(digits-1), 10**digits)
+            text = str(n)
+            s = self.stringifier.stringify(n)
+            self.assertEqual(s, self.stringifier.stringify_digits(text))
+            self.assertEqual(s, self.stringifier.stringify_digits(' 000{}\n'.format(text).encode()))
+            self.assertEqual(s, self.stringifier.stringify_digits(bytearray(text.encode())))
+        for digits in ('', ' ', '0', '000', '-1', '1_000', '+1', '12a', '\u0661'):
+            with self.assertRaises(ValueError):
+                self.stringifier.stringify_digits(digits)
+
+    def test_iter_stringify(self):
+        for n in (1, 1001, 101024, 102000003, 10**40+10**20+1):
+            self.assertEqual(self.stringifier.stringify(n), ''.join(self.stringifier.iter_stringify(n)))
+            fp = io.StringIO()
+            self.stringifier.write_stringify(n, fp)
+            self.assertEqual(self.stringifier.stringify(n), fp.getvalue())
+        with self.assertRaises(ValueError):
+            self.stringifier.iter_stringify(0)
+
+    def test_split_segments(self):
+        rand = random.Random(0)
+        for level in range(4):
+            for bits in (1, 100, 3000):
+                n = rand.getrandbits(bits)
+                blocks = self.stringifier._split_blocks(n)
+                segments = self.stringifier._split_segments(n, level)
+                size = 2**level
+                for i, segment in enumerate(segments):
+                    segment_blocks = blocks[i*size:(i+1)*size]
+                    self.assertEqual(
+                        segment_blocks, self.stringifier._split_blocks_simple(segment, size)[:len(segment_blocks)]
+                    )
+
+    def test_split_powers_threads(self):
+        rand = random.Random(0)
+        nums = [rand.getrandbits(rand.randrange(1000, 14000)) for _ in range(16)]
+        expected = []
+        for n in nums:
+            digits = str(n)
+            expected.append([int(digits[max(i-3, 0):i]) for i in range(len(digits), 0, -3)])
+
+        def split(i):
+            res[i] = (
+                PosIntEngStringifier._split_blocks(nums[i]),
+                PosIntEngStringifier._join_blocks(expected[i]),
+                PosIntEngStringifier._split_segments(nums[i], i % 3),
+            )
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+        try:
+            # the powers are extended by all threads at once from the start
+            for _ in range(5):
+                res = [None]*len(nums)
+                with unittest.mock.patch.object(PosIntEngStringifier, '_split_powers', [1000]):
+                    threads = [threading.Thread(target=split, args=(i,)) for i in range(len(nums))]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                    powers = PosIntEngStringifier._split_powers
+                    self.assertEqual(powers, [1000**(2**k) for k in range(len(powers))])
+                for i, n in enumerate(nums):
+                    blocks, joined, segments = res[i]
+                    self.assertEqual(expected[i], blocks)
+                    self.assertEqual(n, joined)
+                    self.assertEqual(n, sum(segment*1000**(2**(i % 3)*j) for j, segment in enumerate(segments)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_stringify_workers(self):
+        rand = random.Random(0)
+        with unittest.mock.patch.object(PosIntEngStringifier, 'parallel_min_blocks', 4):
+            for n in (rand.getrandbits(1000), 1000**40+3, 1000**40*57+1000**20*101+99, 1000**40*101+24, 1000**40):
+                for workers in (2, 3):
+                    self.assertEqual(self.stringifier.stringify(n), self.stringifier.stringify(n, workers=workers))
+
+    def test_frozen(self):
+        stringifier = PosIntEngStringifier(PosIntBaseMaxEngStringifier(9, use_standard_prefs=False), commas=False)
+        for obj, name in ((stringifier, 'british'), (stringifier, 'parallel_min_blocks'),
+                          (stringifier.num_base_stringifier, 'maxPower'),
+                          (stringifier.num_base_stringifier, 'use_standard_prefixes')):
+            with self.assertRaises(AttributeError):
+                setattr(obj, name, None)
+            with self.assertRaises(AttributeError):
+                delattr(obj, name)
+        self.assertFalse(hasattr(stringifier, '__dict__'))
+        copied = pickle.loads(pickle.dumps(stringifier))
+        self.assertEqual((9, False, False), (
+            copied.num_base_stringifier.maxPower, copied.num_base_stringifier.use_standard_prefixes, copied.commas
+        ))
+        n = 10**40+10**20+1
+        self.assertEqual(stringifier.stringify(n), copied.stringify(n))
+        # the tables of all stringifiers share their strings
+        self.assertIs(
+            self.stringifier._get_block_table()[21],
+            PosIntEngStringifier(PosIntBaseEngStringifier(), british=False)._get_block_table()[21]
+        )
+
+    def test_stringify_slice(self):
+        for n in (1, 1001, 101024, 10**40+10**20+1):
+            s = self.stringifier.stringify(n)
+            self.assertEqual(len(s), self.stringifier.stringify_length(n))
+            for start, stop in ((None, None), (0, 5), (3, 50), (10, 4), (-20, None), (5, -3), (-30, -10), (40, 1000)):
+                self.assertEqual(s[start:stop], self.stringifier.stringify_slice(n, start, stop))
+
+    def test_stringify_bytes(self):
+        max_stringifier = PosIntEngStringifier(PosIntBaseMaxEngStringifier(9), commas=False)
+        for stringifier in (self.stringifier, max_stringifier):
+            for n in (1, 1001, 101024, 10**40+10**20+1, 1000**1001+7):
+                b = stringifier.stringify(n).encode()
+                self.assertEqual(b, stringifier.stringify_bytes(n))
+                self.assertEqual(b, b''.join(stringifier.stringify_buffers(n)))
+                buf = bytearray(len(b)+2)
+                self.assertEqual(len(b), stringifier.stringify_into(n, memoryview(buf)[1:]))
+                self.assertEqual(b, buf[1:-1])
+        with self.assertRaises(ValueError):
+            self.stringifier.stringify_into(1001, bytearray(10))
+
 
 class TestIntEngStrinfier(unittest.TestCase):
     def setUp(self):
@@ -192,3 +371,55 @@ class TestIntEngStrinfier(unittest.TestCase):
         }
         for n, s in num_strs.items():
             self.assertEqual(s, self.stringifier.stringify(n))
+
+    def test_stringify_digits(self):
+        self.assertEqual('zero', self.stringifier.stringify_digits('-000'))
+        self.assertEqual('negative one thousand and one', self.stringifier.stringify_digits(b'-1001'))
+        with self.assertRaises(ValueError):
+            self.stringifier.stringify_digits('--1')
+
+    def test_iter_stringify(self):
+        self.assertEqual(['zero'], list(self.stringifier.iter_stringify(0)))
+        self.assertEqual('negative one million and two', ''.join(self.stringifier.iter_stringify(-1000002)))
+
+    def test_iter_range(self):
+        for start, stop, step in (
+            (-2500, 2500, 1), (2500, -2500, -7), (999900, 1001100, 3), (1000**5+2000, 1000**5-2000, -3),
+            (-1000**3-1500, -1000**3+1500, 1), (0, 10**12, 10**9+7), (5, 5, 1),
+        ):
+            self.assertEqual(
+                [self.stringifier.stringify(n) for n in range(start, stop, step)],
+                list(self.stringifier.iter_range(start, stop, step))
+            )
+        with self.assertRaises(ValueError):
+            self.stringifier.iter_range(0, 1, 0)
+
+    def test_stringify_slice(self):
+        self.assertEqual(len('negative one thousand and one'), self.stringifier.stringify_length(-1001))
+        self.assertEqual('ive one', self.stringifier.stringify_slice(-1001, 5, 12))
+
+    def test_stringify_bytes(self):
+        self.assertEqual(b'zero', self.stringifier.stringify_bytes(0))
+        self.assertEqual(b'negative one thousand and one', self.stringifier.stringify_bytes(-1001))
+
+    def test_cache(self):
+        stringifier = IntEngStringifier(self.baseStringifier, cache_size=2)
+        for n in (0, -25, 0, 7, -25, 2**300, 2**300):
+            self.assertEqual(self.stringifier.stringify(n), stringifier.stringify(n))
+        # 2**300 bypasses the cache, -25 was evicted by 7 then 0 by -25
+        self.assertEqual((1, 4, 2, 2, 2), tuple(stringifier.cache_info()))
+        with self.assertRaises(ValueError):
+            stringifier.stringify(7.0)
+        self.assertIsNone(self.stringifier.cache_info())
+        self.assertEqual(0, pickle.loads(pickle.dumps(stringifier)).cache_info().currsize)
+
+        def stringify_range():
+            for n in range(-300, 300):
+                self.assertEqual(self.stringifier.stringify(n), stringifier.stringify(n))
+        threads = [threading.Thread(target=stringify_range) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = stringifier.cache_info()
+        self.assertEqual(5+4*600, info.hits+info.misses)
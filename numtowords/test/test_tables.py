@@ -0,0 +1,22 @@
+import os
+import unittest
+from numtowords import stringify
+from numtowords.bin import gen_tables
+from numtowords.stringify import *
+
+
+class TestTables(unittest.TestCase):
+    def test_up_to_date(self):
+        with open(os.path.join(os.path.dirname(stringify.__file__), '_tables.py')) as fp:
+            self.assertEqual(fp.read(), gen_tables.make_source())
+        self.assertTrue(stringify.use_precomputed_tables)
+
+    def test_precomputed(self):
+        stringifier = IntEngStringifier(PosIntBaseEngStringifier(), british=False, commas=False)
+        tables = stringify._get_precomputed_table(IntEngStringifier, 'tail', (False, False))
+        self.assertEqual(tables[1][5], ''.join(stringifier._iter_tail(5, 1)))
+        self.assertEqual(len(stringify._get_precomputed_table(PosIntEngStringifier, 'block', (True,))), 1000)
+        # subclasses may change the words
+        class Stringifier(PosIntEngStringifier):
+            pass
+        self.assertIsNone(stringify._get_precomputed_table(Stringifier, 'block', (True,)))
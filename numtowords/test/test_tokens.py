@@ -0,0 +1,57 @@
+import pickle
+import random
+import unittest
+from numtowords.stringify import *
+from numtowords.tokens import *
+
+
+class TestStringifyTokens(unittest.TestCase):
+    def test_decode(self):
+        rand = random.Random(0)
+        nums = list(range(-1100, 1100)) + [rand.getrandbits(rand.randrange(1, 4000)) for _ in range(20)] + [10**3003]
+        for use_standard_prefs in (False, True):
+            for base_stringifier in (
+                PosIntBaseEngStringifier(use_standard_prefs), PosIntBaseMaxEngStringifier(9, use_standard_prefs)
+            ):
+                for british in (True, False):
+                    for commas in (True, False):
+                        stringifier = IntEngStringifier(base_stringifier, british=british, commas=commas)
+                        for n in nums:
+                            self.assertEqual(stringifier.stringify(n), stringify_tokens(stringifier, n).decode())
+
+    def test_power_names(self):
+        vocabulary = Vocabulary()
+        size = len(vocabulary)
+        for use_standard_prefs in (False, True):
+            stringifier = IntEngStringifier(PosIntBaseEngStringifier(use_standard_prefs))
+            # every block is one, so every power is named
+            n = (1000**3000-1)//999
+            encoded = stringify_tokens(stringifier, n, vocabulary)
+            self.assertEqual(stringifier.stringify(n), encoded.decode())
+            self.assertEqual(encoded.ids, stringify_tokens(stringifier, n, Vocabulary()).ids)
+            self.assertEqual(stringifier.stringify(n), pickle.loads(pickle.dumps(encoded)).decode())
+        self.assertEqual(size, len(vocabulary))
+        self.assertEqual(
+            [vocabulary.ids[word] for word in ('one', 'milli', 'nilli', 'on')],
+            list(stringify_tokens(stringifier, 10**3003, vocabulary).ids)
+        )
+
+    def test_encoded_number(self):
+        stringifier = IntEngStringifier(PosIntBaseEngStringifier())
+        vocabulary = Vocabulary()
+        encoded = stringify_tokens(stringifier, -21001, vocabulary)
+        # negative, twenty-one, thousand, and, one
+        self.assertEqual(5, len(encoded.ids))
+        self.assertEqual('negative twenty-one thousand and one', encoded.decode(vocabulary))
+        self.assertEqual(encoded, stringify_tokens(stringifier, -21001, vocabulary))
+        self.assertEqual(hash(encoded), hash(stringify_tokens(stringifier, -21001, vocabulary)))
+        self.assertNotEqual(encoded, stringify_tokens(stringifier, -21002, vocabulary))
+        # the same words have the same ids in any vocabulary
+        self.assertEqual(encoded, stringify_tokens(stringifier, -21001))
+        self.assertEqual('negative twenty-one thousand and one', str(encoded))
+        # pickled without the vocabulary
+        copied = pickle.loads(pickle.dumps(encoded))
+        self.assertLess(len(pickle.dumps(encoded)), 100)
+        self.assertIs(EncodedNumber, type(copied))
+        self.assertEqual(1, len({encoded, copied}))
+        self.assertEqual(str(encoded), str(copied))
@@ -0,0 +1,51 @@
+import io
+import json
+import unittest
+from numtowords import transform
+from numtowords.stringify import *
+
+
+class TestTransform(unittest.TestCase):
+    def setUp(self):
+        self.stringifier = IntEngStringifier(PosIntBaseEngStringifier(), british=False)
+
+    def test_transform_csv(self):
+        text = 'id,amount,note\r\n1,123,a\r\n2,-5,"b,\r\nc"\r\n3,abc,d\r\n4\r\n'
+        expected = (
+            'id,amount,note,amount_words\r\n1,123,a,one hundred twenty-three\r\n2,-5,"b,\r\nc",negative five\r\n'
+            '3,abc,d,Error: digits\r\n4,,,Error: digits\r\n'
+        )
+        for jobs in (1, 2):
+            out_file = io.StringIO(newline='')
+            self.assertEqual(transform.transform_csv(
+                self.stringifier, io.StringIO(text, newline=''), out_file, 'amount', jobs=jobs, chunk_size=2
+            ), 4)
+            self.assertEqual(out_file.getvalue(), expected)
+        out_file = io.StringIO(newline='')
+        transform.transform_csv(
+            self.stringifier, io.StringIO('7;8\r\n9;10\r\n', newline=''), out_file, 1, header=False, delimiter=';'
+        )
+        self.assertEqual(out_file.getvalue(), '7;8;eight\r\n9;10;ten\r\n')
+        with self.assertRaises(ValueError):
+            transform.transform_csv(self.stringifier, io.StringIO('id\r\n1\r\n'), io.StringIO(), 'amount')
+
+    def test_transform_jsonl(self):
+        rows = [{'amount': n} for n in range(-100, 100, 3)] + [
+            {'amount': '1000001'}, {'amount': True}, {'amount': 1.5}, {'other': 1},
+        ]
+        text = ''.join(json.dumps(row) + '\n' for row in rows) + '\n'
+        for jobs in (1, 2):
+            out_file = io.StringIO()
+            self.assertEqual(transform.transform_jsonl(
+                self.stringifier, io.StringIO(text), out_file, 'amount', 'words', jobs=jobs, chunk_size=8
+            ), len(rows)+1)
+            lines = out_file.getvalue().split('\n')
+            self.assertEqual(lines[-2:], ['', ''])
+            res = [json.loads(line)['words'] for line in lines[:-2]]
+            self.assertEqual(res[:-4], [self.stringifier.stringify(row['amount']) for row in rows[:-4]])
+            self.assertEqual(res[-4:], ['one million, one', 'Error: n', 'Error: n', 'Error: field'])
+        out_file = io.StringIO()
+        transform.transform_jsonl(self.stringifier, io.StringIO('{"name": "café", "amount": 2}\n'), out_file, 'amount')
+        self.assertEqual('{"name": "café", "amount": 2, "amount_words": "two"}\n', out_file.getvalue())
+        with self.assertRaises(ValueError):
+            transform.transform_jsonl(self.stringifier, io.StringIO('[1]\n'), io.StringIO(), 'amount')
@@ -0,0 +1,157 @@
+'''
+Add a column of stringified numbers to CSV and JSONL files, streaming them in
+chunks so memory stays bounded however many rows there are. Chunks can be
+spread over a pool of worker processes, rows are written in their original
+order either way.
+
+A value which isn't a number (or is missing) gives an error string in its
+row rather than raising, as in bulk.
+'''
+
+import csv
+import itertools
+import json
+import multiprocessing
+from numtowords import bulk
+
+# (stringifier, field, output_field) of each worker process
+_worker_args = None
+
+
+def _init_worker(args):
+    global _worker_args
+    _worker_args = args
+
+
+def _stringify_value(stringifier, value):
+    try:
+        # bools are ints to python, but not numbers to json
+        if isinstance(value, int) and not isinstance(value, bool):
+            return stringifier.stringify(value)
+        if isinstance(value, str):
+            return bulk.stringify_chunk(stringifier, [value])[0]
+        raise ValueError('n')
+    except ValueError as e:
+        return 'Error: {}'.format(e)
+
+
+def _transform_jsonl_lines(stringifier, field, output_field, lines):
+    res = []
+    for line in lines:
+        if not line.strip():
+            res.append(line)
+            continue
+        row = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError('row')
+        if field in row:
+            row[output_field] = _stringify_value(stringifier, row[field])
+        else:
+            row[output_field] = 'Error: field'
+        # other fields are written back as they were read
+        res.append(json.dumps(row, ensure_ascii=False) + '\n')
+    return res
+
+
+def _worker_transform_jsonl_lines(lines):
+    return _transform_jsonl_lines(*_worker_args, lines)
+
+
+def transform_csv(stringifier, in_file, out_file, field, output_field=None, header=True, jobs=1, chunk_size=10000,
+                  **fmtparams):
+    '''
+    Copy the rows of a CSV file, adding the stringified value of field to
+    each.
+
+    args:
+        in_file, out_file:
+            Text files, opened with newline=''.
+        field:
+            The name of the column in the header, or its index.
+        output_field:
+            The name of the added column in the header, by default
+            '{field}_words'.
+        header:
+            Whether the first row is a header.
+        jobs:
+            Number of worker processes, None for one per cpu.
+        chunk_size:
+            Number of values sent to a worker at once.
+        fmtparams:
+            Passed to csv.reader and csv.writer, e.g. delimiter.
+
+    returns:
+        The number of rows written, excluding the header.
+
+    raises:
+        ValueError if field isn't in the header.
+    '''
+    reader = csv.reader(in_file, **fmtparams)
+    writer = csv.writer(out_file, **fmtparams)
+    index = field
+    # short rows are padded to the header, so the strings are in one column
+    width = 0
+    if header:
+        header_row = next(reader, None)
+        if header_row is None:
+            return 0
+        if not isinstance(field, int):
+            if field not in header_row:
+                raise ValueError('field')
+            index = header_row.index(field)
+        if output_field is None:
+            output_field = '{}_words'.format(header_row[index] if index < len(header_row) else field)
+        writer.writerow(header_row + [output_field])
+        width = len(header_row)
+
+    # only the values are sent to workers, the rows are held here until their
+    # strings are back, which is at most a few chunks per worker
+    rows, value_rows = itertools.tee(reader)
+    values = (row[index] if index < len(row) else '' for row in value_rows)
+    count = 0
+    for chunk in bulk.iter_chunks(zip(rows, bulk.stringify_lines(stringifier, values, jobs, chunk_size)), chunk_size):
+        writer.writerows(row + ['']*(width-len(row)) + [words] for row, words in chunk)
+        count += len(chunk)
+    return count
+
+
+def transform_jsonl(stringifier, in_file, out_file, field, output_field=None, jobs=1, chunk_size=10000):
+    '''
+    Copy the objects of a JSONL file (one per line), adding the stringified
+    value of field to each. Values can be ints or strings of digits (or
+    anything else bulk accepts in a line). Blank lines are copied as they
+    are.
+
+    args:
+        in_file, out_file:
+            Text files.
+        output_field:
+            Key of the added value, by default '{field}_words'.
+        jobs:
+            Number of worker processes, None for one per cpu.
+        chunk_size:
+            Number of lines sent to a worker at once.
+
+    returns:
+        The number of lines written.
+
+    raises:
+        ValueError if a line isn't a json object.
+    '''
+    if output_field is None:
+        output_field = '{}_words'.format(field)
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    chunks = bulk.iter_chunks(in_file, chunk_size)
+    if jobs == 1:
+        results = (_transform_jsonl_lines(stringifier, field, output_field, chunk) for chunk in chunks)
+    else:
+        results = bulk.map_chunks(
+            _worker_transform_jsonl_lines, chunks, jobs, initializer=_init_worker,
+            initargs=((stringifier, field, output_field),)
+        )
+    count = 0
+    for lines in results:
+        out_file.writelines(lines)
+        count += len(lines)
+    return count
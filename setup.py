@@ -10,4 +10,13 @@ setup(
     author_email='simonzack@gmail.com',
 
     packages=find_packages(),
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': [
+            'numtowords=numtowords.bin.main:main',
+            'numtowords-server=numtowords.bin.server:main',
+        ],
+    },
 )